@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import inspect
 from logging import getLogger
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -46,7 +47,8 @@ def from_dict(cls, settings_dict: SettingsDict) -> Self:
         try:
             slack_app = import_string(settings_dict["slack_app"])
             messengers = {
-                name: cls._create_messenger(spec) for name, spec in settings_dict.get("messengers", {}).items()
+                name: cls._create_messenger(spec, name=name)
+                for name, spec in settings_dict.get("messengers", {}).items()
             }
             return cls(
                 slack_app=slack_app,
@@ -57,7 +59,7 @@ def from_dict(cls, settings_dict: SettingsDict) -> Self:
             raise ImproperlyConfigured(msg) from err
 
     @classmethod
-    def _create_messenger(cls, spec: LazyInitSpec) -> Messenger:
+    def _create_messenger(cls, spec: LazyInitSpec, *, name: str) -> Messenger:
         class_ = import_string(spec["class"])
         args, kwargs = spec.get("args", ()), spec.get("kwargs", {})
 
@@ -66,11 +68,30 @@ def _create_messenger(cls, spec: LazyInitSpec) -> Messenger:
         kwargs["template_loaders"] = [lazy_init(tl) for tl in kwargs["template_loaders"]]
         kwargs["middlewares"] = [lazy_init(tl) for tl in kwargs["middlewares"]]
         kwargs["messaging_backend"] = lazy_init(kwargs["messaging_backend"])
+        if "instruments" in kwargs:
+            kwargs["instruments"] = [lazy_init(inst) for inst in kwargs["instruments"]]
+
+        # Custom messenger classes may not take a name
+        if _accepts_keyword(class_, "name"):
+            kwargs.setdefault("name", name)
 
         # Create the messenger
         return class_(*args, **kwargs)  # type: ignore[no-any-return]
 
 
+def _accepts_keyword(callable_: Any, keyword: str) -> bool:
+    """Whether the callable accepts given keyword argument."""
+    try:
+        parameters = inspect.signature(callable_).parameters.values()
+    except (TypeError, ValueError):
+        return False
+
+    return any(
+        (param.name == keyword and param.kind != param.POSITIONAL_ONLY) or param.kind == param.VAR_KEYWORD
+        for param in parameters
+    )
+
+
 def get_settings_from_django(settings_key: str = "DJANGO_SLACK_TOOLS") -> AppSettings:
     """Get application settings."""
     django_settings: SettingsDict = getattr(settings, settings_key)
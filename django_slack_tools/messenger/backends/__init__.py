@@ -1,12 +1,14 @@
 from .base import BaseBackend
 from .dummy import DummyBackend
 from .logging_ import LoggingBackend
+from .rate_limited import RateLimitedBackend
 from .slack import SlackBackend, SlackRedirectBackend
 
 __all__ = (
     "BaseBackend",
     "DummyBackend",
     "LoggingBackend",
+    "RateLimitedBackend",
     "SlackBackend",
     "SlackRedirectBackend",
 )
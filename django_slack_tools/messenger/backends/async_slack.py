@@ -0,0 +1,75 @@
+"""Slack backends working with Slack API natively in asyncio.
+
+This module requires `aiohttp` to be installed, as `slack_bolt.async_app` does.
+"""
+
+from __future__ import annotations
+
+import traceback
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from asgiref.sync import async_to_sync
+from django.utils.module_loading import import_string
+from slack_bolt.async_app import AsyncApp
+from slack_sdk.errors import SlackApiError
+
+from .base import BaseBackend
+
+if TYPE_CHECKING:
+    from slack_sdk.web import SlackResponse
+    from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+    from django_slack_tools.messenger.request import MessageBody, MessageHeader, MessageRequest
+    from django_slack_tools.messenger.response import MessageResponse
+
+
+logger = getLogger(__name__)
+
+
+class AsyncSlackBackend(BaseBackend):
+    """Backend sending the messages with async Slack app, without blocking the event loop."""
+
+    def __init__(self, *, slack_app: AsyncApp | str) -> None:
+        """Initialize backend.
+
+        Args:
+            slack_app: Async Slack app instance or import string.
+        """
+        if isinstance(slack_app, str):
+            slack_app = import_string(slack_app)
+
+        if not isinstance(slack_app, AsyncApp):
+            msg = f"Expected {AsyncApp!s} instance, got {type(slack_app)}"
+            raise TypeError(msg)
+
+        self._slack_app = slack_app
+
+    async def adeliver(self, request: MessageRequest) -> MessageResponse:  # noqa: D102
+        if request.body is None:
+            msg = "Message body is required."
+            raise ValueError(msg)
+
+        try:
+            response = await self._asend_message(
+                channel=request.channel,
+                header=request.header,
+                body=request.body,
+            )
+            error = None
+        except SlackApiError as err:
+            response = err.response
+            error = traceback.format_exc()
+
+        return self._make_response(request, response=response, error=error)
+
+    def _send_message(self, *, channel: str, header: MessageHeader, body: MessageBody) -> SlackResponse:
+        # Sync interface kept for compatibility, e.g. used with `Messenger`
+        return async_to_sync(self._asend_message)(channel=channel, header=header, body=body)  # type: ignore[return-value]
+
+    async def _asend_message(self, *, channel: str, header: MessageHeader, body: MessageBody) -> AsyncSlackResponse:
+        return await self._slack_app.client.chat_postMessage(
+            channel=channel,
+            **header.model_dump(),
+            **body.model_dump(),
+        )
@@ -7,12 +7,14 @@
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, Optional, cast
 
+from asgiref.sync import sync_to_async
 from slack_sdk.errors import SlackApiError
 
 from django_slack_tools.messenger.response import MessageResponse
 
 if TYPE_CHECKING:
     from slack_sdk.web import SlackResponse
+    from slack_sdk.web.async_slack_response import AsyncSlackResponse
 
     from django_slack_tools.messenger.request import MessageBody, MessageHeader, MessageRequest
 
@@ -40,6 +42,23 @@ def deliver(self, request: MessageRequest) -> MessageResponse:
             response = err.response
             error = traceback.format_exc()
 
+        return self._make_response(request, response=response, error=error)
+
+    async def adeliver(self, request: MessageRequest) -> MessageResponse:
+        """Deliver message request asynchronously.
+
+        By default, it runs `.deliver()` in a thread. Backends natively supporting asyncio should override this.
+        """
+        return await sync_to_async(self.deliver, thread_sensitive=False)(request)
+
+    def _make_response(
+        self,
+        request: MessageRequest,
+        *,
+        response: SlackResponse | AsyncSlackResponse,
+        error: str | None,
+    ) -> MessageResponse:
+        """Create message response from Slack API response."""
         ok = cast("bool", response.get("ok"))
         data: Any
         if ok:
@@ -0,0 +1,297 @@
+"""Backend wrapper throttling the deliveries to stay within Slack rate limits."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+
+from django_slack_tools.utils.import_helper import lazy_init
+
+from .base import BaseBackend
+from .slack import SlackBackend
+
+if TYPE_CHECKING:
+    from slack_sdk.web import WebClient
+
+    from django_slack_tools.messenger.request import MessageBody, MessageHeader
+    from django_slack_tools.utils.import_helper import LazyInitSupported
+
+
+logger = getLogger(__name__)
+
+SLACK_TIER_RATES = {
+    1: 1 / 60,
+    2: 20 / 60,
+    3: 50 / 60,
+    4: 100 / 60,
+}
+"""Requests per second allowed for each of Slack Web API rate limit tiers, per workspace.
+
+See [Rate limits](https://api.slack.com/apis/rate-limits) for details.
+"""
+
+_HTTP_TOO_MANY_REQUESTS = 429
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class RateLimitCounters:
+    """Counters of rate limited deliveries."""
+
+    throttled: int = 0
+    """Number of deliveries delayed to stay within the rate limits."""
+
+    queued: int = 0
+    """Number of deliveries currently waiting for their turn."""
+
+    retried: int = 0
+    """Number of retries after rate limited by Slack (HTTP 429)."""
+
+    dropped: int = 0
+    """Number of deliveries given up, due to too long wait or too many retries."""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter by given value."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
+class _TokenBucket:
+    """Token bucket scheduling the requests, reserving tokens in advance for waiting requests."""
+
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds to wait until a token becomes available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def reserve(self) -> None:
+        """Take a token, which could be one becoming available in the future."""
+        self._refill()
+        self.tokens -= 1
+
+    def is_full(self) -> bool:
+        """Whether the bucket is full, as if never used."""
+        self._refill()
+        return self.tokens >= self.capacity
+
+    def block(self, seconds: float) -> None:
+        """Make no tokens available for given seconds."""
+        self._refill()
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+
+class RateLimitedBackend(BaseBackend):
+    """Backend wrapper delaying deliveries to stay within Slack rate limits, rather than failing them.
+
+    Deliveries are scheduled with token buckets per channel and optionally for whole workspace,
+    as `chat.postMessage` allows roughly one message per second per channel, with short bursts.
+    If Slack still responds with HTTP 429, delivery is retried after `Retry-After` seconds.
+
+    If wrapped backend is a `SlackBackend`, its client is wrapped to throttle messages by the channel
+    they are actually posted to (e.g. redirect channel of `SlackRedirectBackend`). Other backends
+    are throttled by the channel of requests. Buckets of channels idle long enough to be full again
+    are evicted, as they are no different from new ones.
+
+    Deliveries are blocked until their turn, so it is best used with concurrent sending,
+    e.g. `Messenger.send_many()`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        backend: BaseBackend | LazyInitSupported,
+        channel_rate: float = 1.0,
+        channel_burst: int = 1,
+        workspace_rate: float | None = None,
+        max_wait: float | None = None,
+        max_retries: int = 3,
+    ) -> None:
+        """Initialize backend.
+
+        Args:
+            backend: Backend to deliver messages with, or lazy init spec of it.
+            channel_rate: Messages per second allowed for each channel.
+            channel_burst: Messages allowed to be sent at once for each channel.
+            workspace_rate: Messages per second allowed for whole workspace. See `SLACK_TIER_RATES`.
+                Not limited if `None`.
+            max_wait: Maximum seconds to wait for the turn. If exceeded, the message is dropped
+                and failed response returned. Waits indefinitely if `None`.
+            max_retries: Maximum retries after rate limited by Slack.
+
+        Raises:
+            ValueError: Invalid rates or limits.
+        """
+        if channel_rate <= 0 or channel_burst < 1 or (workspace_rate is not None and workspace_rate <= 0):
+            msg = "Rates must be positive and burst must be at least 1."
+            raise ValueError(msg)
+
+        if max_retries < 0:
+            msg = f"`max_retries` must not be negative, got {max_retries!r}"
+            raise ValueError(msg)
+
+        self.backend: BaseBackend = backend if isinstance(backend, BaseBackend) else lazy_init(backend)
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.workspace_rate = workspace_rate
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.counters = RateLimitCounters()
+
+        self._lock = threading.Lock()
+        self._channel_buckets: dict[str, _TokenBucket] = {}
+        self._workspace_bucket = _TokenBucket(rate=workspace_rate, capacity=1) if workspace_rate is not None else None
+        self._client_wrapped = False
+        if isinstance(self.backend, SlackBackend):
+            self.backend.wrap_client(self._wrap_client)
+            self._client_wrapped = True
+
+    def _send_message(self, *, channel: str, header: MessageHeader, body: MessageBody) -> SlackResponse:
+        send = partial(
+            self.backend._send_message,  # noqa: SLF001
+            channel=channel,
+            header=header,
+            body=body,
+        )
+        if self._client_wrapped:
+            # Throttled by wrapped client, with the channel actually posted to
+            return send()
+
+        return self._throttled(channel, send)
+
+    def _wrap_client(self, client: WebClient) -> WebClient:
+        return cast("WebClient", _RateLimitedClient(client, backend=self))
+
+    def _throttled(self, channel: str, send: Callable[[], _T]) -> _T:
+        """Call `send` on the channel's turn, retrying if rate limited by Slack."""
+        if not self._wait_turn(channel):
+            logger.warning("Dropping message to channel %s, would wait more than %s seconds", channel, self.max_wait)
+            self.counters.increment("dropped")
+            msg = f"Rate limited, would wait more than {self.max_wait} seconds"
+            raise SlackApiError(msg, _make_rate_limited_response())
+
+        retries = 0
+        while True:
+            try:
+                return send()
+            except SlackApiError as err:  # noqa: PERF203
+                if err.response.status_code != _HTTP_TOO_MANY_REQUESTS:
+                    raise
+
+                if retries >= self.max_retries:
+                    logger.warning("Rate limited by Slack for channel %s, giving up after %d retries", channel, retries)
+                    self.counters.increment("dropped")
+                    raise
+
+                retry_after = _get_retry_after(err.response)
+                logger.info("Rate limited by Slack for channel %s, retrying after %s seconds", channel, retry_after)
+                self._block(channel, retry_after)
+                self.counters.increment("retried")
+                retries += 1
+                self._wait_turn(channel, limit=False)
+
+    def _wait_turn(self, channel: str, *, limit: bool = True) -> bool:
+        """Wait until the channel's turn to send a message. Returns `False` if it would wait too long."""
+        with self._lock:
+            buckets = [self._get_channel_bucket(channel)]
+            if self._workspace_bucket is not None:
+                buckets.append(self._workspace_bucket)
+
+            wait = max(bucket.wait_time() for bucket in buckets)
+            if limit and self.max_wait is not None and wait > self.max_wait:
+                return False
+
+            for bucket in buckets:
+                bucket.reserve()
+
+        if wait > 0:
+            logger.debug("Waiting %.3f seconds to send message to channel %s", wait, channel)
+            self.counters.increment("throttled")
+            self.counters.increment("queued")
+            try:
+                time.sleep(wait)
+            finally:
+                self.counters.increment("queued", -1)
+
+        return True
+
+    def _block(self, channel: str, seconds: float) -> None:
+        with self._lock:
+            self._get_channel_bucket(channel).block(seconds)
+            if self._workspace_bucket is not None:
+                self._workspace_bucket.block(seconds)
+
+    def _get_channel_bucket(self, channel: str) -> _TokenBucket:
+        """Get bucket of the channel, evicting buckets full again. Lock must be held."""
+        # Buckets are kept in order of last use, so those idle longest come first
+        bucket = self._channel_buckets.pop(channel, None)
+        if bucket is None:
+            bucket = _TokenBucket(rate=self.channel_rate, capacity=self.channel_burst)
+
+        for key, idle in list(self._channel_buckets.items()):
+            if not idle.is_full():
+                break
+
+            del self._channel_buckets[key]
+
+        self._channel_buckets[channel] = bucket
+        return bucket
+
+
+class _RateLimitedClient:
+    """Proxy of Slack client throttling `chat.postMessage` calls by the channel posted to."""
+
+    def __init__(self, client: WebClient, *, backend: RateLimitedBackend) -> None:
+        self._client = client
+        self._backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def chat_postMessage(self, *, channel: str, **kwargs: Any) -> SlackResponse:  # noqa: N802
+        return self._backend._throttled(  # noqa: SLF001
+            channel,
+            partial(self._client.chat_postMessage, channel=channel, **kwargs),
+        )
+
+
+def _make_rate_limited_response() -> SlackResponse:
+    """Make response for messages dropped without calling Slack API."""
+    return SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://www.slack.com/api/chat.postMessage",
+        req_args={},
+        data={"ok": False, "error": "ratelimited"},
+        headers={},
+        status_code=_HTTP_TOO_MANY_REQUESTS,
+    )
+
+
+def _get_retry_after(response: SlackResponse) -> float:
+    """Get seconds to wait from `Retry-After` header, defaults to 1 second."""
+    headers = {key.lower(): value for key, value in (response.headers or {}).items()}
+    try:
+        return float(headers.get("retry-after", 1))
+    except (TypeError, ValueError):
+        return 1.0
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from logging import getLogger
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
@@ -12,7 +12,7 @@
 from .base import BaseBackend
 
 if TYPE_CHECKING:
-    from slack_sdk.web import SlackResponse
+    from slack_sdk.web import SlackResponse, WebClient
 
     from django_slack_tools.slack_messages.request import MessageBody, MessageHeader
 
@@ -21,7 +21,11 @@
 
 
 class SlackBackend(BaseBackend):
-    """Backend actually sending the messages."""
+    """Backend actually sending the messages.
+
+    Messages are sent with the client of given Slack app. To reuse HTTP connections across messages,
+    set `django_slack_tools.utils.slack.PooledWebClient` as the client of the app.
+    """
 
     def __init__(self, *, slack_app: App | str) -> None:
         """Initialize backend.
@@ -37,9 +41,20 @@ def __init__(self, *, slack_app: App | str) -> None:
             raise TypeError(msg)
 
         self._slack_app = slack_app
+        self._client_wrapper: Callable[[WebClient], WebClient] | None = None
+
+    @property
+    def client(self) -> WebClient:
+        """Client of Slack app to call Slack API with, wrapped if set with `.wrap_client()`."""
+        client = self._slack_app.client
+        return self._client_wrapper(client) if self._client_wrapper else client
+
+    def wrap_client(self, wrapper: Callable[[WebClient], WebClient]) -> None:
+        """Wrap the client for calls to Slack API, e.g. to throttle messages by the channel actually posted to."""
+        self._client_wrapper = wrapper
 
     def _send_message(self, *, channel: str, header: MessageHeader, body: MessageBody) -> SlackResponse:
-        return self._slack_app.client.chat_postMessage(
+        return self.client.chat_postMessage(
             channel=channel,
             **header.model_dump(),
             **body.model_dump(),
@@ -71,7 +86,7 @@ def _send_message(self, *, channel: str, header: MessageHeader, body: MessageBod
             )
             body.attachments = attachments
 
-        return self._slack_app.client.chat_postMessage(
+        return self.client.chat_postMessage(
             channel=self.redirect_channel,
             **header.model_dump(),
             **body.model_dump(),
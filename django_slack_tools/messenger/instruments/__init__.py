@@ -0,0 +1,3 @@
+from .base import BaseInstrument, Stage
+
+__all__ = ("BaseInstrument", "Stage")
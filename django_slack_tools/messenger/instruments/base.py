@@ -0,0 +1,76 @@
+# noqa: D100
+from __future__ import annotations
+
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from django_slack_tools.messenger.messenger import BaseMessenger
+    from django_slack_tools.messenger.request import MessageRequest
+    from django_slack_tools.messenger.response import MessageResponse
+
+Stage = Literal[
+    "send",
+    "process_request",
+    "middleware_request",
+    "load_template",
+    "render",
+    "deliver",
+    "process_response",
+    "middleware_response",
+]
+"""Stages of sending a message, observed by instruments.
+
+- `"send"`: Whole `Messenger.send_request()` call.
+- `"process_request"`: All request processing middlewares, of which each is `"middleware_request"`.
+- `"load_template"`: Loading template by key, if not loaded yet.
+- `"render"`: Rendering message with template.
+- `"deliver"`: Delivering message with backend.
+- `"process_response"`: All response processing middlewares, of which each is `"middleware_response"`.
+"""
+
+
+class BaseInstrument:
+    """Base class for instruments observing messengers, to collect metrics, traces and so on.
+
+    All hooks do nothing by default. Hooks are called in the thread or task processing the request,
+    so they should be fast and thread-safe.
+    """
+
+    def bind(self, messenger: BaseMessenger) -> None:
+        """Called once for each messenger created with the instrument.
+
+        Args:
+            messenger: Messenger using the instrument.
+        """
+
+    def stage(
+        self,
+        messenger: BaseMessenger,  # noqa: ARG002
+        stage: Stage,  # noqa: ARG002
+        request: MessageRequest | None,  # noqa: ARG002
+        **attributes: Any,  # noqa: ARG002
+    ) -> AbstractContextManager[Any]:
+        """Context manager wrapping a stage of sending a message. Errors raised in the stage propagate through it.
+
+        Args:
+            messenger: Messenger sending the message.
+            stage: Stage name.
+            request: Message request being processed, if known.
+            attributes: Extra details of the stage, such as `component` (class name of middleware or backend)
+                and `template_key`.
+
+        Returns:
+            Context manager entered during the stage.
+        """
+        return nullcontext()
+
+    def on_response(self, messenger: BaseMessenger, response: MessageResponse) -> None:
+        """Called with the response delivered by backend, within the `"deliver"` stage.
+
+        Args:
+            messenger: Messenger sending the message.
+            response: Message response.
+        """
@@ -0,0 +1,82 @@
+"""Instrument tracing messengers with OpenTelemetry.
+
+It requires `opentelemetry-api` package, which can be installed with `django-slack-tools[opentelemetry]` extra.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
+
+from django_slack_tools.utils.tracing import TRACER_NAME
+
+from .base import BaseInstrument
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from opentelemetry.trace import TracerProvider
+
+    from django_slack_tools.messenger.messenger import BaseMessenger
+    from django_slack_tools.messenger.request import MessageRequest
+    from django_slack_tools.messenger.response import MessageResponse
+
+    from .base import Stage
+
+
+class OpenTelemetryInstrument(BaseInstrument):
+    """Instrument opening a span for each stage of sending messages.
+
+    Spans are named `slack_message.<stage>`, followed by class name of middleware or backend where applicable,
+    e.g. `slack_message.middleware_response DjangoDatabasePersister`. Spans of a message are children of
+    its `slack_message.send` span, which is a child of current span of the caller.
+
+    Spans have following attributes, where known:
+
+    - `slack.messenger`: Name of messenger.
+    - `slack.channel`: Channel the message sent to.
+    - `slack.template_key`: Template key of the message.
+    - `slack.component`: Class name of middleware or backend.
+    - `slack.ok`: Whether the delivery succeeded, set on `slack_message.deliver` spans.
+
+    Together with `DjangoDatabasePersister` writes and Celery tasks of this package, which continue the traces
+    on their own if `opentelemetry-api` is installed, it shows where the time sending a message goes.
+    """
+
+    def __init__(self, *, tracer_provider: TracerProvider | None = None) -> None:
+        """Initialize instrument.
+
+        Args:
+            tracer_provider: Tracer provider to create spans with. Defaults to the global tracer provider.
+        """
+        self.tracer = trace.get_tracer(TRACER_NAME, tracer_provider=tracer_provider)
+
+    def stage(  # noqa: D102
+        self,
+        messenger: BaseMessenger,
+        stage: Stage,
+        request: MessageRequest | None,
+        **attributes: Any,
+    ) -> AbstractContextManager[Any]:
+        component = attributes.get("component")
+        span_attributes = {"slack.messenger": messenger.name}
+        if request is not None:
+            span_attributes["slack.channel"] = request.channel
+            if request.template_key is not None:
+                span_attributes["slack.template_key"] = request.template_key
+
+        if component is not None:
+            span_attributes["slack.component"] = component
+
+        name = f"slack_message.{stage} {component}" if component else f"slack_message.{stage}"
+        return self.tracer.start_as_current_span(name, attributes=span_attributes)
+
+    def on_response(self, messenger: BaseMessenger, response: MessageResponse) -> None:  # noqa: ARG002
+        """Record the delivery result to the delivery span."""
+        span = trace.get_current_span()
+        span.set_attribute("slack.ok", response.ok)
+        if not response.ok:
+            error = response.data.get("error") if isinstance(response.data, dict) else None
+            span.set_status(Status(StatusCode.ERROR, error or "Delivery failed"))
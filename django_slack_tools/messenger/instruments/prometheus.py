@@ -0,0 +1,150 @@
+"""Instrument exporting metrics of messengers to Prometheus.
+
+It requires `prometheus-client` package, which can be installed with `django-slack-tools[prometheus]` extra.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+
+from django_slack_tools.messenger.backends.rate_limited import RateLimitedBackend
+
+from .base import BaseInstrument
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django_slack_tools.messenger.messenger import BaseMessenger
+    from django_slack_tools.messenger.request import MessageRequest
+    from django_slack_tools.messenger.response import MessageResponse
+
+    from .base import Stage
+
+
+@dataclass(frozen=True)
+class _Metrics:
+    stage_duration: Histogram
+    messages: Counter
+    queue_depth: Gauge
+
+
+# Metrics can be registered only once for each registry, so share them across instruments
+_metrics_lock = threading.Lock()
+_metrics: weakref.WeakKeyDictionary[CollectorRegistry, dict[str, _Metrics]] = weakref.WeakKeyDictionary()
+
+
+def _get_metrics(registry: CollectorRegistry, namespace: str) -> _Metrics:
+    with _metrics_lock:
+        by_namespace = _metrics.setdefault(registry, {})
+        if namespace not in by_namespace:
+            by_namespace[namespace] = _Metrics(
+                stage_duration=Histogram(
+                    "stage_duration_seconds",
+                    "Time spent in each stage of sending messages.",
+                    labelnames=("messenger", "stage", "component"),
+                    namespace=namespace,
+                    registry=registry,
+                ),
+                messages=Counter(
+                    "messages",
+                    "Messages delivered by backends, by status: ok, ratelimited or error.",
+                    labelnames=("messenger", "template_key", "backend", "status"),
+                    namespace=namespace,
+                    registry=registry,
+                ),
+                queue_depth=Gauge(
+                    "queue_depth",
+                    "Messages waiting in buffering middlewares or rate limited backends.",
+                    labelnames=("messenger", "component"),
+                    namespace=namespace,
+                    registry=registry,
+                ),
+            )
+
+        return by_namespace[namespace]
+
+
+class PrometheusInstrument(BaseInstrument):
+    """Instrument recording metrics of messengers with `prometheus_client`.
+
+    Following metrics are recorded, labelled with name of messenger:
+
+    - `<namespace>_stage_duration_seconds`: Histogram of time spent in each stage, with class name of middleware or
+        backend as `component` where applicable.
+    - `<namespace>_messages_total`: Counter of messages delivered by backend, by template key, backend class
+        and status (`"ok"`, `"ratelimited"` or `"error"`).
+    - `<namespace>_queue_depth`: Gauge of messages waiting in middlewares buffering them, such as
+        `CoalescingMiddleware`, or in `RateLimitedBackend`.
+
+    Metrics are exposed as any other metrics of `prometheus_client`, e.g. with `prometheus_client.start_http_server()`
+    or through `django-prometheus`.
+    """
+
+    def __init__(self, *, registry: CollectorRegistry | None = None, namespace: str = "django_slack_tools") -> None:
+        """Initialize instrument.
+
+        Args:
+            registry: Registry to register metrics to. Defaults to the global registry.
+            namespace: Prefix of metric names.
+        """
+        self.registry = registry if registry is not None else REGISTRY
+        self.namespace = namespace
+        self._metrics = _get_metrics(self.registry, namespace)
+
+    def bind(self, messenger: BaseMessenger) -> None:  # noqa: D102
+        for middleware in messenger.middlewares:
+            if isinstance(getattr(type(middleware), "pending", None), property):
+                self._metrics.queue_depth.labels(
+                    messenger=messenger.name,
+                    component=type(middleware).__name__,
+                ).set_function(lambda middleware=middleware: middleware.pending)  # type: ignore[misc]
+
+        backend = messenger.messaging_backend
+        if isinstance(backend, RateLimitedBackend):
+            self._metrics.queue_depth.labels(
+                messenger=messenger.name,
+                component=type(backend).__name__,
+            ).set_function(lambda: backend.counters.queued)
+
+    @contextmanager
+    def stage(
+        self,
+        messenger: BaseMessenger,
+        stage: Stage,
+        request: MessageRequest | None,  # noqa: ARG002
+        **attributes: Any,
+    ) -> Iterator[None]:
+        """Observe time spent in the stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._metrics.stage_duration.labels(
+                messenger=messenger.name,
+                stage=stage,
+                component=attributes.get("component", ""),
+            ).observe(time.perf_counter() - start)
+
+    def on_response(self, messenger: BaseMessenger, response: MessageResponse) -> None:
+        """Count the delivered message by status."""
+        if response.ok:
+            status = "ok"
+        elif isinstance(response.data, dict) and response.data.get("error") == "ratelimited":
+            status = "ratelimited"
+        else:
+            status = "error"
+
+        request = response.request
+        self._metrics.messages.labels(
+            messenger=messenger.name,
+            template_key=(request.template_key if request is not None else None) or "",
+            backend=type(messenger.messaging_backend).__name__,
+            status=status,
+        ).inc()
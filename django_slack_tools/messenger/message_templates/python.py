@@ -2,37 +2,180 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, TypeVar
+import string
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from django_slack_tools.utils.repr import LazyStr
 
 from .base import BaseTemplate
 
+if TYPE_CHECKING:
+    from typing import Callable
+
 _PyObj = TypeVar("_PyObj", dict, list, str)
 
 logger = logging.getLogger(__name__)
 
 
 class PythonTemplate(BaseTemplate[_PyObj]):
-    """Template that renders a dictionary."""
+    """Template that renders a dictionary.
+
+    Template is compiled once on initialization; static parts of the template are prepared in advance,
+    so that only the strings with replacement fields (e.g. `"Hello, {name}!"`) are formatted on rendering.
+    """
+
+    _template: _PyObj
 
     def __init__(self, template: _PyObj) -> None:
         """Initialize the template."""
         self.template = template
 
+    @property
+    def template(self) -> _PyObj:
+        """Template object."""
+        return self._template
+
+    @template.setter
+    def template(self, template: _PyObj) -> None:
+        self._template = template
+        self._compiled = _CompiledTemplate(template)
+
     def render(self, context: dict[str, Any]) -> _PyObj:  # noqa: D102
-        logger.debug("Rendering template %r with context %r", self.template, context)
-        result = _format_obj(self.template, context=context)
-        logger.debug("Rendered template %r to %r", self.template, result)
+        # Context and rendered tree could be large, so log only what is cheap to format
+        logger.debug("Rendering template with context keys: %s", LazyStr(lambda: ", ".join(context)))
+        result: _PyObj = self._compiled.render(context)
         return result
 
 
-def _format_obj(obj: _PyObj, *, context: dict[str, Any]) -> _PyObj:
+class _CompiledTemplate:
+    """Template object prepared for fast rendering.
+
+    Each container is compiled to a base holding its static values, prepared in advance (e.g. braces unescaped),
+    and slots of keys or indices to fill with rendered children; nested containers and strings containing
+    replacement fields. Rendering copies the bases shallowly and fills the slots, so static parts are not
+    walked again. Strings of a single replacement field (e.g. `"{name}"`) are parsed in advance too.
+    """
+
+    def __init__(self, template: Any) -> None:
+        self._root = _compile(template)
+
+    def render(self, context: dict[str, Any]) -> Any:
+        return self._root.render(context) if isinstance(self._root, _Slot) else self._root
+
+
+class _Slot(ABC):
+    """Part of template rendered on each rendering."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def render(self, context: dict[str, Any]) -> Any:
+        """Render the part with given context."""
+
+
+class _ContainerSlot(_Slot):
+    """Dictionary or list, copied from base with slots filled in."""
+
+    __slots__ = ("base", "slots")
+
+    def __init__(self, base: dict[Any, Any] | list[Any], slots: list[tuple[Any, _Slot]]) -> None:
+        self.base = base
+        # Bound methods looked up once, as rendering calls them for every container
+        self.slots = [(key, slot.render) for key, slot in slots]
+
+    def render(self, context: dict[str, Any]) -> Any:
+        result = self.base.copy()
+        for key, render in self.slots:
+            result[key] = render(context)
+
+        return result
+
+
+class _FormatSlot(_Slot):
+    """String with replacement fields."""
+
+    __slots__ = ("field", "value")
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+        self.field = _parse_single_field(value)
+
+    def render(self, context: dict[str, Any]) -> str:
+        if self.field is None:
+            return self.value.format_map(context)
+
+        name, conversion, format_spec = self.field
+        obj = context[name]
+        if conversion is not None:
+            obj = _CONVERSIONS[conversion](obj)
+
+        return format(obj, format_spec)
+
+
+_CONVERSIONS: dict[str, Callable[[object], str]] = {"r": repr, "s": str, "a": ascii}
+
+
+def _compile(obj: Any) -> Any:
+    """Compile template object to a slot, or to a static value prepared in advance if it needs no rendering."""
+    # Containers are always copied to not share the same object between multiple places in the result
     if isinstance(obj, dict):
-        return {key: _format_obj(value, context=context) for key, value in obj.items()}
+        base: dict[Any, Any] = {}
+        slots: list[tuple[Any, _Slot]] = []
+        for key, value in obj.items():
+            base[key] = _compile(value)
+            if isinstance(base[key], _Slot):
+                slots.append((key, base[key]))
+                base[key] = None
+
+        return _ContainerSlot(base, slots)
 
     if isinstance(obj, list):
-        return [_format_obj(item, context=context) for item in obj]
+        items = [_compile(item) for item in obj]
+        slots = [(i, item) for i, item in enumerate(items) if isinstance(item, _Slot)]
+        return _ContainerSlot([None if isinstance(item, _Slot) else item for item in items], slots)
 
     if isinstance(obj, str):
-        return obj.format_map(context)
+        if _has_replacement_fields(obj):
+            return _FormatSlot(obj)
+
+        # Still need formatting to unescape braces, e.g. `"{{"` -> `"{"`
+        return obj.format_map({})
 
     return obj
+
+
+def _parse_single_field(value: str) -> tuple[str, str | None, str] | None:
+    """Parse string consisting of a single replacement field by name, e.g. `"{name!r:>10}"`.
+
+    Returns `None` for any other strings, such as with literal text, attribute or index lookups
+    and nested replacement fields, which are left to `str.format_map()`.
+    """
+    try:
+        parsed = list(string.Formatter().parse(value))
+    except ValueError:
+        return None
+
+    if len(parsed) != 1:
+        return None
+
+    literal, field_name, format_spec, conversion = parsed[0]
+    if (
+        literal
+        or field_name is None
+        or not field_name.isidentifier()
+        or (conversion is not None and conversion not in _CONVERSIONS)
+        or "{" in (format_spec or "")
+    ):
+        return None
+
+    return field_name, conversion, format_spec or ""
+
+
+def _has_replacement_fields(value: str) -> bool:
+    """Check the string has any replacement fields. Malformed strings are treated as having fields."""
+    try:
+        return any(field_name is not None for _, field_name, _, _ in string.Formatter().parse(value))
+    except ValueError:
+        # Let it fail on rendering, as it was
+        return True
@@ -1,40 +1,54 @@
 # noqa: D100
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
 from typing import TYPE_CHECKING, Any
 
+from asgiref.sync import sync_to_async
+
+from django_slack_tools.utils.repr import LazyStr
+
 from .backends import BaseBackend
+from .instruments import BaseInstrument
 from .middlewares import BaseMiddleware
 from .request import MessageBody, MessageHeader, MessageRequest
+from .response import MessageResponse
 from .template_loaders import BaseTemplateLoader, TemplateNotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Iterable, Iterator, Sequence
+    from contextlib import AbstractContextManager
 
+    from .instruments import Stage
     from .message_templates import BaseTemplate
-    from .response import MessageResponse
 
 logger = logging.getLogger(__name__)
 
+_NO_INSTRUMENT = nullcontext()
 
-class Messenger:
-    """Messenger class that sends message using templates and middlewares.
 
-    Components evaluated in order:
+class BaseMessenger:
+    """Base class of messengers, holding the components and the stages shared by `Messenger` and `AsyncMessenger`.
 
-    1. Request processing middlewares
-    2. Load template by key and render message in-place
-    4. Send message
-    5. Response processing middlewares (in reverse order)
+    Sending messages is left to subclasses, which are not interchangeable as one sends synchronously and
+    the other with coroutines.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         template_loaders: Sequence[BaseTemplateLoader],
         middlewares: Sequence[BaseMiddleware],
         messaging_backend: BaseBackend,
+        instruments: Sequence[BaseInstrument] = (),
+        name: str = "",
+        verbose_sample_rate: float = 0.0,
+        trusted_internal: bool = False,
     ) -> None:
         """Initialize the Messenger.
 
@@ -44,6 +58,13 @@ def __init__(
             middlewares: A sequence of middlewares.
                 Middlewares are applied in the order they are provided for request, and in reverse order for response.
             messaging_backend: The messaging backend to be used.
+            instruments: A sequence of instruments observing the stages.
+            name: Name of messenger, such as the key in app settings. Used to tell messengers apart by instruments.
+            verbose_sample_rate: Fraction of requests logged in whole at INFO level, for debugging.
+                Other requests are logged with their IDs and sizes only, as formatting whole of them is costly.
+            trusted_internal: If `True`, messages rendered by templates are trusted and constructed without
+                validation. Requests given by callers are still validated. Faster for messages with many blocks,
+                but messages of broken templates fail at delivery rather than at rendering.
         """
         # Validate the template loaders
         for tl in template_loaders:
@@ -68,6 +89,118 @@ def __init__(
 
         self.messaging_backend = messaging_backend
 
+        # Validate the instruments
+        for instrument in instruments:
+            if not isinstance(instrument, BaseInstrument):
+                msg = f"Expected inherited from {BaseInstrument!s}, got {type(instrument)}"
+                raise TypeError(msg)
+
+        if not 0 <= verbose_sample_rate <= 1:
+            msg = f"`verbose_sample_rate` must be between 0 and 1, got {verbose_sample_rate!r}"
+            raise ValueError(msg)
+
+        self.instruments = instruments
+        self.name = name
+        self.verbose_sample_rate = verbose_sample_rate
+        self.trusted_internal = trusted_internal
+        for instrument in instruments:
+            instrument.bind(self)
+
+    def _render_message(self, request: MessageRequest, *, templates: dict[str, BaseTemplate] | None = None) -> None:
+        """Updates the request with rendered message, in-place.
+
+        If `templates` is given, it is used as cache of loaded templates by key.
+        """
+        if request.body is not None:
+            logger.debug("Request already has a body, skipping rendering")
+            return
+
+        if request.template_key is None:
+            msg = "Template key is required to render the message"
+            raise ValueError(msg)
+
+        if templates is not None and request.template_key in templates:
+            template = templates[request.template_key]
+        else:
+            with self._instrument("load_template", request, template_key=request.template_key):
+                template = self._get_template(request.template_key)
+
+            if templates is not None:
+                templates[request.template_key] = template
+
+        logger.debug("Rendering request %s with template: %s", request.id_, template)
+        with self._instrument("render", request, template_key=request.template_key):
+            rendered = template.render(request.context)
+            if self.trusted_internal and isinstance(rendered, dict):
+                request.body = MessageBody.from_trusted(rendered)
+            else:
+                request.body = MessageBody.model_validate(rendered)
+
+    def _render_messages(self, requests: Iterable[MessageRequest | MessageResponse | None]) -> None:
+        """Updates requests of a batch with rendered messages in-place, loading each template once."""
+        templates: dict[str, BaseTemplate] = {}
+        for request in requests:
+            if isinstance(request, MessageRequest):
+                self._render_message(request, templates=templates)
+
+    def _get_template(self, key: str) -> BaseTemplate:
+        """Loads the template by key."""
+        for loader in self.template_loaders:
+            template = loader.load(key)
+            if template is not None:
+                return template
+
+        msg = f"Template with key '{key}' not found"
+        raise TemplateNotFoundError(msg)
+
+    def _sample_verbose(self) -> bool:
+        """Whether to log current request in whole."""
+        return self.verbose_sample_rate > 0 and random.random() < self.verbose_sample_rate  # noqa: S311
+
+    def _instrument(
+        self,
+        stage: Stage,
+        request: MessageRequest | None,
+        **attributes: Any,
+    ) -> AbstractContextManager[Any]:
+        """Context manager wrapping a stage with instruments."""
+        if not self.instruments:
+            return _NO_INSTRUMENT
+
+        return self._instrumented(stage, request, **attributes)
+
+    @contextmanager
+    def _instrumented(self, stage: Stage, request: MessageRequest | None, **attributes: Any) -> Iterator[None]:
+        with ExitStack() as stack:
+            for instrument in self.instruments:
+                stack.enter_context(instrument.stage(self, stage, request, **attributes))
+
+            yield
+
+    def _notify_response(self, response: MessageResponse) -> None:
+        for instrument in self.instruments:
+            instrument.on_response(self, response)
+
+
+class Messenger(BaseMessenger):
+    """Messenger class that sends message using templates and middlewares.
+
+    Components evaluated in order:
+
+    1. Request processing middlewares
+    2. Load template by key and render message in-place
+    4. Send message
+    5. Response processing middlewares (in reverse order)
+
+    Request processing middlewares may respond to the request by themselves, e.g. with the cached response of
+    a duplicate request. Then rest of the stages are skipped and the response is returned as is.
+
+    If a stage raises, or a middleware stops or responds to the request, middlewares which processed the request
+    but won't process its response are released (see `BaseMiddleware.release()`).
+
+    Each stage is observed by instruments, if any, to collect metrics and traces.
+    """
+
     def send(
         self,
         to: str,
@@ -75,84 +208,405 @@ def send(
         template: str | None = None,
         context: dict[str, str],
         header: MessageHeader | dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> MessageResponse | None:
         """Simplified shortcut for `.send_request()`."""
         header = MessageHeader.model_validate(header or {})
-        request = MessageRequest(template_key=template, channel=to, context=context, header=header)
+        request = MessageRequest(
+            template_key=template,
+            channel=to,
+            context=context,
+            header=header,
+            idempotency_key=idempotency_key,
+        )
         return self.send_request(request=request)
 
     def send_request(self, request: MessageRequest) -> MessageResponse | None:
         """Sends a message request and processes the response."""
-        logger.info("Sending request: %s", request)
-        _request = self._process_request(request)
-        if _request is None:
-            return None
-
-        self._render_message(_request)
-        response = self._deliver_message(_request)
-        _response = self._process_response(response)
-        if _response is None:
-            return None
-
-        logger.info("Response: %s", _response)
+        verbose = self._sample_verbose()
+        logger.info("Sending request: %s", request if verbose else LazyStr(request.summary))
+        pending: list[tuple[BaseMiddleware, MessageRequest]] = []
+        with self._instrument("send", request, template_key=request.template_key):
+            try:
+                _request = self._process_request(request, pending=pending)
+                if _request is None or isinstance(_request, MessageResponse):
+                    return _request
+
+                self._render_message(_request)
+                response = self._deliver_message(_request)
+                _response = self._process_response(response, pending=pending)
+                if _response is None:
+                    return None
+            finally:
+                self._release(pending)
+
+        logger.info("Response: %s", _response if verbose else LazyStr(_response.summary))
         return response
 
-    def _process_request(self, request: MessageRequest) -> MessageRequest | None:
-        """Processes the request with middlewares in forward order."""
+    def send_many(
+        self,
+        requests: Iterable[MessageRequest],
+        *,
+        max_workers: int = 8,
+    ) -> Iterator[MessageResponse | None]:
+        """Sends multiple message requests at once, streaming back the responses in input order.
+
+        Each stage is applied to the whole batch before moving on to the next one:
+
+        1. Request processing middlewares are applied to every request
+        2. Templates are loaded once per template key and messages rendered
+        3. Messages are delivered concurrently through a bounded thread pool
+        4. Response processing middlewares are applied as each delivery completes, in input order
+        5. Middlewares are flushed (see `.flush()`) once the batch is done
+
+        Args:
+            requests: Message requests to send.
+            max_workers: Maximum number of concurrent deliveries.
+
+        Yields:
+            Response for each request, in the same order as given. `None` if a middleware stopped the request
+            or its response, so position of the results always matches the requests.
+        """
+        if max_workers < 1:
+            msg = f"`max_workers` must be greater than 0, got {max_workers}"
+            raise ValueError(msg)
+
+        pendings: list[list[tuple[BaseMiddleware, MessageRequest]]] = []
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="messenger")
+        try:
+            # Stages before the delivery should complete for all requests before anything is sent out
+            processed = self._process_requests(requests, pendings=pendings)
+
+            logger.info("Sending %d requests in batch", len(processed))
+            self._render_messages(processed)
+
+            # ? Responses are yielded in input order; a slow delivery holds back the completed ones behind it
+            futures: list[Future[MessageResponse] | MessageResponse | None] = [
+                # Deliveries run in the context of caller, e.g. to continue its trace
+                executor.submit(contextvars.copy_context().run, self._deliver_message, request)
+                if isinstance(request, MessageRequest)
+                else request
+                for request in processed
+            ]
+            for future, pending in zip(futures, pendings):
+                if isinstance(future, Future):
+                    yield self._process_response(future.result(), pending=pending)
+                else:
+                    yield future
+        finally:
+            # Stop pending deliveries if the consumer gave up the generator early
+            executor.shutdown(wait=True, cancel_futures=True)
+            for pending in pendings:
+                self._release(pending)
+
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush pending work of the middlewares, such as buffered writes."""
         for middleware in self.middlewares:
-            logger.debug("Processing request (%s) with middleware %s", request, middleware)
-            new_request = middleware.process_request(request)
-            if new_request is None:
-                logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
-                return None
+            logger.debug("Flushing middleware: %s", middleware)
+            middleware.flush()
 
-            request = new_request
+    def _process_requests(
+        self,
+        requests: Iterable[MessageRequest],
+        *,
+        pendings: list[list[tuple[BaseMiddleware, MessageRequest]]],
+    ) -> list[MessageRequest | MessageResponse | None]:
+        """Processes requests of a batch, appending middlewares pending for each request to `pendings`."""
+        processed = []
+        for request in requests:
+            pendings.append([])
+            processed.append(self._process_request(request, pending=pendings[-1]))
 
-        logger.debug("Request after processing: %s", request)
+        return processed
+
+    def _process_request(
+        self,
+        request: MessageRequest,
+        *,
+        pending: list[tuple[BaseMiddleware, MessageRequest]],
+    ) -> MessageRequest | MessageResponse | None:
+        """Processes the request with middlewares in forward order.
+
+        Middlewares passing the request are appended to `pending` with the request they processed.
+        """
+        with self._instrument("process_request", request):
+            for middleware in self.middlewares:
+                logger.debug("Processing request %s with middleware %s", request.id_, middleware)
+                with self._instrument("middleware_request", request, component=type(middleware).__name__):
+                    new_request = middleware.process_request(request)
+
+                if isinstance(new_request, MessageRequest):
+                    pending.append((middleware, request))
+
+                if new_request is None:
+                    logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
+                    return None
+
+                if isinstance(new_request, MessageResponse):
+                    logger.info("Middleware %s responded to request, skipping remaining stages", middleware)
+                    return new_request
+
+                request = new_request
+
+        logger.debug("Request after processing: %s", LazyStr(request.summary))
         return request
 
-    def _render_message(self, request: MessageRequest) -> None:
-        """Updates the request with rendered message, in-place."""
-        if request.body is not None:
-            logger.debug("Request already has a body, skipping rendering")
-            return
+    def _deliver_message(self, request: MessageRequest) -> MessageResponse:
+        """Invoke the messaging backend to deliver the message."""
+        logger.debug("Delivering message request: %s", LazyStr(request.summary))
+        with self._instrument("deliver", request, component=type(self.messaging_backend).__name__):
+            response = self.messaging_backend.deliver(request)
+            self._notify_response(response)
 
-        if request.template_key is None:
-            msg = "Template key is required to render the message"
+        logger.debug("Response after delivery: %s", LazyStr(response.summary))
+        return response
+
+    def _process_response(
+        self,
+        response: MessageResponse,
+        *,
+        pending: list[tuple[BaseMiddleware, MessageRequest]],
+    ) -> MessageResponse | None:
+        """Processes the response with middlewares in reverse order.
+
+        Middlewares are removed from `pending` as they process the response.
+        """
+        with self._instrument("process_response", response.request):
+            for middleware in reversed(self.middlewares):
+                pending.pop()
+
+                logger.debug("Processing response %s with middleware %s", LazyStr(response.summary), middleware)
+                with self._instrument("middleware_response", response.request, component=type(middleware).__name__):
+                    new_response = middleware.process_response(response)
+
+                if new_response is None:
+                    logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
+                    return None
+
+                response = new_response
+
+        logger.debug("Response after processing: %s", LazyStr(response.summary))
+        return response
+
+    def _release(self, pending: list[tuple[BaseMiddleware, MessageRequest]]) -> None:
+        """Release middlewares which processed requests but not their responses, in reverse order."""
+        while pending:
+            middleware, request = pending.pop()
+            logger.debug("Releasing request %s with middleware %s", request.id_, middleware)
+            try:
+                middleware.release(request)
+            except Exception:
+                logger.exception("Error while releasing request %s with middleware %s", request.id_, middleware)
+
+
+class AsyncMessenger(BaseMessenger):
+    """Messenger natively supporting asyncio.
+
+    It works in same order as `Messenger`, but middlewares are applied with their async hooks
+    (`.aprocess_request()` and `.aprocess_response()`) and messages are delivered with `.adeliver()` of the backend.
+    Use an async backend, such as `AsyncSlackBackend`, to keep the deliveries from occupying threads.
+
+    Loading and rendering templates, which may involve database queries, are done in a thread.
+
+    It is not a `Messenger`, as its methods are coroutines. Middlewares sending messages by themselves,
+    such as `DjangoDatabasePolicyHandler`, expect a synchronous `Messenger` for them.
+    """
+
+    async def send(
+        self,
+        to: str,
+        *,
+        template: str | None = None,
+        context: dict[str, str],
+        header: MessageHeader | dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> MessageResponse | None:
+        """Simplified shortcut for `.send_request()`."""
+        header = MessageHeader.model_validate(header or {})
+        request = MessageRequest(
+            template_key=template,
+            channel=to,
+            context=context,
+            header=header,
+            idempotency_key=idempotency_key,
+        )
+        return await self.send_request(request=request)
+
+    async def send_request(self, request: MessageRequest) -> MessageResponse | None:
+        """Sends a message request and processes the response."""
+        verbose = self._sample_verbose()
+        logger.info("Sending request: %s", request if verbose else LazyStr(request.summary))
+        pending: list[tuple[BaseMiddleware, MessageRequest]] = []
+        with self._instrument("send", request, template_key=request.template_key):
+            try:
+                _request = await self._aprocess_request(request, pending=pending)
+                if _request is None or isinstance(_request, MessageResponse):
+                    return _request
+
+                await sync_to_async(self._render_message)(_request)
+                response = await self._adeliver_message(_request)
+                _response = await self._aprocess_response(response, pending=pending)
+                if _response is None:
+                    return None
+            finally:
+                await self._arelease(pending)
+
+        logger.info("Response: %s", _response if verbose else LazyStr(_response.summary))
+        return response
+
+    async def send_many(
+        self,
+        requests: Iterable[MessageRequest],
+        *,
+        max_concurrency: int = 100,
+    ) -> AsyncGenerator[MessageResponse | None, None]:
+        """Sends multiple message requests at once, streaming back the responses in input order.
+
+        Works same as `Messenger.send_many()`, except deliveries are run concurrently in the event loop.
+
+        Args:
+            requests: Message requests to send.
+            max_concurrency: Maximum number of deliveries in flight.
+
+        Yields:
+            Response for each request, in the same order as given. `None` if a middleware stopped the request
+            or its response, so position of the results always matches the requests.
+        """
+        if max_concurrency < 1:
+            msg = f"`max_concurrency` must be greater than 0, got {max_concurrency}"
             raise ValueError(msg)
 
-        template = self._get_template(request.template_key)
-        logger.debug("Rendering request %s with template: %s", request, template)
-        rendered = template.render(request.context)
-        request.body = MessageBody.model_validate(rendered)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _deliver(request: MessageRequest) -> MessageResponse:
+            async with semaphore:
+                return await self._adeliver_message(request)
+
+        pendings: list[list[tuple[BaseMiddleware, MessageRequest]]] = []
+        tasks: list[asyncio.Future[MessageResponse] | MessageResponse | None] = []
+        try:
+            processed = await self._aprocess_requests(requests, pendings=pendings)
+
+            logger.info("Sending %d requests in batch", len(processed))
+            await sync_to_async(self._render_messages)(processed)
+
+            tasks = [
+                asyncio.ensure_future(_deliver(request)) if isinstance(request, MessageRequest) else request
+                for request in processed
+            ]
+            for task, pending in zip(tasks, pendings):
+                if isinstance(task, asyncio.Future):
+                    yield await self._aprocess_response(await task, pending=pending)
+                else:
+                    yield task
+        finally:
+            # Stop pending deliveries if the consumer gave up the generator early
+            for task in tasks:
+                if isinstance(task, asyncio.Future):
+                    task.cancel()
+
+            for pending in pendings:
+                await self._arelease(pending)
+
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Flush pending work of the middlewares, such as buffered writes."""
+        for middleware in self.middlewares:
+            logger.debug("Flushing middleware: %s", middleware)
+            await middleware.aflush()
 
-    def _get_template(self, key: str) -> BaseTemplate:
-        """Loads the template by key."""
-        for loader in self.template_loaders:
-            template = loader.load(key)
-            if template is not None:
-                return template
+    async def _aprocess_requests(
+        self,
+        requests: Iterable[MessageRequest],
+        *,
+        pendings: list[list[tuple[BaseMiddleware, MessageRequest]]],
+    ) -> list[MessageRequest | MessageResponse | None]:
+        """Processes requests of a batch, appending middlewares pending for each request to `pendings`."""
+        processed = []
+        for request in requests:
+            pendings.append([])
+            processed.append(await self._aprocess_request(request, pending=pendings[-1]))
 
-        msg = f"Template with key '{key}' not found"
-        raise TemplateNotFoundError(msg)
+        return processed
 
-    def _deliver_message(self, request: MessageRequest) -> MessageResponse:
+    async def _aprocess_request(
+        self,
+        request: MessageRequest,
+        *,
+        pending: list[tuple[BaseMiddleware, MessageRequest]],
+    ) -> MessageRequest | MessageResponse | None:
+        """Processes the request with middlewares in forward order.
+
+        Middlewares passing the request are appended to `pending` with the request they processed.
+        """
+        with self._instrument("process_request", request):
+            for middleware in self.middlewares:
+                logger.debug("Processing request %s with middleware %s", request.id_, middleware)
+                with self._instrument("middleware_request", request, component=type(middleware).__name__):
+                    new_request = await middleware.aprocess_request(request)
+
+                if isinstance(new_request, MessageRequest):
+                    pending.append((middleware, request))
+
+                if new_request is None:
+                    logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
+                    return None
+
+                if isinstance(new_request, MessageResponse):
+                    logger.info("Middleware %s responded to request, skipping remaining stages", middleware)
+                    return new_request
+
+                request = new_request
+
+        logger.debug("Request after processing: %s", LazyStr(request.summary))
+        return request
+
+    async def _adeliver_message(self, request: MessageRequest) -> MessageResponse:
         """Invoke the messaging backend to deliver the message."""
-        logger.debug("Delivering message request: %s", request)
-        response = self.messaging_backend.deliver(request)
-        logger.debug("Response after delivery: %s", response)
+        logger.debug("Delivering message request: %s", LazyStr(request.summary))
+        with self._instrument("deliver", request, component=type(self.messaging_backend).__name__):
+            response = await self.messaging_backend.adeliver(request)
+            self._notify_response(response)
+
+        logger.debug("Response after delivery: %s", LazyStr(response.summary))
         return response
 
-    def _process_response(self, response: MessageResponse) -> MessageResponse | None:
-        """Processes the response with middlewares in reverse order."""
-        for middleware in reversed(self.middlewares):
-            logger.debug("Processing response (%s) with middleware: %s", response, middleware)
-            new_response = middleware.process_response(response)
-            if new_response is None:
-                logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
-                return None
+    async def _aprocess_response(
+        self,
+        response: MessageResponse,
+        *,
+        pending: list[tuple[BaseMiddleware, MessageRequest]],
+    ) -> MessageResponse | None:
+        """Processes the response with middlewares in reverse order.
 
-            response = new_response
+        Middlewares are removed from `pending` as they process the response.
+        """
+        with self._instrument("process_response", response.request):
+            for middleware in reversed(self.middlewares):
+                pending.pop()
 
-        logger.debug("Response after processing: %s", response)
+                logger.debug("Processing response %s with middleware %s", LazyStr(response.summary), middleware)
+                with self._instrument("middleware_response", response.request, component=type(middleware).__name__):
+                    new_response = await middleware.aprocess_response(response)
+
+                if new_response is None:
+                    logger.warning("Middleware %s returned `None`, skipping remaining middlewares", middleware)
+                    return None
+
+                response = new_response
+
+        logger.debug("Response after processing: %s", LazyStr(response.summary))
         return response
+
+    async def _arelease(self, pending: list[tuple[BaseMiddleware, MessageRequest]]) -> None:
+        """Release middlewares which processed requests but not their responses, in reverse order."""
+        while pending:
+            middleware, request = pending.pop()
+            logger.debug("Releasing request %s with middleware %s", request.id_, middleware)
+            try:
+                await middleware.arelease(request)
+            except Exception:
+                logger.exception("Error while releasing request %s with middleware %s", request.id_, middleware)
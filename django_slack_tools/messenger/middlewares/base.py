@@ -3,6 +3,8 @@
 
 from typing import TYPE_CHECKING
 
+from asgiref.sync import sync_to_async
+
 if TYPE_CHECKING:
     from django_slack_tools.messenger.request import MessageRequest
     from django_slack_tools.messenger.response import MessageResponse
@@ -11,14 +13,18 @@
 class BaseMiddleware:
     """Base class for middleware components."""
 
-    def process_request(self, request: MessageRequest) -> MessageRequest | None:  # pragma: no cover
+    def process_request(  # pragma: no cover
+        self,
+        request: MessageRequest,
+    ) -> MessageRequest | MessageResponse | None:
         """Process the incoming requests.
 
         Args:
             request: Message request.
 
         Returns:
-            MessageRequest objects or `None`.
+            MessageRequest objects or `None`. If a `MessageResponse` returned, messenger responds with it
+            without sending the message, skipping remaining middlewares.
         """
         return request
 
@@ -32,3 +38,62 @@ def process_response(self, response: MessageResponse) -> MessageResponse | None:
             MessageResponse objects or `None`.
         """
         return response
+
+    def release(self, request: MessageRequest) -> None:
+        """Release what `.process_request()` holds for a request of which response won't be processed.
+
+        Messengers call this when a later stage raised, or a later middleware stopped or responded to the request
+        or stopped its response, so `.process_response()` is not called for it. Does nothing by default.
+
+        Args:
+            request: Message request, as given to `.process_request()`.
+        """
+
+    def flush(self) -> None:
+        """Flush any pending work of the middleware, such as buffered writes.
+
+        Messengers call this after sending a batch of messages. Does nothing by default.
+        """
+
+    async def aprocess_request(self, request: MessageRequest) -> MessageRequest | MessageResponse | None:
+        """Async version of `.process_request()`, used by `AsyncMessenger`.
+
+        By default, it runs `.process_request()` in a thread. Override this to process requests natively.
+
+        Args:
+            request: Message request.
+
+        Returns:
+            MessageRequest objects, `MessageResponse` to respond with or `None`.
+        """
+        return await sync_to_async(self.process_request)(request)
+
+    async def aprocess_response(self, response: MessageResponse) -> MessageResponse | None:
+        """Async version of `.process_response()`, used by `AsyncMessenger`.
+
+        By default, it runs `.process_response()` in a thread. Override this to process responses natively.
+
+        Args:
+            response: Message response.
+
+        Returns:
+            MessageResponse objects or `None`.
+        """
+        return await sync_to_async(self.process_response)(response)
+
+    async def arelease(self, request: MessageRequest) -> None:
+        """Async version of `.release()`, used by `AsyncMessenger`.
+
+        By default, it runs `.release()` in a thread.
+
+        Args:
+            request: Message request, as given to `.aprocess_request()`.
+        """
+        await sync_to_async(self.release)(request)
+
+    async def aflush(self) -> None:
+        """Async version of `.flush()`, used by `AsyncMessenger`.
+
+        By default, it runs `.flush()` in a thread.
+        """
+        await sync_to_async(self.flush)()
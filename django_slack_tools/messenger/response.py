@@ -18,3 +18,13 @@ class MessageResponse(BaseModel):
     data: Any
     ts: Optional[str] = None
     parent_ts: Optional[str] = None
+
+    def summary(self) -> str:
+        """Short description of the response, cheaper to log than the whole response."""
+        request_id = self.request.id_ if self.request is not None else None
+        error = self.data.get("error") if not self.ok and isinstance(self.data, dict) else None
+        details = f"ok={self.ok}, ts={self.ts!r}"
+        if error:
+            details += f", error={error!r}"
+
+        return f"{request_id} ({details})"
@@ -1,18 +1,30 @@
 """Re-export shortcuts for the messenger module."""
 
-from .backends import BaseBackend, DummyBackend, LoggingBackend, SlackBackend, SlackRedirectBackend
+from .backends import (
+    BaseBackend,
+    DummyBackend,
+    LoggingBackend,
+    RateLimitedBackend,
+    SlackBackend,
+    SlackRedirectBackend,
+)
+from .instruments import BaseInstrument
 from .message_templates import BaseTemplate, PythonTemplate
-from .messenger import Messenger
+from .messenger import AsyncMessenger, BaseMessenger, Messenger
 from .middlewares import BaseMiddleware
 from .request import MessageBody, MessageHeader, MessageRequest
 from .response import MessageResponse
-from .template_loaders import BaseTemplateLoader, TemplateLoadError, TemplateNotFoundError
+from .template_loaders import BaseTemplateLoader, CachedTemplateLoader, TemplateLoadError, TemplateNotFoundError
 
 __all__ = (
+    "AsyncMessenger",
     "BaseBackend",
+    "BaseInstrument",
+    "BaseMessenger",
     "BaseMiddleware",
     "BaseTemplate",
     "BaseTemplateLoader",
+    "CachedTemplateLoader",
     "DummyBackend",
     "LoggingBackend",
     "MessageBody",
@@ -21,6 +33,7 @@
     "MessageResponse",
     "Messenger",
     "PythonTemplate",
+    "RateLimitedBackend",
     "SlackBackend",
     "SlackRedirectBackend",
     "TemplateLoadError",
@@ -1,4 +1,11 @@
 from .base import BaseTemplateLoader
+from .cached import CachedTemplateLoader, invalidate_cached_templates
 from .errors import TemplateLoadError, TemplateNotFoundError
 
-__all__ = ("BaseTemplateLoader", "TemplateLoadError", "TemplateNotFoundError")
+__all__ = (
+    "BaseTemplateLoader",
+    "CachedTemplateLoader",
+    "TemplateLoadError",
+    "TemplateNotFoundError",
+    "invalidate_cached_templates",
+)
@@ -0,0 +1,124 @@
+# noqa: D100
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from logging import getLogger
+from typing import TYPE_CHECKING, NamedTuple
+
+from django_slack_tools.utils.cache import CacheVersion
+from django_slack_tools.utils.import_helper import lazy_init
+
+from .base import BaseTemplateLoader
+
+if TYPE_CHECKING:
+    from django_slack_tools.messenger.shortcuts import BaseTemplate
+    from django_slack_tools.utils.import_helper import LazyInitSupported
+
+logger = getLogger(__name__)
+
+DEFAULT_VERSION_KEY = "django_slack_tools:template_loaders:version"
+"""Default cache key for version of cached templates."""
+
+
+class _Entry(NamedTuple):
+    template: BaseTemplate | None
+    expires_at: float | None
+
+
+class CachedTemplateLoader(BaseTemplateLoader):
+    """Template loader caching the templates loaded by another loader.
+
+    Loaded templates are kept in memory with LRU eviction and optional TTL. Misses (`None`) are cached too,
+    unless disabled. All cached templates are discarded when the cache version changes, which can be done
+    by calling `invalidate_cached_templates()` from any process sharing the Django cache.
+
+    The version shared in Django cache is checked at most once per `version_check_interval` seconds rather
+    than on every load, as it takes a round trip to cache backends such as Redis or Memcached.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        loader: BaseTemplateLoader | LazyInitSupported,
+        *,
+        maxsize: int = 128,
+        ttl: float | None = 300,
+        cache_misses: bool = True,
+        version_key: str = DEFAULT_VERSION_KEY,
+        cache_alias: str = "default",
+        version_check_interval: float = 1.0,
+    ) -> None:
+        """Initialize template loader.
+
+        Args:
+            loader: Template loader to wrap, or lazy init spec of it.
+            maxsize: Maximum number of templates to keep.
+            ttl: Seconds to keep a template for. `None` to keep them until evicted or invalidated.
+            cache_misses: Whether to cache missing templates.
+            version_key: Cache key of version for invalidation.
+            cache_alias: Alias of Django cache storing the version.
+            version_check_interval: Seconds to reuse the version got from Django cache for. Invalidations by
+                other processes take effect after up to this many seconds. `0` to check it on every load.
+
+        Raises:
+            ValueError: Invalid cache size, TTL or version check interval.
+        """
+        if maxsize < 1:
+            msg = f"`maxsize` must be positive, got {maxsize!r}"
+            raise ValueError(msg)
+
+        if ttl is not None and ttl <= 0:
+            msg = f"`ttl` must be positive or `None`, got {ttl!r}"
+            raise ValueError(msg)
+
+        self.loader: BaseTemplateLoader = loader if isinstance(loader, BaseTemplateLoader) else lazy_init(loader)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_misses = cache_misses
+        self.version = CacheVersion(version_key, cache_alias=cache_alias, check_interval=version_check_interval)
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._current_version = self.version.get()
+
+    def load(self, key: str) -> BaseTemplate | None:  # noqa: D102
+        version = self.version.get()
+        now = time.monotonic()
+        with self._lock:
+            if version != self._current_version:
+                logger.debug("Cache version changed, discarding %d cached templates", len(self._entries))
+                self._entries.clear()
+                self._current_version = version
+
+            entry = self._entries.get(key)
+            if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+                self._entries.move_to_end(key)
+                return entry.template
+
+        template = self.loader.load(key)
+        if template is None and not self.cache_misses:
+            return None
+
+        if self.version.get() != version:
+            logger.debug("Cache version changed while loading template %r, not caching it", key)
+            return template
+
+        expires_at = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            self._entries[key] = _Entry(template, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return template
+
+    def clear(self) -> None:
+        """Discard all cached templates of this loader."""
+        with self._lock:
+            self._entries.clear()
+
+
+def invalidate_cached_templates(version_key: str = DEFAULT_VERSION_KEY, *, cache_alias: str = "default") -> None:
+    """Invalidate templates cached by `CachedTemplateLoader`s using given version key, in all processes."""
+    CacheVersion(version_key, cache_alias=cache_alias).bump()
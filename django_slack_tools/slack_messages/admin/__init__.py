@@ -2,5 +2,12 @@
 from .message import SlackMessageAdmin
 from .message_recipient import SlackMessageRecipientAdmin
 from .messaging_policy import SlackMessagingPolicyAdmin
+from .outbox_message import SlackOutboxMessageAdmin
 
-__all__ = ("SlackMentionAdmin", "SlackMessageAdmin", "SlackMessageRecipientAdmin", "SlackMessagingPolicyAdmin")
+__all__ = (
+    "SlackMentionAdmin",
+    "SlackMessageAdmin",
+    "SlackMessageRecipientAdmin",
+    "SlackMessagingPolicyAdmin",
+    "SlackOutboxMessageAdmin",
+)
@@ -1,6 +1,8 @@
 # noqa: D100
 from __future__ import annotations
 
+import logging
+import time
 from typing import TYPE_CHECKING
 
 from django.contrib import admin
@@ -8,28 +10,82 @@
 from django.db import models
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
+from slack_sdk.errors import SlackClientError
 
+from django_slack_tools.app_settings import app_settings
 from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.slack_messages.permalinks import get_team_url
+from django_slack_tools.utils.django.fields import CompressedJSONField
 from django_slack_tools.utils.django.widgets import JSONWidget
+from django_slack_tools.utils.slack import build_permalink
 
 if TYPE_CHECKING:
+    from typing import Any
+
+    from django.http import HttpRequest
     from django_stubs_ext import StrOrPromise
 
+logger = logging.getLogger(__name__)
+
+_TEAM_URL_RETRY_INTERVAL = 300.0
+"""Seconds to wait before fetching workspace URL again after failure."""
+
 
 @admin.register(SlackMessage)
 class SlackMessageAdmin(admin.ModelAdmin):
     """Admin for messages."""
 
-    readonly_fields = ("id", "_link_to_permalink", "created", "last_modified")
+    readonly_fields = ("id", "_link_to_permalink", "_resolve_permalink", "created", "last_modified")
+
+    # Time of last failure fetching workspace URL, not to call Slack API on every page view while failing
+    _team_url_failed_at: float | None = None
 
     @admin.display(description=_("Permalink"))
     def _link_to_permalink(self, instance: SlackMessage) -> StrOrPromise:
-        url = instance.permalink
+        # Missing permalinks are left to `backfill_permalinks` task, not to call Slack API while rendering rows
+        return self._format_permalink(instance.permalink)
+
+    @admin.display(description=_("Permalink"))
+    def _resolve_permalink(self, instance: SlackMessage) -> StrOrPromise:
+        return self._format_permalink(instance.permalink or self._build_permalink(instance))
+
+    def _format_permalink(self, url: str) -> StrOrPromise:
         if not url:
             return _("N/A")
 
         return format_html("<a href='{url}'>{title}</a>", url=url, title=_("Permalink"))
 
+    def _build_permalink(self, instance: SlackMessage) -> str:
+        """Build permalink of sent message missing it, with workspace URL fetched once for the app.
+
+        Failures are remembered for a while and any Slack API or network error is ignored,
+        so that the page renders without permalink.
+        """
+        if not instance.ok or not instance.ts:
+            return ""
+
+        failed_at = self._team_url_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < _TEAM_URL_RETRY_INTERVAL:
+            return ""
+
+        try:
+            team_url = get_team_url(app_settings.slack_app.client)
+        except (SlackClientError, OSError) as err:
+            logger.warning("Failed to get workspace URL to build permalink: %s", err)
+            self._team_url_failed_at = time.monotonic()
+            return ""
+
+        self._team_url_failed_at = None
+        try:
+            return build_permalink(
+                team_url=team_url,
+                channel=instance.channel,
+                ts=instance.ts,
+                thread_ts=instance.parent_ts,
+            )
+        except ValueError:
+            return ""
+
     # Changelist
     # ------------------------------------------------------------------------
     date_hierarchy = "created"
@@ -58,12 +114,13 @@ def _link_to_permalink(self, instance: SlackMessage) -> StrOrPromise:
     # ------------------------------------------------------------------------
     formfield_overrides = {  # noqa: RUF012
         models.JSONField: {"widget": JSONWidget},
+        CompressedJSONField: {"widget": JSONWidget},
     }
     fieldsets = (
         (
             None,
             {
-                "fields": ("policy", "channel", "ok", "ts", "parent_ts", "_link_to_permalink", "header", "body"),
+                "fields": ("policy", "channel", "ok", "ts", "parent_ts", "_resolve_permalink", "header", "body"),
             },
         ),
         (
@@ -75,3 +132,23 @@ def _link_to_permalink(self, instance: SlackMessage) -> StrOrPromise:
         ),
     )
     autocomplete_fields = ("policy",)
+
+    def get_fieldsets(self, request: HttpRequest, obj: SlackMessage | None = None) -> Any:  # noqa: D102
+        fieldsets = super().get_fieldsets(request, obj)
+        if obj is None or (obj.compressed_request is None and obj.compressed_response is None):
+            return fieldsets
+
+        # Show compressed dumps in place of plain ones, for messages saved with them
+        replace = {"request": "compressed_request", "response": "compressed_response"}
+        return [
+            (
+                name,
+                {
+                    **options,
+                    "fields": tuple(
+                        replace.get(field, field) if isinstance(field, str) else field for field in options["fields"]
+                    ),
+                },
+            )
+            for name, options in fieldsets
+        ]
@@ -0,0 +1,75 @@
+# noqa: D100
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib import admin, messages
+from django.contrib.admin.filters import DateFieldListFilter
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_slack_tools.slack_messages.models import SlackOutboxMessage
+from django_slack_tools.utils.django.widgets import JSONWidget
+
+if TYPE_CHECKING:
+    from django.db.models.query import QuerySet
+    from django.http import HttpRequest
+
+
+@admin.register(SlackOutboxMessage)
+class SlackOutboxMessageAdmin(admin.ModelAdmin):
+    """Admin for outbox messages."""
+
+    readonly_fields = ("id", "attempts", "claimed_by", "claimed_until", "created", "last_modified")
+
+    # Actions
+    actions = ("_retry_messages",)
+
+    @admin.action(description=_("Retry selected messages"))
+    def _retry_messages(self, request: HttpRequest, queryset: QuerySet[SlackOutboxMessage]) -> None:
+        """Put selected messages back to outbox, to be sent again by dispatchers."""
+        num_updated = queryset.exclude(status=SlackOutboxMessage.Status.CLAIMED).update(
+            status=SlackOutboxMessage.Status.PENDING,
+            attempts=0,
+            claimed_by="",
+            claimed_until=None,
+        )
+        self.message_user(
+            request,
+            _("{num_updated} messages will be sent again.").format(num_updated=num_updated),
+            messages.SUCCESS,
+        )
+
+    # Changelist
+    # ------------------------------------------------------------------------
+    date_hierarchy = "created"
+    search_fields = ("id", "ts", "messenger_name")
+    list_display = ("id", "status", "attempts", "ok", "ts", "messenger_name", "created", "last_modified")
+    list_display_links = ("id",)
+    list_filter = (
+        "status",
+        "ok",
+        ("created", DateFieldListFilter),
+        ("last_modified", DateFieldListFilter),
+    )
+
+    # Change
+    # ------------------------------------------------------------------------
+    formfield_overrides = {  # noqa: RUF012
+        models.JSONField: {"widget": JSONWidget},
+    }
+    fieldsets = (
+        (
+            None,
+            {
+                "fields": ("messenger_name", "request", "status", "ok", "ts", "error"),
+            },
+        ),
+        (
+            _("Miscellaneous"),
+            {
+                "fields": ("id", "attempts", "claimed_by", "claimed_until", "created", "last_modified"),
+                "classes": ("collapse",),
+            },
+        ),
+    )
@@ -11,7 +11,9 @@ class DjangoSlackBotConfig(AppConfig):  # noqa: D101
     verbose_name = _("Slack Messages")
 
     def ready(self) -> None:  # pragma: no cover
-        """Auto-discover Celery tasks, if Celery is installed."""
+        """Connect signal handlers and auto-discover Celery tasks, if Celery is installed."""
+        from . import signals  # noqa: F401, PLC0415
+
         try:
             import celery  # noqa: F401, PLC0415
         except ImportError:
@@ -0,0 +1,168 @@
+"""Archive saved messages to compressed files, and restore them.
+
+Archives are gzip compressed JSON Lines files, a message per line in format of Django's `jsonl` serializer.
+Messages are streamed from and to database chunk by chunk, so memory use stays constant regardless of
+number of messages.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from typing import TYPE_CHECKING
+
+from django.core import serializers
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections, transaction
+
+from .models import SlackMessage, SlackMessagingPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+    from pathlib import Path
+
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+
+def archive_messages(queryset: QuerySet[SlackMessage], *, path: str | Path, chunk_size: int = 1000) -> int:
+    """Write messages to a gzip compressed JSON Lines file, streaming them from database chunk by chunk.
+
+    Each line is a message in format of Django's `jsonl` serializer, so the archive can be loaded back
+    with `loaddata` command. The file must not exist, so that archives are never overwritten.
+
+    Args:
+        queryset: Messages to archive.
+        path: Path of archive file, usually ending with `.jsonl.gz`.
+        chunk_size: Number of messages to fetch from database at once.
+
+    Returns:
+        Number of archived messages.
+    """
+    if chunk_size < 1:
+        msg = f"`chunk_size` must be greater than 0, got {chunk_size!r}"
+        raise ValueError(msg)
+
+    total = 0
+
+    def count(messages: Iterable[SlackMessage]) -> Iterator[SlackMessage]:
+        nonlocal total
+        for message in messages:
+            total += 1
+            yield message
+
+    with gzip.open(path, "xt", encoding="utf-8") as fp:
+        serializers.serialize("jsonl", count(queryset.order_by("pk").iterator(chunk_size)), stream=fp)
+
+    logger.info("Archived %d messages to %s", total, path)
+    return total
+
+
+def export_messages(  # noqa: PLR0913
+    path: str | Path,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    channel: str | None = None,
+    policy: str | None = None,
+    ok: bool | None = None,
+    chunk_size: int = 1000,
+) -> int:
+    """Write messages matching given filters to an archive file. Filters not given are not applied.
+
+    Args:
+        path: Path of archive file, usually ending with `.jsonl.gz`. The file must not exist.
+        since: Export messages created at or after given time.
+        until: Export messages created before given time.
+        channel: Export messages sent to given channel.
+        policy: Export messages sent with messaging policy of given code.
+        ok: Export messages of which delivery succeeded, or failed if `False`.
+        chunk_size: Number of messages to fetch from database at once.
+
+    Returns:
+        Number of exported messages.
+    """
+    queryset = SlackMessage.objects.all()
+    if since is not None:
+        queryset = queryset.filter(created__gte=since)
+
+    if until is not None:
+        queryset = queryset.filter(created__lt=until)
+
+    if channel is not None:
+        queryset = queryset.filter(channel=channel)
+
+    if policy is not None:
+        queryset = queryset.filter(policy__code=policy)
+
+    if ok is not None:
+        queryset = queryset.filter(ok=ok)
+
+    return archive_messages(queryset, path=path, chunk_size=chunk_size)
+
+
+def import_messages(path: str | Path, *, batch_size: int = 1000, using: str = DEFAULT_DB_ALIAS) -> int:
+    """Restore messages from an archive file, inserting them in batches.
+
+    Messages of which ID exists already are skipped. References to messaging policies no longer exist
+    are cleared, as deleting policies does.
+
+    Args:
+        path: Path of archive file.
+        batch_size: Number of messages to insert at once.
+        using: Database alias.
+
+    Returns:
+        Number of messages read from the archive, including those skipped.
+    """
+    if batch_size < 1:
+        msg = f"`batch_size` must be greater than 0, got {batch_size!r}"
+        raise ValueError(msg)
+
+    connection = connections[using]
+    if not connection.features.supports_ignore_conflicts:
+        msg = "This database backend does not support ignoring conflicts."
+        raise NotSupportedError(msg)
+
+    total = 0
+    batch: list[SlackMessage] = []
+    with gzip.open(path, "rt", encoding="utf-8") as fp:
+        for deserialized in serializers.deserialize("jsonl", fp, using=using):
+            batch.append(deserialized.object)  # type: ignore[arg-type]
+            if len(batch) >= batch_size:
+                total += _insert_messages(batch, using=using)
+                batch = []
+
+    if batch:
+        total += _insert_messages(batch, using=using)
+
+    logger.info("Imported %d messages from %s", total, path)
+    return total
+
+
+def _insert_messages(messages: list[SlackMessage], *, using: str) -> int:
+    """Insert messages ignoring those exist, keeping timestamps as in archive like `loaddata` does."""
+    policy_ids = {message.policy_id for message in messages if message.policy_id is not None}
+    if policy_ids:
+        existing = set(SlackMessagingPolicy.objects.using(using).filter(pk__in=policy_ids).values_list("pk", flat=True))
+        for message in messages:
+            if message.policy_id not in existing:
+                message.policy_id = None
+
+    queryset = SlackMessage.objects.using(using)
+    with transaction.atomic(using=using):
+        # Skip existing messages here too, not to overwrite their timestamps below
+        existing_ids = set(queryset.filter(pk__in=[message.pk for message in messages]).values_list("pk", flat=True))
+        new_messages = [message for message in messages if message.pk not in existing_ids]
+        timestamps = [(message.created, message.last_modified) for message in new_messages]
+        queryset.bulk_create(new_messages, ignore_conflicts=True)
+
+        # `bulk_create()` sets `auto_now` and `auto_now_add` timestamps to now, while `bulk_update()` does not
+        for message, (created, last_modified) in zip(new_messages, timestamps):
+            message.created, message.last_modified = created, last_modified
+
+        queryset.bulk_update(new_messages, fields=("created", "last_modified"))
+
+    logger.debug("Inserted batch of %d messages, skipped %d existing", len(new_messages), len(existing_ids))
+    return len(messages)
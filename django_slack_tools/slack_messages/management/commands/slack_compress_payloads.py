@@ -0,0 +1,37 @@
+"""Management command converting message dumps between plain and compressed storage."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand
+
+from django_slack_tools.slack_messages.payloads import compress_payloads
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):  # noqa: D101
+    help = (
+        "Move dumps of requests and responses of saved messages to compressed fields, chunk by chunk."
+        " Use along with `compress_payloads` option of persister, to convert messages saved before."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Number of messages to update at once.")
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to sleep between chunks.")
+        parser.add_argument(
+            "--decompress",
+            action="store_true",
+            help="Move compressed dumps back to plain JSON fields instead.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002, D102
+        num_updated = compress_payloads(
+            decompress=options["decompress"],
+            chunk_size=options["chunk_size"],
+            sleep=options["sleep"],
+            progress=lambda total: self.stdout.write(f"Updated {total} messages so far."),
+        )
+        self.stdout.write(f"Updated {num_updated} messages.")
@@ -0,0 +1,58 @@
+"""Management command exporting message history to an archive file."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from django_slack_tools.slack_messages.archive import export_messages
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from datetime import datetime
+
+
+class Command(BaseCommand):  # noqa: D101
+    help = (
+        "Export messages to a gzip compressed JSON Lines file, streaming them chunk by chunk."
+        " The file can be imported with `slack_import_messages` or `loaddata` command."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument("path", help="Path of archive file to create, usually ending with `.jsonl.gz`.")
+        parser.add_argument("--since", type=_datetime, help="Export messages created at or after given ISO time.")
+        parser.add_argument("--until", type=_datetime, help="Export messages created before given ISO time.")
+        parser.add_argument("--channel", help="Export messages sent to given channel.")
+        parser.add_argument("--policy", help="Export messages sent with messaging policy of given code.")
+        ok = parser.add_mutually_exclusive_group()
+        ok.add_argument("--ok", action="store_true", default=None, help="Export messages delivered successfully.")
+        ok.add_argument("--not-ok", dest="ok", action="store_false", help="Export messages failed to deliver.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Number of messages to fetch at once.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002, D102
+        try:
+            num_exported = export_messages(
+                options["path"],
+                since=options["since"],
+                until=options["until"],
+                channel=options["channel"],
+                policy=options["policy"],
+                ok=options["ok"],
+                chunk_size=options["chunk_size"],
+            )
+        except FileExistsError as exc:
+            msg = f"File {options['path']} exists already."
+            raise CommandError(msg) from exc
+
+        self.stdout.write(f"Exported {num_exported} messages.")
+
+
+def _datetime(value: str) -> datetime:
+    dt = parse_datetime(value)
+    if dt is None:
+        msg = f"Invalid ISO time: {value!r}"
+        raise ValueError(msg)
+
+    return dt
@@ -0,0 +1,29 @@
+"""Management command importing message history from an archive file."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from django_slack_tools.slack_messages.archive import import_messages
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):  # noqa: D101
+    help = (
+        "Import messages from a gzip compressed JSON Lines file, such as exported with `slack_export_messages`."
+        " Messages exist already are skipped."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument("path", help="Path of archive file.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of messages to insert at once.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002, D102
+        num_imported = import_messages(options["path"], batch_size=options["batch_size"], using=options["database"])
+        self.stdout.write(f"Imported {num_imported} messages.")
@@ -0,0 +1,65 @@
+"""Management command maintaining monthly partitions of message history on PostgreSQL."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError
+from django.utils import timezone
+
+from django_slack_tools.slack_messages import partitions
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):  # noqa: D101
+    help = (
+        "Create monthly partitions of message history for upcoming months, and detach or drop old ones."
+        " Run it periodically, e.g. daily. PostgreSQL only."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "--setup",
+            action="store_true",
+            help="Convert message table to partitioned table first. It locks the table until done.",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Number of months after current month to create partitions for.",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=None,
+            help="Drop partitions of which messages are all older than given days. Keep all if not given.",
+        )
+        parser.add_argument(
+            "--detach-only",
+            action="store_true",
+            help="Detach old partitions but keep them as standalone tables, instead of dropping them.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002, D102
+        using = options["database"]
+        try:
+            if options["setup"]:
+                partitions.partition_table(months_ahead=options["months_ahead"], using=using)
+                self.stdout.write("Partitioned message table.")
+
+            for name in partitions.create_partitions(months_ahead=options["months_ahead"], using=using):
+                self.stdout.write(f"Created partition {name}.")
+
+            if options["retention_days"] is not None:
+                before = timezone.now() - timedelta(days=options["retention_days"])
+                action = "Detached" if options["detach_only"] else "Dropped"
+                for name in partitions.drop_partitions(before=before, detach_only=options["detach_only"], using=using):
+                    self.stdout.write(f"{action} partition {name}.")
+        except (NotSupportedError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
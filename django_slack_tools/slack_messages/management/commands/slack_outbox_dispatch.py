@@ -0,0 +1,62 @@
+"""Management command running outbox dispatcher."""
+
+from __future__ import annotations
+
+import signal
+import threading
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand
+
+from django_slack_tools.slack_messages.outbox import OutboxDispatcher
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from types import FrameType
+
+
+class Command(BaseCommand):  # noqa: D101
+    help = (
+        "Send messages written to outbox. Runs until interrupted, unless `--once` given."
+        " Multiple processes can run at once to scale out."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument("--batch-size", type=int, default=100, help="Maximum number of messages to claim at once.")
+        parser.add_argument("--max-workers", type=int, default=8, help="Maximum number of concurrent deliveries.")
+        parser.add_argument("--lease", type=float, default=300, help="Seconds a claim of messages is valid.")
+        parser.add_argument("--max-attempts", type=int, default=3, help="Maximum attempts for failing messages.")
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait for new messages when outbox is empty.",
+        )
+        parser.add_argument("--once", action="store_true", help="Send a batch of messages and exit.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ARG002, D102
+        dispatcher = OutboxDispatcher(
+            batch_size=options["batch_size"],
+            max_workers=options["max_workers"],
+            lease=options["lease"],
+            max_attempts=options["max_attempts"],
+        )
+        if options["once"]:
+            try:
+                num_dispatched = dispatcher.run_once()
+            finally:
+                dispatcher.close()
+
+            self.stdout.write(f"Dispatched {num_dispatched} messages.")
+            return
+
+        stop_event = threading.Event()
+
+        def stop(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+            self.stdout.write("Stopping after current batch...")
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+        self.stdout.write("Dispatching outbox messages, press CTRL+C to stop.")
+        dispatcher.run_forever(poll_interval=options["poll_interval"], stop_event=stop_event)
@@ -1,11 +1,20 @@
 from .message_templates import DjangoTemplate
-from .middlewares import DjangoDatabasePersister, DjangoDatabasePolicyHandler
+from .middlewares import (
+    CoalescingMiddleware,
+    DeduplicationMiddleware,
+    DjangoDatabasePersister,
+    DjangoDatabasePolicyHandler,
+)
+from .policy_resolver import PolicyResolver
 from .template_loaders import DjangoPolicyTemplateLoader, DjangoTemplateLoader
 
 __all__ = (
+    "CoalescingMiddleware",
+    "DeduplicationMiddleware",
     "DjangoDatabasePersister",
     "DjangoDatabasePolicyHandler",
     "DjangoPolicyTemplateLoader",
     "DjangoTemplate",
     "DjangoTemplateLoader",
+    "PolicyResolver",
 )
@@ -5,21 +5,29 @@
 import re
 import xml.etree.ElementTree as ET
 from textwrap import dedent
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Literal, overload
 
 import xmltodict
 from django.template import engines
 
 from django_slack_tools.messenger.shortcuts import BaseTemplate
+from django_slack_tools.utils.repr import LazyStr
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Callable
 
     from django.template.backends.base import BaseEngine
     from django.template.base import Template
 
 logger = logging.getLogger(__name__)
 
+XMLParser = Literal["etree", "xmltodict"]
+"""XML parser to convert rendered template to dictionary.
+
+- `"etree"`: Converts the parsed XML tree in a single pass. This is the default.
+- `"xmltodict"`: Previous implementation using `xmltodict`, parses the XML multiple times.
+"""
+
 
 class DjangoTemplate(BaseTemplate):
     """Template utilizing Django built-in template engine."""
@@ -27,10 +35,22 @@ class DjangoTemplate(BaseTemplate):
     template: Template
 
     @overload
-    def __init__(self, *, file: str, engine: BaseEngine | None = None) -> None: ...  # pragma: no cover
+    def __init__(
+        self,
+        *,
+        file: str,
+        engine: BaseEngine | None = None,
+        xml_parser: XMLParser = "etree",
+    ) -> None: ...  # pragma: no cover
 
     @overload
-    def __init__(self, *, inline: str, engine: BaseEngine | None = None) -> None: ...  # pragma: no cover
+    def __init__(
+        self,
+        *,
+        inline: str,
+        engine: BaseEngine | None = None,
+        xml_parser: XMLParser = "etree",
+    ) -> None: ...  # pragma: no cover
 
     def __init__(
         self,
@@ -38,6 +58,7 @@ def __init__(
         file: str | None = None,
         inline: str | None = None,
         engine: BaseEngine | None = None,
+        xml_parser: XMLParser = "etree",
     ) -> None:
         """Initialize template.
 
@@ -45,12 +66,18 @@ def __init__(
             file: Path to file with template.
             inline: XML inline template.
             engine: Template engine to use. Defaults to Django engine.
+            xml_parser: XML parser to convert rendered template with.
 
         Raises:
             TypeError: Some of the arguments are missing or multiple are provided.
+            ValueError: Unsupported XML parser given.
         """
         engine = engines["django"] if engine is None else engine
 
+        if xml_parser not in _XML_PARSERS:
+            msg = f"Unsupported XML parser: {xml_parser!r}"
+            raise ValueError(msg)
+
         if len([value for value in (file, inline) if value is not None]) != 1:
             msg = "Exactly one of 'file' or 'inline' must be provided."
             raise TypeError(msg)
@@ -64,16 +91,91 @@ def __init__(
             raise NotImplementedError(msg)
 
         self.template = template  # type: ignore[assignment] # False-positive error
+        self.xml_parser = xml_parser
 
     def render(self, context: dict[str, Any]) -> Any:  # noqa: D102
-        logger.debug("Rendering template with context: %r", context)
+        logger.debug("Rendering template with context keys: %s", LazyStr(lambda: ", ".join(context)))
         rendered = self.template.render(context=context)  # type: ignore[arg-type] # False-positive error
-        return _xml_to_dict(rendered)
+        return _XML_PARSERS[self.xml_parser](rendered)
 
 
 def _xml_to_dict(xml: str) -> dict:
     """Parse XML string to Python dictionary.
 
+    Result is identical to `_xmltodict_parse`, but the XML is parsed only once and
+    the dictionary is built directly from the element tree.
+
+    Args:
+        xml: XML string.
+
+    Returns:
+        Parsed dictionary. Be aware, the returned value will be the child of
+        top-level node (e.g. <root>...</root>), regardless of its key name.
+    """
+    root = ET.fromstring(xml)  # noqa: S314 ; TODO(lasuillard): Naive belief that XML is safe
+    tag = _rename_tag(root.tag)
+    obj = _push_data(None, tag, _convert_element(root, tag=tag))
+    return dict(next(iter(obj.values())))
+
+
+_FORCE_LIST = frozenset(("blocks", "elements", "options"))
+
+
+def _convert_element(node: ET.Element, *, tag: str) -> Any:
+    """Convert an element into Python object, the way `xmltodict` does with options used in `_xmltodict_parse`.
+
+    Attributes and children are items of a dictionary, text is added as `"text"` key if the element has any of them.
+    Otherwise, the element is converted to its text or `None` if the text is blank.
+    """
+    item: dict[str, Any] | None = None
+    if node.attrib:
+        item = dict(_xml_postprocessor(None, key, value) for key, value in node.attrib.items())
+
+    # Text of an element includes the texts following its children
+    text = node.text or ""
+    if text and tag in ("text", "elements"):
+        text = _normalize_text(text)
+
+    chunks = [text]
+    for child in node:
+        child_tag = _rename_tag(child.tag)
+        item = _push_data(item, child_tag, _convert_element(child, tag=child_tag))
+        if child.tail:
+            chunks.append(child.tail)
+
+    data = "".join(chunks).strip() or None
+    if item is None:
+        return data
+
+    if data:
+        _push_data(item, "text", data)
+
+    return item
+
+
+def _push_data(item: dict[str, Any] | None, key: str, data: Any) -> dict[str, Any]:
+    """Add data to the item, grouping values of repeated keys into a list."""
+    key, data = _xml_postprocessor(None, key, data)
+    if item is None:
+        item = {}
+
+    if key in item:
+        value = item[key]
+        if isinstance(value, list):
+            value.append(data)
+        else:
+            item[key] = [value, data]
+    elif key in _FORCE_LIST:
+        item[key] = [data]
+    else:
+        item[key] = data
+
+    return item
+
+
+def _xmltodict_parse(xml: str) -> dict:
+    """Parse XML string to Python dictionary, using `xmltodict`.
+
     Following transformations are applied by default:
 
     - Normalize text nodes: remove single newlines and dedent text, etc.
@@ -106,14 +208,18 @@ def _preprocess_xml(xml: str) -> str:
         node.tag = _rename_tag(node.tag)
 
         if node.tag in ("text", "elements") and node.text:
-            text = dedent(node.text)
-            text = _remove_single_newline(text)
-            logger.debug("Normalized text node: %r -> %r", node.text, text)
-            node.text = text
+            node.text = _normalize_text(node.text)
 
     return ET.tostring(root, encoding="unicode")
 
 
+def _normalize_text(text: str) -> str:
+    """Normalize text node."""
+    normalized = _remove_single_newline(dedent(text))
+    logger.debug("Normalized text node: %r -> %r", text, normalized)
+    return normalized
+
+
 def _xml_postprocessor(path: Any, key: str, value: Any) -> tuple[str, Any]:  # noqa: ARG001
     if value == "true":
         return key, True
@@ -143,3 +249,9 @@ def _rename_tag(tag: str) -> str:
 def _remove_single_newline(text: str) -> str:
     """Remove a single newline from repeated newlines. If the are just one newline, replace it with space."""
     return re.sub(r"([\n]+)", lambda m: "\n" * (m.group(1).count("\n") - 1) or " ", text)
+
+
+_XML_PARSERS: dict[str, Callable[[str], dict]] = {
+    "etree": _xml_to_dict,
+    "xmltodict": _xmltodict_parse,
+}
@@ -1,37 +1,142 @@
 # noqa: D100
 from __future__ import annotations
 
+import gzip
+import hashlib
+import importlib.util
+import json
 import logging
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
+from django.core import serializers
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.utils import timezone
 from slack_bolt import App
-from slack_sdk.errors import SlackApiError
 
-from django_slack_tools.messenger.shortcuts import BaseMiddleware, MessageHeader, MessageRequest
+from django_slack_tools.messenger.shortcuts import (
+    BaseMiddleware,
+    MessageHeader,
+    MessageRequest,
+    MessageResponse,
+    Messenger,
+)
 from django_slack_tools.slack_messages.models import SlackMessage, SlackMessageRecipient, SlackMessagingPolicy
+from django_slack_tools.slack_messages.permalinks import PermalinkMode, resolve_permalink
+from django_slack_tools.utils import tracing
+from django_slack_tools.utils.django.encoders import RawJSON
+from django_slack_tools.utils.repr import LazyStr
+from django_slack_tools.utils.shutdown import flush_at_exit
+
+from .policy_resolver import PolicyResolver, get_policy
 
 if TYPE_CHECKING:
-    from django_slack_tools.messenger.shortcuts import MessageResponse, Messenger
+    from pathlib import Path
+    from typing import Any, Callable
+
+    from django.core.cache import BaseCache
+
 
 logger = logging.getLogger(__name__)
 
 
 class DjangoDatabasePersister(BaseMiddleware):
-    """Persist message history to database. If request is `None`, will do nothing."""
+    """Persist message history to database. If request is `None`, will do nothing.
+
+    By default, each message is saved as soon as its response arrives. In buffered mode, messages are kept
+    in memory and inserted in bulk when `batch_size` messages are buffered, when `flush_interval` seconds
+    have passed since the last flush, when messenger finishes sending a batch of messages and at process exit.
+    Interval flushes are done by a thread per middleware, running while any message is buffered.
+
+    Buffered messages given up, as they failed to save `max_attempts` times or buffer overflowed, are appended
+    to `spill_path` file to be restored later with `slack_import_messages` command. If not set, or the file
+    can't be written, they are dumped to error log as JSON Lines instead.
+
+    Getting permalinks with `chat.getPermalink` API doubles API calls per message. With `permalink_mode="local"`,
+    permalinks are built from workspace URL instead, and with `"deferred"` they are left to be filled in later
+    by `backfill_permalinks` task.
 
-    def __init__(self, *, slack_app: App | None = None, get_permalink: bool = False) -> None:
+    With `compress_payloads`, dumps of requests and responses are saved compressed, to
+    `compressed_request` and `compressed_response` fields rather than `request` and `response`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        slack_app: App | None = None,
+        get_permalink: bool = False,
+        permalink_mode: PermalinkMode = "api",
+        team_url: str | None = None,
+        buffered: bool = False,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_buffer_size: int = 10_000,
+        max_attempts: int = 3,
+        spill_path: str | Path | None = None,
+        compress_payloads: bool = False,
+    ) -> None:
         """Initialize the middleware.
 
         Args:
             slack_app: Slack app instance to use for certain tasks, such as getting permalinks.
             get_permalink: If `True`, will try to get the permalink of the message.
+            permalink_mode: How to get permalinks, if `get_permalink` is `True`.
+            team_url: Workspace URL to build permalinks with in `"local"` mode. Fetched with the app if not set.
+            buffered: If `True`, will buffer the messages and save them in bulk.
+            batch_size: Number of buffered messages to trigger flush.
+            flush_interval: Seconds since last flush to trigger flush.
+            max_buffer_size: Maximum number of buffered messages. If flushes keep failing and buffer is full,
+                the oldest messages are given up.
+            max_attempts: Number of failed flushes after which a buffered message is given up.
+            spill_path: Path of gzip compressed JSON Lines file to append messages given up to,
+                in format of `slack_export_messages` command.
+            compress_payloads: If `True`, will save dumps of requests and responses compressed.
         """
-        if get_permalink and not isinstance(slack_app, App):
+        if permalink_mode not in ("api", "local", "deferred"):
+            msg = f'Unknown value for `permalink_mode`: "{permalink_mode}"'
+            raise ValueError(msg)
+
+        if get_permalink and permalink_mode != "deferred" and not isinstance(slack_app, App):
             msg = "`slack_app` must be an instance of `App` if `get_permalink` is set `True`."
             raise ValueError(msg)
 
+        if not 0 < batch_size <= max_buffer_size:
+            msg = f"`batch_size` must be positive and not greater than `max_buffer_size`, got {batch_size!r}"
+            raise ValueError(msg)
+
+        if max_attempts < 1:
+            msg = f"`max_attempts` must be positive, got {max_attempts!r}"
+            raise ValueError(msg)
+
         self.slack_app = slack_app
         self.get_permalink = get_permalink
+        self.permalink_mode = permalink_mode
+        self.team_url = team_url
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.max_attempts = max_attempts
+        self.spill_path = spill_path
+        self.compress_payloads = compress_payloads
+
+        self._buffer: list[SlackMessage] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._buffer_lock)
+        self._flusher: threading.Thread | None = None
+        self._last_flush = time.monotonic()
+        self._attempts: dict[str, int] = {}
+        if buffered:
+            flush_at_exit(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of messages buffered but not saved yet."""
+        return len(self._buffer)
 
     def process_response(self, response: MessageResponse) -> MessageResponse | None:  # noqa: D102
         request = response.request
@@ -39,34 +144,186 @@ def process_response(self, response: MessageResponse) -> MessageResponse | None:
             logger.warning("No request found in response, skipping persister.")
             return response
 
-        logger.debug("Getting permalink for message: %s", response)
-        if self.get_permalink:  # noqa: SIM108
-            permalink = self._get_permalink(channel=request.channel, ts=response.ts)
+        if self.get_permalink and self.permalink_mode != "deferred":
+            logger.debug("Getting permalink for message: %s", LazyStr(response.summary))
+            permalink = self._get_permalink(channel=request.channel, ts=response.ts, thread_ts=response.parent_ts)
         else:
             permalink = ""
 
-        logger.debug("Persisting message history to database: %s", response)
+        logger.debug("Persisting message history to database: %s", LazyStr(response.summary))
         try:
+            # Serialized straight to JSON, and header and body once rather than again as part of request
+            payloads = {
+                "request": RawJSON(request.model_dump_json(exclude={"header", "body"})),
+                "response": RawJSON(response.model_dump_json(exclude={"request"})),
+            }
+            if self.compress_payloads:
+                payloads = {f"compressed_{name}": payload for name, payload in payloads.items()}
+
             history = SlackMessage(
                 id=request.id_,
                 channel=request.channel,
-                header=request.header.model_dump(),
-                body=request.body.model_dump() if request.body else {},
+                header=RawJSON(request.header.model_dump_json()),
+                body=RawJSON(request.body.model_dump_json()) if request.body else {},
                 ok=response.ok,
                 permalink=permalink,
                 ts=response.ts,
                 parent_ts=response.parent_ts or "",
-                request=request.model_dump(),
-                response=response.model_dump(exclude={"request"}),
                 exception=response.error or "",
+                **payloads,
             )
-            history.save()
+            if self.buffered:
+                self._add_to_buffer(history)
+            else:
+                with tracing.start_span("slack_message.persist", {"slack.message_id": history.id}):
+                    history.save()
         except Exception:
-            logger.exception("Error while saving message history: %s", response)
+            logger.exception("Error while saving message history: %s", LazyStr(response.summary))
 
         return response
 
-    def _get_permalink(self, *, channel: str, ts: str | None) -> str:
+    def flush(self) -> None:
+        """Save all buffered messages to database.
+
+        If bulk insert fails, messages are saved one by one and those failed are put back to the buffer,
+        to be retried on next flush. Messages failed `max_attempts` times are spilled.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+                self._last_flush = time.monotonic()
+                self._wakeup.notify_all()
+
+            if not batch:
+                return
+
+            logger.debug("Flushing %d buffered messages", len(batch))
+            with tracing.start_span("slack_message.flush", {"slack.messages": len(batch)}):
+                try:
+                    with transaction.atomic():
+                        SlackMessage.objects.bulk_create(batch, batch_size=self.batch_size)
+                except Exception:
+                    logger.exception("Error while saving %d buffered messages in bulk, saving one by one", len(batch))
+                else:
+                    self._forget(batch)
+                    return
+
+                failed = [message for message in batch if not self._save_one(message)]
+
+            failed_ids = {message.id for message in failed}
+            self._forget([message for message in batch if message.id not in failed_ids])
+            if failed:
+                self._requeue(self._count_attempts(failed))
+
+    def _save_one(self, message: SlackMessage) -> bool:
+        """Save a message, returning whether it succeeded."""
+        try:
+            with transaction.atomic():
+                message.save(force_insert=True)
+        except Exception:
+            logger.exception("Error while saving message history: %s", message.id)
+            return False
+
+        return True
+
+    def _forget(self, batch: list[SlackMessage]) -> None:
+        """Forget failed attempts of messages no longer buffered."""
+        if self._attempts:
+            for message in batch:
+                self._attempts.pop(message.id, None)
+
+    def _count_attempts(self, failed: list[SlackMessage]) -> list[SlackMessage]:
+        """Count a failed attempt of messages, returning those to retry."""
+        retry, given_up = [], []
+        for message in failed:
+            attempts = self._attempts.get(message.id, 0) + 1
+            if attempts < self.max_attempts:
+                self._attempts[message.id] = attempts
+                retry.append(message)
+            else:
+                self._attempts.pop(message.id, None)
+                given_up.append(message)
+
+        if retry:
+            logger.error("Failed to save %d messages, will retry on next flush", len(retry))
+
+        if given_up:
+            self._spill(given_up, reason=f"Failed to save {len(given_up)} messages {self.max_attempts} times")
+
+        return retry
+
+    def _add_to_buffer(self, message: SlackMessage) -> None:
+        with self._buffer_lock:
+            self._buffer.append(message)
+            should_flush = len(self._buffer) >= self.batch_size
+            self._start_flusher()
+
+        if should_flush:
+            self.flush()
+
+    def _start_flusher(self) -> None:
+        """Start the flusher thread if not running. Lock must be held."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="persister-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Flush buffered messages every `flush_interval` seconds, until none is buffered."""
+        try:
+            while True:
+                with self._buffer_lock:
+                    if not self._buffer:
+                        self._flusher = None
+                        return
+
+                    wait = self._last_flush + self.flush_interval - time.monotonic()
+                    if wait > 0:
+                        self._wakeup.wait(wait)
+                        continue
+
+                self.flush()
+        finally:
+            connections.close_all()
+
+    def _requeue(self, batch: list[SlackMessage]) -> None:
+        """Put failed messages back to the front of buffer, spilling the oldest ones exceeding the limit."""
+        with self._buffer_lock:
+            self._buffer = batch + self._buffer
+            overflow = len(self._buffer) - self.max_buffer_size
+            if overflow <= 0:
+                return
+
+            given_up, self._buffer = self._buffer[:overflow], self._buffer[overflow:]
+
+        self._forget(given_up)
+        self._spill(given_up, reason=f"Buffer is full, gave up {overflow} oldest messages")
+
+    def _spill(self, messages: list[SlackMessage], *, reason: str) -> None:
+        """Write messages given up to spill file, or to error log if not set, to be restored later."""
+        now = timezone.now()
+        for message in messages:
+            # Serialized as restored messages would be, as model instances are not saved yet
+            message.created = message.last_modified = now
+            for model_field in message._meta.fields:  # noqa: SLF001
+                value = getattr(message, model_field.attname)
+                if isinstance(value, RawJSON):
+                    setattr(message, model_field.attname, json.loads(value))
+
+        ids = [message.id for message in messages]
+        dump = serializers.serialize("jsonl", messages)
+        if self.spill_path is not None:
+            try:
+                with gzip.open(self.spill_path, "at", encoding="utf-8") as fp:
+                    fp.write(dump)
+            except OSError:
+                logger.exception("Error while writing messages to spill file %s", self.spill_path)
+            else:
+                logger.error("%s, written to spill file %s: %s", reason, self.spill_path, ids)
+                return
+
+        logger.error("%s, dumped below to restore later: %s\n%s", reason, ids, dump)
+
+    def _get_permalink(self, *, channel: str, ts: str | None, thread_ts: str | None = None) -> str:
         """Get permalink of the message. It returns empty string on error."""
         if not self.slack_app:
             logger.warning("Slack app not provided, cannot get permalink.")
@@ -76,16 +333,326 @@ def _get_permalink(self, *, channel: str, ts: str | None) -> str:
             logger.warning("No message ts provided, cannot get permalink.")
             return ""
 
-        try:
-            response = self.slack_app.client.chat_getPermalink(channel=channel, message_ts=ts)
-            return response.get("permalink", default="")
-        except SlackApiError as err:
-            logger.debug("Error while getting permalink: %s", exc_info=err)
-            return ""
+        return resolve_permalink(
+            self.slack_app.client,
+            channel=channel,
+            ts=ts,
+            thread_ts=thread_ts,
+            mode="local" if self.permalink_mode == "local" else "api",
+            team_url=self.team_url,
+        )
+
+
+class DeduplicationMiddleware(BaseMiddleware):
+    """Respond to requests with an idempotency key already sent within a time window, without sending them again.
+
+    Responses of requests with `idempotency_key` are cached in Django cache for `window` seconds. Requests with
+    same key within the window are responded with the cached response, before the messages are rendered.
+    While a request is in flight, requests with same key are stopped, until it finishes or `lock_timeout` passes.
+    A request which doesn't finish with a response, e.g. as sending it failed or a later middleware stopped it,
+    is released so requests with same key can be sent again.
+
+    Responses not OK are not cached, so failed messages can be retried. Put it first in the middlewares,
+    to skip the other middlewares for duplicates.
+    """
+
+    _IN_FLIGHT = "__in_flight__"
+
+    def __init__(
+        self,
+        *,
+        cache_alias: str = "default",
+        window: float = 60 * 60,
+        lock_timeout: float = 60,
+        key_prefix: str = "django-slack-tools:dedup",
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            cache_alias: Alias of Django cache to store responses in. Should be shared by processes sending messages.
+            window: Seconds to keep responses, within which requests with same key are considered duplicates.
+            lock_timeout: Seconds to stop requests with same key while a request is in flight.
+            key_prefix: Prefix of cache keys.
+        """
+        if window <= 0 or lock_timeout <= 0:
+            msg = "`window` and `lock_timeout` must be greater than 0."
+            raise ValueError(msg)
+
+        self.cache_alias = cache_alias
+        self.window = window
+        self.lock_timeout = lock_timeout
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self) -> BaseCache:
+        """Cache storing responses."""
+        return caches[self.cache_alias]
+
+    def process_request(self, request: MessageRequest) -> MessageRequest | MessageResponse | None:  # noqa: D102
+        if request.idempotency_key is None:
+            return request
+
+        cache_key = self._make_cache_key(request.idempotency_key)
+        if self.cache.add(cache_key, self._IN_FLIGHT, timeout=self.lock_timeout):
+            return request
+
+        cached = self.cache.get(cache_key)
+        if cached is None or cached == self._IN_FLIGHT:
+            logger.warning("Request with same idempotency key %r is in flight, skipping", request.idempotency_key)
+            return None
+
+        logger.info(
+            "Duplicate request with idempotency key %r, responding with cached response",
+            request.idempotency_key,
+        )
+        return MessageResponse.model_validate(cached)
+
+    def process_response(self, response: MessageResponse) -> MessageResponse | None:  # noqa: D102
+        request = response.request
+        if request is None or request.idempotency_key is None:
+            return response
+
+        cache_key = self._make_cache_key(request.idempotency_key)
+        if response.ok:
+            self.cache.set(cache_key, response.model_dump(mode="json"), timeout=self.window)
+        else:
+            self.cache.delete(cache_key)
+
+        return response
+
+    def release(self, request: MessageRequest) -> None:  # noqa: D102
+        if request.idempotency_key is not None:
+            self.cache.delete(self._make_cache_key(request.idempotency_key))
+
+    def _make_cache_key(self, idempotency_key: str) -> str:
+        # Hash the key as some cache backends restrict characters and length of keys
+        digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+        return f"{self.key_prefix}:{digest}"
 
 
 OnPolicyNotExists = Literal["create", "default", "error"]
 
+FanOut = Literal["sequential", "threads", "celery"]
+"""Strategy to send fanned-out messages to recipients.
+
+- `"sequential"`: Send messages one by one, in current thread.
+- `"threads"`: Send messages concurrently with `Messenger.send_many()`.
+- `"celery"`: Enqueue a Celery task for each chunk of messages. Messenger must be given by name.
+"""
+
+
+@dataclass
+class _Batch:
+    """Window of a coalescing key, with requests buffered in it for a digest."""
+
+    started: float
+    deadline: float
+    requests: list[MessageRequest] = field(default_factory=list)
+
+
+class CoalescingMiddleware(BaseMiddleware):
+    """Coalesce bursts of messages to same channel and template into a single digest message.
+
+    The first request of a `(channel, template_key)` passes through without delay, opening a window of `window`
+    seconds. Requests of the key arriving within the window are buffered and stopped, each extending the window
+    up to `max_delay` seconds since it opened. Once the window closes, buffered requests are sent with given
+    messenger; a digest message is rendered from `digest_template` with context below:
+
+    - `"template_key"`: Template key of coalesced requests.
+    - `"count"`: Number of coalesced requests.
+    - `"contexts"`: Contexts of coalesced requests, in order.
+
+    A single buffered request is sent as is. Requests without template key (i.e. already rendered) are not
+    coalesced. Windows of all keys are closed by a single scheduler thread per middleware, running while any is open.
+
+    Buffered requests are also sent on `.flush()`, which messengers call after sending a batch of messages,
+    and at process exit. If `max_buffer_size` requests are buffered in total, new requests pass through
+    without being coalesced.
+
+    To use it with `DeduplicationMiddleware`, put that one first. Buffered requests are released from it
+    (see `BaseMiddleware.release()`) and take their idempotency keys again when sent, while duplicates of
+    a buffered request are dropped here. Digests are sent without idempotency keys.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        messenger: Messenger | str,
+        digest_template: str,
+        window: float = 5.0,
+        max_delay: float = 60.0,
+        max_batch_size: int = 100,
+        max_buffer_size: int = 10_000,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            messenger: Messenger instance or name to send messages with. Requests sent by this middleware
+                pass through it if it is the same messenger.
+            digest_template: Template key of digest messages.
+            window: Seconds to wait for more requests of a key, since the last one.
+            max_delay: Maximum seconds to hold requests of a key, since the window opened.
+            max_batch_size: Number of buffered requests of a key to send a digest immediately.
+            max_buffer_size: Maximum number of buffered requests in total.
+        """
+        if window <= 0 or max_delay < window:
+            msg = "`window` must be greater than 0 and not greater than `max_delay`."
+            raise ValueError(msg)
+
+        if not 1 < max_batch_size <= max_buffer_size:
+            msg = f"`max_batch_size` must be greater than 1 and not greater than `max_buffer_size`, got {max_batch_size!r}"  # noqa: E501
+            raise ValueError(msg)
+
+        self._messenger = messenger
+        self.digest_template = digest_template
+        self.window = window
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.max_buffer_size = max_buffer_size
+
+        self._batches: dict[tuple[str, str], _Batch] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._scheduler: threading.Thread | None = None
+        self._released: set[str] = set()
+        flush_at_exit(self)
+
+    @property
+    def messenger(self) -> Messenger:
+        """Get the messenger instance. If it's a string, will get the messenger from the app settings."""
+        if isinstance(self._messenger, str):
+            from django_slack_tools.app_settings import get_messenger  # noqa: PLC0415
+
+            self._messenger = get_messenger(self._messenger)
+
+        if not isinstance(self._messenger, Messenger):
+            msg = f"Expected a synchronous {Messenger!s}, got {type(self._messenger)}"
+            raise TypeError(msg)
+
+        return self._messenger
+
+    @property
+    def pending(self) -> int:
+        """Number of requests buffered but not sent yet."""
+        return self._size
+
+    def process_request(self, request: MessageRequest) -> MessageRequest | None:  # noqa: D102
+        if request.id_ in self._released or request.template_key is None:
+            return request
+
+        key = (str(request.channel), request.template_key)
+        now = time.monotonic()
+        requests: list[MessageRequest] = []
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                # Leading request of a window is not delayed
+                self._batches[key] = _Batch(started=now, deadline=now + self.window)
+                self._start_scheduler()
+                return request
+
+            if self._size >= self.max_buffer_size:
+                logger.warning("Coalescing buffer is full, sending request without coalescing: %s", request.id_)
+                return request
+
+            if request.idempotency_key is not None and any(
+                req.idempotency_key == request.idempotency_key for req in batch.requests
+            ):
+                logger.info(
+                    "Duplicate of a buffered request with idempotency key %r, dropping",
+                    request.idempotency_key,
+                )
+                return None
+
+            batch.requests.append(request)
+            self._size += 1
+            if len(batch.requests) >= self.max_batch_size:
+                requests = self._pop(key)
+            else:
+                batch.deadline = min(now + self.window, batch.started + self.max_delay)
+
+        if requests:
+            self._send(requests)
+
+        return None
+
+    def flush(self) -> None:
+        """Send all buffered requests now."""
+        with self._lock:
+            batches = [self._pop(key) for key in list(self._batches)]
+
+        for requests in batches:
+            if requests:
+                self._send(requests)
+
+    def _start_scheduler(self) -> None:
+        """Start the scheduler thread if not running. Lock must be held."""
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(target=self._schedule, name="coalescing-scheduler", daemon=True)
+            self._scheduler.start()
+
+    def _schedule(self) -> None:
+        """Close windows as they expire, until none is open."""
+        try:
+            while True:
+                with self._lock:
+                    due = self._wait_due()
+                    if due is None:
+                        self._scheduler = None
+                        return
+
+                    batches = [self._pop(key) for key in due]
+
+                for requests in batches:
+                    if requests:
+                        self._send(requests)
+        finally:
+            connections.close_all()
+
+    def _wait_due(self) -> list[tuple[str, str]] | None:
+        """Wait until any window expires, returning their keys. `None` if no window is open. Lock must be held."""
+        while self._batches:
+            now = time.monotonic()
+            due = [key for key, batch in self._batches.items() if batch.deadline <= now]
+            if due:
+                return due
+
+            self._wakeup.wait(min(batch.deadline for batch in self._batches.values()) - now)
+
+        return None
+
+    def _pop(self, key: tuple[str, str]) -> list[MessageRequest]:
+        """Close the window of key, returning requests buffered. Lock must be held."""
+        batch = self._batches.pop(key)
+        self._size -= len(batch.requests)
+        return batch.requests
+
+    def _send(self, requests: list[MessageRequest]) -> None:
+        if len(requests) == 1:
+            request = requests[0]
+        else:
+            first = requests[0]
+            request = MessageRequest(
+                channel=first.channel,
+                template_key=self.digest_template,
+                context={
+                    "template_key": first.template_key,
+                    "count": len(requests),
+                    "contexts": [req.context for req in requests],
+                },
+                header=first.header,
+            )
+            logger.debug("Sending digest of %d requests: %s", len(requests), [req.id_ for req in requests])
+
+        self._released.add(request.id_)
+        try:
+            self.messenger.send_request(request)
+        except Exception:
+            logger.exception("Error while sending coalesced messages: %s", [req.id_ for req in requests])
+        finally:
+            self._released.discard(request.id_)
+
 
 class DjangoDatabasePolicyHandler(BaseMiddleware):
     """Middleware to handle Slack messaging policies stored in the database.
@@ -100,11 +667,16 @@ class DjangoDatabasePolicyHandler(BaseMiddleware):
     _RECURSION_DETECTION_CONTEXT_KEY = "__final__"
     """Recursion detection key injected to message context for fanned-out messages to provide secondary protection against infinite loops."""  # noqa: E501
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         messenger: Messenger | str,
         on_policy_not_exists: OnPolicyNotExists = "error",
+        policy_resolver: PolicyResolver | None = None,
+        fan_out: FanOut = "sequential",
+        max_workers: int = 8,
+        chunk_size: int = 10,
+        on_fan_out: Callable[[MessageRequest, list[MessageResponse | None]], Any] | None = None,
     ) -> None:
         """Initialize the middleware.
 
@@ -116,13 +688,42 @@ def __init__(
                 because this middleware cannot properly handle fanned-out messages modified by this middleware.
                 Also, there are chances of infinite loops if the same messenger is used.
             on_policy_not_exists: Action to take when policy is not found.
+            policy_resolver: Resolver caching policies. If not set, policies are queried from database each time.
+            fan_out: Strategy to send fanned-out messages.
+            max_workers: Maximum number of concurrent deliveries, for `"threads"` strategy.
+            chunk_size: Number of messages per task, for `"celery"` strategy.
+            on_fan_out: Callback called with original request and responses of fanned-out messages.
+                Responses are `None` for messages stopped by middlewares or sent by Celery tasks.
         """
         if on_policy_not_exists not in ("create", "default", "error"):
             msg = f'Unknown value for `on_policy_not_exists`: "{on_policy_not_exists}"'
             raise ValueError(msg)
 
+        if fan_out not in ("sequential", "threads", "celery"):
+            msg = f'Unknown value for `fan_out`: "{fan_out}"'
+            raise ValueError(msg)
+
+        if fan_out == "celery":
+            if not isinstance(messenger, str):
+                msg = "Messenger must be given by name to fan out messages with Celery."
+                raise ValueError(msg)
+
+            if importlib.util.find_spec("celery") is None:
+                msg = "Celery is required to fan out messages with Celery."
+                raise ValueError(msg)
+
+        if max_workers < 1 or chunk_size < 1:
+            msg = "`max_workers` and `chunk_size` must be greater than 0."
+            raise ValueError(msg)
+
         self._messenger = messenger
+        self.messenger_name = messenger if isinstance(messenger, str) else None
         self.on_policy_not_exists = on_policy_not_exists
+        self.policy_resolver = policy_resolver
+        self.fan_out_strategy = fan_out
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.on_fan_out = on_fan_out
 
     # * It's not desirable to put import in the method,
     # * but it's the only way to avoid circular imports for now (what's the fix?)
@@ -134,6 +735,10 @@ def messenger(self) -> Messenger:
 
             self._messenger = get_messenger(self._messenger)
 
+        if not isinstance(self._messenger, Messenger):
+            msg = f"Expected a synchronous {Messenger!s}, got {type(self._messenger)}"
+            raise TypeError(msg)
+
         return self._messenger
 
     def process_request(self, request: MessageRequest) -> MessageRequest | None:  # noqa: D102
@@ -142,12 +747,35 @@ def process_request(self, request: MessageRequest) -> MessageRequest | None:  #
         if request.context.get(self._RECURSION_DETECTION_CONTEXT_KEY, False):
             return request
 
-        code = request.channel
-        policy = self._get_policy(code=code)
+        responses = self.fan_out(request)
+        if self.on_fan_out is not None:
+            self.on_fan_out(request, responses)
+
+        # Stop current request
+        return None
+
+    def fan_out(self, request: MessageRequest) -> list[MessageResponse | None]:
+        """Send the message to all recipients of the policy, with configured fan-out strategy.
+
+        Args:
+            request: Original message request, of which channel is the policy code.
+
+        Returns:
+            Responses for each recipient, in order. `None` for messages stopped by middlewares
+            or sent by Celery tasks. Empty if the policy is disabled.
+        """
+        policy = self._get_policy(code=request.channel)
         if not policy.enabled:
             logger.debug("Policy %s is disabled, skipping further messaging", policy)
-            return None
-
+            return []
+
+        # Header is same for all recipients, so validate it once and give each request a copy
+        header = MessageHeader.model_validate(
+            {
+                **policy.header_defaults,
+                **request.header.model_dump(),
+            },
+        )
         requests: list[MessageRequest] = []
         for recipient in policy.recipients.all():
             default_context = self._get_default_context(recipient)
@@ -156,34 +784,47 @@ def process_request(self, request: MessageRequest) -> MessageRequest | None:  #
                 **request.context,
                 self._RECURSION_DETECTION_CONTEXT_KEY: True,
             }
-            header = MessageHeader.model_validate(
-                {
-                    **policy.header_defaults,
-                    **request.header.model_dump(),
-                },
+            req = MessageRequest(
+                channel=recipient.channel,
+                template_key=policy.code,
+                context=context,
+                header=header.model_copy(),
+                idempotency_key=f"{request.idempotency_key}:{recipient.channel}" if request.idempotency_key else None,
             )
-            req = MessageRequest(channel=recipient.channel, template_key=policy.code, context=context, header=header)
             requests.append(req)
 
-        # TODO(lasuillard): How to provide users the access the newly created messages?
-        #                   currently, it's possible with persisters but it would require some additional work
         # TODO(lasuillard): Can `sys.setrecursionlimit` be used to prevent spamming if recursion occurs?
-        for req in requests:
-            self.messenger.send_request(req)
+        logger.debug("Fanning out %d messages with strategy %r", len(requests), self.fan_out_strategy)
+        if self.fan_out_strategy == "threads":
+            return list(self.messenger.send_many(requests, max_workers=self.max_workers))
 
-        # Stop current request
-        return None
+        if self.fan_out_strategy == "celery":
+            self._enqueue(requests)
+            return [None] * len(requests)
+
+        return [self.messenger.send_request(req) for req in requests]
+
+    def _enqueue(self, requests: list[MessageRequest]) -> None:
+        """Enqueue Celery tasks sending the requests, by chunk."""
+        from django_slack_tools.slack_messages.tasks import send_requests  # noqa: PLC0415
+
+        for i in range(0, len(requests), self.chunk_size):
+            chunk = requests[i : i + self.chunk_size]
+            send_requests.delay(
+                messenger_name=self.messenger_name,
+                requests=[req.model_dump(mode="json") for req in chunk],
+            )
 
     def _get_policy(self, *, code: str) -> SlackMessagingPolicy:
         """Get the policy for the given code."""
         try:
-            policy = SlackMessagingPolicy.objects.get(code=code)
+            policy = self._resolve_policy(code)
         except SlackMessagingPolicy.DoesNotExist:
             if self.on_policy_not_exists == "create":
                 logger.warning("No policy found for template key, creating one: %s", code)
                 policy = self._create_policy(code=code)
             elif self.on_policy_not_exists == "default":
-                policy = SlackMessagingPolicy.objects.get(code="DEFAULT")
+                policy = self._resolve_policy("DEFAULT")
             elif self.on_policy_not_exists == "error":
                 raise
             else:
@@ -192,6 +833,12 @@ def _get_policy(self, *, code: str) -> SlackMessagingPolicy:
 
         return policy
 
+    def _resolve_policy(self, code: str) -> SlackMessagingPolicy:
+        if self.policy_resolver is None:
+            return get_policy(code)
+
+        return self.policy_resolver.resolve(code)
+
     def _create_policy(self, *, code: str) -> SlackMessagingPolicy:
         """Create a policy with the given code.
 
@@ -0,0 +1,115 @@
+# noqa: D100
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+from django_slack_tools.slack_messages.models import SlackMessagingPolicy
+from django_slack_tools.utils.cache import CacheVersion
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSION_KEY = "django_slack_tools:policies:version"
+"""Default cache key for version of resolved policies."""
+
+
+class _Entry(NamedTuple):
+    policy: SlackMessagingPolicy
+    expires_at: float | None
+
+
+class PolicyResolver:
+    """Resolve messaging policies by code, with recipients and their mentions prefetched.
+
+    Resolved policies are snapshots cached in memory, which can be shared by the policy handler and template
+    loader to avoid querying same policy repeatedly for each fanned-out message. Snapshots are invalidated on
+    changes of policies, recipients and mentions (see `invalidate_resolved_policies()`) or after TTL expires.
+
+    Caching is opt-in: pass a resolver (e.g. `default_policy_resolver`) to the policy handler and template loader.
+    Invalidation reaches other processes through Django cache, so with a cache not shared between processes
+    (e.g. default local-memory cache), changes are seen by other processes only after TTL expires.
+
+    Snapshots should be treated read-only, as they are shared between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = 60,
+        version_key: str = DEFAULT_VERSION_KEY,
+        cache_alias: str = "default",
+    ) -> None:
+        """Initialize policy resolver.
+
+        Args:
+            ttl: Seconds to keep a resolved policy for. `None` to keep them until invalidated.
+            version_key: Cache key of version for invalidation.
+            cache_alias: Alias of Django cache storing the version.
+
+        Raises:
+            ValueError: Invalid TTL.
+        """
+        if ttl is not None and ttl <= 0:
+            msg = f"`ttl` must be positive or `None`, got {ttl!r}"
+            raise ValueError(msg)
+
+        self.ttl = ttl
+        self.version = CacheVersion(version_key, cache_alias=cache_alias)
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._current_version: tuple[int, int] | None = None
+
+    def resolve(self, code: str) -> SlackMessagingPolicy:
+        """Get the policy for the given code.
+
+        Raises:
+            SlackMessagingPolicy.DoesNotExist: Policy not found.
+        """
+        version = self.version.get()
+        now = time.monotonic()
+        with self._lock:
+            if version != self._current_version:
+                logger.debug("Policy version changed, discarding %d resolved policies", len(self._entries))
+                self._entries.clear()
+                self._current_version = version
+
+            entry = self._entries.get(code)
+            if entry is not None and (entry.expires_at is None or entry.expires_at > now):
+                return entry.policy
+
+        policy = get_policy(code)
+        if self.version.get() != version:
+            logger.debug("Policy version changed while resolving policy %r, not caching it", code)
+            return policy
+
+        expires_at = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            self._entries[code] = _Entry(policy, expires_at)
+
+        return policy
+
+    def clear(self) -> None:
+        """Discard all resolved policies of this resolver."""
+        with self._lock:
+            self._entries.clear()
+
+
+def get_policy(code: str) -> SlackMessagingPolicy:
+    """Get the policy for the given code from database, without caching, with recipients and mentions prefetched.
+
+    Raises:
+        SlackMessagingPolicy.DoesNotExist: Policy not found.
+    """
+    return SlackMessagingPolicy.objects.prefetch_related("recipients__mentions").get(code=code)
+
+
+default_policy_resolver = PolicyResolver()
+"""Policy resolver to share between policy handlers and template loaders, if opted in."""
+
+
+def invalidate_resolved_policies(version_key: str = DEFAULT_VERSION_KEY, *, cache_alias: str = "default") -> None:
+    """Invalidate policies cached by `PolicyResolver`s using given version key, in all processes."""
+    CacheVersion(version_key, cache_alias=cache_alias).bump()
@@ -14,6 +14,9 @@
 if TYPE_CHECKING:
     from django.template.backends.base import BaseEngine
 
+    from .message_templates import XMLParser
+    from .policy_resolver import PolicyResolver
+
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +24,19 @@
 class DjangoTemplateLoader(BaseTemplateLoader):
     """Django filesystem-backed template loader."""
 
-    def __init__(self, *, engine: BaseEngine | None = None) -> None:
+    def __init__(self, *, engine: BaseEngine | None = None, xml_parser: XMLParser = "etree") -> None:
         """Initialize template loader.
 
         Args:
             engine: Template engine to use. Defaults to Django engine.
+            xml_parser: XML parser for loaded templates.
         """
         self.engine = engines["django"] if engine is None else engine
+        self.xml_parser = xml_parser
 
     def load(self, key: str) -> DjangoTemplate | None:  # noqa: D102
         try:
-            return DjangoTemplate(file=key, engine=self.engine)
+            return DjangoTemplate(file=key, engine=self.engine, xml_parser=self.xml_parser)
         except TemplateDoesNotExist:
             logger.debug("Template not found: %s", key)
             return None
@@ -40,6 +45,16 @@ def load(self, key: str) -> DjangoTemplate | None:  # noqa: D102
 class DjangoPolicyTemplateLoader(BaseTemplateLoader):
     """Django database-backed template loader."""
 
+    def __init__(self, *, xml_parser: XMLParser = "etree", policy_resolver: PolicyResolver | None = None) -> None:
+        """Initialize template loader.
+
+        Args:
+            xml_parser: XML parser for loaded Django templates.
+            policy_resolver: Resolver caching policies. If not set, policies are queried from database each time.
+        """
+        self.xml_parser = xml_parser
+        self.policy_resolver = policy_resolver
+
     def load(self, key: str) -> PythonTemplate | DjangoTemplate | None:  # noqa: D102
         return self._get_template_from_policy(policy_or_code=key)
 
@@ -50,7 +65,11 @@ def _get_template_from_policy(
         """Get template instance."""
         if isinstance(policy_or_code, str):
             try:
-                policy = SlackMessagingPolicy.objects.get(code=policy_or_code)
+                policy = (
+                    self.policy_resolver.resolve(policy_or_code)
+                    if self.policy_resolver is not None
+                    else SlackMessagingPolicy.objects.get(code=policy_or_code)
+                )
             except SlackMessagingPolicy.DoesNotExist:
                 logger.warning("Policy not found: %s", policy_or_code)
                 return None
@@ -62,13 +81,13 @@ def _get_template_from_policy(
 
         if policy.template_type == SlackMessagingPolicy.TemplateType.DJANGO:
             try:
-                return DjangoTemplate(file=policy.template)
+                return DjangoTemplate(file=policy.template, xml_parser=self.xml_parser)
             except TemplateDoesNotExist:
                 logger.debug("Template not found: %s", policy.template)
                 return None
 
         if policy.template_type == SlackMessagingPolicy.TemplateType.DJANGO_INLINE:
-            return DjangoTemplate(inline=policy.template)
+            return DjangoTemplate(inline=policy.template, xml_parser=self.xml_parser)
 
         msg = f"Unsupported template type: {policy.template_type!r}"
         raise ValueError(msg)
@@ -0,0 +1,104 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack_messages", "0006_alter_slackmessage_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlackOutboxMessage",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, help_text="When instance created.", verbose_name="Created"),
+                ),
+                (
+                    "last_modified",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="When instance modified recently.",
+                        verbose_name="Last Modified",
+                    ),
+                ),
+                (
+                    "messenger_name",
+                    models.CharField(
+                        blank=True,
+                        help_text="Name of messenger to send message with. Default messenger is used if empty.",
+                        max_length=128,
+                        verbose_name="Messenger name",
+                    ),
+                ),
+                ("request", models.JSONField(help_text="Message request to send.", verbose_name="Request")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("P", "Pending"), ("C", "Claimed"), ("S", "Sent"), ("F", "Failed"), ("X", "Stopped")],
+                        default="P",
+                        help_text="Delivery status.",
+                        max_length=1,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of times claimed for delivery.",
+                        verbose_name="Attempts",
+                    ),
+                ),
+                (
+                    "claimed_by",
+                    models.CharField(
+                        blank=True,
+                        help_text="Token of dispatcher batch last claimed this message.",
+                        max_length=64,
+                        verbose_name="Claimed by",
+                    ),
+                ),
+                (
+                    "claimed_until",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="When the claim expires, after which other dispatchers may claim it again.",
+                        null=True,
+                        verbose_name="Claimed until",
+                    ),
+                ),
+                (
+                    "ok",
+                    models.BooleanField(
+                        default=None,
+                        help_text="Whether Slack API respond with OK. If never sent, will be `null`.",
+                        null=True,
+                        verbose_name="OK",
+                    ),
+                ),
+                (
+                    "ts",
+                    models.CharField(
+                        blank=True,
+                        help_text="ID of sent Slack message.",
+                        max_length=32,
+                        verbose_name="Message ID",
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, help_text="Error of last attempt if any.", verbose_name="Error"),
+                ),
+            ],
+            options={
+                "verbose_name": "Outbox Message",
+                "verbose_name_plural": "Outbox Messages",
+                "ordering": ("-created",),
+                "indexes": [models.Index(fields=["status", "created"], name="slack_outbox_status_created")],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:46
+
+from django.db import migrations, models
+
+import django_slack_tools.utils.django.operations
+
+
+class Migration(migrations.Migration):
+    # Indexes are created concurrently on PostgreSQL, not to block writes to large message table meanwhile,
+    # which can't be done in a transaction. Other databases lock the table while creating them.
+    atomic = False
+
+    dependencies = [
+        ("slack_messages", "0007_slackoutboxmessage"),
+    ]
+
+    operations = [
+        django_slack_tools.utils.django.operations.AddIndexConcurrently(
+            model_name="slackmessage",
+            index=models.Index(fields=["created"], name="slack_message_created"),
+        ),
+        django_slack_tools.utils.django.operations.AddIndexConcurrently(
+            model_name="slackmessage",
+            index=models.Index(fields=["channel", "created"], name="slack_message_channel_created"),
+        ),
+        django_slack_tools.utils.django.operations.AddIndexConcurrently(
+            model_name="slackmessage",
+            index=models.Index(fields=["ok", "created"], name="slack_message_ok_created"),
+        ),
+        django_slack_tools.utils.django.operations.AddIndexConcurrently(
+            model_name="slackmessage",
+            index=models.Index(fields=["parent_ts"], name="slack_message_parent_ts"),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-18 00:29
+
+from django.db import migrations, models
+
+import django_slack_tools.slack_messages.validators
+import django_slack_tools.utils.django.encoders
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack_messages", "0008_slackmessage_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="slackmessage",
+            name="body",
+            field=models.JSONField(
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Message body. Allowed fields are `attachments`, `body`, `text`, `icon_emoji`, `icon_url`, `metadata`, `username`.",  # noqa: E501
+                validators=[django_slack_tools.slack_messages.validators.body_validator],
+                verbose_name="Body",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="slackmessage",
+            name="header",
+            field=models.JSONField(
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Slack control arguments. Allowed fields are `mrkdwn`, `parse`, `reply_broadcast`, `thread_ts`, `unfurl_links`, `unfurl_media`.",  # noqa: E501
+                validators=[django_slack_tools.slack_messages.validators.header_validator],
+                verbose_name="Header",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="slackmessage",
+            name="request",
+            field=models.JSONField(
+                blank=True,
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Dump of request content for debugging, except header and body saved in their own fields.",
+                null=True,
+                verbose_name="Request",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="slackmessage",
+            name="response",
+            field=models.JSONField(
+                blank=True,
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Dump of response content for debugging.",
+                null=True,
+                verbose_name="Response",
+            ),
+        ),
+    ]
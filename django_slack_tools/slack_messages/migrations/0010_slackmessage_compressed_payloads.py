@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 00:34
+
+from django.db import migrations
+
+import django_slack_tools.utils.django.encoders
+import django_slack_tools.utils.django.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack_messages", "0009_slackmessage_raw_json"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="slackmessage",
+            name="compressed_request",
+            field=django_slack_tools.utils.django.fields.CompressedJSONField(
+                blank=True,
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Dump of request content for debugging, stored compressed.",
+                null=True,
+                verbose_name="Request (compressed)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="slackmessage",
+            name="compressed_response",
+            field=django_slack_tools.utils.django.fields.CompressedJSONField(
+                blank=True,
+                encoder=django_slack_tools.utils.django.encoders.RawJSONEncoder,
+                help_text="Dump of response content for debugging, stored compressed.",
+                null=True,
+                verbose_name="Response (compressed)",
+            ),
+        ),
+    ]
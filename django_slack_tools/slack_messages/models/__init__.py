@@ -2,5 +2,12 @@
 from .message import SlackMessage
 from .message_recipient import SlackMessageRecipient
 from .messaging_policy import SlackMessagingPolicy
+from .outbox_message import SlackOutboxMessage
 
-__all__ = ("SlackMention", "SlackMessage", "SlackMessageRecipient", "SlackMessagingPolicy")
+__all__ = (
+    "SlackMention",
+    "SlackMessage",
+    "SlackMessageRecipient",
+    "SlackMessagingPolicy",
+    "SlackOutboxMessage",
+)
@@ -8,6 +8,8 @@
 from django.utils.translation import gettext_lazy as _
 
 from django_slack_tools.slack_messages.validators import body_validator, header_validator
+from django_slack_tools.utils.django.encoders import RawJSONEncoder
+from django_slack_tools.utils.django.fields import CompressedJSONField
 from django_slack_tools.utils.django.model_mixins import TimestampMixin
 
 from .messaging_policy import SlackMessagingPolicy
@@ -42,6 +44,7 @@ class SlackMessage(TimestampMixin, models.Model):
             " Allowed fields are `mrkdwn`, `parse`, `reply_broadcast`, `thread_ts`, `unfurl_links`, `unfurl_media`.",
         ),
         validators=[header_validator],
+        encoder=RawJSONEncoder,
     )
     body = models.JSONField(
         verbose_name=_("Body"),
@@ -50,6 +53,7 @@ class SlackMessage(TimestampMixin, models.Model):
             " Allowed fields are `attachments`, `body`, `text`, `icon_emoji`, `icon_url`, `metadata`, `username`.",
         ),
         validators=[body_validator],
+        encoder=RawJSONEncoder,
     )
     ok = models.BooleanField(
         verbose_name=_("OK"),
@@ -86,15 +90,32 @@ class SlackMessage(TimestampMixin, models.Model):
     # Extraneous call detail for debugging
     request = models.JSONField(
         verbose_name=_("Request"),
-        help_text=_("Dump of request content for debugging."),
+        help_text=_("Dump of request content for debugging, except header and body saved in their own fields."),
         null=True,
         blank=True,
+        encoder=RawJSONEncoder,
     )
     response = models.JSONField(
         verbose_name=_("Response"),
         help_text=_("Dump of response content for debugging."),
         null=True,
         blank=True,
+        encoder=RawJSONEncoder,
+    )
+    # Alternatives to above, saved by persister in compressed payloads mode
+    compressed_request = CompressedJSONField(
+        verbose_name=_("Request (compressed)"),
+        help_text=_("Dump of request content for debugging, stored compressed."),
+        null=True,
+        blank=True,
+        encoder=RawJSONEncoder,
+    )
+    compressed_response = CompressedJSONField(
+        verbose_name=_("Response (compressed)"),
+        help_text=_("Dump of response content for debugging, stored compressed."),
+        null=True,
+        blank=True,
+        encoder=RawJSONEncoder,
     )
     exception = models.TextField(
         verbose_name=_("Exception"),
@@ -108,6 +129,15 @@ class Meta:  # noqa: D106
         verbose_name = _("Message")
         verbose_name_plural = _("Messages")
         ordering = ("-created",)
+        indexes = (
+            # Default ordering, admin date hierarchy and cleanup of old messages
+            models.Index(fields=("created",), name="slack_message_created"),
+            # Admin changelist filtered by channel or result, in default ordering
+            models.Index(fields=("channel", "created"), name="slack_message_channel_created"),
+            models.Index(fields=("ok", "created"), name="slack_message_ok_created"),
+            # Messages in a thread
+            models.Index(fields=("parent_ts",), name="slack_message_parent_ts"),
+        )
 
     def __str__(self) -> str:
         if self.ok is True:
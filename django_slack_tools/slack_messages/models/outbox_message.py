@@ -0,0 +1,99 @@
+# noqa: D100
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_slack_tools.utils.django.model_mixins import TimestampMixin
+
+
+class SlackOutboxMessageManager(models.Manager["SlackOutboxMessage"]):
+    """Manager for Slack outbox messages."""
+
+
+class SlackOutboxMessage(TimestampMixin, models.Model):
+    """Message request waiting to be sent by outbox dispatcher.
+
+    Rows are written in the caller's database transaction, so the messages are sent only if the transaction commits.
+    """
+
+    class Status(models.TextChoices):
+        """Delivery status of outbox messages."""
+
+        PENDING = "P", _("Pending")
+        "Waiting to be claimed by a dispatcher."
+
+        CLAIMED = "C", _("Claimed")
+        "Being sent by a dispatcher. Reclaimed if not finished until lease expires."
+
+        SENT = "S", _("Sent")
+        "Processed by messenger. Response might have been not OK."
+
+        FAILED = "F", _("Failed")
+        "Given up after too many failed attempts."
+
+        STOPPED = "X", _("Stopped")
+        "Processed by messenger, but stopped by a middleware without a response. Not sent by messenger itself."
+
+    messenger_name = models.CharField(
+        verbose_name=_("Messenger name"),
+        help_text=_("Name of messenger to send message with. Default messenger is used if empty."),
+        max_length=128,
+        blank=True,
+    )
+    request = models.JSONField(
+        verbose_name=_("Request"),
+        help_text=_("Message request to send."),
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        help_text=_("Delivery status."),
+        max_length=1,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveIntegerField(
+        verbose_name=_("Attempts"),
+        help_text=_("Number of times claimed for delivery."),
+        default=0,
+    )
+    claimed_by = models.CharField(
+        verbose_name=_("Claimed by"),
+        help_text=_("Token of dispatcher batch last claimed this message."),
+        max_length=64,
+        blank=True,
+    )
+    claimed_until = models.DateTimeField(
+        verbose_name=_("Claimed until"),
+        help_text=_("When the claim expires, after which other dispatchers may claim it again."),
+        null=True,
+        blank=True,
+    )
+    ok = models.BooleanField(
+        verbose_name=_("OK"),
+        help_text=_("Whether Slack API respond with OK. If never sent, will be `null`."),
+        null=True,
+        default=None,
+    )
+    ts = models.CharField(
+        verbose_name=_("Message ID"),
+        help_text=_("ID of sent Slack message."),
+        max_length=32,
+        blank=True,
+    )
+    error = models.TextField(
+        verbose_name=_("Error"),
+        help_text=_("Error of last attempt if any."),
+        blank=True,
+    )
+
+    objects: SlackOutboxMessageManager = SlackOutboxMessageManager()
+
+    class Meta:  # noqa: D106
+        verbose_name = _("Outbox Message")
+        verbose_name_plural = _("Outbox Messages")
+        ordering = ("-created",)
+        indexes = (models.Index(fields=("status", "created"), name="slack_outbox_status_created"),)
+
+    def __str__(self) -> str:
+        return _("Outbox message ({id}, {status})").format(id=self.id, status=self.get_status_display())
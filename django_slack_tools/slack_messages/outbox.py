@@ -0,0 +1,213 @@
+"""Dispatcher sending messages written to outbox."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from django_slack_tools.app_settings import get_messenger
+from django_slack_tools.messenger.shortcuts import MessageRequest
+
+from .models import SlackOutboxMessage
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from django.db.models import QuerySet
+
+    from django_slack_tools.messenger.shortcuts import MessageResponse
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """Claims pending outbox messages in batches and sends them with bounded concurrency.
+
+    Messages are claimed with `SELECT ... FOR UPDATE SKIP LOCKED` (on databases supporting it) and marked
+    with a claim token in a short transaction, so multiple dispatchers can run at once without sending
+    the same message twice. Messages are sent outside of the transaction by a pool of worker threads
+    reused across batches. While a batch is being sent, results finished so far are saved in bulk and
+    the claim of the rest is renewed every third of the lease, so long batches are not claimed again
+    by others. Results are saved only if the message is still under the same claim, so a dispatcher
+    whose claim was taken over by another does not overwrite its results.
+
+    Messages claimed by a dispatcher which died before finishing them are claimed again once
+    the lease expires, so delivery is at-least-once.
+
+    Call `.close()` to shut down the worker threads when done, which `.run_forever()` does on return.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        lease: float = 300,
+        max_attempts: int = 3,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            batch_size: Maximum number of messages to claim at once.
+            max_workers: Maximum number of concurrent deliveries.
+            lease: Seconds a claim is valid. Renewed while sending a batch, so it should be long enough
+                to send a few messages.
+            max_attempts: Maximum number of attempts for messages failing with an exception,
+                such as network errors. Messages responded not OK by Slack are not retried.
+        """
+        if batch_size < 1 or max_workers < 1 or max_attempts < 1:
+            msg = "`batch_size`, `max_workers` and `max_attempts` must be greater than 0."
+            raise ValueError(msg)
+
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.lease = timedelta(seconds=lease)
+        self.max_attempts = max_attempts
+        self._executor: ThreadPoolExecutor | None = None
+
+    def claim(self) -> list[SlackOutboxMessage]:
+        """Claim a batch of pending messages, including those of which claim expired."""
+        now = timezone.now()
+        token = uuid.uuid4().hex
+        claimable = Q(status=SlackOutboxMessage.Status.PENDING) | Q(
+            status=SlackOutboxMessage.Status.CLAIMED,
+            claimed_until__lt=now,
+        )
+        with transaction.atomic():
+            pks = list(
+                SlackOutboxMessage.objects.filter(claimable)
+                .order_by("created", "pk")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", flat=True)[: self.batch_size],
+            )
+            if not pks:
+                return []
+
+            # Conditions checked again, in case rows were not locked by database
+            SlackOutboxMessage.objects.filter(claimable, pk__in=pks).update(
+                status=SlackOutboxMessage.Status.CLAIMED,
+                claimed_by=token,
+                claimed_until=now + self.lease,
+                attempts=F("attempts") + 1,
+                last_modified=now,
+            )
+
+        messages = list(SlackOutboxMessage.objects.filter(claimed_by=token).order_by("created", "pk"))
+        logger.debug("Claimed %d outbox messages with token %s", len(messages), token)
+        return messages
+
+    def dispatch(self, messages: list[SlackOutboxMessage]) -> None:
+        """Send claimed messages and save the results."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="outbox")
+
+        futures = {self._executor.submit(self._send, message): message for message in messages}
+        not_done: set[Future[tuple[MessageResponse | None, str]]] = set(futures)
+        while not_done:
+            done, not_done = wait(not_done, timeout=self.lease.total_seconds() / 3)
+            self._save_results([(futures[future], *future.result()) for future in done])
+            if not_done:
+                self._renew_claim([futures[future] for future in not_done])
+
+    def close(self) -> None:
+        """Shut down worker threads, waiting for deliveries in progress."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def run_once(self) -> int:
+        """Claim and send a batch of messages. Returns number of messages processed."""
+        messages = self.claim()
+        if messages:
+            self.dispatch(messages)
+            logger.info("Dispatched %d outbox messages", len(messages))
+
+        return len(messages)
+
+    def run_forever(self, *, poll_interval: float = 1.0, stop_event: threading.Event | None = None) -> None:
+        """Keep dispatching messages until stopped. Waits `poll_interval` seconds when outbox is empty."""
+        stop_event = stop_event or threading.Event()
+        try:
+            while not stop_event.is_set():
+                close_old_connections()
+                if self.run_once() < self.batch_size:
+                    stop_event.wait(poll_interval)
+        finally:
+            self.close()
+
+    def _send(self, message: SlackOutboxMessage) -> tuple[MessageResponse | None, str]:
+        close_old_connections()
+        try:
+            messenger = get_messenger(message.messenger_name or None)
+            response = messenger.send_request(MessageRequest.model_validate(message.request))
+        except Exception:
+            logger.exception("Error while sending outbox message %s", message.pk)
+            return None, traceback.format_exc()
+        finally:
+            close_old_connections()
+
+        return response, ""
+
+    def _claimed(self, messages: list[SlackOutboxMessage]) -> QuerySet[SlackOutboxMessage]:
+        """Messages still under the claim of this batch, i.e. not taken over by another dispatcher."""
+        return SlackOutboxMessage.objects.filter(
+            pk__in=[message.pk for message in messages],
+            claimed_by=messages[0].claimed_by,
+            status=SlackOutboxMessage.Status.CLAIMED,
+        )
+
+    def _renew_claim(self, messages: list[SlackOutboxMessage]) -> None:
+        """Extend the lease of messages still being sent."""
+        now = timezone.now()
+        renewed = self._claimed(messages).update(claimed_until=now + self.lease, last_modified=now)
+        logger.debug("Renewed claim of %d outbox messages still being sent", renewed)
+
+    def _save_results(self, results: list[tuple[SlackOutboxMessage, MessageResponse | None, str]]) -> None:
+        """Save results of messages, unless their claim has been taken over by another dispatcher."""
+        if not results:
+            return
+
+        messages = []
+        for message, response, error in results:
+            self._update_result(message, response=response, error=error)
+            messages.append(message)
+
+        with transaction.atomic():
+            claimed = set(self._claimed(messages).select_for_update().values_list("pk", flat=True))
+            SlackOutboxMessage.objects.bulk_update(
+                [message for message in messages if message.pk in claimed],
+                fields=("status", "claimed_until", "ok", "ts", "error", "last_modified"),
+            )
+
+        taken_over = [message.pk for message in messages if message.pk not in claimed]
+        if taken_over:
+            logger.warning("Claim of outbox messages %s was taken over, discarding results", taken_over)
+
+    def _update_result(self, message: SlackOutboxMessage, *, response: MessageResponse | None, error: str) -> None:
+        """Update fields of message by result of sending it."""
+        message.last_modified = timezone.now()
+        message.claimed_until = None
+        if error:
+            message.error = error
+            give_up = message.attempts >= self.max_attempts
+            message.status = SlackOutboxMessage.Status.FAILED if give_up else SlackOutboxMessage.Status.PENDING
+            return
+
+        if response is None:
+            # Stopped by a middleware, e.g. fanned out by policy or dropped as duplicate
+            message.status = SlackOutboxMessage.Status.STOPPED
+            return
+
+        message.status = SlackOutboxMessage.Status.SENT
+        message.ok = response.ok
+        message.ts = response.ts or ""
+        message.error = response.error or ""
@@ -0,0 +1,261 @@
+"""Monthly partitions of message history, on PostgreSQL.
+
+Partitioning is opt-in. `partition_table()` converts the message table to one partitioned by month of
+`created`, after which partitions of upcoming months should be created ahead periodically with
+`create_partitions()`. Old messages are then removed by dropping whole partitions with `drop_partitions()`,
+rather than deleting them row by row. Messages not falling in any monthly partition are kept in
+default partition, which is never dropped; they are moved out to monthly partitions as those are created.
+
+As unique constraints of partitioned tables must include the partition key, primary key and uniqueness of
+`ts` are enforced together with `created` once partitioned, i.e. as `(id, created)` and `(ts, created)`.
+See `partition_table()` for what it means.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections
+from django.utils.timezone import is_naive, make_aware
+
+from .models import SlackMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+logger = logging.getLogger(__name__)
+
+_META = SlackMessage._meta  # noqa: SLF001
+_DEFAULT_PARTITION = f"{_META.db_table}_default"
+_PARTITION_NAME_PATTERN = re.compile(r"_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+
+def is_partitioned(*, using: str = DEFAULT_DB_ALIAS) -> bool:
+    """Whether the message table is partitioned. Always `False` on databases other than PostgreSQL."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass",
+            [_META.db_table],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(*, using: str = DEFAULT_DB_ALIAS) -> dict[datetime, str]:
+    """Get monthly partitions of the message table.
+
+    Returns:
+        Names of partitions by start of their months, in order. Default partition is not included.
+    """
+    connection = _get_postgresql(using)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = %s::regclass",
+            [_META.db_table],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = _PARTITION_NAME_PATTERN.search(name)
+        if match:
+            month = datetime(int(match["year"]), int(match["month"]), 1, tzinfo=timezone.utc)
+            partitions[month] = name
+
+    return dict(sorted(partitions.items()))
+
+
+def create_partitions(
+    *,
+    months_ahead: int = 3,
+    now: datetime | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+) -> list[str]:
+    """Create monthly partitions of current and upcoming months, if not exist.
+
+    Messages of the months in default partition, e.g. those created with clock ahead or while no partition
+    of the month existed, are moved to new partitions. Default partition is locked until done.
+
+    Args:
+        months_ahead: Number of months after current month to create partitions for.
+        now: Current time. Defaults to now.
+        using: Database alias.
+
+    Returns:
+        Names of created partitions.
+    """
+    if months_ahead < 0:
+        msg = f"`months_ahead` must not be negative, got {months_ahead!r}"
+        raise ValueError(msg)
+
+    connection = _get_postgresql(using)
+    existing = list_partitions(using=using)
+    start = _month_of(now or datetime.now(tz=timezone.utc))
+    months = [month for month in _months(start, _add_months(start, months_ahead)) if month not in existing]
+    if months:
+        _create_partitions_from_default(connection, months)
+
+    created = [_partition_name(month) for month in months]
+    logger.info("Created %d partitions: %s", len(created), created)
+    return created
+
+
+def drop_partitions(*, before: datetime, detach_only: bool = False, using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Detach and drop monthly partitions of which messages are all created before given time.
+
+    Args:
+        before: Time before which messages are expired. If naive, it is in current time zone.
+        detach_only: If `True`, detach partitions but keep them as standalone tables, e.g. to back them up.
+        using: Database alias.
+
+    Returns:
+        Names of detached or dropped partitions.
+    """
+    connection = _get_postgresql(using)
+    if is_naive(before):
+        before = make_aware(before)
+
+    quote_name = connection.ops.quote_name
+    expired = [name for month, name in list_partitions(using=using).items() if _add_months(month, 1) <= before]
+    with connection.schema_editor() as editor:
+        for name in expired:
+            editor.execute(
+                f"ALTER TABLE {quote_name(_META.db_table)} DETACH PARTITION {quote_name(name)}",
+            )
+            if not detach_only:
+                editor.execute(f"DROP TABLE {quote_name(name)}")
+
+    logger.info("%s %d partitions: %s", "Detached" if detach_only else "Dropped", len(expired), expired)
+    return expired
+
+
+def partition_table(*, months_ahead: int = 3, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Convert the message table to a table partitioned by month, moving existing messages to partitions.
+
+    It rewrites whole table in a transaction, locking it until done. Run it once, during maintenance.
+
+    Warning:
+        Database no longer guarantees global uniqueness of `id` and `ts` once partitioned. Unique constraints
+        of partitioned tables must include the partition key, so they are replaced with ones on `(id, created)`
+        and `(ts, created)`. IDs generated by the sequence are still unique, but messages of the same `ts`
+        could be saved if created at different times, e.g. saved again with altered `created`, after which
+        lookups by `ts` raise `MultipleObjectsReturned`. Make sure nothing saves messages with IDs or `ts` of
+        existing ones before partitioning.
+
+    Args:
+        months_ahead: Number of months after current month to create partitions for.
+        using: Database alias.
+    """
+    connection = _get_postgresql(using)
+    if is_partitioned(using=using):
+        msg = "Message table is partitioned already."
+        raise ValueError(msg)
+
+    quote_name = connection.ops.quote_name
+    table = quote_name(_META.db_table)
+    old_table = quote_name(f"{_META.db_table}_unpartitioned")
+    created = quote_name(_META.get_field("created").column)
+    policy = _META.get_field("policy")
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN({created}) FROM {table}")  # noqa: S608
+        (first_created,) = cursor.fetchone()
+
+    now = datetime.now(tz=timezone.utc)
+    months = list(_months(_month_of(first_created or now), _add_months(_month_of(now), months_ahead)))
+    with connection.schema_editor(atomic=True) as editor:
+        editor.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+        editor.execute(
+            f"CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS) PARTITION BY RANGE ({created})",
+        )
+        editor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({quote_name(_META.pk.column)}, {created})")
+        editor.execute(f"ALTER TABLE {table} ADD UNIQUE ({quote_name(_META.get_field('ts').column)}, {created})")
+        editor.execute(
+            f"ALTER TABLE {table} ADD FOREIGN KEY ({quote_name(policy.column)})"
+            f" REFERENCES {quote_name(policy.related_model._meta.db_table)}"  # type: ignore[union-attr]  # noqa: SLF001
+            f" ({quote_name(policy.target_field.column)})"
+            " DEFERRABLE INITIALLY DEFERRED",
+        )
+        editor.execute(f"CREATE TABLE {quote_name(_DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT")
+        for month in months:
+            editor.execute(_create_partition_sql(connection, month))
+
+        editor.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")  # noqa: S608
+        editor.execute(f"DROP TABLE {old_table}")
+
+        # Indexes are dropped along with old table, so create them again as Django would
+        for sql in editor._model_indexes_sql(SlackMessage):  # type: ignore[attr-defined]  # noqa: SLF001
+            editor.execute(sql)
+
+    logger.info("Partitioned message table with %d monthly partitions", len(months))
+
+
+def _get_postgresql(using: str) -> BaseDatabaseWrapper:
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        msg = f"Partitioning message history is supported on PostgreSQL only, not {connection.vendor}."
+        raise NotSupportedError(msg)
+
+    return connection
+
+
+def _create_partitions_from_default(connection: BaseDatabaseWrapper, months: list[datetime]) -> None:
+    """Create partitions of months, moving rows of them out of default partition."""
+    quote_name = connection.ops.quote_name
+    table = quote_name(_META.db_table)
+    default = quote_name(_DEFAULT_PARTITION)
+    created = quote_name(_META.get_field("created").column)
+    with connection.schema_editor(atomic=True) as editor:
+        # Partition can't be attached while default partition has rows of its range, so move them first.
+        # Locked as attaching a partition does anyway, to not have rows of the range inserted meanwhile
+        editor.execute(f"LOCK TABLE {default} IN ACCESS EXCLUSIVE MODE")
+        for month in months:
+            name = quote_name(_partition_name(month))
+            start, end = month.isoformat(), _add_months(month, 1).isoformat()
+            editor.execute(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)")
+            editor.execute(
+                f"WITH moved AS (DELETE FROM {default} WHERE {created} >= %s AND {created} < %s RETURNING *)"  # noqa: S608
+                f" INSERT INTO {name} SELECT * FROM moved",
+                (start, end),
+            )
+            editor.execute(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')")
+
+
+def _create_partition_sql(connection: BaseDatabaseWrapper, month: datetime) -> str:
+    quote_name = connection.ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {quote_name(_partition_name(month))}"
+        f" PARTITION OF {quote_name(_META.db_table)}"
+        f" FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+    )
+
+
+def _partition_name(month: datetime) -> str:
+    return f"{_META.db_table}_p{month:%Y%m}"
+
+
+def _month_of(dt: datetime) -> datetime:
+    dt = dt.astimezone(timezone.utc)
+    return datetime(dt.year, dt.month, 1, tzinfo=timezone.utc)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    year, month_index = divmod(month.month - 1 + months, 12)
+    return month.replace(year=month.year + year, month=month_index + 1)
+
+
+def _months(start: datetime, end: datetime) -> Iterator[datetime]:
+    """Get starts of months from `start` to `end`, inclusive."""
+    month = start
+    while month <= end:
+        yield month
+        month = _add_months(month, 1)
@@ -0,0 +1,98 @@
+"""Convert dumps of requests and responses of saved messages between plain and compressed storage."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import SlackMessage
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+_PAYLOAD_FIELDS = ("request", "response")
+
+
+def compress_payloads(
+    queryset: QuerySet[SlackMessage] | None = None,
+    *,
+    decompress: bool = False,
+    chunk_size: int = 1000,
+    sleep: float = 0,
+    progress: Callable[[int], object] | None = None,
+) -> int:
+    """Move dumps of requests and responses of saved messages to compressed fields, or back with `decompress`.
+
+    Messages are processed in primary key order, chunk by chunk, each chunk in its own transaction.
+    If interrupted, calling it again continues from where it stopped.
+
+    Args:
+        queryset: Messages to convert. Defaults to all messages.
+        decompress: If `True`, move compressed dumps back to plain JSON fields instead.
+        chunk_size: Number of messages to update at once.
+        sleep: Seconds to sleep between chunks, to give other queries a chance.
+        progress: Callback called with total number of updated messages after each chunk.
+
+    Returns:
+        Number of messages updated.
+    """
+    if chunk_size < 1:
+        msg = f"`chunk_size` must be greater than 0, got {chunk_size!r}"
+        raise ValueError(msg)
+
+    if queryset is None:
+        queryset = SlackMessage.objects.all()
+
+    sources: tuple[str, ...]
+    targets: tuple[str, ...]
+    sources, targets = _PAYLOAD_FIELDS, tuple(f"compressed_{name}" for name in _PAYLOAD_FIELDS)
+    if decompress:
+        sources, targets = targets, sources
+
+    pending = (
+        queryset.filter(Q(**{f"{sources[0]}__isnull": False}) | Q(**{f"{sources[1]}__isnull": False}))
+        .only("id", *sources, *targets)
+        .order_by("pk")
+    )
+    total = 0
+    last_pk = None
+    while True:
+        remaining = pending if last_pk is None else pending.filter(pk__gt=last_pk)
+        with transaction.atomic(using=queryset.db):
+            chunk = list(remaining.select_for_update()[:chunk_size])
+            if not chunk:
+                break
+
+            for message in chunk:
+                _move_payloads(message, sources=sources, targets=targets)
+
+            total += SlackMessage.objects.using(queryset.db).bulk_update(chunk, fields=(*sources, *targets))
+
+        logger.debug("Converted %d messages, %d in total", len(chunk), total)
+        if progress:
+            progress(total)
+
+        if len(chunk) < chunk_size:
+            break
+
+        last_pk = chunk[-1].pk
+        if sleep:
+            time.sleep(sleep)
+
+    return total
+
+
+def _move_payloads(message: SlackMessage, *, sources: tuple[str, ...], targets: tuple[str, ...]) -> None:
+    for source, target in zip(sources, targets):
+        value = getattr(message, source)
+        if value is not None:
+            setattr(message, target, value)
+            setattr(message, source, None)
@@ -0,0 +1,146 @@
+"""Resolve permalinks of sent messages."""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import TYPE_CHECKING, Literal, cast
+
+from slack_sdk.errors import SlackApiError
+
+from django_slack_tools.utils.slack import build_permalink
+
+from .models import SlackMessage
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from slack_sdk import WebClient
+
+logger = logging.getLogger(__name__)
+
+PermalinkMode = Literal["api", "local", "deferred"]
+"""How to get permalinks of sent messages.
+
+- `"api"`: Call `chat.getPermalink` API for each message.
+- `"local"`: Build permalinks from workspace URL, fetched once for each client with `auth.test` API.
+    Falls back to `"api"` if message channel is not a conversation ID, such as channel names.
+- `"deferred"`: Leave permalinks empty, to be filled in later by `backfill_permalinks()`.
+"""
+
+
+@functools.cache
+def get_team_url(client: WebClient) -> str:
+    """Get URL of the workspace client's token belongs to, such as `https://example.slack.com/`.
+
+    Results are cached for each client, while errors are not.
+    """
+    response = client.auth_test()
+    return cast("str", response["url"])
+
+
+def resolve_permalink(  # noqa: PLR0913
+    client: WebClient,
+    *,
+    channel: str,
+    ts: str,
+    thread_ts: str | None = None,
+    mode: Literal["api", "local"] = "api",
+    team_url: str | None = None,
+) -> str:
+    """Get permalink of a message. It returns empty string on error.
+
+    Args:
+        client: Slack Web API client.
+        channel: Channel the message sent to.
+        ts: Message ID.
+        thread_ts: Parent message ID, if the message is a reply in a thread.
+        mode: Whether to call `chat.getPermalink` API, or build it locally if possible.
+        team_url: Workspace URL to build permalinks with. If not set, it is fetched with `get_team_url()`.
+
+    Returns:
+        Permalink of the message, or empty string if failed.
+    """
+    try:
+        if mode == "local":
+            try:
+                return build_permalink(
+                    team_url=team_url or get_team_url(client),
+                    channel=channel,
+                    ts=ts,
+                    thread_ts=thread_ts,
+                )
+            except ValueError:
+                logger.debug("Channel %r is not a conversation ID, getting permalink with API", channel)
+
+        response = client.chat_getPermalink(channel=channel, message_ts=ts)
+        return response.get("permalink", default="")
+    except SlackApiError as err:
+        logger.debug("Error while getting permalink: %s", exc_info=err)
+        return ""
+
+
+def backfill_permalinks(
+    queryset: QuerySet[SlackMessage] | None = None,
+    *,
+    client: WebClient,
+    mode: Literal["api", "local"] = "local",
+    team_url: str | None = None,
+    chunk_size: int = 100,
+) -> int:
+    """Fill in permalinks of sent messages missing them, such as those saved with `"deferred"` permalink mode.
+
+    Messages are processed in primary key order, chunk by chunk. Messages of which permalink couldn't be
+    resolved are left empty, to be retried next time.
+
+    Args:
+        queryset: Messages to fill in permalinks. Defaults to all messages.
+        client: Slack Web API client.
+        mode: Whether to call `chat.getPermalink` API for each message, or build them locally if possible.
+        team_url: Workspace URL to build permalinks with. If not set, it is fetched with `get_team_url()`.
+        chunk_size: Number of messages to update at once.
+
+    Returns:
+        Number of messages updated.
+    """
+    if chunk_size < 1:
+        msg = f"`chunk_size` must be greater than 0, got {chunk_size!r}"
+        raise ValueError(msg)
+
+    if queryset is None:
+        queryset = SlackMessage.objects.all()
+
+    pending = (
+        queryset.filter(ok=True, permalink="", ts__isnull=False)
+        .exclude(ts="")
+        .only("id", "channel", "ts", "parent_ts")
+        .order_by("pk")
+    )
+    total = 0
+    last_pk = None
+    while True:
+        remaining = pending if last_pk is None else pending.filter(pk__gt=last_pk)
+        chunk = list(remaining[:chunk_size])
+        if not chunk:
+            break
+
+        resolved = []
+        for message in chunk:
+            message.permalink = resolve_permalink(
+                client,
+                channel=message.channel,
+                ts=cast("str", message.ts),
+                thread_ts=message.parent_ts,
+                mode=mode,
+                team_url=team_url,
+            )
+            if message.permalink:
+                resolved.append(message)
+
+        total += SlackMessage.objects.bulk_update(resolved, fields=("permalink",))
+        logger.debug("Filled in %d of %d permalinks, %d in total", len(resolved), len(chunk), total)
+        if len(chunk) < chunk_size:
+            break
+
+        last_pk = chunk[-1].pk
+
+    return total
@@ -8,6 +8,8 @@
 from django_slack_tools.app_settings import get_messenger
 from django_slack_tools.messenger.shortcuts import MessageBody, MessageHeader, MessageRequest
 
+from .models import SlackOutboxMessage
+
 if TYPE_CHECKING:
     from django_slack_tools.messenger.shortcuts import MessageResponse
 
@@ -21,6 +23,7 @@ def slack_message(
     messenger_name: str | None = None,
     header: MessageHeader | dict[str, Any] | None = None,
     message: str,
+    idempotency_key: str | None = None,
 ) -> MessageResponse | None: ...  # pragma: no cover
 
 
@@ -32,6 +35,7 @@ def slack_message(
     header: MessageHeader | dict[str, Any] | None = None,
     template: str | None = None,
     context: dict[str, Any] | None = None,
+    idempotency_key: str | None = None,
 ) -> MessageResponse | None: ...  # pragma: no cover
 
 
@@ -43,6 +47,7 @@ def slack_message(  # noqa: PLR0913
     template: str | None = None,
     context: dict[str, Any] | None = None,
     message: str | None = None,
+    idempotency_key: str | None = None,
 ) -> MessageResponse | None:
     """Shortcut for sending a Slack message.
 
@@ -53,26 +58,115 @@ def slack_message(  # noqa: PLR0913
         template: Message template key. Cannot be used with `message`.
         context: Context for rendering the template. Only used with `template`.
         message: Simple message text. Cannot be used with `template`.
+        idempotency_key: Key identifying the message, for `DeduplicationMiddleware` to skip sending it again.
 
     Returns:
         Sent message instance or `None`.
     """
+    messenger = get_messenger(messenger_name)
+    request = _make_request(
+        to,
+        header=header,
+        template=template,
+        context=context,
+        message=message,
+        idempotency_key=idempotency_key,
+    )
+    return messenger.send_request(request)
+
+
+@overload
+def enqueue_slack_message(
+    to: str,
+    *,
+    messenger_name: str | None = None,
+    header: MessageHeader | dict[str, Any] | None = None,
+    message: str,
+    idempotency_key: str | None = None,
+) -> SlackOutboxMessage: ...  # pragma: no cover
+
+
+@overload
+def enqueue_slack_message(
+    to: str,
+    *,
+    messenger_name: str | None = None,
+    header: MessageHeader | dict[str, Any] | None = None,
+    template: str | None = None,
+    context: dict[str, Any] | None = None,
+    idempotency_key: str | None = None,
+) -> SlackOutboxMessage: ...  # pragma: no cover
+
+
+def enqueue_slack_message(  # noqa: PLR0913
+    to: str,
+    *,
+    messenger_name: str | None = None,
+    header: MessageHeader | dict[str, Any] | None = None,
+    template: str | None = None,
+    context: dict[str, Any] | None = None,
+    message: str | None = None,
+    idempotency_key: str | None = None,
+) -> SlackOutboxMessage:
+    """Write a Slack message to outbox, to be sent later by outbox dispatcher.
+
+    Outbox message is created in current database transaction, so it is sent only if the transaction commits.
+    Arguments are same as `slack_message`; template is rendered by dispatcher when sending.
+
+    Args:
+        to: Recipient.
+        messenger_name: Messenger name. If not set, default messenger is used.
+        header: Slack message control header.
+        template: Message template key. Cannot be used with `message`.
+        context: Context for rendering the template. Only used with `template`.
+        message: Simple message text. Cannot be used with `template`.
+        idempotency_key: Key identifying the message, for `DeduplicationMiddleware` to skip sending it again.
+
+    Returns:
+        Created outbox message.
+    """
+    request = _make_request(
+        to,
+        header=header,
+        template=template,
+        context=context,
+        message=message,
+        idempotency_key=idempotency_key,
+    )
+    return SlackOutboxMessage.objects.create(
+        messenger_name=messenger_name or "",
+        request=request.model_dump(mode="json"),
+    )
+
+
+def _make_request(  # noqa: PLR0913
+    to: str,
+    *,
+    header: MessageHeader | dict[str, Any] | None,
+    template: str | None,
+    context: dict[str, Any] | None,
+    message: str | None,
+    idempotency_key: str | None,
+) -> MessageRequest:
     if (template and message) or (not template and not message):
         msg = "Either `template` or `message` must be set, but not both."
         raise ValueError(msg)
 
-    messenger = get_messenger(messenger_name)
     header = MessageHeader.from_any(header)
-
     if message:
-        request = MessageRequest(
+        return MessageRequest(
             channel=to,
             header=header,
             body=MessageBody(text=message),
             template_key=None,
             context={},
+            idempotency_key=idempotency_key,
         )
-        return messenger.send_request(request)
 
-    context = context or {}
-    return messenger.send(to, header=header, template=template, context=context)
+    return MessageRequest(
+        channel=to,
+        header=header,
+        template_key=template,
+        context=context or {},
+        idempotency_key=idempotency_key,
+    )
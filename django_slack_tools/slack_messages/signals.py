@@ -0,0 +1,59 @@
+"""Signal handlers."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from django_slack_tools.messenger.template_loaders import invalidate_cached_templates
+
+from .messenger.policy_resolver import invalidate_resolved_policies
+from .models import SlackMention, SlackMessageRecipient, SlackMessagingPolicy
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+logger = getLogger(__name__)
+
+
+@receiver([post_save, post_delete], sender=SlackMessagingPolicy, dispatch_uid="invalidate_cached_templates")
+def invalidate_cached_policy_templates(
+    sender: type[SlackMessagingPolicy],  # noqa: ARG001
+    instance: SlackMessagingPolicy,
+    using: str,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    """Invalidate cached templates on changes of messaging policies, as templates could be loaded from policies.
+
+    Invalidated once the change is committed, as templates reloaded before that would be of the old policy.
+    """
+    logger.debug("Messaging policy %r changed, invalidating cached templates", instance.code)
+    transaction.on_commit(invalidate_cached_templates, using=using)
+
+
+@receiver([post_save, post_delete], sender=SlackMessagingPolicy, dispatch_uid="invalidate_resolved_policies:policy")
+@receiver([post_save, post_delete], sender=SlackMessageRecipient, dispatch_uid="invalidate_resolved_policies:recipient")
+@receiver([post_save, post_delete], sender=SlackMention, dispatch_uid="invalidate_resolved_policies:mention")
+@receiver(
+    m2m_changed,
+    sender=SlackMessagingPolicy.recipients.through,
+    dispatch_uid="invalidate_resolved_policies:policy_recipients",
+)
+@receiver(
+    m2m_changed,
+    sender=SlackMessageRecipient.mentions.through,
+    dispatch_uid="invalidate_resolved_policies:recipient_mentions",
+)
+def invalidate_policy_snapshots(sender: type[Model], **kwargs: Any) -> None:
+    """Invalidate resolved policies on changes of policies or their recipients and mentions, once committed."""
+    # Relation changes signal before and after the change
+    action = kwargs.get("action")
+    if action is not None and not action.startswith("post_"):
+        return
+
+    logger.debug("%s changed, invalidating resolved policies", sender.__name__)
+    transaction.on_commit(invalidate_resolved_policies, using=kwargs["using"])
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
-from celery import shared_task
+from celery import Task, shared_task
 from celery.utils.log import get_task_logger
 from django.utils import timezone
 
-from . import shortcuts
+from django_slack_tools.app_settings import app_settings, get_messenger
+from django_slack_tools.messenger.shortcuts import MessageRequest
+from django_slack_tools.utils import tracing
+from django_slack_tools.utils.django.deletion import chunked_delete
+
+from . import archive, partitions, permalinks, shortcuts
 from .models import SlackMessage
 
 if TYPE_CHECKING:
@@ -17,8 +23,29 @@
 
 logger = get_task_logger(__name__)
 
+_TRACE_CONTEXT_HEADER = "django_slack_tools_trace_context"
+
+
+class TracedTask(Task):
+    """Task continuing the trace of caller, if `opentelemetry-api` is installed.
+
+    Trace context of caller is sent in message headers, to be attached while the task runs.
+    """
+
+    def apply_async(self, args: Any = None, kwargs: Any = None, **options: Any) -> Any:  # noqa: D102
+        carrier = tracing.inject_context()
+        if carrier:
+            options["headers"] = {**(options.get("headers") or {}), _TRACE_CONTEXT_HEADER: carrier}
+
+        return super().apply_async(args, kwargs, **options)
 
-@shared_task
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: D102
+        headers = self.request.headers or {}
+        with tracing.attach_context(headers.get(_TRACE_CONTEXT_HEADER)):
+            return super().__call__(*args, **kwargs)
+
+
+@shared_task(base=TracedTask)
 def slack_message(*args: Any, **kwargs: Any) -> str | None:
     """Celery task wrapper for `.shortcuts.slack_message`.
 
@@ -33,22 +60,58 @@ def slack_message(*args: Any, **kwargs: Any) -> str | None:
     return response.ts if response else None
 
 
-@shared_task
+@shared_task(base=TracedTask)
+def send_requests(*, messenger_name: str | None, requests: list[dict[str, Any]]) -> list[str | None]:
+    """Send serialized message requests with a messenger, e.g. messages fanned out by policy handler.
+
+    Args:
+        messenger_name: Messenger name. If not set, default messenger is used.
+        requests: Message requests serialized in JSON mode.
+
+    Returns:
+        IDs of sent messages, `None` for those not sent.
+    """
+    messenger = get_messenger(messenger_name)
+    results = []
+    for request in requests:
+        response = messenger.send_request(MessageRequest.model_validate(request))
+        results.append(response.ts if response else None)
+
+    return results
+
+
+@shared_task(base=TracedTask)
 def cleanup_old_messages(
     *,
     base_ts: str | None = None,
     threshold_seconds: int | None = 7 * 24 * 60 * 60,  # 7 days
+    chunk_size: int = 1000,
+    sleep_seconds: float = 0,
+    archive_dir: str | None = None,
 ) -> int:
     """Delete old messages created before given threshold.
 
+    Messages are deleted chunk by chunk to keep transactions short. If the task is killed midway,
+    running it again with same `base_ts` continues from where it stopped.
+
+    If the message table is partitioned on PostgreSQL, monthly partitions of which messages are all old
+    are dropped at once first, and only the rest are deleted row by row.
+
     Args:
         threshold_seconds: Threshold seconds. Defaults to 7 days.
         base_ts: Base timestamp to calculate the threshold, in ISO format. If falsy, current timestamp will be used.
+            Timestamps without time zone are in current time zone.
+        chunk_size: Number of messages to delete at once.
+        sleep_seconds: Seconds to sleep between chunks.
+        archive_dir: If set, old messages are written to a gzip compressed JSON Lines file in the directory
+            before deleted, which can be loaded back with `loaddata` command.
 
     Returns:
-        Number of deleted messages.
+        Number of messages deleted row by row, not including those in dropped partitions.
     """
     dt = datetime.fromisoformat(base_ts) if base_ts else timezone.localtime()
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
 
     if threshold_seconds is None:
         logger.warning("Threshold seconds not provided, skipping cleanup.")
@@ -57,7 +120,44 @@ def cleanup_old_messages(
     cleanup_threshold = dt - timedelta(seconds=threshold_seconds)
     logger.debug("Cleaning up messages older than %s.", cleanup_threshold)
 
-    num_deleted, _ = SlackMessage.objects.filter(created__lt=cleanup_threshold).delete()
+    old_messages = SlackMessage.objects.filter(created__lt=cleanup_threshold)
+    if archive_dir:
+        path = Path(archive_dir) / f"slack_messages_{timezone.now():%Y%m%dT%H%M%S%f}.jsonl.gz"
+        archive.archive_messages(old_messages, path=path, chunk_size=chunk_size)
+
+    if partitions.is_partitioned():
+        dropped = partitions.drop_partitions(before=cleanup_threshold)
+        logger.info("Dropped %d partitions of old messages.", len(dropped))
+
+    num_deleted = chunked_delete(
+        old_messages,
+        chunk_size=chunk_size,
+        sleep=sleep_seconds,
+        progress=lambda total: logger.info("Deleted %d old messages so far.", total),
+    )
     logger.info("Deleted %d old messages.", num_deleted)
 
     return num_deleted
+
+
+@shared_task(base=TracedTask)
+def backfill_permalinks(*, mode: Literal["api", "local"] = "local", chunk_size: int = 100) -> int:
+    """Fill in permalinks of sent messages missing them, with the client of configured Slack app.
+
+    Schedule it periodically along with `"deferred"` permalink mode of persister, to keep them off from sending.
+
+    Args:
+        mode: Whether to call `chat.getPermalink` API for each message, or build them locally if possible.
+        chunk_size: Number of messages to update at once.
+
+    Returns:
+        Number of messages updated.
+    """
+    num_updated = permalinks.backfill_permalinks(
+        client=app_settings.slack_app.client,
+        mode=mode,
+        chunk_size=chunk_size,
+    )
+    logger.info("Filled in permalinks of %d messages.", num_updated)
+
+    return num_updated
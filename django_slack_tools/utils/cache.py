@@ -0,0 +1,75 @@
+"""Cache utilities."""
+
+from __future__ import annotations
+
+import threading
+import time
+from logging import getLogger
+
+from django.core.cache import caches
+
+logger = getLogger(__name__)
+
+_local_versions: dict[str, int] = {}
+_local_versions_lock = threading.Lock()
+
+
+class CacheVersion:
+    """Version of locally cached data, to invalidate it across the processes.
+
+    Version is kept both in process memory and in Django's cache. In-process version makes invalidation work
+    even with cache backends not shared between processes (e.g. dummy cache), while the shared one lets other
+    processes know the data has been changed.
+
+    Getting the shared version is a round trip to the cache backend (e.g. Redis), so it can be reused for
+    `check_interval` seconds. Then changes by other processes are noticed with that much delay, while those
+    by current process are noticed immediately.
+    """
+
+    def __init__(self, key: str, *, cache_alias: str = "default", check_interval: float = 0) -> None:
+        """Initialize cache version.
+
+        Args:
+            key: Cache key for the version.
+            cache_alias: Alias of Django cache to store the version.
+            check_interval: Seconds to reuse the shared version for. `0` to get it on every call.
+
+        Raises:
+            ValueError: Negative check interval.
+        """
+        if check_interval < 0:
+            msg = f"`check_interval` must not be negative, got {check_interval!r}"
+            raise ValueError(msg)
+
+        self.key = key
+        self.cache_alias = cache_alias
+        self.check_interval = check_interval
+        self._shared: tuple[int, float] | None = None
+
+    def get(self) -> tuple[int, int]:
+        """Return current version. Versions are only meant to be compared for equality."""
+        return _local_versions.get(self.key, 0), self._get_shared()
+
+    def _get_shared(self) -> int:
+        now = time.monotonic()
+        shared = self._shared
+        if shared is not None and now - shared[1] < self.check_interval:
+            return shared[0]
+
+        version: int = caches[self.cache_alias].get(self.key, 0)
+        self._shared = (version, now)
+        return version
+
+    def bump(self) -> None:
+        """Bump the version, invalidating data cached with previous versions."""
+        with _local_versions_lock:
+            _local_versions[self.key] = _local_versions.get(self.key, 0) + 1
+
+        cache = caches[self.cache_alias]
+        try:
+            cache.incr(self.key)
+        except ValueError:
+            # Key does not exist (or has been evicted) yet
+            cache.set(self.key, 1, timeout=None)
+
+        logger.debug("Bumped cache version for key %r", self.key)
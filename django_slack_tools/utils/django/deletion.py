@@ -0,0 +1,77 @@
+"""Utils for deleting large number of rows."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.deletion import Collector
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from django.db.models import Model, QuerySet
+
+logger = logging.getLogger(__name__)
+
+
+def chunked_delete(
+    queryset: QuerySet[Model],
+    *,
+    chunk_size: int = 1000,
+    sleep: float = 0,
+    progress: Callable[[int], object] | None = None,
+) -> int:
+    """Delete rows matching the queryset, chunk by chunk.
+
+    Unlike `QuerySet.delete()` which collects every object to delete in memory and deletes them
+    in a single transaction, each chunk is deleted in its own short transaction. If interrupted,
+    chunks already deleted stay deleted and calling it again with same queryset continues from there.
+
+    Chunks are deleted with a single `DELETE` query if possible, i.e. there are no cascades or signals to handle.
+    Otherwise it falls back to `QuerySet.delete()` for each chunk.
+
+    Args:
+        queryset: Rows to delete.
+        chunk_size: Number of rows to delete at once.
+        sleep: Seconds to sleep between chunks, to give other queries a chance.
+        progress: Callback called with total number of deleted rows after each chunk.
+
+    Returns:
+        Number of deleted rows of the queryset's model, not including cascades.
+    """
+    if chunk_size < 1:
+        msg = f"`chunk_size` must be greater than 0, got {chunk_size!r}"
+        raise ValueError(msg)
+
+    label = queryset.model._meta.label  # noqa: SLF001
+    db = queryset.db
+    pk_queryset = queryset.order_by().values_list("pk", flat=True)
+    total = 0
+    while True:
+        with transaction.atomic(using=db):
+            pks = list(pk_queryset[:chunk_size])
+            if not pks:
+                break
+
+            chunk = queryset.order_by().filter(pk__in=pks)
+            if Collector(using=db, origin=chunk).can_fast_delete(chunk):
+                num_deleted = chunk._raw_delete(db)  # type: ignore[attr-defined]  # noqa: SLF001
+            else:
+                _, per_model = chunk.delete()
+                num_deleted = per_model.get(label, 0)
+
+        total += num_deleted
+        logger.debug("Deleted %d rows of %s, %d in total", num_deleted, label, total)
+        if progress is not None:
+            progress(total)
+
+        if len(pks) < chunk_size:
+            break
+
+        if sleep:
+            time.sleep(sleep)
+
+    return total
@@ -0,0 +1,26 @@
+"""JSON encoders for Django model fields."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class RawJSON(str):
+    """JSON document encoded already, such as with Pydantic's `model_dump_json()`."""
+
+    __slots__ = ()
+
+
+class RawJSONEncoder(json.JSONEncoder):
+    """JSON encoder writing `RawJSON` as is, while encoding other objects as usual.
+
+    Set as `encoder` of `JSONField` to save JSON encoded elsewhere, without turning it into Python objects
+    and encoding them again.
+    """
+
+    def encode(self, o: Any) -> str:  # noqa: D102
+        if isinstance(o, RawJSON):
+            return str(o)
+
+        return super().encode(o)
@@ -0,0 +1,93 @@
+"""Django model fields."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from base64 import b64encode
+from typing import TYPE_CHECKING, Any
+
+from django import forms
+from django.db import models
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+    from django.db.models import Expression, Model
+
+
+class CompressedJSONField(models.BinaryField):
+    """JSON field stored compressed with zlib as binary, for large documents rarely queried.
+
+    Values are read and written as Python objects like `JSONField`, and edited as JSON in forms.
+    Unlike `JSONField`, values can't be queried into with lookups such as `field__key`.
+    """
+
+    description = "Compressed JSON object"
+
+    def __init__(
+        self,
+        *args: Any,
+        encoder: type[json.JSONEncoder] | None = None,
+        level: int = 6,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize field.
+
+        Args:
+            args: Positional arguments of `BinaryField`.
+            encoder: JSON encoder class to encode values with.
+            level: zlib compression level, from 0 (none) to 9 (best).
+            kwargs: Keyword arguments of `BinaryField`.
+        """
+        if not 0 <= level <= 9:  # noqa: PLR2004
+            msg = f"`level` must be between 0 and 9, got {level!r}"
+            raise ValueError(msg)
+
+        self.encoder = encoder
+        self.level = level
+        kwargs.setdefault("editable", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> Any:  # noqa: D102
+        name, path, args, kwargs = super().deconstruct()
+        if self.editable:
+            del kwargs["editable"]
+        else:
+            kwargs["editable"] = False
+
+        if self.encoder is not None:
+            kwargs["encoder"] = self.encoder
+
+        if self.level != 6:  # noqa: PLR2004
+            kwargs["level"] = self.level
+
+        return name, path, args, kwargs
+
+    def get_prep_value(self, value: Any) -> bytes | None:  # noqa: D102
+        if value is None:
+            return None
+
+        return zlib.compress(json.dumps(value, cls=self.encoder).encode(), self.level)
+
+    def from_db_value(self, value: Any, expression: Expression, connection: BaseDatabaseWrapper) -> Any:  # noqa: ARG002, D102
+        if value is None:
+            return None
+
+        return self._decompress(value)
+
+    def to_python(self, value: Any) -> Any:  # noqa: D102
+        value = super().to_python(value)
+        if isinstance(value, (bytes, memoryview)):
+            return self._decompress(value)
+
+        return value
+
+    def value_to_string(self, obj: Model) -> str:
+        """Serialize compressed value as base64, as `BinaryField` does."""
+        return b64encode(self.get_prep_value(self.value_from_object(obj)) or b"").decode("ascii")
+
+    def formfield(self, **kwargs: Any) -> forms.Field | None:  # type: ignore[override]  # noqa: D102
+        return super().formfield(**{"form_class": forms.JSONField, "encoder": self.encoder, **kwargs})
+
+    def _decompress(self, value: bytes | memoryview) -> Any:
+        return json.loads(zlib.decompress(value))
@@ -0,0 +1,61 @@
+"""Migration operations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import NotSupportedError, migrations
+
+if TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import ProjectState
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """Add index without blocking writes to the table on PostgreSQL, and as `AddIndex` does on other databases.
+
+    On PostgreSQL, index is created with `CREATE INDEX CONCURRENTLY` like `django.contrib.postgres`'s operation
+    of the same name, which can't be imported without PostgreSQL driver installed. As it can't run in
+    a transaction, migrations using it must set `atomic = False`.
+    """
+
+    def describe(self) -> str:  # noqa: D102
+        return f"Concurrently create index {self.index.name} on field(s) {', '.join(self.index.fields)} of model {self.model_name}"  # noqa: E501
+
+    def database_forwards(  # noqa: D102
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor != "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+            return
+
+        _ensure_not_in_transaction(schema_editor)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)  # type: ignore[call-arg]
+
+    def database_backwards(  # noqa: D102
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor != "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+            return
+
+        _ensure_not_in_transaction(schema_editor)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)  # type: ignore[call-arg]
+
+
+def _ensure_not_in_transaction(schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.in_atomic_block:
+        msg = "Concurrent index operations can't run in a transaction. Set `atomic = False` on the migration."
+        raise NotSupportedError(msg)
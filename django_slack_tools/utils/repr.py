@@ -1,10 +1,32 @@
 # noqa: D100
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 
 def make_repr(obj: Any) -> str:
     """Make a repr string for an object."""
     args = ", ".join(f"{k}={v!r}" for k, v in obj.__dict__.items())
     return f"{obj.__class__.__name__}({args})"
+
+
+class LazyStr:
+    """String computed only when formatted, such as arguments of log messages not emitted.
+
+    ```python
+    logger.info("Sending request: %s", LazyStr(request.summary))
+    ```
+    """
+
+    __slots__ = ("_func",)
+
+    def __init__(self, func: Callable[[], str]) -> None:
+        """Initialize lazy string.
+
+        Args:
+            func: Function returning the string.
+        """
+        self._func = func
+
+    def __str__(self) -> str:
+        return self._func()
@@ -0,0 +1,45 @@
+"""Flushing pending work of objects at process exit."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import weakref
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class Flushable(Protocol):
+    """Object having pending work to flush."""
+
+    def flush(self) -> None:
+        """Flush pending work."""
+
+
+_flushables: weakref.WeakSet[Flushable] = weakref.WeakSet()
+_lock = threading.Lock()
+_registered = False
+
+
+def flush_at_exit(obj: Flushable) -> None:
+    """Flush given object at process exit.
+
+    Objects are referenced weakly, so they are not kept alive for it. A single exit hook flushes all of them.
+    """
+    global _registered  # noqa: PLW0603
+
+    with _lock:
+        _flushables.add(obj)
+        if not _registered:
+            atexit.register(_flush_all)
+            _registered = True
+
+
+def _flush_all() -> None:
+    for obj in list(_flushables):
+        try:
+            obj.flush()
+        except Exception:  # noqa: PERF203
+            logger.exception("Error while flushing %r at exit", obj)
@@ -1,3 +1,10 @@
-from .misc import get_block_kit_builder_url
+from .client import ConnectionClosedAfterSendError, ConnectionPoolMetrics, PooledWebClient
+from .misc import build_permalink, get_block_kit_builder_url
 
-__all__ = ("get_block_kit_builder_url",)
+__all__ = (
+    "ConnectionClosedAfterSendError",
+    "ConnectionPoolMetrics",
+    "PooledWebClient",
+    "build_permalink",
+    "get_block_kit_builder_url",
+)
@@ -0,0 +1,288 @@
+"""Slack Web API client reusing HTTP connections."""
+
+from __future__ import annotations
+
+import http.client
+import io
+import os
+import select
+import threading
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from slack_sdk import WebClient
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+logger = getLogger(__name__)
+
+PoolScope = Literal["process", "thread"]
+
+_ConnectionKey = tuple[str, str, "int | None"]
+
+# Errors of reused connections closed by server while idle, safe to retry with new connection if request not sent
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+# Methods safe to retry even if the request might have been processed by server
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+
+_HTTP_BAD_REQUEST = 400
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """Counters of connection pool usage."""
+
+    requests: int = 0
+    """Number of requests sent."""
+
+    opened: int = 0
+    """Number of connections opened."""
+
+    reused: int = 0
+    """Number of requests sent with a connection reused from pool."""
+
+    discarded: int = 0
+    """Number of pooled connections found closed by server when reused."""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter by given value."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Ratio of requests sent with reused connections."""
+        return self.reused / self.requests if self.requests else 0.0
+
+
+class ConnectionClosedAfterSendError(ConnectionError):
+    """Connection closed by server after a non-idempotent request was sent, so it might have been processed.
+
+    Unlike the errors it is raised from (e.g. `RemoteDisconnected`), it is not retried by `WebClient`'s default
+    retry handlers, which would otherwise send the request (e.g. `chat.postMessage`) again.
+    """
+
+
+class _StaleConnectionError(Exception):
+    """Reused connection found closed by server, in a way safe to retry the request with a new connection."""
+
+
+class _ConnectionPool:
+    """Idle connections by host, dropped in forked processes as the sockets are shared with parent."""
+
+    def __init__(self, *, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._idle: dict[_ConnectionKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(self, key: _ConnectionKey) -> http.client.HTTPConnection | None:
+        with self._lock:
+            self._check_fork()
+            connections = self._idle.get(key)
+            return connections.pop() if connections else None
+
+    def put(self, key: _ConnectionKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._check_fork()
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.maxsize:
+                connections.append(connection)
+                return
+
+        connection.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            # Do not close them, to not shut down the connections of parent process
+            self._idle = {}
+            self._pid = os.getpid()
+
+
+class PooledWebClient(WebClient):
+    """Slack Web API client keeping HTTP connections alive and reusing them across requests.
+
+    `WebClient` opens a new connection (and TLS handshake) for each API call. This client keeps
+    idle connections in a pool, shared by the process or by each thread, to reuse them for next calls.
+    Set it as the client of Slack app to use it for all the calls, including those of messaging backends
+    and middlewares:
+
+    ```python
+    app = App(client=PooledWebClient(token=..., pool_size=4), signing_secret=...)
+    ```
+
+    Requests through proxy are sent as `WebClient` does, without pooling.
+    """
+
+    def __init__(self, *args: Any, pool_size: int = 4, pool_scope: PoolScope = "process", **kwargs: Any) -> None:
+        """Initialize client.
+
+        Args:
+            args: Positional arguments for `WebClient`.
+            pool_size: Maximum number of idle connections kept for each host, per pool.
+            pool_scope: Whether to share a pool in the process, or have a pool for each thread.
+            kwargs: Keyword arguments for `WebClient`.
+        """
+        if pool_size < 1:
+            msg = f"`pool_size` must be greater than 0, got {pool_size!r}"
+            raise ValueError(msg)
+
+        if pool_scope not in ("process", "thread"):
+            msg = f"Unsupported pool scope: {pool_scope!r}"
+            raise ValueError(msg)
+
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size
+        self.pool_scope = pool_scope
+        self.pool_metrics = ConnectionPoolMetrics()
+        self._process_pool = _ConnectionPool(maxsize=pool_size)
+        self._thread_local = threading.local()
+
+    def close(self) -> None:
+        """Close idle connections of the pool in use by current thread."""
+        self._get_pool().clear()
+
+    def _get_pool(self) -> _ConnectionPool:
+        if self.pool_scope == "process":
+            return self._process_pool
+
+        pool: _ConnectionPool | None = getattr(self._thread_local, "pool", None)
+        if pool is None:
+            pool = self._thread_local.pool = _ConnectionPool(maxsize=self.pool_size)
+
+        return pool
+
+    def _perform_urllib_http_request_internal(self, url: str, req: Request) -> dict[str, Any]:
+        if self.proxy is not None or not url.lower().startswith("http"):
+            return super()._perform_urllib_http_request_internal(url, req)
+
+        parts = urlsplit(url)
+        key: _ConnectionKey = (parts.scheme.lower(), parts.hostname or "", parts.port)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        response, body = self._request(key, method=req.get_method(), path=path, req=req)
+
+        # Responses with error status are raised as `urllib` does, to be handled by `WebClient`
+        if response.status >= _HTTP_BAD_REQUEST:
+            raise HTTPError(url, response.status, response.reason, response.msg, io.BytesIO(body))
+
+        if response.msg.get_content_type() == "application/gzip":
+            return {"status": response.status, "headers": response.msg, "body": body}
+
+        charset = response.msg.get_content_charset() or "utf-8"
+        return {"status": response.status, "headers": response.msg, "body": body.decode(charset)}
+
+    def _request(
+        self,
+        key: _ConnectionKey,
+        *,
+        method: str,
+        path: str,
+        req: Request,
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """Send request with pooled connection, returning the response with body read."""
+        pool = self._get_pool()
+        self.pool_metrics.increment("requests")
+        connection = pool.get(key)
+        if connection is not None and _is_dropped(connection):
+            logger.debug("Pooled connection to %s closed by server while idle, discarding", key[1])
+            connection.close()
+            self.pool_metrics.increment("discarded")
+            connection = None
+
+        if connection is not None:
+            try:
+                response, body = self._send(connection, method=method, path=path, req=req, reused=True)
+            except _StaleConnectionError:
+                logger.debug("Pooled connection to %s closed by server, reconnecting", key[1])
+                self.pool_metrics.increment("discarded")
+            else:
+                self.pool_metrics.increment("reused")
+                self._release(pool, key, connection, response)
+                return response, body
+
+        scheme, host, port = key
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl)
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+        self.pool_metrics.increment("opened")
+        response, body = self._send(connection, method=method, path=path, req=req)
+        self._release(pool, key, connection, response)
+        return response, body
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        *,
+        method: str,
+        path: str,
+        req: Request,
+        reused: bool = False,
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """Send request and read the response, closing the connection on error.
+
+        For `reused` connections, errors of stale connections are raised as `_StaleConnectionError` if the
+        request is safe to retry: the error was raised before the request was sent, or the method is idempotent.
+        Otherwise, the request (e.g. `chat.postMessage`) might have been processed, so the error is raised as
+        `ConnectionClosedAfterSendError` not to be retried.
+        """
+        sent = False
+        try:
+            connection.request(method, path, body=req.data, headers=dict(req.header_items()))
+            sent = True
+            response = connection.getresponse()
+            return response, response.read()
+        except Exception as exc:
+            connection.close()
+            if not isinstance(exc, _STALE_CONNECTION_ERRORS):
+                raise
+
+            if sent and method not in _IDEMPOTENT_METHODS:
+                msg = f"Connection closed by server after {method} request was sent: {exc}"
+                raise ConnectionClosedAfterSendError(msg) from exc
+
+            if reused:
+                raise _StaleConnectionError from exc
+
+            raise
+
+    def _release(
+        self,
+        pool: _ConnectionPool,
+        key: _ConnectionKey,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        if response.will_close:
+            connection.close()
+        else:
+            pool.put(key, connection)
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Whether idle connection has been closed by server, i.e. readable before any request is sent."""
+    if connection.sock is None:
+        return True
+
+    try:
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+
+    return bool(readable)
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import json
+import re
 import urllib.parse
 
+# Public and private channels, and direct messages
+_CONVERSATION_ID_PATTERN = re.compile(r"^[CGD][A-Z0-9]+$")
+
 
 def get_block_kit_builder_url(*, team_id: str = "", blocks: list | None = None, attachments: list | None = None) -> str:
     """Returns URL to Slack Block Kit Builder.
@@ -27,3 +31,29 @@ def get_block_kit_builder_url(*, team_id: str = "", blocks: list | None = None,
     payload = {"blocks": blocks} if blocks else {"attachments": attachments} if attachments else {}
     payload_urlencoded = urllib.parse.quote(json.dumps(payload))
     return f"https://app.slack.com/block-kit-builder/{team_id}#{payload_urlencoded}"
+
+
+def build_permalink(*, team_url: str, channel: str, ts: str, thread_ts: str | None = None) -> str:
+    """Build permalink of a message locally, in the format of `chat.getPermalink` API.
+
+    Args:
+        team_url: URL of the workspace, such as `https://example.slack.com/`, as `auth.test` API returns.
+        channel: ID of conversation the message belongs to.
+        ts: Message ID.
+        thread_ts: Parent message ID, if the message is a reply in a thread.
+
+    Raises:
+        ValueError: Thrown if channel is not a conversation ID, e.g. channel name or user ID.
+
+    Returns:
+        Permalink of the message.
+    """
+    if not _CONVERSATION_ID_PATTERN.match(channel):
+        msg = f"Permalink requires a conversation ID, got {channel!r}"
+        raise ValueError(msg)
+
+    url = f"{team_url.rstrip('/')}/archives/{channel}/p{ts.replace('.', '')}"
+    if thread_ts and thread_ts != ts:
+        url += "?" + urllib.parse.urlencode({"thread_ts": thread_ts, "cid": channel})
+
+    return url
@@ -0,0 +1,68 @@
+"""Tracing utilities, doing nothing unless `opentelemetry-api` is installed.
+
+Spans are created with the global tracer provider, as configured by the OpenTelemetry SDK.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+try:
+    from opentelemetry import context, propagate, trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from contextlib import AbstractContextManager
+
+TRACER_NAME = "django_slack_tools"
+
+
+def start_span(name: str, attributes: Mapping[str, Any] | None = None) -> AbstractContextManager[Any]:
+    """Start a span as child of current span, if tracing is available.
+
+    Args:
+        name: Span name.
+        attributes: Span attributes.
+
+    Returns:
+        Context manager of the span, which ends the span on exit.
+    """
+    if trace is None:  # pragma: no cover
+        return nullcontext()
+
+    return trace.get_tracer(TRACER_NAME).start_as_current_span(name, attributes=attributes)
+
+
+def inject_context() -> dict[str, str]:
+    """Serialize current trace context, to continue the trace in other processes such as Celery workers.
+
+    Returns:
+        Trace context to pass to `attach_context()`. Empty if tracing is not available.
+    """
+    carrier: dict[str, str] = {}
+    if trace is None:  # pragma: no cover
+        return carrier
+
+    propagate.inject(carrier)
+    return carrier
+
+
+@contextmanager
+def attach_context(carrier: Mapping[str, str] | None) -> Iterator[None]:
+    """Continue the trace serialized by `inject_context()` while in the context.
+
+    Args:
+        carrier: Serialized trace context. Does nothing if empty.
+    """
+    if trace is None or not carrier:
+        yield
+        return
+
+    token = context.attach(propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        context.detach(token)
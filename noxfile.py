@@ -1,6 +1,8 @@
 # flake8: noqa: D100, D103
 from __future__ import annotations
 
+import os
+
 import nox
 
 nox.options.default_venv_backend = "uv"
@@ -13,7 +15,10 @@
     "extras",
     [
         [],
+        ["async"],
         ["celery"],
+        ["opentelemetry"],
+        ["prometheus"],
     ],
 )
 def tests(
@@ -24,3 +29,18 @@ def tests(
     # Run the tests via `uv`
     session.run_install("uv", "sync", "--quiet", *[f"--extra={extra}" for extra in extras])
     session.run("uv", "run", "pytest", "--cov-append")
+
+
+# * Needs a PostgreSQL server, configured with `POSTGRES_HOST`, `POSTGRES_PORT`, `POSTGRES_USER` and `POSTGRES_PASSWORD`
+@nox.session(default=False)
+def tests_postgresql(session: nox.Session) -> None:
+    # Run the tests with PostgreSQL database configured, for features specific to it such as partitioning
+    session.run_install("uv", "sync", "--quiet")
+    session.run(
+        "uv",
+        "run",
+        "--with=psycopg[binary]>=3.1,<4",
+        "pytest",
+        "--cov-append",
+        env={"POSTGRES_DB": os.environ.get("POSTGRES_DB", "django_slack_tools")},
+    )
@@ -93,6 +93,17 @@
     },
 }
 
+# Optional PostgreSQL database to test features specific to it, such as partitioning
+if os.environ.get("POSTGRES_DB"):
+    DATABASES["postgresql"] = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ["POSTGRES_DB"],
+        "USER": os.environ.get("POSTGRES_USER", "postgres"),
+        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+        "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+        "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+    }
+
 
 # Cache
 # https://docs.djangoproject.com/en/3.2/ref/settings/#caches
@@ -0,0 +1,88 @@
+"""Run benchmarks.
+
+Each `bench_*` module in this package exposes `run() -> Iterable[BenchmarkResult]`.
+Benchmarks run against a test database created for the run and destroyed afterward,
+and those talking to Slack use a local fake server, so no network access is needed.
+
+```shell
+python -m tests.benchmarks [--filter PATTERN] [--output results.json]
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Discover and run benchmarks."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    parser.add_argument("-k", "--filter", default="", help="Run only benchmark modules containing given string.")
+    parser.add_argument("-o", "--output", type=Path, help="Write results to given path as JSON.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Do not suppress logs.")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "testproj.config.settings")
+    django.setup()
+    if not args.verbose:
+        # Test project logs everything in debug level, which would dominate timings
+        logging.disable(logging.WARNING)
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        results = _run_benchmarks(args.filter)
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+    if args.output:
+        report = {
+            "meta": {
+                "created": datetime.now(tz=timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+
+    return 0
+
+
+def _run_benchmarks(filter_: str) -> list[dict]:
+    package = importlib.import_module(__package__ or "tests.benchmarks")
+    results = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        if not module_info.name.startswith("bench_") or filter_ not in module_info.name:
+            continue
+
+        print(f"# {module_info.name}")  # noqa: T201
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        for result in module.run():
+            print(result)  # noqa: T201
+            results.append({"module": module_info.name, **result.as_dict()})
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main())
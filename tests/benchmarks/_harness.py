@@ -0,0 +1,63 @@
+"""Helpers for benchmarks."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Result of a benchmark, timings in seconds per call."""
+
+    name: str
+    rounds: int
+    number: int
+    best: float
+    median: float
+    mean: float
+    extra: dict[str, Any]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as dictionary, for serialization."""
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return f"{self.name:<50} best {self.best * 1e6:>12.2f} us   median {self.median * 1e6:>12.2f} us"
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    number: int = 100,
+    rounds: int = 5,
+    extra: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    """Call `func` `number` times per round and return the per-call timings.
+
+    One extra call is made before measuring to warm up caches.
+    """
+    func()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+
+        timings.append((time.perf_counter() - start) / number)
+
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        number=number,
+        best=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        extra=extra or {},
+    )
@@ -0,0 +1,80 @@
+"""Saving and loading dumps of messages, plain `JSONField` vs. `CompressedJSONField`.
+
+Stored sizes are recorded in results along with timings, for payloads of growing number of blocks.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
+
+from django.db import connection
+
+from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.utils.django.encoders import RawJSON
+
+from ._harness import BenchmarkResult, measure
+from .bench_python_template import make_template
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    plain_field = SlackMessage._meta.get_field("response")
+    compressed_field = SlackMessage._meta.get_field("compressed_response")
+    for sections in (10, 100, 500):
+        payload = _make_response(sections=sections)
+        encoded = RawJSON(json.dumps(payload))
+        compressed = cast("bytes", compressed_field.get_prep_value(encoded))
+        extra = {"sections": sections, "plain_bytes": len(encoded.encode()), "compressed_bytes": len(compressed)}
+        yield measure(
+            f"JSONField.encode[{sections=}]",
+            partial(plain_field.get_db_prep_value, encoded, connection),
+            extra=extra,
+        )
+        yield measure(
+            f"CompressedJSONField.encode[{sections=}]",
+            partial(compressed_field.get_db_prep_value, encoded, connection),
+            extra=extra,
+        )
+        yield measure(
+            f"JSONField.decode[{sections=}]",
+            partial(plain_field.from_db_value, str(encoded), None, connection),  # type: ignore[arg-type]
+            extra=extra,
+        )
+        yield measure(
+            f"CompressedJSONField.decode[{sections=}]",
+            partial(compressed_field.from_db_value, compressed, None, connection),  # type: ignore[arg-type]
+            extra=extra,
+        )
+        for compress in (False, True):
+            yield measure(
+                f"save_and_load[{sections=}, {compress=}]",
+                partial(_save_and_load, encoded, compress=compress),
+                extra=extra,
+            )
+
+    SlackMessage.objects.all().delete()
+
+
+def _make_response(*, sections: int) -> dict[str, Any]:
+    """Return `chat.postMessage` response echoing the message back, as saved by persister."""
+    message = make_template(sections=sections, fields=0)
+    return {
+        "ok": True,
+        "error": None,
+        "data": {"ok": True, "channel": "C0123", "ts": "1700000000.000100", "message": message},
+        "ts": "1700000000.000100",
+        "parent_ts": None,
+    }
+
+
+def _save_and_load(payload: RawJSON, *, compress: bool) -> None:
+    id_ = str(uuid.uuid4())
+    field = "compressed_response" if compress else "response"
+    SlackMessage.objects.create(id=id_, channel="C0123", header={}, body={}, **{field: payload})
+    SlackMessage.objects.only(field).get(id=id_)
@@ -0,0 +1,24 @@
+"""Converting rendered Django templates to dictionary, per XML parser."""
+
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django_slack_tools.slack_messages.messenger.message_templates import _XML_PARSERS
+
+from ._harness import BenchmarkResult, measure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TESTCASES_DIR = Path(__file__).parent.parent / "slack_messages" / "messenger" / "testcases"
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    for name in ("notification.xml", "complex-template.xml", "search-results-2.xml"):
+        xml = (TESTCASES_DIR / name).read_text()
+        for parser, func in _XML_PARSERS.items():
+            yield measure(f"{parser}[{name}]", partial(func, xml), number=500, extra={"size": len(xml)})
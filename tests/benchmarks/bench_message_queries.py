@@ -0,0 +1,123 @@
+"""Queries on message history commonly run by admin and cleanup task, with and without indexes.
+
+Message table is seeded with `BENCHMARK_MESSAGE_ROWS` rows (1M by default), which takes a while.
+Query plans are recorded in results along with timings.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.db import connection
+from django.utils import timezone
+
+from django_slack_tools.slack_messages.models import SlackMessage
+
+from ._harness import BenchmarkResult, measure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+NUM_CHANNELS = 100
+NUM_THREADS = 1000
+SEED_BATCH_SIZE = 10_000
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    num_rows = int(os.environ.get("BENCHMARK_MESSAGE_ROWS", "1000000"))
+    now = timezone.now()
+    _seed(num_rows, now=now)
+    try:
+        queries = _queries(now)
+        for indexed in (False, True):
+            if not indexed:
+                _drop_indexes()
+
+            for name, queryset in queries.items():
+                yield measure(
+                    f"{name}[{'indexed' if indexed else 'not indexed'}]",
+                    partial(_evaluate, queryset),
+                    number=5,
+                    rounds=3,
+                    extra={"rows": num_rows, "plan": queryset.explain()},
+                )
+
+            if not indexed:
+                _create_indexes()
+    finally:
+        SlackMessage.objects.all()._raw_delete(SlackMessage.objects.db)  # type: ignore[attr-defined]
+
+
+def _queries(now: datetime) -> dict[str, QuerySet]:
+    messages = SlackMessage.objects.all()
+    return {
+        # Admin changelist pages, in default ordering
+        "changelist": messages[:100],
+        "changelist_by_channel": messages.filter(channel="C00000042")[:100],
+        "changelist_by_ok": messages.filter(ok=False)[:100],
+        # Chunk of messages to delete by cleanup task
+        "cleanup_chunk": messages.filter(created__lt=now - timedelta(days=7)).order_by().values_list("pk")[:1000],
+        "thread": messages.filter(parent_ts="1700000000.0000042"),
+    }
+
+
+def _evaluate(queryset: QuerySet) -> None:
+    # Querysets cache results once evaluated, so clone it
+    list(queryset.all())
+
+
+def _seed(num_rows: int, *, now: datetime) -> None:
+    """Create messages spread over last 30 days, of which 1% failed and 10% are replies in threads."""
+    step = timedelta(days=30) / num_rows
+    with _no_auto_now_add():
+        for start in range(0, num_rows, SEED_BATCH_SIZE):
+            SlackMessage.objects.bulk_create(
+                SlackMessage(
+                    id=str(uuid.uuid4()),
+                    channel=f"C{i % NUM_CHANNELS:08d}",
+                    header={},
+                    body={"text": "Hello, World!"},
+                    ok=i % 100 != 0,
+                    ts=f"1700000000.{i:07d}",
+                    parent_ts=f"1700000000.{i % NUM_THREADS:07d}" if i % 10 == 0 else "",
+                    created=now - step * i,
+                    last_modified=now,
+                )
+                for i in range(start, min(start + SEED_BATCH_SIZE, num_rows))
+            )
+
+
+@contextmanager
+def _no_auto_now_add() -> Iterator[None]:
+    """Let `created` be set explicitly, rather than overwritten with current time."""
+    field = SlackMessage._meta.get_field("created")
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+def _drop_indexes() -> None:
+    with connection.schema_editor() as editor:
+        for index in SlackMessage._meta.indexes:
+            editor.remove_index(SlackMessage, index)
+
+
+def _create_indexes() -> None:
+    with connection.schema_editor() as editor:
+        for index in SlackMessage._meta.indexes:
+            editor.add_index(SlackMessage, index)
+
+    # Update statistics for query planner, as done by database maintenance in real world
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
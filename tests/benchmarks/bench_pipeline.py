@@ -0,0 +1,211 @@
+"""End-to-end `Messenger.send_request()`, delivering to local fake Slack API.
+
+Covers rendering policy templates (Python and Django with XML conversion), policy fan-out strategies,
+persisting the history and retrying rate limited deliveries. Requires database, which is set up by the runner.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django_slack_tools.messenger.shortcuts import (
+    BaseBackend,
+    BaseMiddleware,
+    MessageHeader,
+    MessageRequest,
+    Messenger,
+    RateLimitedBackend,
+    SlackBackend,
+)
+from django_slack_tools.slack_messages.messenger import (
+    DjangoDatabasePersister,
+    DjangoDatabasePolicyHandler,
+    DjangoPolicyTemplateLoader,
+)
+from django_slack_tools.slack_messages.models import (
+    SlackMention,
+    SlackMessage,
+    SlackMessageRecipient,
+    SlackMessagingPolicy,
+)
+
+from ._fake_slack import FakeSlackServer
+from ._harness import BenchmarkResult, measure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from slack_bolt import App
+
+    from django_slack_tools.slack_messages.messenger.middlewares import FanOut
+
+NUM_RECIPIENTS = 10
+
+PYTHON_TEMPLATE = {
+    "text": "Deployment of {service} finished",
+    "blocks": [
+        {"type": "header", "text": {"type": "plain_text", "text": "Deployment of {service}"}},
+        {"type": "section", "text": {"type": "mrkdwn", "text": "{mentions} version *{version}* is live."}},
+        {"type": "divider"},
+        {
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": "Requested by {user}"}],
+        },
+    ],
+}
+
+DJANGO_TEMPLATE = """
+<root>
+  <text>Deployment of {{ service }} finished</text>
+  <blocks>
+    <block type="header"><text type="plain_text">Deployment of {{ service }}</text></block>
+    <block type="section"><text type="mrkdwn">{{ mentions|join:" " }} version *{{ version }}* is live.</text></block>
+    <block type="divider" />
+    <block type="context"><elements><element type="mrkdwn" text="Requested by {{ user }}" /></elements></block>
+  </blocks>
+</root>
+"""
+
+CONTEXT = {"service": "api", "version": "1.2.3", "user": "deploy-bot"}
+
+# Policy handler adds mentions of recipient to the context, give it in advance for messages sent directly
+DIRECT_CONTEXT = {**CONTEXT, "mentions": ["<@U00000000>", "<@U00000001>"]}
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    _create_policies()
+    try:
+        yield from _bench_send_request()
+        yield from _bench_fan_out()
+        yield from _bench_rate_limited()
+    finally:
+        SlackMessage.objects.all().delete()
+        SlackMessagingPolicy.objects.all().delete()
+        SlackMessageRecipient.objects.all().delete()
+        SlackMention.objects.all().delete()
+
+
+def _bench_send_request() -> Iterator[BenchmarkResult]:
+    """Single message through the whole pipeline, mostly CPU-bound with server responding immediately."""
+    with FakeSlackServer() as server:
+        app = server.make_app()
+        for template_type in ("python", "django"):
+            messenger = _make_messenger(app)
+            request = partial(_send, messenger, template_key=f"bench-{template_type}")
+            yield measure(f"send_request[{template_type}]", request, number=50)
+
+        for buffered in (False, True):
+            persister = DjangoDatabasePersister(buffered=buffered)
+            messenger = _make_messenger(app, middlewares=[persister])
+            name = "send_request[django,persister,{}]".format("buffered" if buffered else "unbuffered")
+            yield measure(name, partial(_send, messenger, template_key="bench-django"), number=50)
+            messenger.flush()
+
+
+def _bench_fan_out() -> Iterator[BenchmarkResult]:
+    """Policy fanning out to recipients, with realistic network latency."""
+    strategies: tuple[FanOut, ...] = ("sequential", "threads")
+    with FakeSlackServer(latency=0.02) as server:
+        app = server.make_app()
+        for fan_out in strategies:
+            handler = DjangoDatabasePolicyHandler(messenger=_make_messenger(app), fan_out=fan_out)
+            messenger = _make_messenger(app, middlewares=[handler])
+            yield measure(
+                f"fan_out[{fan_out}]",
+                partial(_send, messenger, template_key=None, channel="bench-django", context=CONTEXT),
+                number=3,
+                rounds=3,
+                extra={"recipients": NUM_RECIPIENTS, "latency": server.latency},
+            )
+
+
+def _bench_rate_limited() -> Iterator[BenchmarkResult]:
+    """Batch of messages with every few deliveries rate limited by Slack, retried immediately."""
+    with FakeSlackServer(rate_limit_every=5, retry_after=0) as server:
+        backend = RateLimitedBackend(
+            backend=SlackBackend(slack_app=server.make_app()),
+            channel_rate=1000,
+            channel_burst=100,
+        )
+        messenger = _make_messenger(server.make_app(), backend=backend)
+        requests = [
+            MessageRequest(
+                channel=f"C{i:08d}",
+                template_key="bench-python",
+                context=DIRECT_CONTEXT,
+                header=MessageHeader(),
+            )
+            for i in range(20)
+        ]
+        result = measure("send_many[rate_limited]", partial(_send_many, messenger, requests), number=5, rounds=3)
+        yield BenchmarkResult(
+            **{
+                **result.as_dict(),
+                "extra": {
+                    "requests": server.num_requests,
+                    "rate_limited": server.num_rate_limited,
+                    "retried": backend.counters.retried,
+                    "dropped": backend.counters.dropped,
+                },
+            },
+        )
+
+
+def _make_messenger(
+    app: App,
+    *,
+    middlewares: list[BaseMiddleware] | None = None,
+    backend: BaseBackend | None = None,
+) -> Messenger:
+    return Messenger(
+        template_loaders=[DjangoPolicyTemplateLoader()],
+        middlewares=middlewares or [],
+        messaging_backend=backend or SlackBackend(slack_app=app),
+    )
+
+
+def _send(
+    messenger: Messenger,
+    *,
+    template_key: str | None,
+    channel: str = "C00000000",
+    context: dict[str, Any] = DIRECT_CONTEXT,
+) -> Any:
+    request = MessageRequest(channel=channel, template_key=template_key, context=context, header=MessageHeader())
+    response = messenger.send_request(request)
+    if response is not None and not response.ok:
+        msg = f"Delivery failed: {response.error}"
+        raise RuntimeError(msg)
+
+    return response
+
+
+def _send_many(messenger: Messenger, requests: list[MessageRequest]) -> None:
+    # Requests are rendered in-place, so send copies to render every time
+    copies = [request.model_copy(deep=True) for request in requests]
+    for response in messenger.send_many(copies):
+        if response is None or not response.ok:
+            msg = f"Delivery failed: {response}"
+            raise RuntimeError(msg)
+
+
+def _create_policies() -> None:
+    mentions = [
+        SlackMention.objects.create(type=SlackMention.MentionType.USER, name=f"user-{i}", mention_id=f"U{i:08d}")
+        for i in range(2)
+    ]
+    recipients = []
+    for i in range(NUM_RECIPIENTS):
+        recipient = SlackMessageRecipient.objects.create(alias=f"recipient-{i}", channel=f"C{i:08d}")
+        recipient.mentions.add(*mentions)
+        recipients.append(recipient)
+
+    templates = [
+        ("bench-python", SlackMessagingPolicy.TemplateType.PYTHON, PYTHON_TEMPLATE),
+        ("bench-django", SlackMessagingPolicy.TemplateType.DJANGO_INLINE, DJANGO_TEMPLATE),
+    ]
+    for code, template_type, template in templates:
+        policy = SlackMessagingPolicy.objects.create(code=code, template_type=template_type, template=template)
+        policy.recipients.add(*recipients)
@@ -0,0 +1,70 @@
+"""Rendering large Python templates, compiled vs. walking whole template on every render."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django_slack_tools.messenger.message_templates.python import PythonTemplate
+
+from ._harness import BenchmarkResult, measure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def make_template(*, sections: int, fields: int) -> dict[str, Any]:
+    """Return block kit template with `sections` sections of which `fields` contain replacement fields."""
+    blocks: list[dict[str, Any]] = [{"type": "header", "text": {"type": "plain_text", "text": "Daily report"}}]
+    for i in range(sections):
+        text = f"Item #{i}: *{{item_{i}}}*" if i < fields else f"Static item #{i}"
+        blocks.append(
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": text},
+                "accessory": {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "Open", "emoji": True},
+                    "value": f"item-{i}",
+                    "action_id": f"open-{i}",
+                },
+            },
+        )
+        blocks.append({"type": "divider"})
+
+    return {"text": "Daily report for {date}", "blocks": blocks}
+
+
+def format_obj(obj: Any, *, context: dict[str, Any]) -> Any:
+    """Format every string in the template tree, as done on every render before templates were compiled."""
+    if isinstance(obj, dict):
+        return {key: format_obj(value, context=context) for key, value in obj.items()}
+
+    if isinstance(obj, list):
+        return [format_obj(item, context=context) for item in obj]
+
+    if isinstance(obj, str):
+        return obj.format_map(context)
+
+    return obj
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    for sections, fields in ((10, 2), (100, 5), (500, 10)):
+        template = make_template(sections=sections, fields=fields)
+        context = {"date": "2024-01-01", **{f"item_{i}": f"value {i}" for i in range(fields)}}
+        compiled = PythonTemplate(template)
+        assert compiled.render(context) == format_obj(template, context=context)
+
+        extra = {"sections": sections, "fields": fields}
+        yield measure(
+            f"format_obj[{sections=}, {fields=}]",
+            partial(format_obj, template, context=context),
+            extra=extra,
+        )
+        yield measure(
+            f"PythonTemplate.render[{sections=}, {fields=}]",
+            partial(compiled.render, context),
+            extra=extra,
+        )
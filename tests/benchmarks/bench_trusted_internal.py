@@ -0,0 +1,63 @@
+"""Building message bodies from rendered templates, validated vs. trusted (`Messenger(trusted_internal=True)`)."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django_slack_tools.messenger.shortcuts import (
+    DummyBackend,
+    MessageBody,
+    MessageHeader,
+    MessageRequest,
+    Messenger,
+    PythonTemplate,
+)
+
+from ._harness import BenchmarkResult, measure
+from .bench_python_template import make_template
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django_slack_tools.messenger.shortcuts import BaseTemplate
+
+
+def run() -> Iterator[BenchmarkResult]:
+    """Run benchmarks."""
+    for sections in (10, 100, 500):
+        template = PythonTemplate(make_template(sections=sections, fields=0))
+        rendered = template.render({"date": "2024-01-01"})
+        extra = {"sections": sections}
+        yield measure(
+            f"MessageBody.model_validate[{sections=}]",
+            partial(MessageBody.model_validate, rendered),
+            extra=extra,
+        )
+        yield measure(
+            f"MessageBody.from_trusted[{sections=}]",
+            partial(MessageBody.from_trusted, rendered),
+            extra=extra,
+        )
+        for trusted_internal in (False, True):
+            messenger = Messenger(
+                template_loaders=[],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+                trusted_internal=trusted_internal,
+            )
+            yield measure(
+                f"Messenger._render_message[{sections=}, {trusted_internal=}]",
+                partial(_render, messenger, {"report": template}),
+                extra=extra,
+            )
+
+
+def _render(messenger: Messenger, templates: dict[str, BaseTemplate]) -> None:
+    request = MessageRequest(
+        channel="C0123",
+        template_key="report",
+        context={"date": "2024-01-01"},
+        header=MessageHeader(),
+    )
+    messenger._render_message(request, templates=templates)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
 from slack_bolt import App
 
 from django_slack_tools.app_settings import AppSettings
+from django_slack_tools.slack_messages.messenger.policy_resolver import default_policy_resolver
+from django_slack_tools.slack_messages.permalinks import get_team_url
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -14,6 +16,18 @@
     from django_slack_tools.app_settings import SettingsDict
 
 
+@pytest.fixture(autouse=True)
+def _clear_resolved_policies() -> None:
+    """Policies resolved in previous tests could have been rolled back, which signals can't catch."""
+    default_policy_resolver.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_team_urls() -> None:
+    """Workspace URLs are cached by client, which may be reused across tests."""
+    get_team_url.cache_clear()
+
+
 @pytest.fixture(scope="session")
 def slack_app() -> App:
     """Dummy Slack app fixture. It won't work."""
@@ -31,6 +45,28 @@ def mock_slack_client() -> Iterator[mock.Mock]:
         yield m
 
 
+@pytest.fixture(scope="session")
+def _global_span_exporter() -> Any:
+    """Global tracer provider can be set only once, so share it in the session."""
+    trace = pytest.importorskip("opentelemetry.trace")
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: PLC0415
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: PLC0415
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def span_exporter(_global_span_exporter: Any) -> Any:
+    """In-memory exporter of spans created with global tracer provider. Skips test if OpenTelemetry SDK is missing."""
+    _global_span_exporter.clear()
+    return _global_span_exporter
+
+
 @pytest.fixture(scope="session")
 def app_settings() -> SettingsDict:
     """Default app settings fixture. Each test suite should override it for practical test cases."""
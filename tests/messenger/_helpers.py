@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Callable
 
 from django_slack_tools.messenger.shortcuts import (
+    BaseInstrument,
     BaseMiddleware,
     BaseTemplate,
     BaseTemplateLoader,
@@ -11,7 +13,10 @@
 )
 
 if TYPE_CHECKING:
-    from django_slack_tools.messenger.shortcuts import MessageRequest, MessageResponse
+    from collections.abc import Iterator
+
+    from django_slack_tools.messenger.instruments import Stage
+    from django_slack_tools.messenger.shortcuts import BaseMessenger, MessageRequest, MessageResponse
 
 
 class MockTemplate(BaseTemplate):
@@ -38,13 +43,15 @@ class MockMiddleware(BaseMiddleware):
     def __init__(
         self,
         *,
-        process_request: Callable[[MessageRequest], MessageRequest | None] | None = None,
+        process_request: Callable[[MessageRequest], MessageRequest | MessageResponse | None] | None = None,
         process_response: Callable[[MessageResponse], MessageResponse | None] | None = None,
+        release: Callable[[MessageRequest], None] | None = None,
     ) -> None:
         self._process_request = process_request
         self._process_response = process_response
+        self._release = release
 
-    def process_request(self, request: MessageRequest) -> MessageRequest | None:
+    def process_request(self, request: MessageRequest) -> MessageRequest | MessageResponse | None:
         if self._process_request:
             return self._process_request(request)
 
@@ -56,6 +63,10 @@ def process_response(self, response: MessageResponse) -> MessageResponse | None:
 
         return super().process_response(response)
 
+    def release(self, request: MessageRequest) -> None:
+        if self._release:
+            self._release(request)
+
 
 class MockBackend(DummyBackend):
     def __init__(self, *, should_error: bool = False) -> None:
@@ -67,3 +78,30 @@ def _send_message(self, *args: Any, **kwargs: Any) -> Any:
             raise Exception(msg)  # noqa: TRY002
 
         return super()._send_message(*args, **kwargs)
+
+
+class MockInstrument(BaseInstrument):
+    """Instrument recording the hooks called."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[Any, ...]] = []
+
+    def bind(self, messenger: BaseMessenger) -> None:
+        self.events.append(("bind", messenger.name))
+
+    @contextmanager
+    def stage(
+        self,
+        messenger: BaseMessenger,  # noqa: ARG002
+        stage: Stage,
+        request: MessageRequest | None,  # noqa: ARG002
+        **attributes: Any,
+    ) -> Iterator[None]:
+        self.events.append(("enter", stage, attributes))
+        try:
+            yield
+        finally:
+            self.events.append(("exit", stage))
+
+    def on_response(self, messenger: BaseMessenger, response: MessageResponse) -> None:  # noqa: ARG002
+        self.events.append(("response", response.ok))
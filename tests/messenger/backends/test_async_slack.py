@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django_slack_tools.messenger.shortcuts import MessageBody, MessageHeader, MessageRequest, MessageResponse
+from tests._factories import SlackApiErrorFactory
+from tests.slack_messages._factories import SlackMessageResponseFactory
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp_installed = False
+else:
+    from slack_bolt.async_app import AsyncApp
+
+    from django_slack_tools.messenger.backends.async_slack import AsyncSlackBackend
+
+    aiohttp_installed = True
+
+    # Values for import testing
+    _slack_app = AsyncApp(
+        token="stupid-sandwich",  # noqa: S106
+        signing_secret="peanut-butter",  # noqa: S106
+    )
+    _not_slack_app = -1
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+pytestmark = pytest.mark.skipif(not aiohttp_installed, reason="aiohttp is not installed")
+
+
+@pytest.fixture
+def mock_async_slack_client() -> Iterator[mock.Mock]:
+    """Mock `slack_bolt.async_app.AsyncApp.client`."""
+    with mock.patch("slack_bolt.async_app.AsyncApp.client") as m:
+        m.chat_postMessage = mock.AsyncMock()
+        yield m
+
+
+class TestAsyncSlackBackend:
+    @pytest.fixture
+    def backend(self) -> AsyncSlackBackend:
+        return AsyncSlackBackend(slack_app=_slack_app)
+
+    def test_instance_creation(self) -> None:
+        assert AsyncSlackBackend(slack_app="tests.messenger.backends.test_async_slack._slack_app")
+        assert AsyncSlackBackend(slack_app=_slack_app)
+        with pytest.raises(
+            TypeError,
+            match="Expected <class 'slack_bolt.app.async_app.AsyncApp'> instance, got <class 'int'>",
+        ):
+            AsyncSlackBackend(slack_app="tests.messenger.backends.test_async_slack._not_slack_app")
+
+    def test_adeliver(self, backend: AsyncSlackBackend, mock_async_slack_client: mock.Mock) -> None:
+        """Test sending message."""
+        mock_async_slack_client.chat_postMessage.return_value = SlackMessageResponseFactory()
+
+        request = MessageRequest(
+            channel="test-channel",
+            template_key="__any__",
+            context={},
+            header=MessageHeader(),
+            body=MessageBody(text="Hello, World!"),
+        )
+        response = async_to_sync(backend.adeliver)(request)
+
+        assert isinstance(response, MessageResponse)
+        assert response.request is request
+        assert response.ok is True
+        assert response.error is None
+        assert response.data
+        assert response.ts
+        assert response.parent_ts is None
+        mock_async_slack_client.chat_postMessage.assert_awaited_once()
+
+    def test_adeliver_request_body_required(self, backend: AsyncSlackBackend) -> None:
+        request = MessageRequest(
+            channel="test-channel",
+            template_key="__any__",
+            context={},
+            header=MessageHeader(),
+            body=None,
+        )
+        with pytest.raises(ValueError, match="Message body is required."):
+            async_to_sync(backend.adeliver)(request)
+
+    def test_adeliver_remote_api_error(self, backend: AsyncSlackBackend, mock_async_slack_client: mock.Mock) -> None:
+        """Test sending message with error."""
+        mock_async_slack_client.chat_postMessage.side_effect = SlackApiErrorFactory()
+
+        request = MessageRequest(
+            channel="test-channel",
+            template_key="__any__",
+            context={},
+            header=MessageHeader(),
+            body=MessageBody(text="Hello, World!"),
+        )
+        response = async_to_sync(backend.adeliver)(request)
+
+        assert isinstance(response, MessageResponse)
+        assert response.ok is False
+        assert response.error
+        assert response.data == {"ok": False}
+        assert response.ts is None
+
+    def test_deliver(self, backend: AsyncSlackBackend, mock_async_slack_client: mock.Mock) -> None:
+        """Synchronous interface should also work, e.g. when used with sync messenger."""
+        mock_async_slack_client.chat_postMessage.return_value = SlackMessageResponseFactory()
+
+        request = MessageRequest(
+            channel="test-channel",
+            template_key="__any__",
+            context={},
+            header=MessageHeader(),
+            body=MessageBody(text="Hello, World!"),
+        )
+        response = backend.deliver(request)
+
+        assert response.ok is True
+        assert response.ts
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+
+from django_slack_tools.messenger.backends.rate_limited import _get_retry_after
+from django_slack_tools.messenger.shortcuts import (
+    DummyBackend,
+    MessageBody,
+    MessageHeader,
+    MessageRequest,
+    RateLimitedBackend,
+    SlackBackend,
+    SlackRedirectBackend,
+)
+from tests._factories import SlackApiErrorFactory, SlackResponseFactory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from unittest.mock import Mock
+
+    from slack_bolt import App
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    clock = FakeClock()
+    with mock.patch("time.monotonic", clock.monotonic), mock.patch("time.sleep", clock.sleep):
+        yield clock
+
+
+def _request(channel: str = "test-channel") -> MessageRequest:
+    return MessageRequest(
+        channel=channel,
+        template_key="__any__",
+        context={},
+        header=MessageHeader(),
+        body=MessageBody(text="Hello, World!"),
+    )
+
+
+def _rate_limited_error(**headers: Any) -> Any:
+    return SlackApiErrorFactory(
+        response=SlackResponseFactory(
+            status_code=429,
+            headers=headers,
+            data={"ok": False, "error": "ratelimited"},
+        ),
+    )
+
+
+class TestRateLimitedBackend:
+    def test_instance_creation(self) -> None:
+        backend = RateLimitedBackend(backend="django_slack_tools.messenger.shortcuts.DummyBackend")
+        assert isinstance(backend.backend, DummyBackend)
+
+        with pytest.raises(ValueError, match="Rates must be positive and burst must be at least 1."):
+            RateLimitedBackend(backend=DummyBackend(), channel_rate=0)
+
+        with pytest.raises(ValueError, match="Rates must be positive and burst must be at least 1."):
+            RateLimitedBackend(backend=DummyBackend(), channel_burst=0)
+
+        with pytest.raises(ValueError, match="Rates must be positive and burst must be at least 1."):
+            RateLimitedBackend(backend=DummyBackend(), workspace_rate=0)
+
+        with pytest.raises(ValueError, match="`max_retries` must not be negative, got -1"):
+            RateLimitedBackend(backend=DummyBackend(), max_retries=-1)
+
+    def test_deliver_throttled_per_channel(self, clock: FakeClock) -> None:
+        backend = RateLimitedBackend(backend=DummyBackend(), channel_rate=2, channel_burst=2)
+
+        responses = [backend.deliver(_request("channel-1")) for _ in range(4)]
+        responses.append(backend.deliver(_request("channel-2")))
+
+        assert all(response.ok for response in responses)
+        # First two messages are sent in burst, then each half second
+        assert clock.sleeps == [0.5, 0.5]
+        assert backend.counters.throttled == 2
+        assert backend.counters.queued == 0
+
+    def test_deliver_throttled_workspace(self, clock: FakeClock) -> None:
+        backend = RateLimitedBackend(backend=DummyBackend(), workspace_rate=0.5)
+
+        for i in range(3):
+            backend.deliver(_request(f"channel-{i}"))
+
+        assert clock.sleeps == [2, 2]
+
+    def test_deliver_reserves_turns_in_advance(self, clock: FakeClock) -> None:
+        """Concurrent deliveries waiting for the same channel should be scheduled one after another."""
+        backend = RateLimitedBackend(backend=DummyBackend())
+
+        waits: list[float] = []
+        for _ in range(3):
+            with mock.patch("time.sleep", waits.append):
+                backend.deliver(_request())
+
+        assert waits == [1, 2]
+        assert clock.now == 1000.0
+
+    def test_deliver_dropped_if_wait_too_long(self, clock: FakeClock) -> None:
+        backend = RateLimitedBackend(backend=DummyBackend(), max_wait=2)
+
+        with mock.patch("time.sleep"):
+            responses = [backend.deliver(_request()) for _ in range(4)]
+
+        assert [response.ok for response in responses] == [True, True, True, False]
+        assert responses[-1].error
+        assert "Rate limited, would wait more than 2 seconds" in responses[-1].error
+        assert responses[-1].data == {"ok": False, "error": "ratelimited"}
+        assert backend.counters.dropped == 1
+        assert clock.now == 1000.0
+
+    def test_deliver_evicts_idle_buckets(self, clock: FakeClock) -> None:
+        backend = RateLimitedBackend(backend=DummyBackend(), channel_rate=0.5)
+        backend.deliver(_request("channel-1"))
+        clock.now += 1
+        backend.deliver(_request("channel-2"))
+        assert list(backend._channel_buckets) == ["channel-1", "channel-2"]
+
+        # Bucket of channel-1 is full again, while channel-2 is not
+        clock.now += 1
+        backend.deliver(_request("channel-3"))
+        assert list(backend._channel_buckets) == ["channel-2", "channel-3"]
+
+        # Throttling is not affected by eviction
+        backend.deliver(_request("channel-1"))
+        assert clock.sleeps == []
+
+    def test_deliver_requires_body(self) -> None:
+        """Requests are validated as other backends do, before waiting for the turn."""
+        backend = RateLimitedBackend(backend=DummyBackend())
+        request = _request()
+        request.body = None
+
+        with pytest.raises(ValueError, match="Message body is required."):
+            backend.deliver(request)
+
+        assert backend.counters.throttled == 0
+
+
+class TestRateLimitedBackendSlack:
+    """Slack backends are throttled by wrapping their clients."""
+
+    def test_deliver_redirected(self, slack_app: App, mock_slack_client: Mock, clock: FakeClock) -> None:
+        """Messages are throttled by the channel actually posted to."""
+        mock_slack_client.chat_postMessage.return_value = SlackResponseFactory()
+        backend = RateLimitedBackend(
+            backend=SlackRedirectBackend(slack_app=slack_app, redirect_channel="redirect", inform_redirect=False),
+        )
+
+        for channel in ("channel-1", "channel-2"):
+            assert backend.deliver(_request(channel)).ok
+
+        assert clock.sleeps == [1]
+        assert list(backend._channel_buckets) == ["redirect"]
+        assert [call.kwargs["channel"] for call in mock_slack_client.chat_postMessage.call_args_list] == [
+            "redirect",
+            "redirect",
+        ]
+
+    def test_deliver_dropped_if_wait_too_long(
+        self,
+        slack_app: App,
+        mock_slack_client: Mock,
+        clock: FakeClock,
+    ) -> None:
+        mock_slack_client.chat_postMessage.return_value = SlackResponseFactory()
+        backend = RateLimitedBackend(backend=SlackBackend(slack_app=slack_app), max_wait=0)
+
+        responses = [backend.deliver(_request()) for _ in range(2)]
+
+        assert [response.ok for response in responses] == [True, False]
+        assert responses[-1].error
+        assert "Rate limited, would wait more than 0 seconds" in responses[-1].error
+        mock_slack_client.chat_postMessage.assert_called_once()
+        assert backend.counters.dropped == 1
+        assert clock.sleeps == []
+
+    def test_deliver_retry_after(self, slack_app: App, mock_slack_client: Mock, clock: FakeClock) -> None:
+        mock_slack_client.chat_postMessage.side_effect = [
+            _rate_limited_error(**{"Retry-After": "30"}),
+            SlackResponseFactory(),
+            SlackResponseFactory(),
+        ]
+        backend = RateLimitedBackend(backend=SlackBackend(slack_app=slack_app))
+
+        response = backend.deliver(_request())
+
+        assert response.ok
+        assert clock.sleeps == [30]
+        assert backend.counters.retried == 1
+
+        # Channel is blocked for others too
+        backend.deliver(_request())
+        assert clock.sleeps == [30, 1]
+
+    def test_deliver_retry_exhausted(self, slack_app: App, mock_slack_client: Mock, clock: FakeClock) -> None:
+        mock_slack_client.chat_postMessage.side_effect = _rate_limited_error(**{"retry-after": "5"})
+        backend = RateLimitedBackend(backend=SlackBackend(slack_app=slack_app), max_retries=2, workspace_rate=10)
+
+        response = backend.deliver(_request())
+
+        assert not response.ok
+        assert response.data == {"ok": False, "error": "ratelimited"}
+        assert clock.sleeps == [5, 5]
+        assert backend.counters.retried == 2
+        assert backend.counters.dropped == 1
+
+    def test_deliver_other_errors_not_retried(
+        self,
+        slack_app: App,
+        mock_slack_client: Mock,
+        clock: FakeClock,
+    ) -> None:
+        mock_slack_client.chat_postMessage.side_effect = SlackApiErrorFactory()
+        backend = RateLimitedBackend(backend=SlackBackend(slack_app=slack_app))
+
+        response = backend.deliver(_request())
+
+        assert not response.ok
+        mock_slack_client.chat_postMessage.assert_called_once()
+        assert clock.sleeps == []
+
+    def test_client_proxy(self, slack_app: App, mock_slack_client: Mock) -> None:
+        """Other calls of wrapped client are not throttled."""
+        inner = SlackBackend(slack_app=slack_app)
+        RateLimitedBackend(backend=inner)
+
+        assert inner.client.auth_test is mock_slack_client.auth_test
+
+
+@pytest.mark.parametrize(
+    ("headers", "expect"),
+    [
+        ({"Retry-After": "10"}, 10),
+        ({"retry-after": "2.5"}, 2.5),
+        ({}, 1),
+        ({"Retry-After": "invalid"}, 1),
+    ],
+)
+def test_get_retry_after(headers: dict[str, str], expect: float) -> None:
+    response: Any = SlackResponseFactory(headers=headers)
+    assert _get_retry_after(response) == expect
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django_slack_tools.messenger.shortcuts import BaseInstrument, Messenger
+from tests.messenger._factories import MessageRequestFactory, MessageResponseFactory
+from tests.messenger._helpers import MockBackend
+
+
+def test_base_instrument_does_nothing() -> None:
+    instrument = BaseInstrument()
+    messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
+    request = MessageRequestFactory.create()
+
+    instrument.bind(messenger)
+    with instrument.stage(messenger, "send", request, template_key=request.template_key) as value:
+        assert value is None
+
+    instrument.on_response(messenger, MessageResponseFactory.create(request=request))
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from django_slack_tools.messenger.instruments.opentelemetry import OpenTelemetryInstrument  # noqa: E402
+from django_slack_tools.messenger.shortcuts import MessageRequest, MessageResponse, Messenger  # noqa: E402
+from django_slack_tools.utils import tracing  # noqa: E402
+from tests.messenger._factories import MessageRequestFactory  # noqa: E402
+from tests.messenger._helpers import MockBackend, MockMiddleware, MockTemplateLoader  # noqa: E402
+
+
+class FailingBackend(MockBackend):
+    def deliver(self, request: MessageRequest) -> MessageResponse:
+        return MessageResponse(request=request, ok=False, data={"ok": False, "error": "channel_not_found"})
+
+
+def _create_messenger(**kwargs: Any) -> Messenger:
+    return Messenger(
+        **{
+            "template_loaders": [MockTemplateLoader()],
+            "middlewares": [MockMiddleware()],
+            "messaging_backend": MockBackend(),
+            "instruments": [OpenTelemetryInstrument()],
+            "name": "default",
+            **kwargs,
+        },
+    )
+
+
+class TestOpenTelemetryInstrument:
+    def test_send_request(self, span_exporter: Any) -> None:
+        messenger = _create_messenger()
+
+        with tracing.start_span("caller"):
+            messenger.send_request(MessageRequestFactory.create(channel="C0123", context={"name": "Daniel"}))
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        assert sorted(spans) == [
+            "caller",
+            "slack_message.deliver MockBackend",
+            "slack_message.load_template",
+            "slack_message.middleware_request MockMiddleware",
+            "slack_message.middleware_response MockMiddleware",
+            "slack_message.process_request",
+            "slack_message.process_response",
+            "slack_message.render",
+            "slack_message.send",
+        ]
+        assert spans["slack_message.send"].parent.span_id == spans["caller"].context.span_id
+        assert spans["slack_message.render"].parent.span_id == spans["slack_message.send"].context.span_id
+        assert (
+            spans["slack_message.middleware_request MockMiddleware"].parent.span_id
+            == spans["slack_message.process_request"].context.span_id
+        )
+        assert spans["slack_message.send"].attributes == {
+            "slack.messenger": "default",
+            "slack.channel": "C0123",
+            "slack.template_key": "some-template-key",
+        }
+        assert spans["slack_message.deliver MockBackend"].attributes == {
+            "slack.messenger": "default",
+            "slack.channel": "C0123",
+            "slack.template_key": "some-template-key",
+            "slack.component": "MockBackend",
+            "slack.ok": True,
+        }
+
+    def test_delivery_failed(self, span_exporter: Any) -> None:
+        messenger = _create_messenger(messaging_backend=FailingBackend())
+
+        messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        (span,) = (span for span in span_exporter.get_finished_spans() if span.name.startswith("slack_message.deliver"))
+        assert span.attributes["slack.ok"] is False
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.status.description == "channel_not_found"
+
+    def test_error_recorded(self, span_exporter: Any) -> None:
+        messenger = _create_messenger()
+
+        with pytest.raises(ValueError, match="Template key is required to render the message"):
+            messenger.send_request(MessageRequestFactory.create(template_key=None))
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        assert spans["slack_message.send"].status.status_code == StatusCode.ERROR
+        assert "slack.template_key" not in spans["slack_message.send"].attributes
+
+    def test_send_many(self, span_exporter: Any) -> None:
+        """Deliveries in worker threads continue the trace of caller."""
+        messenger = _create_messenger()
+        requests = MessageRequestFactory.create_batch(3, context={"name": "Daniel"})
+
+        with tracing.start_span("caller"):
+            list(messenger.send_many(requests, max_workers=2))
+
+        spans = span_exporter.get_finished_spans()
+        (caller,) = (span for span in spans if span.name == "caller")
+        deliveries = [span for span in spans if span.name.startswith("slack_message.deliver")]
+        assert len(deliveries) == 3
+        assert all(span.parent.span_id == caller.context.span_id for span in deliveries)
+
+    def test_stage_without_request(self, span_exporter: Any) -> None:
+        instrument = OpenTelemetryInstrument()
+
+        with instrument.stage(_create_messenger(), "send", None):
+            pass
+
+        (span,) = span_exporter.get_finished_spans()
+        assert span.attributes == {"slack.messenger": "default"}
+
+    def test_tracer_provider(self) -> None:
+        exporter = InMemorySpanExporter()
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        messenger = _create_messenger(instruments=[OpenTelemetryInstrument(tracer_provider=provider)])
+
+        messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        assert len(exporter.get_finished_spans()) == 8
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from django_slack_tools.messenger.instruments.prometheus import PrometheusInstrument  # noqa: E402
+from django_slack_tools.messenger.shortcuts import (  # noqa: E402
+    MessageRequest,
+    MessageResponse,
+    Messenger,
+    RateLimitedBackend,
+)
+from tests.messenger._factories import MessageRequestFactory  # noqa: E402
+from tests.messenger._helpers import MockBackend, MockMiddleware, MockTemplateLoader  # noqa: E402
+
+
+class FailingBackend(MockBackend):
+    def __init__(self, error: str) -> None:
+        self.error = error
+
+    def deliver(self, request: MessageRequest) -> MessageResponse:
+        return MessageResponse(request=request, ok=False, data={"ok": False, "error": self.error})
+
+
+class BufferingMiddleware(MockMiddleware):
+    @property
+    def pending(self) -> int:
+        return 3
+
+
+@pytest.fixture
+def registry() -> Any:
+    return prometheus_client.CollectorRegistry()
+
+
+def _create_messenger(instrument: PrometheusInstrument, **kwargs: Any) -> Messenger:
+    return Messenger(
+        **{
+            "template_loaders": [MockTemplateLoader()],
+            "middlewares": [MockMiddleware()],
+            "messaging_backend": MockBackend(),
+            "instruments": [instrument],
+            "name": "default",
+            **kwargs,
+        },
+    )
+
+
+class TestPrometheusInstrument:
+    def test_default_registry(self) -> None:
+        instrument = PrometheusInstrument(namespace="test_default_registry")
+
+        assert instrument.registry is prometheus_client.REGISTRY
+
+    def test_metrics_shared(self, registry: Any) -> None:
+        """Metrics can't be registered twice, so shared by instruments with same registry and namespace."""
+        first = PrometheusInstrument(registry=registry)
+        second = PrometheusInstrument(registry=registry)
+        other = PrometheusInstrument(registry=registry, namespace="other")
+
+        assert first._metrics is second._metrics
+        assert first._metrics is not other._metrics
+
+    def test_stage_duration(self, registry: Any) -> None:
+        messenger = _create_messenger(PrometheusInstrument(registry=registry))
+
+        messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        for stage, component in [
+            ("send", ""),
+            ("process_request", ""),
+            ("middleware_request", "MockMiddleware"),
+            ("load_template", ""),
+            ("render", ""),
+            ("deliver", "MockBackend"),
+            ("process_response", ""),
+            ("middleware_response", "MockMiddleware"),
+        ]:
+            assert (
+                registry.get_sample_value(
+                    "django_slack_tools_stage_duration_seconds_count",
+                    {"messenger": "default", "stage": stage, "component": component},
+                )
+                == 1
+            )
+
+    @pytest.mark.parametrize(
+        ("backend", "status"),
+        [
+            (MockBackend(), "ok"),
+            (FailingBackend("channel_not_found"), "error"),
+            (FailingBackend("ratelimited"), "ratelimited"),
+        ],
+    )
+    def test_messages(self, registry: Any, backend: MockBackend, status: str) -> None:
+        messenger = _create_messenger(PrometheusInstrument(registry=registry), messaging_backend=backend)
+
+        for _ in range(2):
+            messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        assert (
+            registry.get_sample_value(
+                "django_slack_tools_messages_total",
+                {
+                    "messenger": "default",
+                    "template_key": "some-template-key",
+                    "backend": type(backend).__name__,
+                    "status": status,
+                },
+            )
+            == 2
+        )
+
+    def test_messages_without_request(self, registry: Any) -> None:
+        instrument = PrometheusInstrument(registry=registry)
+        messenger = _create_messenger(instrument)
+
+        instrument.on_response(messenger, MessageResponse(ok=True, data={}))
+
+        assert (
+            registry.get_sample_value(
+                "django_slack_tools_messages_total",
+                {"messenger": "default", "template_key": "", "backend": "MockBackend", "status": "ok"},
+            )
+            == 1
+        )
+
+    def test_queue_depth(self, registry: Any) -> None:
+        backend = RateLimitedBackend(backend=MockBackend())
+        _create_messenger(
+            PrometheusInstrument(registry=registry),
+            middlewares=[MockMiddleware(), BufferingMiddleware()],
+            messaging_backend=backend,
+        )
+
+        def queue_depth(component: str) -> float | None:
+            return registry.get_sample_value(  # type: ignore[no-any-return]
+                "django_slack_tools_queue_depth",
+                {"messenger": "default", "component": component},
+            )
+
+        assert queue_depth("MockMiddleware") is None
+        assert queue_depth("BufferingMiddleware") == 3
+        assert queue_depth("RateLimitedBackend") == 0
+
+        backend.counters.increment("queued", 2)
+        assert queue_depth("RateLimitedBackend") == 2
@@ -1,3 +1,9 @@
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
 from django_slack_tools.messenger.shortcuts import PythonTemplate
 
 
@@ -30,3 +36,120 @@ def test_render(self) -> None:
             ],
             "unknown": False,
         }
+
+    def test_render_escaped_braces(self) -> None:
+        """Escaped braces should be unescaped, whether the string has replacement fields or not."""
+        template = PythonTemplate({"text": "{{literal}}", "blocks": [{"text": "{{literal}} {greet}"}]})
+        result = template.render(context={"greet": "Hello"})
+        assert result == {"text": "{literal}", "blocks": [{"text": "{literal} Hello"}]}
+
+    def test_render_str(self) -> None:
+        assert PythonTemplate("{greet}, World!").render(context={"greet": "Hello"}) == "Hello, World!"
+        assert PythonTemplate("Hello, World!").render(context={}) == "Hello, World!"
+
+    def test_render_list(self) -> None:
+        template = PythonTemplate(["{greet}", "static", 1, None, ["{greet}"]])
+        assert template.render(context={"greet": "Hello"}) == ["Hello", "static", 1, None, ["Hello"]]
+
+    def test_render_missing_context_key(self) -> None:
+        template = PythonTemplate({"text": "{greet}"})
+        with pytest.raises(KeyError, match="greet"):
+            template.render(context={})
+
+    def test_render_malformed_format_string(self) -> None:
+        """Malformed format string fails on rendering, not on initialization."""
+        template = PythonTemplate({"text": "{greet"})
+        with pytest.raises(ValueError, match="expected '}' before end of string"):
+            template.render(context={"greet": "Hello"})
+
+    def test_render_returns_new_objects(self) -> None:
+        """Rendered objects should not be shared with the template or between the results."""
+        section: dict[str, Any] = {"type": "section", "text": {"type": "mrkdwn", "text": "Static"}}
+        template = PythonTemplate({"blocks": [section, section]})
+
+        first = template.render(context={})
+        second = template.render(context={})
+        first["blocks"][0]["text"]["text"] = "Modified"
+
+        assert first["blocks"][1]["text"]["text"] == "Static"
+        assert second["blocks"][0]["text"]["text"] == "Static"
+        assert section["text"]["text"] == "Static"
+
+    def test_render_static_objects(self) -> None:
+        """Objects other than containers and strings are put in the result as they are."""
+        lock = threading.Lock()
+        template = PythonTemplate({"text": "{greet}", "lock": lock})
+        assert template.render(context={"greet": "Hello"})["lock"] is lock
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "{greet}",
+            "{greet!r}",
+            "{greet!s:>10}",
+            "{greet!a}",
+            "{count:05d}",
+            "{count:{width}}",
+            "{user.name}",
+            "{items[0]}",
+            "{greet}{greet}",
+            "{}",
+        ],
+    )
+    def test_render_single_field(self, value: str) -> None:
+        """Strings of a single field are rendered the same as formatting them."""
+        context = {
+            "greet": "Hellö",
+            "count": 42,
+            "width": 8,
+            "user": SimpleNamespace(name="Daniel"),
+            "items": ["apple"],
+        }
+        template = PythonTemplate({"text": value})
+
+        try:
+            expected = value.format_map(context)
+        except (IndexError, ValueError) as exc:
+            with pytest.raises(type(exc)):
+                template.render(context)
+        else:
+            assert template.render(context) == {"text": expected}
+
+    def test_render_invalid_conversion(self) -> None:
+        template = PythonTemplate("{greet!x}")
+        with pytest.raises(ValueError, match="Unknown conversion specifier x"):
+            template.render(context={"greet": "Hello"})
+
+    def test_template_update(self) -> None:
+        """Updating template should also update the compiled one."""
+        template = PythonTemplate({"text": "{greet}"})
+        template.template = {"text": "{greet}, World!"}
+        assert template.render(context={"greet": "Hello"}) == {"text": "Hello, World!"}
+
+    def test_render_same_as_formatting_whole_tree(self) -> None:
+        template_obj = {
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"Item {i}: {{item_{i}!r:>10}}" if i % 5 == 0 else f"Item {i}"},
+                    "accessory": {"type": "button", "value": i, "emoji": True, "style": None},
+                }
+                for i in range(50)
+            ],
+            "text": "{user.name} has {items[0]} and more",
+        }
+        context = {f"item_{i}": i for i in range(50)} | {
+            "user": SimpleNamespace(name="Daniel"),
+            "items": ["apple"],
+        }
+        assert PythonTemplate(template_obj).render(context) == {
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"Item {i}: {i!r:>10}" if i % 5 == 0 else f"Item {i}"},
+                    "accessory": {"type": "button", "value": i, "emoji": True, "style": None},
+                }
+                for i in range(50)
+            ],
+            "text": "Daniel has apple and more",
+        }
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.test import override_settings
+
+from django_slack_tools.messenger.shortcuts import BaseTemplateLoader, CachedTemplateLoader, PythonTemplate
+from django_slack_tools.messenger.template_loaders import invalidate_cached_templates
+from tests.messenger._helpers import MockTemplateLoader
+
+
+class CountingTemplateLoader(BaseTemplateLoader):
+    def __init__(self, *, missing: tuple[str, ...] = ()) -> None:
+        self.missing = missing
+        self.calls: list[str] = []
+
+    def load(self, key: str) -> PythonTemplate | None:
+        self.calls.append(key)
+        if key in self.missing:
+            return None
+
+        return PythonTemplate({"text": key})
+
+
+def _make_loader(
+    *,
+    missing: tuple[str, ...] = (),
+    **kwargs: Any,
+) -> tuple[CachedTemplateLoader, CountingTemplateLoader]:
+    inner = CountingTemplateLoader(missing=missing)
+    kwargs.setdefault("version_key", "test-cached-template-loader")
+    return CachedTemplateLoader(inner, **kwargs), inner
+
+
+class TestCachedTemplateLoader:
+    def test_instance_creation(self) -> None:
+        loader = CachedTemplateLoader("tests.messenger._helpers.MockTemplateLoader")
+        assert isinstance(loader.loader, MockTemplateLoader)
+
+        with pytest.raises(ValueError, match="`maxsize` must be positive, got 0"):
+            CachedTemplateLoader(MockTemplateLoader(), maxsize=0)
+
+        with pytest.raises(ValueError, match="`ttl` must be positive or `None`, got 0"):
+            CachedTemplateLoader(MockTemplateLoader(), ttl=0)
+
+    def test_load(self) -> None:
+        loader, inner = _make_loader()
+
+        first = loader.load("a")
+        second = loader.load("a")
+
+        assert first is not None
+        assert first is second
+        assert inner.calls == ["a"]
+
+    def test_load_cache_misses(self) -> None:
+        loader, inner = _make_loader(missing=("a",))
+
+        assert loader.load("a") is None
+        assert loader.load("a") is None
+        assert inner.calls == ["a"]
+
+    def test_load_not_cache_misses(self) -> None:
+        loader, inner = _make_loader(missing=("a",), cache_misses=False)
+
+        assert loader.load("a") is None
+        assert loader.load("a") is None
+        assert inner.calls == ["a", "a"]
+
+    def test_lru_eviction(self) -> None:
+        loader, inner = _make_loader(maxsize=2)
+
+        loader.load("a")
+        loader.load("b")
+        loader.load("a")  # `b` is now least recently used
+        loader.load("c")
+        loader.load("a")
+        loader.load("b")
+
+        assert inner.calls == ["a", "b", "c", "b"]
+
+    def test_ttl(self) -> None:
+        loader, inner = _make_loader(ttl=10)
+
+        with mock.patch("time.monotonic", return_value=10**9):
+            loader.load("a")
+
+        with mock.patch("time.monotonic", return_value=109):
+            loader.load("a")
+
+        with mock.patch("time.monotonic", return_value=10**9 + 10):
+            loader.load("a")
+
+        assert inner.calls == ["a", "a"]
+
+    def test_no_ttl(self) -> None:
+        loader, inner = _make_loader(ttl=None)
+
+        with mock.patch("time.monotonic", return_value=0):
+            loader.load("a")
+
+        with mock.patch("time.monotonic", return_value=1e9):
+            loader.load("a")
+
+        assert inner.calls == ["a"]
+
+    def test_clear(self) -> None:
+        loader, inner = _make_loader()
+
+        loader.load("a")
+        loader.clear()
+        loader.load("a")
+
+        assert inner.calls == ["a", "a"]
+
+    def test_invalidate(self) -> None:
+        loader, inner = _make_loader(version_key="test_invalidate")
+        other_loader, _ = _make_loader()
+
+        loader.load("a")
+        other_loader.load("a")
+        invalidate_cached_templates("test_invalidate")
+        loader.load("a")
+
+        assert inner.calls == ["a", "a"]
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-cached"}},
+    )
+    def test_invalidate_by_other_process(self) -> None:
+        loader, inner = _make_loader(version_key="test_invalidate_by_other_process", version_check_interval=0)
+
+        loader.load("a")
+        caches["default"].set("test_invalidate_by_other_process", 999)
+        loader.load("a")
+
+        assert inner.calls == ["a", "a"]
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-cached"}},
+    )
+    def test_version_check_interval(self) -> None:
+        """Invalidations by other processes take effect once the interval passes."""
+        loader, inner = _make_loader(version_key="test_version_check_interval", version_check_interval=10)
+        with mock.patch("django_slack_tools.utils.cache.time.monotonic", return_value=10**9):
+            loader.load("a")
+            caches["default"].set("test_version_check_interval", 999)
+            loader.load("a")
+
+        assert inner.calls == ["a"]
+
+        with mock.patch("django_slack_tools.utils.cache.time.monotonic", return_value=10**9 + 10):
+            loader.load("a")
+
+        assert inner.calls == ["a", "a"]
+
+    def test_not_store_template_loaded_with_stale_version(self) -> None:
+        loader, inner = _make_loader(version_key="test_not_store_stale")
+
+        def load(key: str) -> PythonTemplate | None:
+            # Invalidated while loading template
+            invalidate_cached_templates("test_not_store_stale")
+            return CountingTemplateLoader.load(inner, key)
+
+        with mock.patch.object(inner, "load", side_effect=load):
+            loader.load("a")
+
+        # Version changes are detected
+        loader.load("a")
+        loader.load("a")
+
+        assert inner.calls == ["a", "a"]
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+import logging
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 from unittest import mock
 
 import pytest
+from asgiref.sync import async_to_sync
+from pydantic import ValidationError
 
-from django_slack_tools.messenger.shortcuts import MessageHeader, MessageRequest, Messenger, TemplateNotFoundError
+from django_slack_tools.messenger.shortcuts import (
+    AsyncMessenger,
+    BaseMessenger,
+    MessageBody,
+    MessageHeader,
+    MessageRequest,
+    Messenger,
+    TemplateNotFoundError,
+)
 from django_slack_tools.slack_messages.messenger import (
     DjangoDatabasePersister,
     DjangoDatabasePolicyHandler,
@@ -13,13 +24,36 @@
     DjangoTemplateLoader,
 )
 
-from ._factories import MessageRequestFactory
-from ._helpers import MockBackend, MockMiddleware, MockTemplate, MockTemplateLoader
+from ._factories import MessageRequestFactory, MessageResponseFactory
+from ._helpers import MockBackend, MockInstrument, MockMiddleware, MockTemplate, MockTemplateLoader
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from django_slack_tools.messenger.shortcuts import MessageResponse
 
 
+_INSTRUMENTED_EVENTS = [
+    ("enter", "send", {"template_key": "some-template-key"}),
+    ("enter", "process_request", {}),
+    ("enter", "middleware_request", {"component": "MockMiddleware"}),
+    ("exit", "middleware_request"),
+    ("exit", "process_request"),
+    ("enter", "load_template", {"template_key": "some-template-key"}),
+    ("exit", "load_template"),
+    ("enter", "render", {"template_key": "some-template-key"}),
+    ("exit", "render"),
+    ("enter", "deliver", {"component": "MockBackend"}),
+    ("response", True),
+    ("exit", "deliver"),
+    ("enter", "process_response", {}),
+    ("enter", "middleware_response", {"component": "MockMiddleware"}),
+    ("exit", "middleware_response"),
+    ("exit", "process_response"),
+    ("exit", "send"),
+]
+
+
 class TestMessenger:
     def test_instance_creation(self) -> None:
         """Test various instance creation scenarios."""
@@ -58,6 +92,16 @@ def test_instance_creation(self) -> None:
         ):
             Messenger(**(kwargs | {"messaging_backend": object()}))
 
+        # All instruments should be inherited from `BaseInstrument`
+        with pytest.raises(
+            TypeError,
+            match=r"Expected inherited from <class '.+\.BaseInstrument'>, got <class 'object'>",
+        ):
+            Messenger(**(kwargs | {"instruments": [object()]}))
+
+        with pytest.raises(ValueError, match="`verbose_sample_rate` must be between 0 and 1, got 1.5"):
+            Messenger(**(kwargs | {"verbose_sample_rate": 1.5}))
+
     def test_send(self) -> None:
         """Test `.send()` shortcut method, which wraps `.send_request()` for convenience."""
         messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
@@ -109,11 +153,77 @@ def test_send_request(self) -> None:
                     "unfurl_media": None,
                 },
                 "id_": mock.ANY,
+                "idempotency_key": None,
                 "template_key": "some-template-key",
             },
             "ts": None,
         }
 
+    @pytest.mark.parametrize(("verbose_sample_rate", "verbose"), [(0.0, False), (1.0, True)])
+    def test_send_request_logging(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        verbose_sample_rate: float,
+        verbose: bool,  # noqa: FBT001
+    ) -> None:
+        """Only IDs and sizes are logged at INFO level, unless sampled for verbose logging."""
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[],
+            messaging_backend=MockBackend(),
+            verbose_sample_rate=verbose_sample_rate,
+        )
+        request = MessageRequestFactory.create(id_="some-id", context={"name": "Daniel"})
+
+        with caplog.at_level(logging.DEBUG, logger="django_slack_tools.messenger.messenger"):
+            messenger.send_request(request=request)
+
+        sending, response = (record.getMessage() for record in caplog.records if record.levelno == logging.INFO)
+        assert ("context={'name': 'Daniel'}" in sending) is verbose
+        assert ("Hello, Daniel!" in response) is verbose
+        if not verbose:
+            assert sending == f"Sending request: {request.summary()}"
+
+        # Debug logs are summaries too
+        debug = [record.getMessage() for record in caplog.records if record.levelno == logging.DEBUG]
+        assert debug
+        assert not any("Daniel" in message for message in debug)
+
+    def test_send_request_instrumented(self) -> None:
+        instrument = MockInstrument()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware()],
+            messaging_backend=MockBackend(),
+            instruments=[instrument],
+            name="some-messenger",
+        )
+        assert instrument.events == [("bind", "some-messenger")]
+        instrument.events.clear()
+
+        messenger.send_request(request=MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        assert instrument.events == _INSTRUMENTED_EVENTS
+
+    def test_send_request_instrumented_error(self) -> None:
+        """Stages are exited even if errors raised in them."""
+        instrument = MockInstrument()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[],
+            messaging_backend=MockBackend(),
+            instruments=[instrument],
+        )
+
+        with pytest.raises(KeyError):
+            messenger.send_request(request=MessageRequestFactory.create(context={}))
+
+        assert instrument.events[-3:] == [
+            ("enter", "render", {"template_key": "some-template-key"}),
+            ("exit", "render"),
+            ("exit", "send"),
+        ]
+
     def test_send_request_request_middleware_returned_none(self) -> None:
         """When request middleware returned `None`, the request should not be sent."""
         messenger = Messenger(
@@ -124,6 +234,23 @@ def test_send_request_request_middleware_returned_none(self) -> None:
         response = messenger.send_request(request=MessageRequestFactory.create())
         assert response is None
 
+    def test_send_request_request_middleware_responded(self) -> None:
+        """When request middleware responded, the response should be returned without sending the request."""
+        cached = MessageResponseFactory.create()
+        backend = MockBackend()
+        response_middleware = MockMiddleware(process_response=mock.Mock())
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[response_middleware, MockMiddleware(process_request=lambda _: cached), MockMiddleware()],
+            messaging_backend=backend,
+        )
+        with mock.patch.object(backend, "deliver") as deliver:
+            response = messenger.send_request(request=MessageRequestFactory.create())
+
+        assert response is cached
+        deliver.assert_not_called()
+        response_middleware._process_response.assert_not_called()  # type: ignore[union-attr]
+
     def test_send_request_request_middleware_raised_error(self) -> None:
         """When request middleware raised an error, it should propagate the error."""
 
@@ -169,6 +296,33 @@ def test_send_request_message_rendering_failed_missing_context_key(self) -> None
         with pytest.raises(KeyError, match="name"):
             messenger.send_request(request=MessageRequestFactory.create(context={}))
 
+    @pytest.mark.parametrize("trusted_internal", [False, True])
+    def test_send_request_trusted_internal(self, trusted_internal: bool) -> None:  # noqa: FBT001
+        """Rendered messages are not validated if trusted, while other results are validated anyway."""
+        messenger = Messenger(
+            template_loaders=[
+                MockTemplateLoader(MockTemplate(render=lambda _: {"username": "bot"}), key="no-text"),
+                MockTemplateLoader(MockTemplate(render=lambda _: MessageBody(text="Hello")), key="body"),
+            ],
+            middlewares=[],
+            messaging_backend=MockBackend(),
+            trusted_internal=trusted_internal,
+        )
+
+        response = messenger.send_request(request=MessageRequestFactory.create(template_key="body"))
+        assert response
+        assert response.request
+        assert response.request.body == MessageBody(text="Hello")
+
+        if trusted_internal:
+            response = messenger.send_request(request=MessageRequestFactory.create(template_key="no-text"))
+            assert response
+            assert response.request
+            assert response.request.body == MessageBody.model_construct(username="bot")
+        else:
+            with pytest.raises(ValidationError, match="At least one of"):
+                messenger.send_request(request=MessageRequestFactory.create(template_key="no-text"))
+
     def test_send_request_message_rendering_failed_template_error_propagates_to_caller(self) -> None:
         """Error in rendering propagates to caller."""
 
@@ -208,3 +362,455 @@ def _throw_error(_: MessageResponse) -> None:
         )
         with pytest.raises(Exception, match="Some error occurred"):
             messenger.send_request(request=MessageRequestFactory.create(context={"name": "Daniel"}))
+
+    @pytest.mark.parametrize(
+        ("stage", "released"),
+        [
+            ("none", []),
+            ("stop-request", ["first"]),
+            ("respond", ["first"]),
+            ("deliver", ["second", "first"]),
+            ("stop-response", ["first"]),
+        ],
+    )
+    def test_send_request_releases_middlewares(self, stage: str, released: list[str]) -> None:
+        """Middlewares which processed the request but not its response are released."""
+        messenger, record = _make_releasing_messenger(Messenger, stage=stage)
+        request = MessageRequestFactory.create(context={"name": "Daniel"})
+
+        if stage == "deliver":
+            with pytest.raises(Exception, match="Some error occurred"):
+                messenger.send_request(request)
+        else:
+            messenger.send_request(request)
+
+        assert record == [(name, request.id_) for name in released]
+
+    def test_send_request_release_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Errors while releasing are logged, and the other middlewares are still released."""
+
+        def _throw_error(_: MessageRequest) -> None:
+            msg = "Some error occurred"
+            raise Exception(msg)  # noqa: TRY002
+
+        release = mock.Mock()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[
+                MockMiddleware(release=release),
+                MockMiddleware(release=_throw_error),
+                MockMiddleware(process_request=lambda _: None),
+            ],
+            messaging_backend=MockBackend(),
+        )
+        request = MessageRequestFactory.create()
+
+        assert messenger.send_request(request) is None
+        release.assert_called_once_with(request)
+        assert "Error while releasing request" in caplog.text
+
+    def test_send_many_releases_middlewares(self) -> None:
+        messenger, record = _make_releasing_messenger(Messenger, stage="deliver")
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(2)]
+
+        with pytest.raises(Exception, match="Some error occurred"):
+            list(messenger.send_many(requests))
+
+        assert sorted(record) == sorted((name, request.id_) for request in requests for name in ("second", "first"))
+
+    def test_send_many(self) -> None:
+        """Test sending multiple requests at once."""
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware()],
+            messaging_backend=MockBackend(),
+        )
+        names = [f"User {i}" for i in range(20)]
+        requests = [MessageRequestFactory.create(context={"name": name}) for name in names]
+
+        responses = list(messenger.send_many(requests, max_workers=4))
+
+        assert len(responses) == len(requests)
+        for request, response in zip(requests, responses):
+            assert response
+            assert response.ok is True
+            assert response.request is request
+
+        assert [request.body.text for request in requests if request.body] == [f"Hello, {name}!" for name in names]
+
+    def test_send_many_flushes_middlewares(self) -> None:
+        """Middlewares should be flushed after the batch, even if the consumer stopped early."""
+        middleware = MockMiddleware()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[middleware],
+            messaging_backend=MockBackend(),
+        )
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(3)]
+
+        with mock.patch.object(middleware, "flush") as flush:
+            list(messenger.send_many(requests))
+            flush.assert_called_once_with()
+
+            flush.reset_mock()
+            stream = cast("Generator[MessageResponse | None, None, None]", messenger.send_many(requests))
+            next(stream)
+            stream.close()
+            flush.assert_called_once_with()
+
+    def test_send_many_loads_template_once_per_key(self) -> None:
+        """Templates should be loaded only once for each template key in batch."""
+        loader = MockTemplateLoader()
+        messenger = Messenger(template_loaders=[loader], middlewares=[], messaging_backend=MockBackend())
+        requests = [
+            MessageRequestFactory.create(template_key=key, context={"name": "Daniel"})
+            for key in ("template-a", "template-b", "template-a", "template-b", "template-a")
+        ]
+
+        with mock.patch.object(loader, "load", wraps=loader.load) as load:
+            responses = list(messenger.send_many(requests))
+
+        assert all(response and response.ok for response in responses)
+        assert load.call_args_list == [mock.call("template-a"), mock.call("template-b")]
+
+    def test_send_many_middleware_returned_none(self) -> None:
+        """Stopped requests and responses should yield `None` at their position."""
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[
+                MockMiddleware(
+                    process_request=lambda req: None if req.channel == "stop-request" else req,
+                    process_response=lambda res: (
+                        None if res.request and res.request.channel == "stop-response" else res
+                    ),
+                ),
+            ],
+            messaging_backend=MockBackend(),
+        )
+        requests = [
+            MessageRequestFactory.create(channel=channel, context={"name": "Daniel"})
+            for channel in ("some-channel", "stop-request", "stop-response", "some-channel")
+        ]
+
+        responses = list(messenger.send_many(requests))
+
+        assert [response.request.channel if response and response.request else None for response in responses] == [
+            "some-channel",
+            None,
+            None,
+            "some-channel",
+        ]
+
+    def test_send_many_middleware_responded(self) -> None:
+        """Responses of middlewares should be yielded at their position, without sending the requests."""
+        cached = MessageResponseFactory.create()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_request=lambda req: cached if req.channel == "cached" else req)],
+            messaging_backend=MockBackend(),
+        )
+        requests = [
+            MessageRequestFactory.create(channel=channel, context={"name": "Daniel"})
+            for channel in ("some-channel", "cached", "some-channel")
+        ]
+
+        responses = list(messenger.send_many(requests))
+
+        assert responses[1] is cached
+        assert [response.request.channel if response and response.request else None for response in responses] == [
+            "some-channel",
+            cached.request.channel,
+            "some-channel",
+        ]
+        assert requests[1].body is None
+
+    def test_send_many_request_middlewares_applied_before_delivery(self) -> None:
+        """All requests should be processed and rendered before any of them is delivered."""
+        events: list[str] = []
+
+        def _process_request(request: MessageRequest) -> MessageRequest:
+            events.append(f"request:{request.context['name']}")
+            return request
+
+        class _Backend(MockBackend):
+            def deliver(self, request: MessageRequest) -> MessageResponse:
+                events.append("deliver")
+                return super().deliver(request)
+
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_request=_process_request)],
+            messaging_backend=_Backend(),
+        )
+        requests = [MessageRequestFactory.create(context={"name": name}) for name in ("a", "b", "c")]
+
+        list(messenger.send_many(requests, max_workers=1))
+
+        assert events == ["request:a", "request:b", "request:c", "deliver", "deliver", "deliver"]
+
+    def test_send_many_rendering_error_propagates_to_caller(self) -> None:
+        """Error in rendering propagates to caller, before any of the messages are delivered."""
+        backend = MockBackend()
+        messenger = Messenger(template_loaders=[MockTemplateLoader()], middlewares=[], messaging_backend=backend)
+        requests = [
+            MessageRequestFactory.create(context={"name": "Daniel"}),
+            MessageRequestFactory.create(context={}),
+        ]
+
+        with mock.patch.object(backend, "deliver") as deliver, pytest.raises(KeyError, match="name"):
+            list(messenger.send_many(requests))
+
+        deliver.assert_not_called()
+
+    def test_send_many_bad_max_workers(self) -> None:
+        messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
+        with pytest.raises(ValueError, match="`max_workers` must be greater than 0, got 0"):
+            list(messenger.send_many([], max_workers=0))
+
+
+class TestAsyncMessenger:
+    def test_not_messenger(self) -> None:
+        """Async messenger can't be used where a synchronous one is expected."""
+        messenger = AsyncMessenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
+        assert isinstance(messenger, BaseMessenger)
+        assert not isinstance(messenger, Messenger)
+
+    def test_send(self) -> None:
+        """Test `.send()` shortcut method, which wraps `.send_request()` for convenience."""
+        messenger = AsyncMessenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
+        with mock.patch.object(messenger, "send_request") as send_request:
+            async_to_sync(messenger.send)(
+                to="channel",
+                template="template",
+                context={"key": "value"},
+                header={"thread_ts": "123"},
+            )
+            assert send_request.call_count == 1
+            assert cast("MessageRequest", send_request.call_args.kwargs["request"]).model_dump(
+                exclude={"id_"},
+            ) == MessageRequest(
+                template_key="template",
+                channel="channel",
+                context={"key": "value"},
+                header=MessageHeader(thread_ts="123"),
+            ).model_dump(exclude={"id_"})
+
+    def test_send_request(self) -> None:
+        """Test sending a message request."""
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware()],
+            messaging_backend=MockBackend(),
+        )
+        request = MessageRequestFactory.create(context={"name": "Daniel"})
+
+        response = async_to_sync(messenger.send_request)(request=request)
+
+        assert response
+        assert response.ok is True
+        assert response.request is request
+        assert request.body
+        assert request.body.text == "Hello, Daniel!"
+
+    def test_send_request_instrumented(self) -> None:
+        instrument = MockInstrument()
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware()],
+            messaging_backend=MockBackend(),
+            instruments=[instrument],
+        )
+
+        async_to_sync(messenger.send_request)(request=MessageRequestFactory.create(context={"name": "Daniel"}))
+
+        assert instrument.events == [("bind", ""), *_INSTRUMENTED_EVENTS]
+
+    def test_send_request_request_middleware_returned_none(self) -> None:
+        """When request middleware returned `None`, the request should not be sent."""
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_request=lambda _: None)],
+            messaging_backend=MockBackend(),
+        )
+        response = async_to_sync(messenger.send_request)(request=MessageRequestFactory.create())
+        assert response is None
+
+    def test_send_request_request_middleware_responded(self) -> None:
+        """When request middleware responded, the response should be returned without sending the request."""
+        cached = MessageResponseFactory.create()
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_request=lambda _: cached)],
+            messaging_backend=MockBackend(),
+        )
+        request = MessageRequestFactory.create()
+        response = async_to_sync(messenger.send_request)(request=request)
+        assert response is cached
+        assert request.body is None
+
+    def test_send_request_response_middleware_returned_none(self) -> None:
+        """When response middleware returned `None`, it should return the `None`."""
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_response=lambda _: None)],
+            messaging_backend=MockBackend(),
+        )
+        response = async_to_sync(messenger.send_request)(
+            request=MessageRequestFactory.create(context={"name": "Daniel"}),
+        )
+        assert response is None
+
+    @pytest.mark.parametrize(("stage", "released"), [("none", []), ("deliver", ["second", "first"])])
+    def test_send_request_releases_middlewares(self, stage: str, released: list[str]) -> None:
+        messenger, record = _make_releasing_messenger(AsyncMessenger, stage=stage)
+        request = MessageRequestFactory.create(context={"name": "Daniel"})
+
+        if stage == "deliver":
+            with pytest.raises(Exception, match="Some error occurred"):
+                async_to_sync(messenger.send_request)(request)
+        else:
+            async_to_sync(messenger.send_request)(request)
+
+        assert record == [(name, request.id_) for name in released]
+
+    def test_send_request_release_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        def _throw_error(_: MessageRequest) -> None:
+            msg = "Some error occurred"
+            raise Exception(msg)  # noqa: TRY002
+
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(release=_throw_error), MockMiddleware(process_request=lambda _: None)],
+            messaging_backend=MockBackend(),
+        )
+
+        assert async_to_sync(messenger.send_request)(MessageRequestFactory.create()) is None
+        assert "Error while releasing request" in caplog.text
+
+    def test_send_many_releases_middlewares(self) -> None:
+        messenger, record = _make_releasing_messenger(AsyncMessenger, stage="stop-request")
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(2)]
+
+        async def _send_many() -> list[MessageResponse | None]:
+            return [response async for response in messenger.send_many(requests)]
+
+        assert async_to_sync(_send_many)() == [None, None]
+        assert record == [("first", request.id_) for request in requests]
+
+    def test_send_many(self) -> None:
+        """Test sending multiple requests at once."""
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[
+                MockMiddleware(
+                    process_request=lambda req: None if req.channel == "stop-request" else req,
+                    process_response=lambda res: (
+                        None if res.request and res.request.channel == "stop-response" else res
+                    ),
+                ),
+            ],
+            messaging_backend=MockBackend(),
+        )
+        channels = ["some-channel", "stop-request", "stop-response", *(f"channel-{i}" for i in range(10))]
+        requests = [MessageRequestFactory.create(channel=channel, context={"name": "Daniel"}) for channel in channels]
+
+        async def _send_many() -> list[MessageResponse | None]:
+            return [response async for response in messenger.send_many(requests, max_concurrency=3)]
+
+        responses = async_to_sync(_send_many)()
+
+        assert [response.request.channel if response and response.request else None for response in responses] == [
+            "some-channel",
+            None,
+            None,
+            *(f"channel-{i}" for i in range(10)),
+        ]
+
+    def test_send_many_middleware_responded(self) -> None:
+        """Responses of middlewares should be yielded at their position, without sending the requests."""
+        cached = MessageResponseFactory.create()
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[MockMiddleware(process_request=lambda req: cached if req.channel == "cached" else req)],
+            messaging_backend=MockBackend(),
+        )
+        requests = [
+            MessageRequestFactory.create(channel=channel, context={"name": "Daniel"})
+            for channel in ("some-channel", "cached", "some-channel")
+        ]
+
+        async def _send_many() -> list[MessageResponse | None]:
+            return [response async for response in messenger.send_many(requests)]
+
+        responses = async_to_sync(_send_many)()
+
+        assert responses[1] is cached
+        assert responses[0] is not None
+        assert responses[0].request is requests[0]
+        assert requests[1].body is None
+
+    def test_send_many_flushes_middlewares(self) -> None:
+        middleware = MockMiddleware()
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[middleware],
+            messaging_backend=MockBackend(),
+        )
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(3)]
+
+        async def _send_many() -> list[MessageResponse | None]:
+            return [response async for response in messenger.send_many(requests)]
+
+        with mock.patch.object(middleware, "flush") as flush:
+            async_to_sync(_send_many)()
+
+        flush.assert_called_once_with()
+
+    def test_send_many_stop_early(self) -> None:
+        """Pending deliveries should be cancelled if consumer stops early."""
+        messenger = AsyncMessenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[],
+            messaging_backend=MockBackend(),
+        )
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(5)]
+
+        async def _send_first() -> MessageResponse | None:
+            stream = messenger.send_many(requests, max_concurrency=1)
+            response = await stream.__anext__()
+            await stream.aclose()
+            return response
+
+        response = async_to_sync(_send_first)()
+        assert response
+        assert response.request is requests[0]
+
+    def test_send_many_bad_max_concurrency(self) -> None:
+        messenger = AsyncMessenger(template_loaders=[], middlewares=[], messaging_backend=MockBackend())
+
+        async def _send_many() -> list[MessageResponse | None]:
+            return [response async for response in messenger.send_many([], max_concurrency=0)]
+
+        with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0, got 0"):
+            async_to_sync(_send_many)()
+
+
+_M = TypeVar("_M", Messenger, AsyncMessenger)
+
+
+def _make_releasing_messenger(cls: type[_M], *, stage: str) -> tuple[_M, list[tuple[str, str]]]:
+    """Create messenger with two middlewares recording releases, of which requests stop at given stage."""
+    record: list[tuple[str, str]] = []
+    cached = MessageResponseFactory.create()
+    second = {
+        "stop-request": MockMiddleware(process_request=lambda _: None),
+        "respond": MockMiddleware(process_request=lambda _: cached),
+        "stop-response": MockMiddleware(process_response=lambda _: None),
+    }.get(stage, MockMiddleware())
+    second._release = lambda request: record.append(("second", request.id_))
+    messenger = cls(
+        template_loaders=[MockTemplateLoader()],
+        middlewares=[MockMiddleware(release=lambda request: record.append(("first", request.id_))), second],
+        messaging_backend=MockBackend(should_error=stage == "deliver"),
+    )
+    return messenger, record
@@ -9,6 +9,18 @@ class TestMessageRequest:
     def test_instance_creation(self) -> None:
         assert MessageRequestFactory()
 
+    def test_summary(self) -> None:
+        request = MessageRequestFactory.create(id_="some-id")
+        assert request.summary() == (
+            "some-id (channel='some-channel', template_key='some-template-key', context_keys=1, body=not rendered)"
+        )
+
+        request.body = MessageBody(text="Hello, World!", blocks=[{"type": "divider"}] * 2)
+        assert request.summary() == (
+            "some-id (channel='some-channel', template_key='some-template-key', context_keys=1, "
+            "body=2 blocks, 0 attachments, 13 characters of text)"
+        )
+
 
 class TestMessageHeader:
     def test_instance_creation(self) -> None:
@@ -32,3 +44,11 @@ def test_from_any(self) -> None:
         assert MessageBody.from_any("some-text") == MessageBody(text="some-text")
         with pytest.raises(TypeError, match="Unsupported type <class 'int'>"):
             MessageBody.from_any(-1)  # type: ignore[arg-type]
+
+    def test_from_trusted(self) -> None:
+        body = MessageBody.from_trusted({"text": "some-text", "unknown": True})
+        assert body == MessageBody(text="some-text")
+        assert body.model_fields_set == {"text"}
+
+        # Not validated
+        assert MessageBody.from_trusted({}).model_dump(exclude_none=True) == {}
@@ -1,6 +1,19 @@
-from ._factories import MessageResponseFactory
+from ._factories import MessageRequestFactory, MessageResponseFactory
 
 
 class TestMessageResponse:
     def test_instance_creation(self) -> None:
         assert MessageResponseFactory()
+
+    def test_summary(self) -> None:
+        request = MessageRequestFactory.create(id_="some-id")
+        assert MessageResponseFactory.create(request=request).summary() == "some-id (ok=True, ts='some-ts')"
+        assert (
+            MessageResponseFactory.create(
+                request=None,
+                ok=False,
+                ts=None,
+                data={"error": "channel_not_found"},
+            ).summary()
+            == "None (ok=False, ts=None, error='channel_not_found')"
+        )
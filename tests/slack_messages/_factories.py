@@ -67,3 +67,21 @@ def data(self) -> dict[str, Any]:
 
     class Params:
         permalink = "https://ghostbusters.slack.com/archives/C1H9RESGA/p135854651500008"
+
+
+class SlackAuthTestResponseFactory(SlackResponseFactory):
+    """Response factory for `auth.test` API method."""
+
+    @lazy_attribute
+    def data(self) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "url": self.url,  # type: ignore[attr-defined]
+            "team": "Ghostbusters",
+            "user": "bot",
+            "team_id": "T0G9PQBBK",
+            "user_id": "W23456789",
+        }
+
+    class Params:
+        url = "https://ghostbusters.slack.com/"
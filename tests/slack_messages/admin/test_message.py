@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import urllib.error
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
+from django.contrib import admin
+from slack_sdk.errors import SlackApiError
 
 from django_slack_tools.slack_messages.admin import SlackMessageAdmin
 from django_slack_tools.slack_messages.models import SlackMessage
@@ -55,3 +59,115 @@ def test_changelist(self, admin_client: Client) -> None:
         # Test permalink field
         self.factory_cls.create(permalink="https://example.com")
         return super().test_changelist(admin_client)
+
+    def test_permalink_missing(self, admin_client: Client, mock_slack_client: mock.Mock) -> None:
+        """Missing permalinks are shown as N/A, without calling Slack API while rendering rows."""
+        self.factory_cls.create(channel="C1H9RESGA", ok=True, ts="1358546515.000008", permalink="")
+
+        response = admin_client.get(self._reverse("changelist"))
+
+        assert response.status_code == 200
+        assert b"/archives/" not in response.content
+        assert b"N/A" in response.content
+        assert not mock_slack_client.method_calls
+
+    @pytest.fixture
+    def model_admin(self, monkeypatch: pytest.MonkeyPatch) -> SlackMessageAdmin:
+        """Registered admin, of which remembered failure is restored after test."""
+        model_admin = admin.site._registry[SlackMessage]
+        assert isinstance(model_admin, SlackMessageAdmin)
+        monkeypatch.setattr(model_admin, "_team_url_failed_at", None)
+        return model_admin
+
+    @pytest.mark.usefixtures("model_admin")
+    def test_change_permalink_missing(self, admin_client: Client, mock_slack_client: mock.Mock) -> None:
+        """Missing permalink is built in change view, with workspace URL fetched once."""
+        mock_slack_client.auth_test.return_value = {"url": "https://example.slack.com/"}
+        for ts in ("1358546515.000008", "1358546515.000009"):
+            message = self.factory_cls.create(channel="C1H9RESGA", ok=True, ts=ts, permalink="")
+
+            response = admin_client.get(self._reverse("change", args=(message.pk,)))
+
+            assert response.status_code == 200
+            assert f"https://example.slack.com/archives/C1H9RESGA/p{ts.replace('.', '')}".encode() in response.content
+
+        mock_slack_client.auth_test.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            SlackApiError("invalid_auth", response=mock.Mock()),
+            urllib.error.URLError("Connection refused"),
+        ],
+    )
+    def test_change_permalink_error(
+        self,
+        admin_client: Client,
+        mock_slack_client: mock.Mock,
+        model_admin: SlackMessageAdmin,
+        error: Exception,
+    ) -> None:
+        """Failure to fetch workspace URL is shown as N/A, and remembered for a while."""
+        mock_slack_client.auth_test.side_effect = error
+        message = self.factory_cls.create(channel="C1H9RESGA", ok=True, ts="1358546515.000008", permalink="")
+        url = self._reverse("change", args=(message.pk,))
+
+        with mock.patch("time.monotonic", return_value=10**9):
+            response = admin_client.get(url)
+            admin_client.get(url)
+
+        assert response.status_code == 200
+        assert b"/archives/" not in response.content
+        assert model_admin._team_url_failed_at == 10**9
+        mock_slack_client.auth_test.assert_called_once_with()
+
+        # Retried after a while
+        mock_slack_client.auth_test.side_effect = None
+        mock_slack_client.auth_test.return_value = {"url": "https://example.slack.com/"}
+        with mock.patch("time.monotonic", return_value=10**9 + 300):
+            response = admin_client.get(url)
+
+        assert b"https://example.slack.com/archives/C1H9RESGA/p1358546515000008" in response.content
+        assert model_admin._team_url_failed_at is None
+
+    @pytest.mark.parametrize(
+        ("ok", "ts", "channel"),
+        [
+            (False, None, "C1H9RESGA"),
+            (True, "1358546515.000008", "#general"),
+        ],
+    )
+    @pytest.mark.usefixtures("model_admin")
+    def test_change_permalink_unavailable(
+        self,
+        admin_client: Client,
+        mock_slack_client: mock.Mock,
+        ok: bool,  # noqa: FBT001
+        ts: str | None,
+        channel: str,
+    ) -> None:
+        """Permalink can't be built for unsent messages or channel names."""
+        mock_slack_client.auth_test.return_value = {"url": "https://example.slack.com/"}
+        message = self.factory_cls.create(channel=channel, ok=ok, ts=ts, permalink="")
+
+        response = admin_client.get(self._reverse("change", args=(message.pk,)))
+
+        assert response.status_code == 200
+        assert b"/archives/" not in response.content
+        assert not mock_slack_client.chat_getPermalink.called
+
+    def test_change_compressed_payloads(self, admin_client: Client) -> None:
+        """Compressed dumps are shown as JSON in place of plain ones."""
+        message = self.factory_cls.create(
+            request=None,
+            response=None,
+            compressed_request={"channel": "C1H9RESGA"},
+            compressed_response={"ok": True, "data": {"ts": "1358546515.000008"}},
+        )
+
+        response = admin_client.get(self._reverse("change", args=(message.pk,)))
+
+        assert response.status_code == 200
+        assert b'name="compressed_request"' in response.content
+        assert b'name="request"' not in response.content
+        assert b"&quot;ts&quot;: &quot;1358546515.000008&quot;" in response.content
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from django_slack_tools.slack_messages.admin import SlackOutboxMessageAdmin
+from django_slack_tools.slack_messages.models import SlackOutboxMessage
+from tests._helpers import ModelAdminTestBase
+from tests.slack_messages.models._factories import SlackOutboxMessageFactory
+
+if TYPE_CHECKING:
+    from django.test.client import Client
+
+
+class TestSlackOutboxMessageAdmin(ModelAdminTestBase):
+    admin_cls = SlackOutboxMessageAdmin
+    model_cls = SlackOutboxMessage
+    factory_cls = SlackOutboxMessageFactory
+
+    pytestmark = pytest.mark.django_db()
+
+    def test_retry_messages(self, admin_client: Client) -> None:
+        failed = self.factory_cls.create(status=SlackOutboxMessage.Status.FAILED, attempts=3, error="Timed out")
+        claimed = self.factory_cls.create(status=SlackOutboxMessage.Status.CLAIMED, attempts=1, claimed_by="abc")
+
+        response = admin_client.post(
+            self._reverse("changelist"),
+            {
+                "action": "_retry_messages",
+                "_selected_action": [failed.id, claimed.id],
+            },
+        )
+
+        assert self._get_messages(response.wsgi_request) == ["1 messages will be sent again."]
+        failed.refresh_from_db()
+        assert failed.status == SlackOutboxMessage.Status.PENDING
+        assert failed.attempts == 0
+
+        # Messages being sent are not touched
+        claimed.refresh_from_db()
+        assert claimed.status == SlackOutboxMessage.Status.CLAIMED
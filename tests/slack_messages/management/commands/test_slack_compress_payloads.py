@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from django_slack_tools.slack_messages.models import SlackMessage
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_compress_payloads() -> None:
+    SlackMessageFactory.create_batch(3, request={"channel": "C1H9RESGA"}, response={"ok": True})
+    out = StringIO()
+
+    call_command("slack_compress_payloads", "--chunk-size", "2", stdout=out)
+
+    assert out.getvalue() == "Updated 2 messages so far.\nUpdated 3 messages so far.\nUpdated 3 messages.\n"
+    assert not SlackMessage.objects.filter(request__isnull=False).exists()
+
+    out = StringIO()
+    call_command("slack_compress_payloads", "--decompress", stdout=out)
+
+    assert out.getvalue() == "Updated 3 messages so far.\nUpdated 3 messages.\n"
+    assert not SlackMessage.objects.filter(compressed_request__isnull=False).exists()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from io import StringIO
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_messages(tmp_path: Path) -> None:
+    SlackMessageFactory.create_batch(3)
+    path = tmp_path / "messages.jsonl.gz"
+    out = StringIO()
+
+    call_command("slack_export_messages", str(path), stdout=out)
+
+    assert path.exists()
+    assert out.getvalue() == "Exported 3 messages.\n"
+
+    # Not overwritten
+    with pytest.raises(CommandError, match="exists already"):
+        call_command("slack_export_messages", str(path))
+
+
+@pytest.mark.parametrize(
+    ("args", "ok"),
+    [
+        ([], None),
+        (["--ok"], True),
+        (["--not-ok"], False),
+    ],
+)
+def test_export_messages_filters(tmp_path: Path, args: list[str], ok: bool | None) -> None:  # noqa: FBT001
+    path = tmp_path / "messages.jsonl.gz"
+    with mock.patch(
+        "django_slack_tools.slack_messages.management.commands.slack_export_messages.export_messages",
+        return_value=0,
+    ) as export_messages:
+        call_command(
+            "slack_export_messages",
+            str(path),
+            "--since=2024-01-01T00:00:00Z",
+            "--until=2024-02-01T00:00:00+09:00",
+            "--channel=C0123",
+            "--policy=MY_POLICY",
+            "--chunk-size=10",
+            *args,
+            stdout=StringIO(),
+        )
+
+    export_messages.assert_called_once_with(
+        str(path),
+        since=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        until=datetime(2024, 1, 31, 15, tzinfo=timezone.utc),
+        channel="C0123",
+        policy="MY_POLICY",
+        ok=ok,
+        chunk_size=10,
+    )
+
+
+def test_export_messages_invalid_time(tmp_path: Path) -> None:
+    with pytest.raises(CommandError, match="argument --since: invalid _datetime value: 'yesterday'"):
+        call_command("slack_export_messages", str(tmp_path / "messages.jsonl.gz"), "--since=yesterday")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+
+from django_slack_tools.slack_messages.archive import export_messages
+from django_slack_tools.slack_messages.models import SlackMessage
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.django_db
+
+
+def test_import_messages(tmp_path: Path) -> None:
+    SlackMessageFactory.create_batch(3)
+    path = tmp_path / "messages.jsonl.gz"
+    export_messages(path)
+    SlackMessage.objects.all().delete()
+    out = StringIO()
+
+    call_command("slack_import_messages", str(path), "--batch-size=2", stdout=out)
+
+    assert SlackMessage.objects.count() == 3
+    assert out.getvalue() == "Imported 3 messages.\n"
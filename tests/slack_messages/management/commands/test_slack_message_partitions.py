@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+pytestmark = pytest.mark.django_db
+
+
+def test_not_postgresql() -> None:
+    with pytest.raises(CommandError, match="supported on PostgreSQL only"):
+        call_command("slack_message_partitions")
+
+
+@pytest.mark.parametrize(("detach_only", "action"), [(False, "Dropped"), (True, "Detached")])
+def test_partitions(detach_only: bool, action: str) -> None:  # noqa: FBT001
+    out = StringIO()
+    now = timezone.now()
+    with mock.patch.multiple(
+        "django_slack_tools.slack_messages.partitions",
+        partition_table=mock.DEFAULT,
+        create_partitions=mock.DEFAULT,
+        drop_partitions=mock.DEFAULT,
+    ) as mocks:
+        mocks["create_partitions"].return_value = ["slack_messages_slackmessage_p202502"]
+        mocks["drop_partitions"].return_value = ["slack_messages_slackmessage_p202411"]
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            call_command(
+                "slack_message_partitions",
+                "--setup",
+                "--months-ahead=2",
+                "--retention-days=30",
+                *(["--detach-only"] if detach_only else []),
+                stdout=out,
+            )
+
+    mocks["partition_table"].assert_called_once_with(months_ahead=2, using="default")
+    mocks["create_partitions"].assert_called_once_with(months_ahead=2, using="default")
+    mocks["drop_partitions"].assert_called_once_with(
+        before=now - timedelta(days=30),
+        detach_only=detach_only,
+        using="default",
+    )
+    assert out.getvalue() == (
+        "Partitioned message table.\n"
+        "Created partition slack_messages_slackmessage_p202502.\n"
+        f"{action} partition slack_messages_slackmessage_p202411.\n"
+    )
+
+
+def test_create_only() -> None:
+    out = StringIO()
+    with mock.patch.multiple(
+        "django_slack_tools.slack_messages.partitions",
+        partition_table=mock.DEFAULT,
+        create_partitions=mock.DEFAULT,
+        drop_partitions=mock.DEFAULT,
+    ) as mocks:
+        mocks["create_partitions"].return_value = []
+        call_command("slack_message_partitions", stdout=out)
+
+    mocks["partition_table"].assert_not_called()
+    mocks["create_partitions"].assert_called_once_with(months_ahead=3, using="default")
+    mocks["drop_partitions"].assert_not_called()
+    assert out.getvalue() == ""
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import signal
+from io import StringIO
+from typing import Any, Callable
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+from django_slack_tools.slack_messages.models import SlackOutboxMessage
+from tests.slack_messages.models._factories import SlackOutboxMessageFactory
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("override_app_settings"),
+]
+
+
+def test_dispatch_once() -> None:
+    SlackOutboxMessageFactory.create_batch(3)
+    out = StringIO()
+
+    call_command("slack_outbox_dispatch", "--once", "--batch-size", "2", stdout=out)
+
+    assert out.getvalue() == "Dispatched 2 messages.\n"
+    assert SlackOutboxMessage.objects.filter(status=SlackOutboxMessage.Status.SENT).count() == 2
+
+
+def test_dispatch_until_stopped() -> None:
+    out = StringIO()
+    handlers: dict[int, Callable[..., Any]] = {}
+
+    def run_forever(*, poll_interval: float, stop_event: mock.Mock) -> None:
+        assert poll_interval == 0.5
+        handlers[signal.SIGTERM](signal.SIGTERM, None)
+        assert stop_event.is_set()
+
+    with mock.patch("signal.signal", side_effect=handlers.__setitem__):  # noqa: SIM117
+        with mock.patch(
+            "django_slack_tools.slack_messages.outbox.OutboxDispatcher.run_forever",
+            side_effect=run_forever,
+        ) as run_forever_mock:
+            call_command("slack_outbox_dispatch", "--poll-interval", "0.5", stdout=out)
+
+    run_forever_mock.assert_called_once()
+    assert set(handlers) == {signal.SIGINT, signal.SIGTERM}
+    assert out.getvalue() == "Dispatching outbox messages, press CTRL+C to stop.\nStopping after current batch...\n"
@@ -2,11 +2,16 @@
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from django.template import TemplateDoesNotExist
 
 from django_slack_tools.slack_messages.messenger import DjangoTemplate
+from django_slack_tools.slack_messages.messenger.message_templates import _xml_to_dict, _xmltodict_parse
+
+if TYPE_CHECKING:
+    from django_slack_tools.slack_messages.messenger.message_templates import XMLParser
 
 
 @pytest.fixture(scope="session")
@@ -24,6 +29,10 @@ def test_instance_creation(self) -> None:
         with pytest.raises(TemplateDoesNotExist, match="template-does-not-exists.xml"):
             DjangoTemplate(file="template-does-not-exists.xml")
 
+        # Unsupported XML parser
+        with pytest.raises(ValueError, match="Unsupported XML parser: 'whatever'"):
+            DjangoTemplate(inline="<whatever>Whatever</whatever>", xml_parser="whatever")  # type: ignore[call-overload]
+
     @pytest.mark.parametrize(
         ("xml_input", "json_expect"),
         [
@@ -39,12 +48,13 @@ def test_instance_creation(self) -> None:
             ("search-results-2.xml", "search-results-2.json"),
         ],
     )
-    def test_render(self, xml_input: str, json_expect: str, data_dir: Path) -> None:
+    @pytest.mark.parametrize("xml_parser", ["etree", "xmltodict"])
+    def test_render(self, xml_input: str, json_expect: str, xml_parser: XMLParser, data_dir: Path) -> None:
         # Arrange
         expect = json.loads((data_dir / json_expect).read_text())
 
         # Act
-        actual = DjangoTemplate(inline=(data_dir / xml_input).read_text()).render({})
+        actual = DjangoTemplate(inline=(data_dir / xml_input).read_text(), xml_parser=xml_parser).render({})
 
         # Assert
         assert actual == expect
@@ -115,3 +125,24 @@ def test_render_complex_with_context(self, data_dir: Path) -> None:
         # Assert
         expect = json.loads((data_dir / "complex-template.json").read_text())
         assert actual == expect
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        # Attributes, coerced values and repeated keys
+        '<root><block type="divider" /><block type="section" emoji="true"><text>A</text></block></root>',
+        '<root flag="false"><indent>4</indent><block type="rich_text_list" indent="1" /></root>',
+        "<root><text>One</text><text>Two</text><element>Forced to list</element></root>",
+        # Text mixed with children, text normalization
+        "<root><elements>\n    Line\n    continued\n\n    Paragraph\n</elements></root>",
+        "<root>Head <b>bold</b> tail <i>italic</i> end<option value='1' /></root>",
+        '<root><text type="mrkdwn">  Text with attributes  </text><empty /><blank>   </blank></root>',
+        # Renamed tag conflicting with attribute
+        '<root blocks="attribute"><block type="section" /></root>',
+        # Escaped characters
+        '<root><text>&lt;@U1234&gt; &amp; "quotes"</text><button value="a&#10;b" /></root>',
+    ],
+)
+def test_xml_to_dict_same_as_xmltodict(xml: str) -> None:
+    assert _xml_to_dict(xml) == _xmltodict_parse(xml)
@@ -1,39 +1,64 @@
 from __future__ import annotations
 
+import json
 import sys
+import time
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from unittest import mock
 
 import pytest
+from django.core.cache import caches
 
 from django_slack_tools.messenger.shortcuts import (
+    AsyncMessenger,
     BaseMiddleware,
     DummyBackend,
     MessageRequest,
     MessageResponse,
     Messenger,
+    PythonTemplate,
 )
-from django_slack_tools.slack_messages.messenger import DjangoDatabasePersister, DjangoDatabasePolicyHandler
+from django_slack_tools.slack_messages.archive import import_messages
+from django_slack_tools.slack_messages.messenger import (
+    CoalescingMiddleware,
+    DeduplicationMiddleware,
+    DjangoDatabasePersister,
+    DjangoDatabasePolicyHandler,
+    DjangoPolicyTemplateLoader,
+)
+from django_slack_tools.slack_messages.messenger.policy_resolver import default_policy_resolver
 from django_slack_tools.slack_messages.models import SlackMessage
 from django_slack_tools.slack_messages.models.messaging_policy import SlackMessagingPolicy
 from tests._factories import SlackApiErrorFactory
 from tests._helpers import AnyRegex
 from tests.messenger._factories import MessageRequestFactory, MessageResponseFactory
-from tests.messenger._helpers import MockBackend, MockTemplateLoader
-from tests.slack_messages._factories import SlackGetPermalinkResponseFactory
+from tests.messenger._helpers import MockBackend, MockMiddleware, MockTemplateLoader
+from tests.slack_messages._factories import SlackAuthTestResponseFactory, SlackGetPermalinkResponseFactory
 from tests.slack_messages.models._factories import (
     SlackMentionFactory,
+    SlackMessageFactory,
     SlackMessageRecipientFactory,
     SlackMessagingPolicyFactory,
 )
 
+try:
+    import celery  # noqa: F401
+except ImportError:
+    celery_installed = False
+else:
+    celery_installed = True
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Any, Callable
 
+    from pytest_django.fixtures import SettingsWrapper
     from slack_bolt import App
 
     from django_slack_tools.app_settings import SettingsDict
+    from django_slack_tools.slack_messages.messenger.middlewares import FanOut
 
 
 pytestmark = [
@@ -72,7 +97,26 @@ def app_settings() -> SettingsDict:
     }
 
 
+@contextmanager
+def failing_saves() -> Iterator[None]:
+    """Make saving messages fail, both in bulk and one by one."""
+    error = Exception("Some error occurred")
+    with mock.patch.object(SlackMessage.objects, "bulk_create", side_effect=error):  # noqa: SIM117
+        with mock.patch.object(SlackMessage, "save", side_effect=error):
+            yield
+
+
 class TestDjangoDatabasePersister:
+    @pytest.fixture(autouse=True)
+    def _no_flush_at_exit(self) -> Iterator[None]:
+        """Messages left in buffer can't be flushed at exit, as test database is gone.
+
+        Neither by flusher thread, which can't see data of test transaction. See `TestDjangoDatabasePersisterFlusher`.
+        """
+        with mock.patch("django_slack_tools.slack_messages.messenger.middlewares.flush_at_exit"):  # noqa: SIM117
+            with mock.patch.object(DjangoDatabasePersister, "_start_flusher"):
+                yield
+
     def test_instance_creation(self, slack_app: App) -> None:
         """Test various instance creation scenarios."""
         DjangoDatabasePersister(slack_app=None, get_permalink=False)
@@ -84,6 +128,23 @@ def test_instance_creation(self, slack_app: App) -> None:
 
         DjangoDatabasePersister(slack_app=slack_app, get_permalink=True)
         DjangoDatabasePersister(slack_app=slack_app, get_permalink=False)
+        DjangoDatabasePersister(slack_app=None, get_permalink=True, permalink_mode="deferred")
+
+        with pytest.raises(ValueError, match='Unknown value for `permalink_mode`: "whatever"'):
+            DjangoDatabasePersister(slack_app=slack_app, get_permalink=True, permalink_mode="whatever")  # type: ignore[arg-type]
+
+        with pytest.raises(
+            ValueError,
+            match="`batch_size` must be positive and not greater than `max_buffer_size`, got 0",
+        ):
+            DjangoDatabasePersister(batch_size=0)
+
+        with pytest.raises(ValueError, match="`max_attempts` must be positive, got 0"):
+            DjangoDatabasePersister(max_attempts=0)
+
+        with mock.patch("django_slack_tools.slack_messages.messenger.middlewares.flush_at_exit") as flush_at_exit:
+            persister = DjangoDatabasePersister(buffered=True)
+            flush_at_exit.assert_called_once_with(persister)
 
     def test_process_response(self, slack_app: App, mock_slack_client: mock.Mock) -> None:
         """Test processing the response."""
@@ -111,10 +172,59 @@ def test_process_response(self, slack_app: App, mock_slack_client: mock.Mock) ->
         assert saved_message.permalink == permalink
         assert saved_message.ts == response.ts
         assert saved_message.parent_ts == ""
-        assert MessageRequest.model_validate(saved_message.request)
+        # Header and body are saved once, in their own fields
+        saved_request = cast("dict[str, Any]", saved_message.request)
+        assert saved_request.keys() == {"id_", "channel", "template_key", "context", "idempotency_key"}
+        saved_request.update(header=saved_message.header, body=saved_message.body or None)
+        assert MessageRequest.model_validate(saved_request) == response.request
         assert MessageResponse.model_validate(saved_message.response)
         assert saved_message.exception == ""
 
+    def test_process_response_compress_payloads(self) -> None:
+        persister = DjangoDatabasePersister(compress_payloads=True)
+
+        response = MessageResponseFactory.create()
+        persister.process_response(response)
+        saved_message = SlackMessage.objects.get(id=response.request.id_)
+
+        assert saved_message.request is None
+        assert saved_message.response is None
+        assert saved_message.compressed_request == response.request.model_dump(mode="json", exclude={"header", "body"})
+        assert saved_message.compressed_response == response.model_dump(mode="json", exclude={"request"})
+
+    def test_process_response_local_permalink(self, slack_app: App, mock_slack_client: mock.Mock) -> None:
+        """Permalinks are built from workspace URL, fetched once."""
+        mock_slack_client.auth_test.return_value = SlackAuthTestResponseFactory()
+        persister = DjangoDatabasePersister(slack_app=slack_app, get_permalink=True, permalink_mode="local")
+
+        for ts, parent_ts in (("1358546515.000008", None), ("1358546515.000010", "1358546515.000008")):
+            response = MessageResponseFactory.create(
+                request=MessageRequestFactory.create(channel="C1H9RESGA"),
+                ts=ts,
+                parent_ts=parent_ts,
+            )
+            persister.process_response(response)
+
+        assert list(SlackMessage.objects.order_by("ts").values_list("permalink", flat=True)) == [
+            "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008",
+            (
+                "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000010"
+                "?thread_ts=1358546515.000008&cid=C1H9RESGA"
+            ),
+        ]
+        mock_slack_client.auth_test.assert_called_once()
+        mock_slack_client.chat_getPermalink.assert_not_called()
+
+    def test_process_response_deferred_permalink(self, mock_slack_client: mock.Mock) -> None:
+        """Permalinks are left empty, without any API calls."""
+        persister = DjangoDatabasePersister(get_permalink=True, permalink_mode="deferred")
+
+        response = MessageResponseFactory.create()
+        persister.process_response(response)
+
+        assert SlackMessage.objects.get(id=response.request.id_).permalink == ""
+        assert mock_slack_client.mock_calls == []
+
     def test_process_response_fail_save_db(self) -> None:
         """Test failing to save to the database. It should log the error, but not raise it."""
         persister = DjangoDatabasePersister()
@@ -132,6 +242,189 @@ def test_process_response_skip_persist_if_request_none(self) -> None:
         assert result is response
         assert not SlackMessage.objects.exists()
 
+    def test_process_response_buffered(self) -> None:
+        """Buffered messages should be saved in bulk once batch size reached."""
+        persister = DjangoDatabasePersister(buffered=True, batch_size=3)
+
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        assert persister.pending == 2
+        assert not SlackMessage.objects.exists()
+
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        assert persister.pending == 0
+        assert SlackMessage.objects.count() == 3
+
+    def test_process_response_buffered_flush_on_batch_completion(self) -> None:
+        """Messenger should flush the buffer once it finished sending a batch."""
+        persister = DjangoDatabasePersister(buffered=True)
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[persister],
+            messaging_backend=DummyBackend(),
+        )
+        requests = [MessageRequestFactory.create(context={"name": "Daniel"}) for _ in range(5)]
+
+        list(messenger.send_many(requests))
+
+        assert persister.pending == 0
+        assert SlackMessage.objects.count() == 5
+
+    def test_spans(self, span_exporter: Any) -> None:
+        """Database writes are traced, if OpenTelemetry is installed."""
+        response = MessageResponseFactory.create(ts=None)
+        DjangoDatabasePersister().process_response(response)
+
+        persister = DjangoDatabasePersister(buffered=True)
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.flush()
+
+        persist, flush = span_exporter.get_finished_spans()
+        assert persist.name == "slack_message.persist"
+        assert persist.attributes == {"slack.message_id": response.request.id_}
+        assert flush.name == "slack_message.flush"
+        assert flush.attributes == {"slack.messages": 1}
+
+    def test_flush_failure(self) -> None:
+        """Messages failed to save should be kept in buffer, and retried on next flush."""
+        persister = DjangoDatabasePersister(buffered=True)
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+
+        with failing_saves():
+            persister.flush()
+
+        assert persister.pending == 2
+        assert not SlackMessage.objects.exists()
+
+        persister.flush()
+        assert persister.pending == 0
+        assert SlackMessage.objects.count() == 2
+
+    def test_flush_failure_bulk_only(self) -> None:
+        persister = DjangoDatabasePersister(buffered=True)
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+
+        with mock.patch.object(SlackMessage.objects, "bulk_create", side_effect=Exception("Some error occurred")):
+            persister.flush()
+
+        assert persister.pending == 0
+        assert SlackMessage.objects.count() == 2
+
+    def test_flush_failure_partial(self) -> None:
+        """If bulk insert fails, messages should be saved one by one, keeping only failed ones in buffer."""
+        persister = DjangoDatabasePersister(buffered=True)
+        SlackMessageFactory.create(ts="duplicate-ts")
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.process_response(MessageResponseFactory.create(ts="duplicate-ts"))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+
+        persister.flush()
+
+        assert persister.pending == 1
+        assert SlackMessage.objects.count() == 3
+
+    def test_flush_failure_max_attempts(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Messages keep failing should be dropped after `max_attempts` flushes."""
+        persister = DjangoDatabasePersister(buffered=True, max_attempts=2)
+        SlackMessageFactory.create(ts="duplicate-ts")
+        persister.process_response(poison := MessageResponseFactory.create(ts="duplicate-ts"))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+
+        persister.flush()
+        assert persister.pending == 1
+
+        persister.flush()
+        assert persister.pending == 0
+        assert poison.request
+        assert f"Failed to save 1 messages 2 times, dumped below to restore later: ['{poison.request.id_}']" in (
+            caplog.text
+        )
+        assert f'"pk": "{poison.request.id_}"' in caplog.text
+        assert persister._attempts == {}
+
+    def test_flush_failure_attempts_reset(self) -> None:
+        """Failed attempts are forgotten once a message is saved."""
+        persister = DjangoDatabasePersister(buffered=True, max_attempts=2)
+        persister.process_response(MessageResponseFactory.create(ts=None))
+
+        with failing_saves():
+            persister.flush()
+
+        assert len(persister._attempts) == 1
+
+        persister.flush()
+        assert persister.pending == 0
+        assert persister._attempts == {}
+
+    def test_flush_failure_buffer_full(self) -> None:
+        """Oldest messages should be dropped if buffer is full."""
+        persister = DjangoDatabasePersister(buffered=True, batch_size=2, max_buffer_size=3, max_attempts=10)
+        responses = MessageResponseFactory.create_batch(5, ts=None)
+
+        with failing_saves():
+            for response in responses:
+                persister.process_response(response)
+
+        assert persister.pending == 3
+
+        persister.flush()
+        assert list(SlackMessage.objects.values_list("id", flat=True).order_by("created")) == [
+            response.request.id_ for response in responses[2:] if response.request
+        ]
+
+    def test_spill_file(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Messages given up are appended to spill file, which can be imported back."""
+        spill_path = tmp_path / "spill.jsonl.gz"
+        persister = DjangoDatabasePersister(
+            buffered=True,
+            batch_size=1,
+            max_buffer_size=1,
+            max_attempts=10,
+            spill_path=spill_path,
+            compress_payloads=True,
+        )
+        responses = MessageResponseFactory.create_batch(3, ts=None)
+
+        with failing_saves():
+            for response in responses:
+                persister.process_response(response)
+
+        assert persister.pending == 1
+        ids = [response.request.id_ for response in responses if response.request]
+        assert f"Buffer is full, gave up 1 oldest messages, written to spill file {spill_path}: ['{ids[1]}']" in (
+            caplog.text
+        )
+
+        assert import_messages(spill_path) == 2
+        restored = SlackMessage.objects.order_by("created")
+        assert [message.id for message in restored] == ids[:2]
+        assert restored[0].header == json.loads(responses[0].request.header.model_dump_json())
+        assert restored[0].compressed_response
+        assert restored[0].compressed_response["ok"] == responses[0].ok
+
+    def test_spill_file_error(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Messages are dumped to log, if spill file can't be written."""
+        persister = DjangoDatabasePersister(buffered=True, max_attempts=1, spill_path=tmp_path / "missing" / "spill")
+        persister.process_response(response := MessageResponseFactory.create(ts=None))
+
+        with failing_saves():
+            persister.flush()
+
+        assert persister.pending == 0
+        assert "Error while writing messages to spill file" in caplog.text
+        assert f"Failed to save 1 messages 1 times, dumped below to restore later: ['{response.request.id_}']" in (
+            caplog.text
+        )
+
+    def test_flush_empty(self) -> None:
+        persister = DjangoDatabasePersister(buffered=True)
+        with mock.patch.object(SlackMessage.objects, "bulk_create") as bulk_create:
+            persister.flush()
+
+        bulk_create.assert_not_called()
+
     def test_get_permalink(self, slack_app: App, mock_slack_client: mock.Mock) -> None:
         """Test getting permalink for the message."""
         expect = "https://example.com/permalink"
@@ -160,6 +453,370 @@ def test_get_permalink_error_no_ts(self, slack_app: App) -> None:
         assert persister._get_permalink(channel="test-channel", ts="") == ""
 
 
+@pytest.mark.django_db(transaction=True)
+class TestDjangoDatabasePersisterFlusher:
+    def test_flush_interval(self) -> None:
+        """Buffered messages are saved by flusher thread once flush interval passed, without new messages."""
+        persister = DjangoDatabasePersister(buffered=True, flush_interval=0.05)
+
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        assert persister.pending == 2
+
+        # Flusher stops once buffer is empty
+        _wait_until(lambda: persister._flusher is None)
+        assert persister.pending == 0
+        assert SlackMessage.objects.count() == 2
+
+    def test_flush_stops_flusher(self) -> None:
+        persister = DjangoDatabasePersister(buffered=True, flush_interval=60)
+        persister.process_response(MessageResponseFactory.create(ts=None))
+        assert persister._flusher is not None
+
+        persister.flush()
+
+        _wait_until(lambda: persister._flusher is None)
+        assert SlackMessage.objects.count() == 1
+
+
+@pytest.fixture
+def _locmem_cache(settings: SettingsWrapper) -> Iterator[None]:
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    yield
+    caches["default"].clear()
+
+
+@pytest.mark.usefixtures("_locmem_cache")
+class TestDeduplicationMiddleware:
+    @pytest.fixture
+    def backend(self) -> MockBackend:
+        return MockBackend()
+
+    @pytest.fixture
+    def messenger(self, backend: MockBackend) -> Messenger:
+        return Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[DeduplicationMiddleware()],
+            messaging_backend=backend,
+        )
+
+    def test_instance_creation(self) -> None:
+        with pytest.raises(ValueError, match="`window` and `lock_timeout` must be greater than 0."):
+            DeduplicationMiddleware(window=0)
+
+        with pytest.raises(ValueError, match="`window` and `lock_timeout` must be greater than 0."):
+            DeduplicationMiddleware(lock_timeout=0)
+
+    def test_duplicates(self, messenger: Messenger, backend: MockBackend) -> None:
+        """Requests with same key are responded with the cached response of the first one."""
+        requests = [
+            MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key=key)
+            for key in ("key-1", "key-1", "key-2", None, None)
+        ]
+
+        with mock.patch.object(backend, "deliver", wraps=backend.deliver) as deliver:
+            responses = [messenger.send_request(request) for request in requests]
+
+        assert deliver.call_count == 4
+        assert all(response and response.ok for response in responses)
+        assert responses[1] == responses[0]
+        assert responses[1].request.id_ == requests[0].id_  # type: ignore[union-attr]
+        assert requests[1].body is None
+
+    def test_window_expired(self, messenger: Messenger, backend: MockBackend) -> None:
+        with mock.patch.object(backend, "deliver", wraps=backend.deliver) as deliver:
+            messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key="key"))
+            with mock.patch("django.core.cache.backends.locmem.time.time", return_value=10**10):
+                messenger.send_request(MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key="key"))
+
+        assert deliver.call_count == 2
+
+    def test_in_flight(self) -> None:
+        middleware = DeduplicationMiddleware()
+        request = MessageRequestFactory.create(idempotency_key="key")
+
+        assert middleware.process_request(request) is request
+        assert middleware.process_request(MessageRequestFactory.create(idempotency_key="key")) is None
+
+    def test_released_on_error(self, backend: MockBackend) -> None:
+        """Retries of requests failed with an error are sent, rather than stopped as in flight."""
+        request = MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key="key")
+        for messenger in (
+            Messenger(
+                template_loaders=[MockTemplateLoader(key="other")],
+                middlewares=[DeduplicationMiddleware()],
+                messaging_backend=backend,
+            ),
+            Messenger(
+                template_loaders=[MockTemplateLoader()],
+                middlewares=[DeduplicationMiddleware()],
+                messaging_backend=MockBackend(should_error=True),
+            ),
+        ):
+            with pytest.raises(Exception):  # noqa: B017, PT011
+                messenger.send_request(request.model_copy())
+
+            retry = MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key="key")
+            with mock.patch.object(backend, "deliver", wraps=backend.deliver) as deliver:
+                assert Messenger(
+                    template_loaders=[MockTemplateLoader()],
+                    middlewares=[DeduplicationMiddleware()],
+                    messaging_backend=backend,
+                ).send_request(retry)
+
+            deliver.assert_called_once()
+            caches["default"].clear()
+
+    def test_released_on_stop(self, backend: MockBackend) -> None:
+        """Requests stopped by a later middleware, e.g. fanned out by policy handler, are not kept in flight."""
+        stopping = MockMiddleware(process_request=lambda _: None)
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[DeduplicationMiddleware(), stopping],
+            messaging_backend=backend,
+        )
+        assert messenger.send_request(MessageRequestFactory.create(idempotency_key="key")) is None
+
+        messenger.middlewares = [DeduplicationMiddleware()]
+        retry = MessageRequestFactory.create(context={"name": "Daniel"}, idempotency_key="key")
+        response = messenger.send_request(retry)
+        assert response
+        assert response.request is retry
+
+    def test_in_flight_not_released_by_duplicate(self) -> None:
+        """Duplicates stopped as in flight don't release the request in flight."""
+        middleware = DeduplicationMiddleware()
+        messenger = Messenger(
+            template_loaders=[MockTemplateLoader()],
+            middlewares=[middleware],
+            messaging_backend=MockBackend(),
+        )
+        assert middleware.process_request(MessageRequestFactory.create(idempotency_key="key"))
+
+        assert messenger.send_request(MessageRequestFactory.create(idempotency_key="key")) is None
+        assert middleware.process_request(MessageRequestFactory.create(idempotency_key="key")) is None
+
+    def test_not_ok_response_not_cached(self) -> None:
+        """Failed messages should be sent again on retry."""
+        middleware = DeduplicationMiddleware()
+        request = MessageRequestFactory.create(idempotency_key="key")
+
+        assert middleware.process_request(request) is request
+        middleware.process_response(MessageResponseFactory.create(request=request, ok=False))
+
+        retry = MessageRequestFactory.create(idempotency_key="key")
+        assert middleware.process_request(retry) is retry
+
+    def test_no_request(self) -> None:
+        middleware = DeduplicationMiddleware()
+        response = MessageResponseFactory.create(request=None)
+
+        assert middleware.process_response(response) is response
+        middleware.release(MessageRequestFactory.create(idempotency_key=None))
+
+
+class TestCoalescingMiddleware:
+    @pytest.fixture(autouse=True)
+    def _no_flush_at_exit(self) -> Iterator[None]:
+        with mock.patch("django_slack_tools.slack_messages.messenger.middlewares.flush_at_exit"):
+            yield
+
+    def _make_messenger(
+        self,
+        *,
+        dedup: bool = False,
+        **kwargs: Any,
+    ) -> tuple[Messenger, CoalescingMiddleware, list[MessageRequest]]:
+        """Create messenger coalescing messages with itself, returning also the list of requests sent."""
+        sent: list[MessageRequest] = []
+
+        def record(response: MessageResponse) -> MessageResponse:
+            assert response.request
+            sent.append(response.request)
+            return response
+
+        messenger = Messenger(
+            template_loaders=[
+                MockTemplateLoader(PythonTemplate({"text": "{count} x {template_key}"}), key="digest"),
+                MockTemplateLoader(),
+            ],
+            middlewares=[],
+            messaging_backend=MockBackend(),
+        )
+        middleware = CoalescingMiddleware(messenger=messenger, digest_template="digest", **kwargs)
+        messenger.middlewares = [
+            MockMiddleware(process_response=record),
+            *([DeduplicationMiddleware()] if dedup else []),
+            middleware,
+        ]
+        return messenger, middleware, sent
+
+    def test_instance_creation(self) -> None:
+        messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=DummyBackend())
+        with mock.patch("django_slack_tools.slack_messages.messenger.middlewares.flush_at_exit") as flush_at_exit:
+            middleware = CoalescingMiddleware(messenger=messenger, digest_template="digest")
+            flush_at_exit.assert_called_once_with(middleware)
+
+        for kwargs in ({"window": 0}, {"window": 10, "max_delay": 5}):
+            with pytest.raises(ValueError, match="`window` must be greater than 0 and not greater than `max_delay`."):
+                CoalescingMiddleware(messenger=messenger, digest_template="digest", **kwargs)
+
+        for kwargs in ({"max_batch_size": 1}, {"max_batch_size": 10, "max_buffer_size": 5}):
+            with pytest.raises(ValueError, match="`max_batch_size` must be greater than 1 and not greater than"):
+                CoalescingMiddleware(messenger=messenger, digest_template="digest", **kwargs)
+
+        middleware = CoalescingMiddleware(messenger="test-django-middleware", digest_template="digest")
+        assert isinstance(middleware.messenger, Messenger)
+
+        async_messenger = AsyncMessenger(template_loaders=[], middlewares=[], messaging_backend=DummyBackend())
+        middleware = CoalescingMiddleware(messenger=async_messenger, digest_template="digest")  # type: ignore[arg-type]
+        with pytest.raises(TypeError, match="Expected a synchronous"):
+            _ = middleware.messenger
+
+    def test_digest(self) -> None:
+        messenger, middleware, sent = self._make_messenger(window=0.05)
+        requests = [
+            MessageRequestFactory.create(channel=channel, template_key="alert", context={"name": name})
+            for channel, name in (("C1", "a"), ("C1", "b"), ("C2", "c"), ("C1", "d"), ("C2", "e"))
+        ]
+
+        responses = [messenger.send_request(request) for request in requests]
+
+        # First requests of windows are sent without delay
+        assert [response is not None for response in responses] == [True, False, True, False, False]
+        assert sent == [requests[0], requests[2]]
+        assert middleware.pending == 3
+
+        _wait_until(lambda: len(sent) == 4)
+        assert middleware.pending == 0
+
+        digest = next(request for request in sent[2:] if request.channel == "C1")
+        assert digest.template_key == "digest"
+        assert digest.context == {
+            "template_key": "alert",
+            "count": 2,
+            "contexts": [{"name": "b"}, {"name": "d"}],
+        }
+        assert digest.body
+        assert digest.body.text == "2 x alert"
+
+        # Single request is sent as is
+        assert next(request for request in sent[2:] if request.channel == "C2") is requests[4]
+
+        # Scheduler stops once all windows are closed
+        _wait_until(lambda: middleware._scheduler is None)
+
+    def test_leading_only(self) -> None:
+        messenger, middleware, sent = self._make_messenger(window=0.05)
+        request = MessageRequestFactory.create(channel="C1", context={"name": "a"})
+
+        assert messenger.send_request(request)
+
+        _wait_until(lambda: middleware._scheduler is None)
+        assert sent == [request]
+
+    def test_max_delay(self) -> None:
+        """Requests keep coming should not be held more than `max_delay`."""
+        messenger, _, sent = self._make_messenger(window=0.1, max_delay=0.2)
+
+        for _ in range(10):
+            if len(sent) > 1:
+                break
+
+            messenger.send_request(MessageRequestFactory.create(channel="C1", context={"name": "a"}))
+            time.sleep(0.05)
+
+        _wait_until(lambda: len(sent) == 2)
+        assert sent[1].context["count"] < 9
+
+    def test_max_batch_size(self) -> None:
+        messenger, middleware, sent = self._make_messenger(max_batch_size=3)
+
+        for _ in range(5):
+            messenger.send_request(MessageRequestFactory.create(channel="C1", context={"name": "a"}))
+
+        # Leading request, digest of 3 and leading request of next window
+        assert [request.context.get("count") for request in sent] == [None, 3, None]
+        assert middleware.pending == 0
+
+        # Nothing to send for window of leading request only
+        middleware.flush()
+        assert len(sent) == 3
+
+    def test_max_buffer_size(self) -> None:
+        messenger, middleware, sent = self._make_messenger(max_batch_size=2, max_buffer_size=2)
+
+        for channel in ("C1", "C1", "C2", "C2"):
+            messenger.send_request(MessageRequestFactory.create(channel=channel, context={"name": "a"}))
+
+        assert middleware.pending == 2
+        response = messenger.send_request(request := MessageRequestFactory.create(channel="C1", context={"name": "c"}))
+
+        assert response
+        assert sent[-1] is request
+        assert middleware.pending == 2
+
+    def test_flush(self) -> None:
+        """Buffered requests are sent when messenger finishes sending a batch."""
+        messenger, middleware, sent = self._make_messenger()
+        requests = [MessageRequestFactory.create(channel="C1", context={"name": "a"}) for _ in range(3)]
+
+        responses = list(messenger.send_many(requests))
+
+        assert [response is not None for response in responses] == [True, False, False]
+        assert [request.context.get("count") for request in sent] == [None, 2]
+        assert middleware.pending == 0
+
+    def test_not_coalesced(self) -> None:
+        """Requests without template key are sent as is."""
+        messenger, middleware, sent = self._make_messenger()
+        request = MessageRequestFactory.create(template_key=None, body={"text": "Hello"})
+
+        assert messenger.send_request(request)
+        assert sent == [request]
+        assert middleware.pending == 0
+
+    def test_send_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        messenger, middleware, _ = self._make_messenger()
+        for _ in range(2):
+            messenger.send_request(MessageRequestFactory.create(channel="C1", context={"name": "a"}))
+
+        with mock.patch.object(messenger, "send_request", side_effect=Exception("Boom")):
+            middleware.flush()
+
+        assert "Error while sending coalesced messages" in caplog.text
+        assert middleware.pending == 0
+
+    @pytest.mark.usefixtures("_locmem_cache")
+    def test_deduplication(self) -> None:
+        """Buffered requests are sent once, even with duplicates arriving while buffered or after sent."""
+        messenger, middleware, sent = self._make_messenger(dedup=True)
+        leading = MessageRequestFactory.create(channel="C1", context={"name": "a"}, idempotency_key="key-1")
+        buffered = MessageRequestFactory.create(channel="C1", context={"name": "b"}, idempotency_key="key-2")
+
+        assert messenger.send_request(leading)
+        assert messenger.send_request(buffered) is None
+        assert messenger.send_request(buffered.model_copy(update={"id_": "duplicate"})) is None
+        assert middleware.pending == 1
+
+        middleware.flush()
+        assert sent == [leading, buffered]
+
+        # Responded with cached response, once sent
+        response = messenger.send_request(MessageRequestFactory.create(channel="C1", idempotency_key="key-2"))
+        assert response
+        assert response.request
+        assert response.request.id_ == buffered.id_
+        assert sent == [leading, buffered]
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.01)
+
+
 class TestDjangoDatabasePolicyHandler:
     def test_instance_creation(self) -> None:
         """Test various instance creation scenarios."""
@@ -180,6 +837,30 @@ def test_instance_creation(self) -> None:
                 on_policy_not_exists="unknown-behavior",  # type: ignore[arg-type]
             )
 
+        # Fanned-out messages can't be sent with coroutines
+        async_messenger = AsyncMessenger(template_loaders=[], middlewares=[], messaging_backend=DummyBackend())
+        middleware = DjangoDatabasePolicyHandler(messenger=async_messenger)  # type: ignore[arg-type]
+        with pytest.raises(TypeError, match="Expected a synchronous"):
+            _ = middleware.messenger
+
+    def test_instance_creation_fan_out(self) -> None:
+        messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=DummyBackend())
+        with pytest.raises(ValueError, match='Unknown value for `fan_out`: "unknown"'):
+            DjangoDatabasePolicyHandler(messenger=messenger, fan_out="unknown")  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="Messenger must be given by name to fan out messages with Celery."):
+            DjangoDatabasePolicyHandler(messenger=messenger, fan_out="celery")
+
+        with mock.patch("importlib.util.find_spec", return_value=None):  # noqa: SIM117
+            with pytest.raises(ValueError, match="Celery is required to fan out messages with Celery."):
+                DjangoDatabasePolicyHandler(messenger="test-django-middleware", fan_out="celery")
+
+        with pytest.raises(ValueError, match="`max_workers` and `chunk_size` must be greater than 0."):
+            DjangoDatabasePolicyHandler(messenger=messenger, max_workers=0)
+
+        with pytest.raises(ValueError, match="`max_workers` and `chunk_size` must be greater than 0."):
+            DjangoDatabasePolicyHandler(messenger=messenger, chunk_size=0)
+
     def test_process_request(self) -> None:
         """Test processing the request."""
         # Arrange
@@ -297,6 +978,133 @@ def test_process_request(self) -> None:
             },
         ]
 
+    @pytest.mark.parametrize("fan_out", ["sequential", "threads"])
+    def test_fan_out(self, fan_out: FanOut) -> None:
+        """Responses of fanned-out messages should be returned in order of recipients."""
+        middleware = DjangoDatabasePolicyHandler(
+            messenger=Messenger(
+                template_loaders=[MockTemplateLoader()],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+            ),
+            fan_out=fan_out,
+            max_workers=3,
+        )
+        recipients = [SlackMessageRecipientFactory.create(channel=f"channel-{i}") for i in range(10)]
+        policy = SlackMessagingPolicyFactory.create(recipients=recipients)
+
+        responses = middleware.fan_out(MessageRequestFactory.create(channel=policy.code, context={"name": "Daniel"}))
+
+        assert [response.request.channel if response and response.request else None for response in responses] == [
+            recipient.channel for recipient in policy.recipients.all()
+        ]
+
+    def test_fan_out_idempotency_key(self) -> None:
+        """Fanned-out messages should have idempotency key derived for each recipient."""
+        middleware = DjangoDatabasePolicyHandler(
+            messenger=Messenger(
+                template_loaders=[MockTemplateLoader()],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+            ),
+        )
+        recipients = [SlackMessageRecipientFactory.create(channel=f"channel-{i}") for i in range(2)]
+        policy = SlackMessagingPolicyFactory.create(recipients=recipients)
+
+        for key, expect in (("key", ["key:channel-0", "key:channel-1"]), (None, [None, None])):
+            request = MessageRequestFactory.create(channel=policy.code, context={"name": "Daniel"}, idempotency_key=key)
+            responses = middleware.fan_out(request)
+
+            keys = [response.request.idempotency_key for response in responses if response and response.request]
+            assert sorted(keys, key=str) == expect
+
+    def test_fan_out_disabled_policy(self) -> None:
+        messenger = Messenger(template_loaders=[], middlewares=[], messaging_backend=DummyBackend())
+        middleware = DjangoDatabasePolicyHandler(messenger=messenger)
+        policy = SlackMessagingPolicyFactory.create(enabled=False)
+
+        assert middleware.fan_out(MessageRequestFactory.create(channel=policy.code)) == []
+
+    @pytest.mark.skipif(not celery_installed, reason="Celery is not installed")
+    def test_fan_out_celery(self) -> None:
+        """Tasks should be enqueued for each chunk of fanned-out messages."""
+        middleware = DjangoDatabasePolicyHandler(
+            messenger="test-django-middleware",
+            fan_out="celery",
+            chunk_size=4,
+        )
+        recipients = SlackMessageRecipientFactory.create_batch(10)
+        policy = SlackMessagingPolicyFactory.create(recipients=recipients)
+
+        with mock.patch("django_slack_tools.slack_messages.tasks.send_requests.delay") as delay:
+            responses = middleware.fan_out(MessageRequestFactory.create(channel=policy.code))
+
+        assert responses == [None] * 10
+        assert [len(call.kwargs["requests"]) for call in delay.call_args_list] == [4, 4, 2]
+        assert {call.kwargs["messenger_name"] for call in delay.call_args_list} == {"test-django-middleware"}
+        channels = [req["channel"] for call in delay.call_args_list for req in call.kwargs["requests"]]
+        assert channels == [recipient.channel for recipient in policy.recipients.all()]
+
+    def test_process_request_on_fan_out(self) -> None:
+        """Callback should receive responses of fanned-out messages."""
+        on_fan_out = mock.Mock()
+        middleware = DjangoDatabasePolicyHandler(
+            messenger=Messenger(
+                template_loaders=[MockTemplateLoader()],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+            ),
+            on_fan_out=on_fan_out,
+        )
+        policy = SlackMessagingPolicyFactory.create(recipients=SlackMessageRecipientFactory.create_batch(3))
+        request = MessageRequestFactory.create(channel=policy.code, context={"name": "Daniel"})
+
+        assert middleware.process_request(request) is None
+
+        on_fan_out.assert_called_once_with(request, mock.ANY)
+        _, responses = on_fan_out.call_args.args
+        assert len(responses) == 3
+        assert all(response and response.ok for response in responses)
+
+    def test_process_request_num_queries(self, django_assert_num_queries: Callable[..., Any]) -> None:
+        """Policy with recipients and mentions is resolved once with prefetching, shared with template loader."""
+        # Arrange
+        middleware = DjangoDatabasePolicyHandler(
+            messenger=Messenger(
+                template_loaders=[DjangoPolicyTemplateLoader(policy_resolver=default_policy_resolver)],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+            ),
+            policy_resolver=default_policy_resolver,
+        )
+        recipients = [SlackMessageRecipientFactory(mentions=SlackMentionFactory.create_batch(3)) for _ in range(5)]
+        policy = SlackMessagingPolicyFactory(recipients=recipients, template={"text": "{mentions}"})
+
+        # Act & Assert
+        # Policy, recipients and mentions
+        with django_assert_num_queries(3):
+            middleware.process_request(MessageRequestFactory.create(channel=policy.code))
+
+        with django_assert_num_queries(0):
+            middleware.process_request(MessageRequestFactory.create(channel=policy.code))
+
+    def test_process_request_uncached(self, django_assert_num_queries: Callable[..., Any]) -> None:
+        """Policies are not cached unless a resolver is given."""
+        middleware = DjangoDatabasePolicyHandler(
+            messenger=Messenger(
+                template_loaders=[DjangoPolicyTemplateLoader()],
+                middlewares=[],
+                messaging_backend=DummyBackend(),
+            ),
+        )
+        recipients = [SlackMessageRecipientFactory(mentions=SlackMentionFactory.create_batch(3)) for _ in range(5)]
+        policy = SlackMessagingPolicyFactory(recipients=recipients, template={"text": "{mentions}"})
+
+        # Policy, recipients and mentions, then policy for template of each recipient
+        for _ in range(2):
+            with django_assert_num_queries(3 + 5):
+                middleware.process_request(MessageRequestFactory.create(channel=policy.code))
+
     def test_process_request_recursion_detection(self) -> None:
         """Test recursion detection mechanism. Fanned-out requests should contain special context key for detection."""
         # Arrange
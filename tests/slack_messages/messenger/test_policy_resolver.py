@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from django_slack_tools.slack_messages.messenger import PolicyResolver
+from django_slack_tools.slack_messages.messenger.policy_resolver import invalidate_resolved_policies
+from django_slack_tools.slack_messages.models import SlackMessagingPolicy
+from tests.slack_messages.models._factories import (
+    SlackMentionFactory,
+    SlackMessageRecipientFactory,
+    SlackMessagingPolicyFactory,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPolicyResolver:
+    def test_instance_creation(self) -> None:
+        with pytest.raises(ValueError, match="`ttl` must be positive or `None`, got -1"):
+            PolicyResolver(ttl=-1)
+
+    def test_resolve(self, django_assert_num_queries: Callable[..., Any]) -> None:
+        recipients = SlackMessageRecipientFactory.create_batch(3, mentions=SlackMentionFactory.create_batch(2))
+        policy = SlackMessagingPolicyFactory.create(recipients=recipients)
+        resolver = PolicyResolver()
+
+        with django_assert_num_queries(3):
+            resolved = resolver.resolve(policy.code)
+            mentions = [mention.mention for r in resolved.recipients.all() for mention in r.mentions.all()]
+
+        assert resolved == policy
+        assert len(mentions) == 6
+
+        # Cached
+        with django_assert_num_queries(0):
+            assert resolver.resolve(policy.code) is resolved
+
+    def test_resolve_not_exists(self) -> None:
+        with pytest.raises(SlackMessagingPolicy.DoesNotExist):
+            PolicyResolver().resolve("nonexistent-policy-code")
+
+    def test_resolve_ttl(self) -> None:
+        policy = SlackMessagingPolicyFactory.create()
+        resolver = PolicyResolver(ttl=10)
+
+        with mock.patch("time.monotonic", return_value=100):
+            resolved = resolver.resolve(policy.code)
+
+        with mock.patch("time.monotonic", return_value=109):
+            assert resolver.resolve(policy.code) is resolved
+
+        with mock.patch("time.monotonic", return_value=110):
+            assert resolver.resolve(policy.code) is not resolved
+
+    def test_resolve_no_ttl(self) -> None:
+        policy = SlackMessagingPolicyFactory.create()
+        resolver = PolicyResolver(ttl=None)
+
+        with mock.patch("time.monotonic", return_value=0):
+            resolved = resolver.resolve(policy.code)
+
+        with mock.patch("time.monotonic", return_value=1e9):
+            assert resolver.resolve(policy.code) is resolved
+
+    def test_clear(self) -> None:
+        policy = SlackMessagingPolicyFactory.create()
+        resolver = PolicyResolver()
+
+        resolved = resolver.resolve(policy.code)
+        resolver.clear()
+
+        assert resolver.resolve(policy.code) is not resolved
+
+    def test_invalidate(self) -> None:
+        policy = SlackMessagingPolicyFactory.create()
+        resolver = PolicyResolver(version_key="test_invalidate")
+
+        resolved = resolver.resolve(policy.code)
+        invalidate_resolved_policies("test_invalidate")
+
+        assert resolver.resolve(policy.code) is not resolved
+
+    def test_invalidate_on_changes(self, django_capture_on_commit_callbacks: Any) -> None:
+        mention = SlackMentionFactory.create()
+        recipient = SlackMessageRecipientFactory.create(mentions=[mention])
+        policy = SlackMessagingPolicyFactory.create(recipients=[recipient])
+        other_recipient = SlackMessageRecipientFactory.create()
+        resolver = PolicyResolver()
+
+        for change in (
+            policy.save,
+            # Updates of related objects
+            mention.save,
+            recipient.save,
+            recipient.mentions.clear,
+            lambda: policy.recipients.add(other_recipient),
+        ):
+            resolved = resolver.resolve(policy.code)
+            with django_capture_on_commit_callbacks() as callbacks:
+                change()
+                # Not until committed
+                assert resolver.resolve(policy.code) is resolved
+
+            for callback in callbacks:
+                callback()
+
+            assert resolver.resolve(policy.code) is not resolved
+
+    def test_not_cache_policy_resolved_with_stale_version(self) -> None:
+        policy = SlackMessagingPolicyFactory.create()
+        resolver = PolicyResolver(version_key="test_not_cache_stale")
+
+        # Version changed while querying the policy
+        with mock.patch.object(resolver.version, "get", side_effect=[(0, 0), (1, 0), (1, 0), (1, 0), (1, 0)]):
+            stale = resolver.resolve(policy.code)
+            resolved = resolver.resolve(policy.code)
+            assert resolved is not stale
+            assert resolver.resolve(policy.code) is resolved
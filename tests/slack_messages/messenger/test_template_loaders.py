@@ -14,6 +14,12 @@ def test_load(self) -> None:
         assert isinstance(template, DjangoTemplate)
         assert template.template.template.name == "greet.xml"  # type: ignore[attr-defined] # Maybe false-positive error?
 
+    def test_load_with_xml_parser(self) -> None:
+        loader = DjangoTemplateLoader(xml_parser="xmltodict")
+        template = loader.load("greet.xml")
+        assert template
+        assert template.xml_parser == "xmltodict"
+
     def test_load_template_not_found(self) -> None:
         loader = DjangoTemplateLoader()
         template = loader.load("NOT_FOUND")
@@ -118,6 +124,17 @@ def test_load_django_inline_template(self) -> None:
         assert isinstance(template, DjangoTemplate)
         assert template.template.template.source == inline_template  # type: ignore[attr-defined] # Maybe false-positive error?
 
+    def test_load_django_template_with_xml_parser(self) -> None:
+        policy = SlackMessagingPolicyFactory.create(
+            template_type=SlackMessagingPolicy.TemplateType.DJANGO_INLINE,
+            template="<root><text>Hello</text></root>",
+        )
+        loader = DjangoPolicyTemplateLoader(xml_parser="xmltodict")
+        template = loader.load(policy.code)
+
+        assert isinstance(template, DjangoTemplate)
+        assert template.xml_parser == "xmltodict"
+
     def test_load_unknown_template_type(self) -> None:
         SlackMessagingPolicyFactory(
             code="TEST",
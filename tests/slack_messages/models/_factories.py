@@ -14,6 +14,7 @@
     SlackMessage,
     SlackMessageRecipient,
     SlackMessagingPolicy,
+    SlackOutboxMessage,
 )
 
 _fake = faker.Faker()
@@ -117,3 +118,19 @@ def recipients(  # type: ignore[misc]
         ],
     }
     header_defaults: dict = {}  # noqa: RUF012
+
+
+class SlackOutboxMessageFactory(DjangoModelFactory):
+    class Meta:
+        model = SlackOutboxMessage
+
+    messenger_name = ""
+    request = LazyAttribute(
+        lambda _: {
+            "channel": _fake.pystr(),
+            "header": {},
+            "body": {"text": _fake.paragraph()},
+            "template_key": None,
+            "context": {},
+        },
+    )
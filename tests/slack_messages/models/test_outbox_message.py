@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django_slack_tools.slack_messages.models import SlackOutboxMessage
+from tests._helpers import ModelTestBase
+
+from ._factories import SlackOutboxMessageFactory
+
+
+class TestSlackOutboxMessage(ModelTestBase):
+    model_cls = SlackOutboxMessage
+    factory_cls = SlackOutboxMessageFactory
+
+    def test_str(self) -> None:
+        instance = self.factory_cls.build(id=1, status=SlackOutboxMessage.Status.CLAIMED)
+        assert str(instance) == "Outbox message (1, Claimed)"
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import NotSupportedError, connection
+
+from django_slack_tools.slack_messages.archive import archive_messages, export_messages, import_messages
+from django_slack_tools.slack_messages.models import SlackMessage
+from tests.slack_messages.models._factories import SlackMessageFactory, SlackMessagingPolicyFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.django_db
+
+
+def test_archive_messages(tmp_path: Path) -> None:
+    messages = SlackMessageFactory.create_batch(3, body={"text": "Hello, World!"})
+    path = tmp_path / "messages.jsonl.gz"
+
+    assert archive_messages(SlackMessage.objects.all(), path=path, chunk_size=2) == 3
+
+    with gzip.open(path, "rt") as fp:
+        lines = [json.loads(line) for line in fp]
+
+    assert sorted(line["pk"] for line in lines) == sorted(message.pk for message in messages)
+    assert all(line["fields"]["body"] == {"text": "Hello, World!"} for line in lines)
+
+    # Loaded back as they were
+    SlackMessage.objects.all().delete()
+    call_command("loaddata", str(path), verbosity=0)
+    assert SlackMessage.objects.count() == 3
+
+    # Archives are never overwritten
+    with pytest.raises(FileExistsError):
+        archive_messages(SlackMessage.objects.all(), path=path)
+
+
+def test_archive_messages_chunk_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="`chunk_size` must be greater than 0, got 0"):
+        archive_messages(SlackMessage.objects.all(), path=tmp_path / "messages.jsonl.gz", chunk_size=0)
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, ["old", "new-ok", "new-failed", "other-channel", "policy"]),
+        ({"since": datetime(2024, 1, 1, tzinfo=timezone.utc)}, ["new-ok", "new-failed", "other-channel", "policy"]),
+        ({"until": datetime(2024, 1, 1, tzinfo=timezone.utc)}, ["old"]),
+        ({"channel": "C0456"}, ["other-channel"]),
+        ({"policy": "MY_POLICY"}, ["policy"]),
+        ({"ok": True}, ["old", "new-ok", "other-channel", "policy"]),
+        ({"ok": False}, ["new-failed"]),
+        ({"since": datetime(2024, 1, 1, tzinfo=timezone.utc), "channel": "C0123", "ok": True}, ["new-ok", "policy"]),
+    ],
+)
+def test_export_messages(tmp_path: Path, filters: dict, expected: list[str]) -> None:
+    policy = SlackMessagingPolicyFactory(code="MY_POLICY")
+    new = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    for id_, created, channel, ok, policy_ in (
+        ("old", datetime(2023, 6, 1, tzinfo=timezone.utc), "C0123", True, None),
+        ("new-ok", new, "C0123", True, None),
+        ("new-failed", new, "C0123", False, None),
+        ("other-channel", new, "C0456", True, None),
+        ("policy", new, "C0123", True, policy),
+    ):
+        message = SlackMessageFactory.create(id=id_, channel=channel, ok=ok, policy=policy_)
+        SlackMessage.objects.filter(pk=message.pk).update(created=created)
+
+    path = tmp_path / "messages.jsonl.gz"
+
+    assert export_messages(path, chunk_size=2, **filters) == len(expected)
+
+    with gzip.open(path, "rt") as fp:
+        assert sorted(json.loads(line)["pk"] for line in fp) == sorted(expected)
+
+
+def test_import_messages(tmp_path: Path) -> None:
+    policy = SlackMessagingPolicyFactory(code="MY_POLICY")
+    created = datetime(2023, 6, 1, tzinfo=timezone.utc)
+    messages = SlackMessageFactory.create_batch(5, policy=policy, body={"text": "Hello, World!"})
+    SlackMessage.objects.update(created=created, last_modified=created + timedelta(minutes=1))
+    path = tmp_path / "messages.jsonl.gz"
+    export_messages(path)
+
+    # Restored as they were, timestamps included
+    SlackMessage.objects.all().delete()
+    assert import_messages(path, batch_size=2) == 5
+    assert SlackMessage.objects.count() == 5
+    for message in SlackMessage.objects.all():
+        assert message.policy == policy
+        assert message.body == {"text": "Hello, World!"}
+        assert message.created == created
+        assert message.last_modified == created + timedelta(minutes=1)
+
+    # Existing messages are skipped rather than overwritten
+    changed = created + timedelta(days=1)
+    SlackMessage.objects.filter(pk=messages[0].pk).update(body={"text": "Changed"}, last_modified=changed)
+    SlackMessage.objects.filter(pk=messages[1].pk).delete()
+    assert import_messages(path, batch_size=5) == 5
+    assert SlackMessage.objects.count() == 5
+    existing = SlackMessage.objects.get(pk=messages[0].pk)
+    assert (existing.body, existing.last_modified) == ({"text": "Changed"}, changed)
+    restored = SlackMessage.objects.get(pk=messages[1].pk)
+    assert (restored.created, restored.last_modified) == (created, created + timedelta(minutes=1))
+
+
+def test_import_messages_policy_deleted(tmp_path: Path) -> None:
+    kept_policy = SlackMessagingPolicyFactory.create(code="KEPT")
+    deleted_policy = SlackMessagingPolicyFactory.create(code="DELETED")
+    kept = SlackMessageFactory.create(policy=kept_policy)
+    deleted = SlackMessageFactory.create(policy=deleted_policy)
+    without = SlackMessageFactory.create(policy=None)
+    path = tmp_path / "messages.jsonl.gz"
+    export_messages(path)
+
+    SlackMessage.objects.all().delete()
+    deleted_policy.delete()
+    assert import_messages(path) == 3
+
+    assert SlackMessage.objects.get(pk=kept.pk).policy == kept_policy
+    assert SlackMessage.objects.get(pk=deleted.pk).policy is None
+    assert SlackMessage.objects.get(pk=without.pk).policy is None
+
+
+def test_import_messages_batch_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="`batch_size` must be greater than 0, got 0"):
+        import_messages(tmp_path / "messages.jsonl.gz", batch_size=0)
+
+
+def test_import_messages_not_supported(tmp_path: Path) -> None:
+    with mock.patch.object(connection.features, "supports_ignore_conflicts", new=False):  # noqa: SIM117
+        with pytest.raises(NotSupportedError, match="does not support ignoring conflicts"):
+            import_messages(tmp_path / "messages.jsonl.gz")
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from django_slack_tools.slack_messages.models import SlackMessage, SlackOutboxMessage
+from django_slack_tools.slack_messages.outbox import OutboxDispatcher
+from django_slack_tools.slack_messages.shortcuts import enqueue_slack_message
+from tests._factories import SlackApiErrorFactory
+from tests.slack_messages.models._factories import SlackOutboxMessageFactory
+
+from ._factories import SlackMessageResponseFactory
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+    from django_slack_tools.app_settings import SettingsDict
+    from django_slack_tools.messenger.shortcuts import MessageRequest
+
+# Messages are sent in worker threads, which can't see uncommitted data of test transaction
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures("override_app_settings"),
+]
+
+
+@pytest.fixture(scope="session")
+def app_settings() -> SettingsDict:
+    return {
+        "slack_app": "testproj.config.slack_app.app",
+        "messengers": {
+            "default": {
+                "class": "django_slack_tools.messenger.shortcuts.Messenger",
+                "kwargs": {
+                    "template_loaders": [
+                        "django_slack_tools.slack_messages.messenger.DjangoTemplateLoader",
+                    ],
+                    "middlewares": [
+                        "django_slack_tools.slack_messages.messenger.DjangoDatabasePersister",
+                    ],
+                    "messaging_backend": {
+                        "class": "django_slack_tools.messenger.shortcuts.SlackBackend",
+                        "kwargs": {
+                            "slack_app": "testproj.config.slack_app.app",
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+class TestOutboxDispatcher:
+    def test_instance_creation(self) -> None:
+        msg = "`batch_size`, `max_workers` and `max_attempts` must be greater than 0."
+        with pytest.raises(ValueError, match=msg):
+            OutboxDispatcher(batch_size=0)
+
+        with pytest.raises(ValueError, match=msg):
+            OutboxDispatcher(max_workers=0)
+
+        with pytest.raises(ValueError, match=msg):
+            OutboxDispatcher(max_attempts=0)
+
+    def test_run_once(self, mock_slack_client: Mock) -> None:
+        # Arrange
+        mock_slack_client.chat_postMessage.side_effect = [
+            SlackMessageResponseFactory(data={"ok": True, "ts": "1703393199.000001"}),
+            SlackMessageResponseFactory(data={"ok": True, "ts": "1703393199.000002"}),
+        ]
+        first = enqueue_slack_message("channel-1", message="Hello, World!")
+        second = enqueue_slack_message("channel-2", template="greet.xml", context={"greet": "Hi"})
+        dispatcher = OutboxDispatcher()
+
+        # Act
+        num_dispatched = dispatcher.run_once()
+
+        # Assert
+        assert num_dispatched == 2
+        assert mock_slack_client.chat_postMessage.call_count == 2
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.status, first.ok, first.ts, first.attempts) == (
+            SlackOutboxMessage.Status.SENT,
+            True,
+            "1703393199.000001",
+            1,
+        )
+        assert first.claimed_until is None
+        assert (second.status, second.ok, second.ts) == (SlackOutboxMessage.Status.SENT, True, "1703393199.000002")
+
+        # History persisted by messenger as usual
+        assert SlackMessage.objects.count() == 2
+
+        # Sent messages are not claimed again
+        assert dispatcher.run_once() == 0
+        assert mock_slack_client.chat_postMessage.call_count == 2
+
+    def test_claim(self) -> None:
+        now = timezone.now()
+        pending = SlackOutboxMessageFactory.create_batch(3)
+        expired = SlackOutboxMessageFactory.create(
+            status=SlackOutboxMessage.Status.CLAIMED,
+            claimed_until=now - timedelta(seconds=1),
+            attempts=1,
+        )
+        SlackOutboxMessageFactory.create(
+            status=SlackOutboxMessage.Status.CLAIMED,
+            claimed_until=now + timedelta(seconds=60),
+            attempts=1,
+        )
+        SlackOutboxMessageFactory.create(status=SlackOutboxMessage.Status.SENT)
+        SlackOutboxMessageFactory.create(status=SlackOutboxMessage.Status.FAILED)
+        dispatcher = OutboxDispatcher(batch_size=3, lease=30)
+
+        first_batch = dispatcher.claim()
+        second_batch = dispatcher.claim()
+
+        assert [message.pk for message in first_batch] == [message.pk for message in pending]
+        assert [message.pk for message in second_batch] == [expired.pk]
+        assert dispatcher.claim() == []
+
+        claimed = [*first_batch, *second_batch]
+        assert all(message.status == SlackOutboxMessage.Status.CLAIMED for message in claimed)
+        assert [message.attempts for message in claimed] == [1, 1, 1, 2]
+        assert first_batch[0].claimed_by != second_batch[0].claimed_by
+        assert first_batch[0].claimed_until
+        assert first_batch[0].claimed_until > now + timedelta(seconds=29)
+
+    def test_dispatch_retried_on_error(self, mock_slack_client: Mock) -> None:
+        # Arrange
+        mock_slack_client.chat_postMessage.side_effect = ConnectionError("Connection reset by peer")
+        message = enqueue_slack_message("channel-1", message="Hello, World!")
+        dispatcher = OutboxDispatcher(max_attempts=2)
+
+        # Act & Assert
+        assert dispatcher.run_once() == 1
+        message.refresh_from_db()
+        assert message.status == SlackOutboxMessage.Status.PENDING
+        assert "Connection reset by peer" in message.error
+
+        assert dispatcher.run_once() == 1
+        message.refresh_from_db()
+        assert message.status == SlackOutboxMessage.Status.FAILED
+        assert message.attempts == 2
+        assert message.ok is None
+
+        assert dispatcher.run_once() == 0
+
+    def test_dispatch_not_ok_response(self, mock_slack_client: Mock) -> None:
+        # Arrange
+        mock_slack_client.chat_postMessage.side_effect = SlackApiErrorFactory()
+        message = enqueue_slack_message("channel-1", message="Hello, World!")
+
+        # Act
+        OutboxDispatcher().run_once()
+
+        # Assert
+        message.refresh_from_db()
+        assert message.status == SlackOutboxMessage.Status.SENT
+        assert message.ok is False
+        assert message.ts == ""
+        assert message.error
+
+    def test_dispatch_no_response(self) -> None:
+        message = SlackOutboxMessageFactory.create(messenger_name="policy-handler")
+
+        with mock.patch("django_slack_tools.slack_messages.outbox.get_messenger") as get_messenger:
+            get_messenger.return_value.send_request.return_value = None
+            OutboxDispatcher().run_once()
+
+        get_messenger.assert_called_once_with("policy-handler")
+        message.refresh_from_db()
+        assert message.status == SlackOutboxMessage.Status.STOPPED
+        assert message.ok is None
+
+    def test_dispatch_claim_taken_over(self, mock_slack_client: Mock, caplog: pytest.LogCaptureFixture) -> None:
+        """Results are discarded if another dispatcher claimed the message again after lease expired."""
+        mock_slack_client.chat_postMessage.return_value = SlackMessageResponseFactory(
+            data={"ok": True, "ts": "1703393199.000001"},
+        )
+        message = enqueue_slack_message("channel-1", message="Hello, World!")
+        slow, other = OutboxDispatcher(lease=0), OutboxDispatcher()
+        (claimed,) = slow.claim()
+        (reclaimed,) = other.claim()
+
+        slow.dispatch([claimed])
+
+        assert "was taken over, discarding result" in caplog.text
+        message.refresh_from_db()
+        assert (message.status, message.claimed_by, message.ts) == (
+            SlackOutboxMessage.Status.CLAIMED,
+            reclaimed.claimed_by,
+            "",
+        )
+
+        other.dispatch([reclaimed])
+
+        message.refresh_from_db()
+        assert (message.status, message.ts) == (SlackOutboxMessage.Status.SENT, "1703393199.000001")
+
+    def test_dispatch_long_batch(self) -> None:
+        """Results are saved as deliveries finish, while claim of messages still being sent is renewed."""
+        fast = SlackOutboxMessageFactory.create()
+        slow = SlackOutboxMessageFactory.create(request={**fast.request, "channel": "slow-channel"})
+        dispatcher = OutboxDispatcher(lease=0.3)
+        messages = dispatcher.claim()
+        renewed = threading.Event()
+        _renew_claim = dispatcher._renew_claim
+
+        def renew_claim(messages: list[SlackOutboxMessage]) -> None:
+            _renew_claim(messages)
+            renewed.set()
+
+        def send_request(request: MessageRequest) -> None:
+            if request.channel == "slow-channel":
+                assert renewed.wait(5)
+
+        with mock.patch("django_slack_tools.slack_messages.outbox.get_messenger") as get_messenger:  # noqa: SIM117
+            with mock.patch.object(dispatcher, "_renew_claim", side_effect=renew_claim) as renew_claim_mock:
+                get_messenger.return_value.send_request.side_effect = send_request
+                dispatcher.dispatch(messages)
+
+        # Claim renewed for the slow message only, after result of the fast one saved
+        first_renewal = renew_claim_mock.call_args_list[0]
+        assert [message.pk for message in first_renewal.args[0]] == [slow.pk]
+        fast.refresh_from_db()
+        slow.refresh_from_db()
+        assert fast.status == slow.status == SlackOutboxMessage.Status.STOPPED
+        assert fast.last_modified < slow.last_modified
+        dispatcher.close()
+
+    def test_dispatch_reuses_workers(self) -> None:
+        dispatcher = OutboxDispatcher(batch_size=1)
+        SlackOutboxMessageFactory.create_batch(2)
+
+        with mock.patch("django_slack_tools.slack_messages.outbox.ThreadPoolExecutor") as executor_cls:
+            executor_cls.return_value.submit.side_effect = lambda fn, *args: _done(fn(*args))
+            with mock.patch("django_slack_tools.slack_messages.outbox.get_messenger") as get_messenger:
+                get_messenger.return_value.send_request.return_value = None
+                dispatcher.dispatch(dispatcher.claim())
+                dispatcher.dispatch(dispatcher.claim())
+
+            executor_cls.assert_called_once_with(max_workers=8, thread_name_prefix="outbox")
+
+            dispatcher.close()
+            executor_cls.return_value.shutdown.assert_called_once_with(wait=True)
+
+        # Closing again is no-op
+        dispatcher.close()
+        assert SlackOutboxMessage.objects.filter(status=SlackOutboxMessage.Status.STOPPED).count() == 2
+
+    def test_run_forever(self) -> None:
+        dispatcher = OutboxDispatcher(batch_size=10)
+        stop_event = threading.Event()
+
+        def run_once() -> int:
+            if run_once_mock.call_count == 2:
+                stop_event.set()
+                return 0
+
+            return 10
+
+        with mock.patch.object(dispatcher, "run_once", side_effect=run_once) as run_once_mock:  # noqa: SIM117
+            with mock.patch.object(stop_event, "wait") as wait:
+                dispatcher.run_forever(poll_interval=3, stop_event=stop_event)
+
+        # Waits only if fetched less than batch size
+        assert run_once_mock.call_count == 2
+        wait.assert_called_once_with(3)
+
+    def test_run_forever_closes(self) -> None:
+        dispatcher = OutboxDispatcher()
+        stop_event = threading.Event()
+        stop_event.set()
+
+        with mock.patch.object(dispatcher, "close") as close:
+            dispatcher.run_forever(stop_event=stop_event)
+
+        close.assert_called_once_with()
+
+
+def _done(result: Any) -> Future[Any]:
+    future: Future[Any] = Future()
+    future.set_result(result)
+    return future
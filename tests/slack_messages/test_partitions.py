@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.db import NotSupportedError, connections
+
+from django_slack_tools.slack_messages import partitions
+from django_slack_tools.slack_messages.models import SlackMessage
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakePostgreSQL:
+    """Connection to PostgreSQL recording SQL executed by schema editor, as tests run on SQLite."""
+
+    def __init__(self, *, partition_names: list[str]) -> None:
+        self.connection = mock.MagicMock(vendor="postgresql")
+        self.connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+
+        self.cursor = self.connection.cursor.return_value.__enter__.return_value
+        self.cursor.fetchone.return_value = (1,)
+        self.cursor.fetchall.return_value = [(name,) for name in partition_names]
+
+        self.editor = self.connection.schema_editor.return_value.__enter__.return_value
+        self.editor._model_indexes_sql.return_value = ['CREATE INDEX "slack_message_created" ...']
+
+    @property
+    def executed(self) -> list[str]:
+        return [call.args[0] for call in self.editor.execute.call_args_list]
+
+
+@pytest.fixture
+def postgresql() -> Iterator[FakePostgreSQL]:
+    fake = FakePostgreSQL(
+        partition_names=[
+            "slack_messages_slackmessage_default",
+            "slack_messages_slackmessage_p202412",
+            "slack_messages_slackmessage_p202411",
+            "slack_messages_slackmessage_p202501",
+        ],
+    )
+    with mock.patch.object(partitions, "connections", {"default": fake.connection}):
+        yield fake
+
+
+@pytest.mark.django_db
+def test_not_postgresql() -> None:
+    assert partitions.is_partitioned() is False
+
+    for func in (partitions.list_partitions, partitions.create_partitions, partitions.partition_table):
+        with pytest.raises(NotSupportedError, match="supported on PostgreSQL only, not sqlite"):
+            func()
+
+    with pytest.raises(NotSupportedError):
+        partitions.drop_partitions(before=datetime.now(tz=timezone.utc))
+
+
+def test_is_partitioned(postgresql: FakePostgreSQL) -> None:
+    assert partitions.is_partitioned() is True
+
+    postgresql.cursor.fetchone.return_value = None
+    assert partitions.is_partitioned() is False
+
+
+def test_list_partitions(postgresql: FakePostgreSQL) -> None:  # noqa: ARG001
+    assert partitions.list_partitions() == {
+        datetime(2024, 11, 1, tzinfo=timezone.utc): "slack_messages_slackmessage_p202411",
+        datetime(2024, 12, 1, tzinfo=timezone.utc): "slack_messages_slackmessage_p202412",
+        datetime(2025, 1, 1, tzinfo=timezone.utc): "slack_messages_slackmessage_p202501",
+    }
+
+
+def test_create_partitions(postgresql: FakePostgreSQL) -> None:
+    created = partitions.create_partitions(months_ahead=2, now=datetime(2024, 12, 31, 23, tzinfo=timezone.utc))
+
+    assert created == ["slack_messages_slackmessage_p202502"]
+    table, partition = '"slack_messages_slackmessage"', '"slack_messages_slackmessage_p202502"'
+    assert postgresql.executed == [
+        'LOCK TABLE "slack_messages_slackmessage_default" IN ACCESS EXCLUSIVE MODE',
+        f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)",
+        (
+            'WITH moved AS (DELETE FROM "slack_messages_slackmessage_default"'  # noqa: S608
+            ' WHERE "created" >= %s AND "created" < %s RETURNING *)'
+            f" INSERT INTO {partition} SELECT * FROM moved"
+        ),
+        (
+            f"ALTER TABLE {table} ATTACH PARTITION {partition}"
+            " FOR VALUES FROM ('2025-02-01T00:00:00+00:00') TO ('2025-03-01T00:00:00+00:00')"
+        ),
+    ]
+    assert postgresql.editor.execute.call_args_list[2].args[1] == (
+        "2025-02-01T00:00:00+00:00",
+        "2025-03-01T00:00:00+00:00",
+    )
+
+    # Nothing to create
+    postgresql.editor.execute.reset_mock()
+    assert partitions.create_partitions(months_ahead=1, now=datetime(2024, 12, 1, tzinfo=timezone.utc)) == []
+    assert postgresql.executed == []
+
+    with pytest.raises(ValueError, match="`months_ahead` must not be negative, got -1"):
+        partitions.create_partitions(months_ahead=-1)
+
+
+@pytest.mark.parametrize("detach_only", [False, True])
+def test_drop_partitions(postgresql: FakePostgreSQL, detach_only: bool) -> None:  # noqa: FBT001
+    dropped = partitions.drop_partitions(before=datetime(2025, 1, 15, tzinfo=timezone.utc), detach_only=detach_only)
+
+    assert dropped == ["slack_messages_slackmessage_p202411", "slack_messages_slackmessage_p202412"]
+    expected = []
+    for name in dropped:
+        expected.append(f'ALTER TABLE "slack_messages_slackmessage" DETACH PARTITION "{name}"')
+        if not detach_only:
+            expected.append(f'DROP TABLE "{name}"')
+
+    assert postgresql.executed == expected
+
+
+def test_drop_partitions_naive(postgresql: FakePostgreSQL) -> None:  # noqa: ARG001
+    """Naive time is taken as in current time zone, rather than failing to compare with months."""
+    dropped = partitions.drop_partitions(before=datetime(2025, 1, 15), detach_only=True)  # noqa: DTZ001
+
+    assert dropped == ["slack_messages_slackmessage_p202411", "slack_messages_slackmessage_p202412"]
+
+
+def test_partition_table(postgresql: FakePostgreSQL) -> None:
+    postgresql.cursor.fetchone.side_effect = [None, (datetime(2024, 11, 20, tzinfo=timezone.utc),)]
+
+    with mock.patch.object(partitions, "datetime", wraps=datetime) as datetime_mock:
+        datetime_mock.now.return_value = datetime(2025, 1, 5, tzinfo=timezone.utc)
+        partitions.partition_table(months_ahead=1)
+
+    table = '"slack_messages_slackmessage"'
+    old_table = '"slack_messages_slackmessage_unpartitioned"'
+    assert postgresql.executed == [
+        f"ALTER TABLE {table} RENAME TO {old_table}",
+        f'CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS) PARTITION BY RANGE ("created")',
+        f'ALTER TABLE {table} ADD PRIMARY KEY ("id", "created")',
+        f'ALTER TABLE {table} ADD UNIQUE ("ts", "created")',
+        (
+            f'ALTER TABLE {table} ADD FOREIGN KEY ("policy_id") REFERENCES "slack_messages_slackmessagingpolicy" ("id")'
+            " DEFERRABLE INITIALLY DEFERRED"
+        ),
+        f'CREATE TABLE "slack_messages_slackmessage_default" PARTITION OF {table} DEFAULT',
+        *(
+            f'CREATE TABLE IF NOT EXISTS "slack_messages_slackmessage_p{month}" PARTITION OF {table}'
+            f" FOR VALUES FROM ('{start}T00:00:00+00:00') TO ('{end}T00:00:00+00:00')"
+            for month, start, end in (
+                ("202411", "2024-11-01", "2024-12-01"),
+                ("202412", "2024-12-01", "2025-01-01"),
+                ("202501", "2025-01-01", "2025-02-01"),
+                ("202502", "2025-02-01", "2025-03-01"),
+            )
+        ),
+        f"INSERT INTO {table} SELECT * FROM {old_table}",  # noqa: S608
+        f"DROP TABLE {old_table}",
+        'CREATE INDEX "slack_message_created" ...',
+    ]
+
+    # Not again
+    postgresql.cursor.fetchone.side_effect = None
+    with pytest.raises(ValueError, match="Message table is partitioned already."):
+        partitions.partition_table()
+
+
+@pytest.mark.skipif("postgresql" not in settings.DATABASES, reason="PostgreSQL database not configured")
+@pytest.mark.django_db(databases=["postgresql"], transaction=True)
+def test_create_partitions_moves_default_rows() -> None:
+    """Messages of new partitions' months in default partition should be moved to them.
+
+    Runs against PostgreSQL database configured with `POSTGRES_*` environment variables, if any.
+    """
+    postgresql_database = "postgresql"
+    if not partitions.is_partitioned(using=postgresql_database):
+        partitions.partition_table(months_ahead=0, using=postgresql_database)
+
+    now = datetime.now(tz=timezone.utc)
+    future = partitions._add_months(partitions._month_of(now), 6)
+    message = SlackMessageFactory.build()
+    message.save(using=postgresql_database)
+    SlackMessage.objects.using(postgresql_database).filter(pk=message.pk).update(created=future)
+
+    created = partitions.create_partitions(months_ahead=6, now=now, using=postgresql_database)
+
+    name = partitions._partition_name(future)
+    assert name in created
+    with connections[postgresql_database].cursor() as cursor:
+        cursor.execute(f'SELECT id FROM "{name}"')  # noqa: S608
+        assert cursor.fetchall() == [(message.pk,)]
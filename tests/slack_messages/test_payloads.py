@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.slack_messages.payloads import compress_payloads
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_compress_payloads() -> None:
+    plain = [SlackMessageFactory.create(request={"channel": f"C{i}"}, response={"ok": True}) for i in range(5)]
+    SlackMessageFactory.create(request=None, response=None)
+    progress: list[int] = []
+
+    assert compress_payloads(chunk_size=2, sleep=0.001, progress=progress.append) == 5
+    assert progress == [2, 4, 5]
+
+    for i, message in enumerate(plain):
+        message.refresh_from_db()
+        assert message.request is None
+        assert message.response is None
+        assert message.compressed_request == {"channel": f"C{i}"}
+        assert message.compressed_response == {"ok": True}
+
+    # Nothing left to compress
+    assert compress_payloads() == 0
+
+    assert compress_payloads(SlackMessage.objects.filter(pk=plain[0].pk), decompress=True) == 1
+    plain[0].refresh_from_db()
+    assert plain[0].request == {"channel": "C0"}
+    assert plain[0].compressed_request is None
+
+
+def test_compress_payloads_partial() -> None:
+    """Messages with either of dumps are converted, leaving the other as is."""
+    message = SlackMessageFactory.create(request=None, response={"ok": False})
+
+    assert compress_payloads(chunk_size=1) == 1
+
+    message.refresh_from_db()
+    assert message.compressed_request is None
+    assert message.compressed_response == {"ok": False}
+
+
+def test_compress_payloads_chunk_size() -> None:
+    with pytest.raises(ValueError, match="`chunk_size` must be greater than 0, got 0"):
+        compress_payloads(chunk_size=0)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.slack_messages.permalinks import backfill_permalinks, get_team_url, resolve_permalink
+from tests._factories import SlackApiErrorFactory
+from tests.slack_messages._factories import SlackAuthTestResponseFactory, SlackGetPermalinkResponseFactory
+from tests.slack_messages.models._factories import SlackMessageFactory
+
+
+@pytest.fixture
+def client() -> mock.Mock:
+    client = mock.Mock()
+    client.auth_test.return_value = SlackAuthTestResponseFactory()
+    client.chat_getPermalink.return_value = SlackGetPermalinkResponseFactory(
+        permalink="https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008",
+    )
+    return client
+
+
+def test_get_team_url(client: mock.Mock) -> None:
+    client.auth_test.side_effect = [SlackApiErrorFactory(), SlackAuthTestResponseFactory()]
+
+    with pytest.raises(SlackApiErrorFactory._meta.model):
+        get_team_url(client)
+
+    # Errors are not cached, but results are
+    assert get_team_url(client) == "https://ghostbusters.slack.com/"
+    assert get_team_url(client) == "https://ghostbusters.slack.com/"
+    assert client.auth_test.call_count == 2
+
+
+class TestResolvePermalink:
+    def test_api(self, client: mock.Mock) -> None:
+        permalink = resolve_permalink(client, channel="C1H9RESGA", ts="1358546515.000008")
+
+        assert permalink == "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008"
+        client.chat_getPermalink.assert_called_once_with(channel="C1H9RESGA", message_ts="1358546515.000008")
+        client.auth_test.assert_not_called()
+
+    def test_local(self, client: mock.Mock) -> None:
+        for ts in ("1358546515.000008", "1358546515.000010"):
+            permalink = resolve_permalink(
+                client,
+                channel="C1H9RESGA",
+                ts=ts,
+                thread_ts="1358546515.000008",
+                mode="local",
+            )
+            assert permalink.startswith("https://ghostbusters.slack.com/archives/C1H9RESGA/p")
+
+        assert permalink.endswith("?thread_ts=1358546515.000008&cid=C1H9RESGA")
+        client.auth_test.assert_called_once()
+        client.chat_getPermalink.assert_not_called()
+
+    def test_local_with_team_url(self, client: mock.Mock) -> None:
+        permalink = resolve_permalink(
+            client,
+            channel="C1H9RESGA",
+            ts="1358546515.000008",
+            mode="local",
+            team_url="https://example.slack.com",
+        )
+
+        assert permalink == "https://example.slack.com/archives/C1H9RESGA/p1358546515000008"
+        client.auth_test.assert_not_called()
+
+    def test_local_fallback_to_api(self, client: mock.Mock) -> None:
+        """Channel names can't be used to build permalinks."""
+        permalink = resolve_permalink(client, channel="#general", ts="1358546515.000008", mode="local")
+
+        assert permalink == "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008"
+        client.chat_getPermalink.assert_called_once_with(channel="#general", message_ts="1358546515.000008")
+
+    @pytest.mark.parametrize("mode", ["api", "local"])
+    def test_error(self, client: mock.Mock, mode: str) -> None:
+        client.auth_test.side_effect = SlackApiErrorFactory()
+        client.chat_getPermalink.side_effect = SlackApiErrorFactory()
+
+        assert resolve_permalink(client, channel="C1H9RESGA", ts="1358546515.000008", mode=mode) == ""  # type: ignore[arg-type]
+
+
+@pytest.mark.django_db
+class TestBackfillPermalinks:
+    def test_backfill_permalinks(self, client: mock.Mock) -> None:
+        pending = [
+            SlackMessageFactory.create(channel="C1H9RESGA", ok=True, permalink="", ts=f"1358546515.00000{i}")
+            for i in range(5)
+        ]
+        skipped = [
+            SlackMessageFactory.create(ok=True, permalink="https://example.com"),
+            SlackMessageFactory.create(ok=False, permalink="", ts=None),
+            SlackMessageFactory.create(ok=None, permalink="", ts=None),
+        ]
+
+        assert backfill_permalinks(client=client, chunk_size=2) == 5
+
+        assert [SlackMessage.objects.get(pk=message.pk).permalink for message in pending] == [
+            f"https://ghostbusters.slack.com/archives/C1H9RESGA/p135854651500000{i}" for i in range(5)
+        ]
+
+        for message in skipped:
+            assert SlackMessage.objects.get(pk=message.pk).permalink == message.permalink
+
+        client.auth_test.assert_called_once()
+
+    def test_unresolved_left_empty(self, client: mock.Mock) -> None:
+        client.chat_getPermalink.side_effect = [SlackApiErrorFactory(), SlackGetPermalinkResponseFactory()]
+        messages = SlackMessageFactory.create_batch(2, channel="#general", ok=True, permalink="")
+
+        assert backfill_permalinks(SlackMessage.objects.all(), client=client, mode="api", chunk_size=1) == 1
+
+        assert sorted(SlackMessage.objects.get(pk=message.pk).permalink for message in messages) == [
+            "",
+            "https://ghostbusters.slack.com/archives/C1H9RESGA/p135854651500008",
+        ]
+
+    def test_chunk_size(self, client: mock.Mock) -> None:
+        with pytest.raises(ValueError, match="`chunk_size` must be greater than 0, got 0"):
+            backfill_permalinks(client=client, chunk_size=0)
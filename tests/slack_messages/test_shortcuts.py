@@ -6,7 +6,8 @@
 import pytest
 
 from django_slack_tools.messenger.shortcuts import MessageResponse
-from django_slack_tools.slack_messages.shortcuts import slack_message
+from django_slack_tools.slack_messages.models import SlackOutboxMessage
+from django_slack_tools.slack_messages.shortcuts import enqueue_slack_message, slack_message
 
 from ._factories import SlackMessageResponseFactory
 
@@ -79,6 +80,7 @@ def test_slack_message_simplest_message(mock_slack_client: Mock) -> None:
             "unfurl_media": None,
         },
         "id_": mock.ANY,
+        "idempotency_key": None,
         "template_key": None,
     }
 
@@ -121,6 +123,7 @@ def test_slack_message_with_template(mock_slack_client: Mock) -> None:
             "unfurl_media": None,
         },
         "id_": mock.ANY,
+        "idempotency_key": None,
         "template_key": "greet.xml",
     }
     assert response.error is None
@@ -143,3 +146,54 @@ def test_slack_message_mutually_exclusive_arguments(mock_slack_client: Mock) ->
         )
 
     mock_slack_client.chat_postMessage.assert_not_called()
+
+
+def test_enqueue_slack_message(mock_slack_client: Mock) -> None:
+    # Act
+    outbox_message = enqueue_slack_message(
+        "whatever-channel",
+        messenger_name="default",
+        template="greet.xml",
+        context={"greet": "Hello, World!"},
+    )
+
+    # Assert
+    mock_slack_client.chat_postMessage.assert_not_called()
+    outbox_message.refresh_from_db()
+    assert outbox_message.status == SlackOutboxMessage.Status.PENDING
+    assert outbox_message.messenger_name == "default"
+    assert outbox_message.request == {
+        "body": None,
+        "channel": "whatever-channel",
+        "context": {"greet": "Hello, World!"},
+        "header": {
+            "mrkdwn": None,
+            "parse": None,
+            "reply_broadcast": None,
+            "thread_ts": None,
+            "unfurl_links": None,
+            "unfurl_media": None,
+        },
+        "id_": mock.ANY,
+        "idempotency_key": None,
+        "template_key": "greet.xml",
+    }
+
+
+def test_enqueue_slack_message_mutually_exclusive_arguments() -> None:
+    with pytest.raises(ValueError, match="Either `template` or `message` must be set, but not both."):
+        enqueue_slack_message("whatever-channel")
+
+    assert not SlackOutboxMessage.objects.exists()
+
+
+def test_idempotency_key(mock_slack_client: Mock) -> None:
+    mock_slack_client.chat_postMessage.return_value = SlackMessageResponseFactory()
+
+    response = slack_message("whatever-channel", message="Hello, World!", idempotency_key="alert-1")
+    outbox_message = enqueue_slack_message("whatever-channel", message="Hello, World!", idempotency_key="alert-1")
+
+    assert response
+    assert response.request
+    assert response.request.idempotency_key == "alert-1"
+    assert outbox_message.request["idempotency_key"] == "alert-1"
@@ -0,0 +1,44 @@
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from tests.slack_messages.models._factories import SlackMessageRecipientFactory, SlackMessagingPolicyFactory
+
+
+@pytest.mark.django_db
+def test_invalidate_cached_policy_templates(django_capture_on_commit_callbacks: Any) -> None:
+    with mock.patch("django_slack_tools.slack_messages.signals.invalidate_cached_templates") as invalidate:
+        # Not until the change is committed
+        with django_capture_on_commit_callbacks() as callbacks:
+            policy = SlackMessagingPolicyFactory.create()
+            invalidate.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+
+        assert invalidate.called
+
+        invalidate.reset_mock()
+        with django_capture_on_commit_callbacks(execute=True):
+            policy.delete()
+
+        invalidate.assert_called_once_with()
+
+
+@pytest.mark.django_db
+def test_invalidate_policy_snapshots(django_capture_on_commit_callbacks: Any) -> None:
+    recipient = SlackMessageRecipientFactory.create()
+    policy = SlackMessagingPolicyFactory.create()
+    with mock.patch("django_slack_tools.slack_messages.signals.invalidate_resolved_policies") as invalidate:
+        with django_capture_on_commit_callbacks(execute=True):
+            policy.recipients.add(recipient)
+            invalidate.assert_not_called()
+
+        invalidate.assert_called_once_with()
+
+        invalidate.reset_mock()
+        with django_capture_on_commit_callbacks(execute=True):
+            recipient.delete()
+
+        assert invalidate.called
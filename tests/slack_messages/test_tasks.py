@@ -1,9 +1,15 @@
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
 from unittest import mock
 
 import pytest
+from django.core.management import call_command
 
+from django_slack_tools.app_settings import app_settings
 from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.utils import tracing
+from tests.messenger._factories import MessageRequestFactory, MessageResponseFactory
 from tests.slack_messages.models._factories import SlackMessageFactory
 
 try:
@@ -21,6 +27,37 @@
 ]
 
 
+class TestTracedTask:
+    def test_trace_context_sent(self, span_exporter: Any) -> None:  # noqa: ARG002
+        with mock.patch("celery.app.task.Task.apply_async") as apply_async:
+            tasks.slack_message.delay("test", message="Hello, World!")
+            assert "headers" not in apply_async.call_args.kwargs
+
+            with tracing.start_span("caller"):
+                tasks.slack_message.delay("test", message="Hello, World!")
+
+        carrier = apply_async.call_args.kwargs["headers"]["django_slack_tools_trace_context"]
+        assert carrier["traceparent"]
+
+    def test_trace_continued(self, span_exporter: Any) -> None:
+        with tracing.start_span("caller"):
+            carrier = tracing.inject_context()
+
+        def slack_message(*args: Any, **kwargs: Any) -> None:  # noqa: ARG001
+            with tracing.start_span("callee"):
+                pass
+
+        with mock.patch("django_slack_tools.slack_messages.shortcuts.slack_message", side_effect=slack_message):
+            tasks.slack_message.apply(
+                args=("test",),
+                kwargs={"message": "Hello, World!"},
+                headers={"django_slack_tools_trace_context": carrier},
+            )
+
+        caller, callee = span_exporter.get_finished_spans()
+        assert callee.parent.span_id == caller.context.span_id
+
+
 class TestSlackMessage:
     def test_slack_message(self) -> None:
         with mock.patch("django_slack_tools.slack_messages.shortcuts.slack_message") as m:
@@ -39,8 +76,26 @@ def test_slack_message(self) -> None:
         )
 
 
+class TestSendRequests:
+    def test_send_requests(self) -> None:
+        messenger = mock.Mock()
+        messenger.send_request.side_effect = [MessageResponseFactory.create(ts="1234.5678"), None]
+        requests = MessageRequestFactory.create_batch(2)
+
+        with mock.patch("django_slack_tools.slack_messages.tasks.get_messenger", return_value=messenger) as get:
+            result = tasks.send_requests(
+                messenger_name="test",
+                requests=[request.model_dump(mode="json") for request in requests],
+            )
+
+        get.assert_called_once_with("test")
+        assert result == ["1234.5678", None]
+        assert [call.args[0] for call in messenger.send_request.call_args_list] == requests
+
+
 class TestCleanupOldMessages:
-    def test_cleanup_old_messages(self) -> None:
+    @pytest.mark.parametrize("chunk_size", [1, 1000])
+    def test_cleanup_old_messages(self, chunk_size: int) -> None:
         # Arrange
         ts = datetime(2024, 10, 9, 3, 48, 22, tzinfo=timezone.utc)
         _should_deleted = [
@@ -56,12 +111,61 @@ def test_cleanup_old_messages(self) -> None:
         ]
 
         # Act
-        num_deleted = tasks.cleanup_old_messages(base_ts=ts.isoformat(), threshold_seconds=5 * 60)  # 5 minutes
+        num_deleted = tasks.cleanup_old_messages(
+            base_ts=ts.isoformat(),
+            threshold_seconds=5 * 60,  # 5 minutes
+            chunk_size=chunk_size,
+        )
 
         # Assert
         assert num_deleted == 2
         assert sorted(SlackMessage.objects.values_list("id", flat=True)) == sorted(m.id for m in should_remain)
 
+    def test_cleanup_old_messages_archive(self, tmp_path: Path) -> None:
+        ts = datetime(2024, 10, 9, 3, 48, 22, tzinfo=timezone.utc)
+        old = SlackMessageFactory.create(created=ts - timedelta(hours=1), compressed_response={"ok": True})
+        SlackMessageFactory.create(created=ts)
+
+        num_deleted = tasks.cleanup_old_messages(
+            base_ts=ts.isoformat(),
+            threshold_seconds=60,
+            archive_dir=str(tmp_path),
+        )
+
+        assert num_deleted == 1
+        (path,) = tmp_path.glob("slack_messages_*.jsonl.gz")
+        call_command("loaddata", str(path), verbosity=0)
+        restored = SlackMessage.objects.get(pk=old.pk)
+        assert restored.created == old.created
+        assert restored.compressed_response == {"ok": True}
+
+    def test_cleanup_old_messages_partitioned(self) -> None:
+        ts = datetime(2024, 10, 9, 3, 48, 22, tzinfo=timezone.utc)
+        SlackMessageFactory.create(created=ts - timedelta(hours=1))
+
+        with mock.patch("django_slack_tools.slack_messages.partitions.is_partitioned", return_value=True):  # noqa: SIM117
+            with mock.patch(
+                "django_slack_tools.slack_messages.partitions.drop_partitions",
+                return_value=["slack_messages_slackmessage_p202408"],
+            ) as drop_partitions:
+                num_deleted = tasks.cleanup_old_messages(base_ts=ts.isoformat(), threshold_seconds=60)
+
+        drop_partitions.assert_called_once_with(before=ts - timedelta(seconds=60))
+        assert num_deleted == 1
+
+    def test_cleanup_old_messages_naive_base_ts(self) -> None:
+        """Base timestamp without time zone is in current time zone."""
+        ts = datetime(2024, 10, 9, 3, 48, 22, tzinfo=timezone.utc)
+        SlackMessageFactory.create(created=ts - timedelta(hours=1))
+
+        with mock.patch("django_slack_tools.slack_messages.partitions.is_partitioned", return_value=True):  # noqa: SIM117
+            with mock.patch("django_slack_tools.slack_messages.partitions.drop_partitions") as drop_partitions:
+                num_deleted = tasks.cleanup_old_messages(base_ts="2024-10-09T03:48:22", threshold_seconds=60)
+
+        drop_partitions.assert_called_once_with(before=ts - timedelta(seconds=60))
+        assert drop_partitions.call_args.kwargs["before"].tzinfo is not None
+        assert num_deleted == 1
+
     def test_cleanup_old_messages_skip_if_threshold_is_none(self) -> None:
         # Arrange
         ts = datetime(2024, 10, 9, 3, 48, 22, tzinfo=timezone.utc)
@@ -75,3 +179,14 @@ def test_cleanup_old_messages_skip_if_threshold_is_none(self) -> None:
         # Assert
         assert num_deleted == 0
         assert SlackMessage.objects.count() == 3
+
+
+class TestBackfillPermalinks:
+    def test_backfill_permalinks(self) -> None:
+        with mock.patch(
+            "django_slack_tools.slack_messages.permalinks.backfill_permalinks",
+            return_value=3,
+        ) as backfill:
+            assert tasks.backfill_permalinks(mode="api", chunk_size=10) == 3
+
+        backfill.assert_called_once_with(client=app_settings.slack_app.client, mode="api", chunk_size=10)
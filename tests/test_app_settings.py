@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest import mock
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
 from slack_bolt import App
 
-from django_slack_tools.app_settings import AppSettings, get_settings_from_django
-from django_slack_tools.messenger.shortcuts import Messenger
+from django_slack_tools.app_settings import AppSettings, _accepts_keyword, get_settings_from_django
+from django_slack_tools.messenger.shortcuts import BaseBackend, BaseInstrument, Messenger
 
 if TYPE_CHECKING:
     from pytest_django.fixtures import SettingsWrapper
 
     from django_slack_tools.app_settings import SettingsDict
+    from django_slack_tools.messenger.shortcuts import BaseMiddleware, BaseTemplateLoader
 
 
 # Config fixtures to run in parametrize (map of test id to config dictionary)
@@ -109,6 +111,20 @@
             },
         },
     },
+    "instrumented": {
+        "slack_app": "testproj.config.slack_app.app",
+        "messengers": {
+            "default": {
+                "class": "django_slack_tools.messenger.shortcuts.Messenger",
+                "kwargs": {
+                    "template_loaders": [],
+                    "middlewares": [],
+                    "messaging_backend": "django_slack_tools.messenger.shortcuts.DummyBackend",
+                    "instruments": ["django_slack_tools.messenger.shortcuts.BaseInstrument"],
+                },
+            },
+        },
+    },
 }
 
 # Save decorator for reuse, as not all test in suite requires this
@@ -122,6 +138,23 @@
 not_slack_app = -1
 
 
+class CustomMessenger(Messenger):
+    """Messenger of which constructor takes neither name nor instruments."""
+
+    def __init__(
+        self,
+        *,
+        template_loaders: list[BaseTemplateLoader],
+        middlewares: list[BaseMiddleware],
+        messaging_backend: BaseBackend,
+    ) -> None:
+        super().__init__(
+            template_loaders=template_loaders,
+            middlewares=middlewares,
+            messaging_backend=messaging_backend,
+        )
+
+
 class TestAppSettings:
     def _assert_app_settings(self, app_settings: AppSettings) -> None:
         assert isinstance(app_settings.slack_app, App)
@@ -142,6 +175,51 @@ def test_django_config(self, settings: SettingsWrapper, settings_dict: SettingsD
         app_settings = get_settings_from_django()
         self._assert_app_settings(app_settings)
 
+    def test_messenger_name(self) -> None:
+        app_settings = AppSettings.from_dict(config_fixtures["instrumented"])
+
+        messenger = app_settings.messengers["default"]
+        assert messenger.name == "default"
+        assert [type(instrument) for instrument in messenger.instruments] == [BaseInstrument]
+
+    def test_custom_messenger(self) -> None:
+        """Name and instruments are not passed to messenger classes not taking them."""
+        app_settings = AppSettings.from_dict(
+            {
+                "slack_app": "testproj.config.slack_app.app",
+                "messengers": {
+                    "custom": {
+                        "class": "tests.test_app_settings.CustomMessenger",
+                        "kwargs": {
+                            "template_loaders": [],
+                            "middlewares": [],
+                            "messaging_backend": "django_slack_tools.messenger.shortcuts.DummyBackend",
+                        },
+                    },
+                },
+            },
+        )
+
+        messenger = app_settings.messengers["custom"]
+        assert isinstance(messenger, CustomMessenger)
+        assert messenger.name == ""
+        assert messenger.instruments == ()
+
+    def test_accepts_keyword(self) -> None:
+        def func(a: Any, /, b: Any, *, c: Any) -> None: ...
+
+        def func_kwargs(**kwargs: Any) -> None: ...
+
+        assert not _accepts_keyword(func, "a")
+        assert _accepts_keyword(func, "b")
+        assert _accepts_keyword(func, "c")
+        assert not _accepts_keyword(func, "d")
+        assert _accepts_keyword(func_kwargs, "d")
+
+        # Callables without signature, such as some builtins
+        with mock.patch("inspect.signature", side_effect=ValueError("no signature found")):
+            assert not _accepts_keyword(func_kwargs, "d")
+
     def test_bad_config_not_slack_app(self) -> None:
         with pytest.raises(
             ImproperlyConfigured,
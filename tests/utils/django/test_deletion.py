@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from unittest import mock
+
+import pytest
+
+from django_slack_tools.slack_messages.models import SlackMessage, SlackMessagingPolicy
+from django_slack_tools.utils.django.deletion import chunked_delete
+from tests.slack_messages.models._factories import SlackMessageFactory, SlackMessagingPolicyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_chunked_delete(django_assert_num_queries: Callable[..., Any]) -> None:
+    SlackMessageFactory.create_batch(5, ok=False)
+    remain = SlackMessageFactory.create(ok=True)
+    progress = mock.Mock()
+
+    # Per chunk: select chunk and delete it, in a savepoint of test transaction
+    with mock.patch("time.sleep") as sleep, django_assert_num_queries(3 * 4):
+        num_deleted = chunked_delete(
+            SlackMessage.objects.filter(ok=False),
+            chunk_size=2,
+            sleep=0.5,
+            progress=progress,
+        )
+
+    assert num_deleted == 5
+    assert list(SlackMessage.objects.all()) == [remain]
+    assert [call.args for call in progress.call_args_list] == [(2,), (4,), (5,)]
+    assert sleep.call_args_list == [mock.call(0.5), mock.call(0.5)]
+
+
+def test_chunked_delete_with_cascades() -> None:
+    """Objects with relations or signals are deleted with collector."""
+    policy = SlackMessagingPolicyFactory.create()
+    message = SlackMessageFactory.create(policy=policy)
+
+    num_deleted = chunked_delete(SlackMessagingPolicy.objects.filter(pk=policy.pk))
+
+    assert num_deleted == 1
+    message.refresh_from_db()
+    assert message.policy is None
+
+
+def test_chunked_delete_resumes() -> None:
+    SlackMessageFactory.create_batch(5)
+    progress = mock.Mock(side_effect=[None, KeyboardInterrupt])
+
+    with pytest.raises(KeyboardInterrupt):
+        chunked_delete(SlackMessage.objects.all(), chunk_size=2, progress=progress)
+
+    # Chunks deleted before interrupted are not rolled back
+    assert SlackMessage.objects.count() == 1
+    assert chunked_delete(SlackMessage.objects.all(), chunk_size=2) == 1
+    assert not SlackMessage.objects.exists()
+
+
+def test_chunked_delete_nothing_to_delete() -> None:
+    SlackMessageFactory.create()
+
+    assert chunked_delete(SlackMessage.objects.filter(ok=True)) == 0
+    assert SlackMessage.objects.count() == 1
+
+
+def test_chunked_delete_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="`chunk_size` must be greater than 0, got 0"):
+        chunked_delete(SlackMessage.objects.all(), chunk_size=0)
@@ -0,0 +1,10 @@
+import json
+
+from django_slack_tools.utils.django.encoders import RawJSON, RawJSONEncoder
+
+
+class TestRawJSONEncoder:
+    def test_encode(self) -> None:
+        assert json.dumps(RawJSON('{"foo": [1, 2]}'), cls=RawJSONEncoder) == '{"foo": [1, 2]}'
+        assert json.dumps({"foo": "bar"}, cls=RawJSONEncoder) == '{"foo": "bar"}'
+        assert json.dumps("{}", cls=RawJSONEncoder) == '"{}"'
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import zlib
+
+import pytest
+from django import forms
+from django.db import connection
+
+from django_slack_tools.slack_messages.models import SlackMessage
+from django_slack_tools.utils.django.encoders import RawJSON, RawJSONEncoder
+from django_slack_tools.utils.django.fields import CompressedJSONField
+
+
+class TestCompressedJSONField:
+    def test_level(self) -> None:
+        with pytest.raises(ValueError, match="`level` must be between 0 and 9, got 10"):
+            CompressedJSONField(level=10)
+
+    def test_deconstruct(self) -> None:
+        *_, kwargs = CompressedJSONField().deconstruct()
+        assert kwargs == {}
+
+        *_, kwargs = CompressedJSONField(encoder=RawJSONEncoder, level=9, editable=False).deconstruct()
+        assert kwargs == {"encoder": RawJSONEncoder, "level": 9, "editable": False}
+
+    def test_round_trip(self) -> None:
+        field = CompressedJSONField(encoder=RawJSONEncoder)
+        value = {"blocks": [{"type": "divider"}] * 100}
+
+        compressed = field.get_prep_value(value)
+        assert compressed
+        assert len(compressed) < len(str(value))
+        assert field.from_db_value(compressed, None, connection) == value  # type: ignore[arg-type]
+        assert field.from_db_value(None, None, connection) is None  # type: ignore[arg-type]
+        assert field.get_prep_value(None) is None
+
+        # Values encoded already are compressed as is
+        assert zlib.decompress(field.get_prep_value(RawJSON('{"ok":true}')) or b"") == b'{"ok":true}'
+
+    def test_to_python(self) -> None:
+        field = CompressedJSONField()
+        compressed = field.get_prep_value({"ok": True})
+        assert compressed
+
+        assert field.to_python(compressed) == {"ok": True}
+        assert field.to_python(memoryview(compressed)) == {"ok": True}
+        assert field.to_python({"ok": True}) == {"ok": True}
+        assert field.to_python(None) is None
+
+    def test_value_to_string(self) -> None:
+        field = SlackMessage._meta.get_field("compressed_request")
+        message = SlackMessage(compressed_request={"ok": True})
+
+        assert field.to_python(field.value_to_string(message)) == {"ok": True}
+
+    def test_formfield(self) -> None:
+        formfield = CompressedJSONField(encoder=RawJSONEncoder).formfield()
+
+        assert isinstance(formfield, forms.JSONField)
+        assert formfield.encoder is RawJSONEncoder
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from django.apps import apps
+from django.db import NotSupportedError, models
+from django.db.migrations.state import ProjectState
+
+from django_slack_tools.utils.django.operations import AddIndexConcurrently
+
+
+@pytest.fixture
+def operation() -> AddIndexConcurrently:
+    return AddIndexConcurrently(
+        model_name="slackmessage",
+        index=models.Index(fields=["created"], name="slack_message_test"),
+    )
+
+
+def _schema_editor(vendor: str, *, in_atomic_block: bool = False) -> mock.Mock:
+    return mock.Mock(connection=mock.Mock(vendor=vendor, alias="default", in_atomic_block=in_atomic_block))
+
+
+def test_describe(operation: AddIndexConcurrently) -> None:
+    assert operation.describe() == (
+        "Concurrently create index slack_message_test on field(s) created of model slackmessage"
+    )
+
+
+def test_postgresql(operation: AddIndexConcurrently) -> None:
+    state = ProjectState.from_apps(apps)
+    schema_editor = _schema_editor("postgresql")
+
+    operation.database_forwards("slack_messages", schema_editor, state, state)
+    operation.database_backwards("slack_messages", schema_editor, state, state)
+
+    model = state.apps.get_model("slack_messages", "slackmessage")
+    schema_editor.add_index.assert_called_once_with(model, operation.index, concurrently=True)
+    schema_editor.remove_index.assert_called_once_with(model, operation.index, concurrently=True)
+
+
+def test_postgresql_not_allowed(operation: AddIndexConcurrently) -> None:
+    """Models not allowed to migrate by routers are skipped."""
+    state = ProjectState.from_apps(apps)
+    schema_editor = _schema_editor("postgresql")
+
+    with mock.patch.object(operation, "allow_migrate_model", return_value=False):
+        operation.database_forwards("slack_messages", schema_editor, state, state)
+        operation.database_backwards("slack_messages", schema_editor, state, state)
+
+    schema_editor.add_index.assert_not_called()
+    schema_editor.remove_index.assert_not_called()
+
+
+def test_postgresql_in_transaction(operation: AddIndexConcurrently) -> None:
+    state = ProjectState.from_apps(apps)
+    schema_editor = _schema_editor("postgresql", in_atomic_block=True)
+
+    msg = "Concurrent index operations can't run in a transaction. Set `atomic = False` on the migration."
+    with pytest.raises(NotSupportedError, match=msg):
+        operation.database_forwards("slack_messages", schema_editor, state, state)
+
+    with pytest.raises(NotSupportedError, match=msg):
+        operation.database_backwards("slack_messages", schema_editor, state, state)
+
+    schema_editor.add_index.assert_not_called()
+    schema_editor.remove_index.assert_not_called()
+
+
+def test_other_databases(operation: AddIndexConcurrently) -> None:
+    """Indexes are created as usual on other databases, even in a transaction."""
+    state = ProjectState.from_apps(apps)
+    schema_editor = _schema_editor("sqlite", in_atomic_block=True)
+
+    operation.database_forwards("slack_messages", schema_editor, state, state)
+    operation.database_backwards("slack_messages", schema_editor, state, state)
+
+    model = state.apps.get_model("slack_messages", "slackmessage")
+    schema_editor.add_index.assert_called_once_with(model, operation.index)
+    schema_editor.remove_index.assert_called_once_with(model, operation.index)
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import http.client
+import socket
+import threading
+from email.message import Message
+from typing import TYPE_CHECKING
+from unittest import mock
+from urllib.parse import urlsplit
+
+import pytest
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+from django_slack_tools.utils.slack import ConnectionClosedAfterSendError, ConnectionPoolMetrics, PooledWebClient
+from django_slack_tools.utils.slack.client import _ConnectionPool
+from tests.benchmarks._fake_slack import FakeSlackServer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def server() -> Iterator[FakeSlackServer]:
+    with FakeSlackServer() as server:
+        yield server
+
+
+@pytest.fixture
+def sockets() -> Iterator[tuple[socket.socket, socket.socket]]:
+    """Pair of connected sockets, for connections in pool to be alive until the peer closes."""
+    left, right = socket.socketpair()
+    with left, right:
+        yield left, right
+
+
+def _mock_connection(*, status: int = 200, content_type: str = "application/json", body: bytes = b"{}") -> mock.Mock:
+    headers = Message()
+    headers["Content-Type"] = content_type
+    response = mock.Mock(status=status, reason="OK", msg=headers, will_close=False)
+    response.read.return_value = body
+    connection = mock.Mock()
+    connection.getresponse.return_value = response
+    return connection
+
+
+class TestPooledWebClient:
+    def test_instance_creation(self) -> None:
+        with pytest.raises(ValueError, match="`pool_size` must be greater than 0, got 0"):
+            PooledWebClient(pool_size=0)
+
+        with pytest.raises(ValueError, match="Unsupported pool scope: 'global'"):
+            PooledWebClient(pool_scope="global")  # type: ignore[arg-type]
+
+    def test_connection_reused(self, server: FakeSlackServer) -> None:
+        client = PooledWebClient(token="xoxb-token", base_url=server.base_url)  # noqa: S106
+        assert client.pool_metrics.reuse_ratio == 0
+
+        for _ in range(3):
+            response = client.chat_postMessage(channel="C0123", text="Hello, World!")
+            assert response["ok"]
+
+        assert client.chat_getPermalink(channel="C0123", message_ts=response["ts"])["permalink"]
+        assert client.pool_metrics == ConnectionPoolMetrics(requests=4, opened=1, reused=3, discarded=0)
+        assert client.pool_metrics.reuse_ratio == 0.75
+
+    def test_error_status(self) -> None:
+        with FakeSlackServer(rate_limit_every=1, retry_after=30) as server:
+            client = PooledWebClient(token="xoxb-token", base_url=server.base_url)  # noqa: S106
+            for _ in range(2):
+                with pytest.raises(SlackApiError) as exc_info:
+                    client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+                assert exc_info.value.response.status_code == 429
+                assert exc_info.value.response.headers["Retry-After"] == "30"
+                assert exc_info.value.response["error"] == "ratelimited"
+
+        assert client.pool_metrics.reused == 1
+
+    def test_pool_per_thread(self, server: FakeSlackServer) -> None:
+        client = PooledWebClient(token="xoxb-token", base_url=server.base_url, pool_scope="thread")  # noqa: S106
+
+        def send() -> None:
+            for _ in range(2):
+                client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        thread.join()
+        send()
+
+        assert client.pool_metrics == ConnectionPoolMetrics(requests=4, opened=2, reused=2, discarded=0)
+
+        # Closing connections of current thread's pool
+        client.close()
+        send()
+        assert client.pool_metrics.opened == 3
+
+    def test_stale_connection_replaced(
+        self,
+        server: FakeSlackServer,
+        sockets: tuple[socket.socket, socket.socket],
+    ) -> None:
+        """Request failed to be sent with stale connection should be retried with new one."""
+        client = PooledWebClient(token="xoxb-token", base_url=server.base_url)  # noqa: S106
+        stale = mock.Mock(sock=sockets[0])
+        stale.request.side_effect = http.client.RemoteDisconnected("Remote end closed connection without response")
+        client._get_pool().put(("http", "127.0.0.1", urlsplit(server.base_url).port), stale)
+
+        response = client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        assert response["ok"]
+        stale.close.assert_called()
+        assert client.pool_metrics == ConnectionPoolMetrics(requests=1, opened=1, reused=0, discarded=1)
+
+    @pytest.mark.parametrize("closed", ["peer", "socket", "connection"])
+    def test_dropped_connection_discarded(
+        self,
+        server: FakeSlackServer,
+        sockets: tuple[socket.socket, socket.socket],
+        closed: str,
+    ) -> None:
+        """Idle connections closed by server should be discarded before sending request."""
+        client = PooledWebClient(token="xoxb-token", base_url=server.base_url)  # noqa: S106
+        dropped = mock.Mock(sock=None if closed == "connection" else sockets[0])
+        sockets[0 if closed == "socket" else 1].close()
+        client._get_pool().put(("http", "127.0.0.1", urlsplit(server.base_url).port), dropped)
+
+        assert client.chat_postMessage(channel="C0123", text="Hello, World!")["ok"]
+
+        dropped.request.assert_not_called()
+        dropped.close.assert_called_once()
+        assert client.pool_metrics == ConnectionPoolMetrics(requests=1, opened=1, reused=0, discarded=1)
+
+    def test_stale_connection_after_sent(self, sockets: tuple[socket.socket, socket.socket]) -> None:
+        """Messages might have been posted if connection is closed after sent, so never sent again."""
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        stale = _mock_connection()
+        stale.sock = sockets[0]
+        stale.getresponse.side_effect = http.client.RemoteDisconnected("Remote end closed connection without response")
+        client._get_pool().put(("https", "slack.com", None), stale)
+
+        with mock.patch("http.client.HTTPSConnection", return_value=_mock_connection()) as connection_cls:  # noqa: SIM117
+            with pytest.raises(ConnectionClosedAfterSendError, match="after POST request was sent"):
+                client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        stale.request.assert_called_once()
+        stale.close.assert_called_once()
+        connection_cls.assert_not_called()
+        assert client.pool_metrics.discarded == 0
+
+    def test_new_connection_closed_after_sent(self) -> None:
+        """Not retried by default retry handlers of `WebClient` either, with new connections."""
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        connection = _mock_connection()
+        connection.getresponse.side_effect = ConnectionResetError("Connection reset by peer")
+
+        with mock.patch("http.client.HTTPSConnection", return_value=connection) as connection_cls:  # noqa: SIM117
+            with pytest.raises(ConnectionClosedAfterSendError):
+                client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        connection_cls.assert_called_once()
+        connection.request.assert_called_once()
+
+    def test_new_connection_closed_before_sent(self) -> None:
+        """Requests not sent are left to retry handlers of `WebClient`, which retry them once by default."""
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        connection = _mock_connection()
+        connection.request.side_effect = ConnectionResetError("Connection reset by peer")
+
+        with mock.patch("http.client.HTTPSConnection", return_value=connection) as connection_cls:  # noqa: SIM117
+            with pytest.raises(ConnectionResetError):
+                client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        assert connection_cls.call_count == 2
+
+    def test_stale_connection_after_sent_idempotent(self, sockets: tuple[socket.socket, socket.socket]) -> None:
+        """Idempotent requests are safe to send again with new connection. `WebClient` API calls are all POST."""
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        stale = _mock_connection()
+        stale.sock = sockets[0]
+        stale.getresponse.side_effect = http.client.RemoteDisconnected("Remote end closed connection without response")
+        client._get_pool().put(("https", "slack.com", None), stale)
+
+        with mock.patch("http.client.HTTPSConnection", return_value=_mock_connection(body=b'{"ok": true}')) as cls:
+            req = mock.Mock(data=None, header_items=list, get_method=lambda: "GET")
+            assert client._perform_urllib_http_request_internal("https://slack.com/files/F0123", req)["status"] == 200
+
+        stale.close.assert_called_once()
+        cls.assert_called_once()
+        assert client.pool_metrics == ConnectionPoolMetrics(requests=1, opened=1, reused=0, discarded=1)
+
+    def test_connection_closed_on_error(self) -> None:
+        client = PooledWebClient(token="xoxb-token", base_url="http://localhost:1/api/")  # noqa: S106
+        connection = mock.Mock()
+        connection.getresponse.side_effect = TimeoutError
+
+        with mock.patch("http.client.HTTPConnection", return_value=connection):  # noqa: SIM117
+            with pytest.raises(TimeoutError):
+                client.chat_postMessage(channel="C0123", text="Hello, World!")
+
+        connection.close.assert_called_once()
+        assert client._get_pool().get(("http", "localhost", 1)) is None
+
+    def test_https_connection(self) -> None:
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        connection = _mock_connection(body=b'{"ok": true}')
+
+        with mock.patch("http.client.HTTPSConnection", return_value=connection) as connection_cls:
+            assert client.auth_test()["ok"]
+
+        connection_cls.assert_called_once_with("slack.com", None, timeout=client.timeout, context=client.ssl)
+        connection.request.assert_called_once_with("POST", "/api/auth.test", body=None, headers=mock.ANY)
+        assert client._get_pool().get(("https", "slack.com", None)) is connection
+
+    def test_connection_will_close(self) -> None:
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        connection = _mock_connection(body=b'{"ok": true}')
+        connection.getresponse.return_value.will_close = True
+
+        with mock.patch("http.client.HTTPSConnection", return_value=connection):
+            client.auth_test()
+
+        connection.close.assert_called_once()
+        assert client._get_pool().get(("https", "slack.com", None)) is None
+
+    def test_binary_response(self) -> None:
+        client = PooledWebClient(token="xoxb-token")  # noqa: S106
+        connection = _mock_connection(content_type="application/gzip", body=b"\x1f\x8b")
+
+        with mock.patch("http.client.HTTPSConnection", return_value=connection):
+            response = client._perform_urllib_http_request_internal(
+                "https://slack.com/api/admin.analytics.getFile?type=member",
+                mock.Mock(data=b"", header_items=list, get_method=lambda: "POST"),
+            )
+
+        connection.request.assert_called_once_with(
+            "POST",
+            "/api/admin.analytics.getFile?type=member",
+            body=b"",
+            headers={},
+        )
+        assert response["body"] == b"\x1f\x8b"
+
+    def test_proxy_not_pooled(self) -> None:
+        client = PooledWebClient(token="xoxb-token", proxy="http://proxy.local:3128")  # noqa: S106
+
+        with mock.patch.object(
+            WebClient,
+            "_perform_urllib_http_request_internal",
+            return_value={"status": 200, "headers": {}, "body": '{"ok": true}'},
+        ) as perform:
+            assert client.auth_test()["ok"]
+
+        perform.assert_called_once()
+        assert client.pool_metrics.requests == 0
+
+
+class TestConnectionPool:
+    def test_maxsize(self) -> None:
+        pool = _ConnectionPool(maxsize=1)
+        key = ("https", "slack.com", None)
+        first, second = mock.Mock(), mock.Mock()
+
+        pool.put(key, first)
+        pool.put(key, second)
+
+        second.close.assert_called_once()
+        assert pool.get(key) is first
+        assert pool.get(key) is None
+
+    def test_clear(self) -> None:
+        pool = _ConnectionPool(maxsize=2)
+        connection = mock.Mock()
+        pool.put(("https", "slack.com", None), connection)
+
+        pool.clear()
+
+        connection.close.assert_called_once()
+        assert pool.get(("https", "slack.com", None)) is None
+
+    def test_forked(self) -> None:
+        pool = _ConnectionPool(maxsize=2)
+        connection = mock.Mock()
+        pool.put(("https", "slack.com", None), connection)
+
+        with mock.patch("os.getpid", return_value=-1):
+            assert pool.get(("https", "slack.com", None)) is None
+
+        # Connections shared with parent process are left alone
+        connection.close.assert_not_called()
@@ -1,6 +1,6 @@
 import pytest
 
-from django_slack_tools.utils.slack import get_block_kit_builder_url
+from django_slack_tools.utils.slack import build_permalink, get_block_kit_builder_url
 
 
 def test_get_block_kit_builder_url() -> None:
@@ -45,3 +45,34 @@ def test_get_block_kit_builder_url() -> None:
         url
         == "https://app.slack.com/block-kit-builder/T00000000#%7B%22attachments%22%3A%20%5B%7B%22type%22%3A%20%22section%22%2C%20%22text%22%3A%20%7B%22type%22%3A%20%22mrkdwn%22%2C%20%22text%22%3A%20%22Hello%2C%20World%21%22%7D%7D%5D%7D"
     )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expect"),
+    [
+        (
+            {"channel": "C1H9RESGA", "ts": "1358546515.000008"},
+            "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008",
+        ),
+        (
+            {"channel": "C1H9RESGA", "ts": "1358546515.000008", "thread_ts": "1358546515.000008"},
+            "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000008",
+        ),
+        (
+            {"channel": "C1H9RESGA", "ts": "1358546515.000010", "thread_ts": "1358546515.000008"},
+            "https://ghostbusters.slack.com/archives/C1H9RESGA/p1358546515000010?thread_ts=1358546515.000008&cid=C1H9RESGA",
+        ),
+        (
+            {"channel": "D024BE91L", "ts": "1358546515.000008"},
+            "https://ghostbusters.slack.com/archives/D024BE91L/p1358546515000008",
+        ),
+    ],
+)
+def test_build_permalink(kwargs: dict, expect: str) -> None:
+    assert build_permalink(team_url="https://ghostbusters.slack.com/", **kwargs) == expect
+
+
+@pytest.mark.parametrize("channel", ["#general", "general", "U024BE7LH", ""])
+def test_build_permalink_not_conversation_id(channel: str) -> None:
+    with pytest.raises(ValueError, match="Permalink requires a conversation ID, got"):
+        build_permalink(team_url="https://ghostbusters.slack.com/", channel=channel, ts="1358546515.000008")
@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.test import override_settings
+
+from django_slack_tools.utils.cache import CacheVersion
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-cache"}}
+
+
+class TestCacheVersion:
+    def test_bump(self) -> None:
+        version = CacheVersion("test_bump")
+        initial = version.get()
+
+        version.bump()
+
+        assert version.get() != initial
+
+    def test_shared_in_process(self) -> None:
+        # Even with dummy cache, versions of same key are shared in process
+        version, other = CacheVersion("test_shared_in_process"), CacheVersion("test_shared_in_process")
+        initial = other.get()
+
+        version.bump()
+
+        assert other.get() != initial
+        assert other.get() == version.get()
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_shared_across_processes(self) -> None:
+        version = CacheVersion("test_shared_across_processes")
+        version.bump()
+        assert version.get()[1] == 1
+
+        version.bump()
+        assert version.get()[1] == 2
+
+        # Bumped by some other process
+        caches["default"].incr("test_shared_across_processes")
+        assert version.get()[1] == 3
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_check_interval(self) -> None:
+        version = CacheVersion("test_check_interval", check_interval=5)
+        with mock.patch("django_slack_tools.utils.cache.time.monotonic", return_value=100):
+            initial = version.get()
+            caches["default"].set("test_check_interval", 999)
+            assert version.get() == initial
+
+            # Bumps in current process are seen immediately
+            version.bump()
+            assert version.get()[0] == initial[0] + 1
+            assert version.get()[1] == initial[1]
+
+        with mock.patch("django_slack_tools.utils.cache.time.monotonic", return_value=105):
+            assert version.get()[1] == 1000
+
+        with pytest.raises(ValueError, match="`check_interval` must not be negative, got -1"):
+            CacheVersion("test_check_interval", check_interval=-1)
+
+    @pytest.mark.parametrize("key", ["key-1", "key-2"])
+    def test_independent_keys(self, key: str) -> None:
+        version, other = CacheVersion(f"test_independent_keys:{key}"), CacheVersion("test_independent_keys:other")
+        initial = other.get()
+
+        version.bump()
+
+        assert other.get() == initial
@@ -1 +1,24 @@
-# NOTE: Won't test `make_repr`; it is used by other classes and will be tested indirectly.
+from __future__ import annotations
+
+from unittest import mock
+
+from django_slack_tools.utils.repr import LazyStr, make_repr
+
+
+def test_make_repr() -> None:
+    class Greeting:
+        def __init__(self) -> None:
+            self.text = "Hello"
+            self.times = 2
+
+    assert make_repr(Greeting()) == "Greeting(text='Hello', times=2)"
+
+
+def test_lazy_str() -> None:
+    func = mock.Mock(return_value="Hello, World!")
+    lazy = LazyStr(func)
+    func.assert_not_called()
+
+    assert f"{lazy}" == "Hello, World!"
+    assert "%s" % lazy == "Hello, World!"  # noqa: UP031
+    assert func.call_count == 2
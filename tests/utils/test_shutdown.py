@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import gc
+from unittest import mock
+
+from django_slack_tools.utils import shutdown
+
+
+class Buffer:
+    def __init__(self) -> None:
+        self.flush = mock.Mock()
+
+
+def test_flush_at_exit() -> None:
+    buffers = [Buffer(), Buffer()]
+    with mock.patch.object(shutdown, "_registered", new=False), mock.patch("atexit.register") as register:
+        for buffer in buffers:
+            shutdown.flush_at_exit(buffer)
+
+    # A single hook for all
+    register.assert_called_once_with(shutdown._flush_all)
+
+    buffers[0].flush.side_effect = Exception("Boom")
+    shutdown._flush_all()
+
+    for buffer in buffers:
+        buffer.flush.assert_called_once_with()
+
+
+def test_flush_at_exit_not_keep_alive() -> None:
+    buffer = Buffer()
+    shutdown.flush_at_exit(buffer)
+    assert buffer in shutdown._flushables
+
+    del buffer
+    gc.collect()
+
+    assert not any(isinstance(obj, Buffer) for obj in shutdown._flushables)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django_slack_tools.utils import tracing
+
+
+def test_start_span(span_exporter: Any) -> None:
+    with tracing.start_span("parent"), tracing.start_span("child", {"key": "value"}):
+        pass
+
+    child, parent = span_exporter.get_finished_spans()
+    assert child.name == "child"
+    assert child.attributes == {"key": "value"}
+    assert child.parent.span_id == parent.context.span_id
+
+
+def test_propagation(span_exporter: Any) -> None:
+    assert tracing.inject_context() == {}
+
+    with tracing.start_span("caller"):
+        carrier = tracing.inject_context()
+
+    assert carrier
+
+    with tracing.attach_context(carrier), tracing.start_span("callee"):
+        pass
+
+    with tracing.attach_context(None), tracing.start_span("unrelated"):
+        pass
+
+    caller, callee, unrelated = span_exporter.get_finished_spans()
+    assert callee.context.trace_id == caller.context.trace_id
+    assert callee.parent.span_id == caller.context.span_id
+    assert unrelated.parent is None